@@ -0,0 +1,77 @@
+# ----------------------------------------------------------------------
+# Tests: Benchmarks
+# Copyright (C) 2018-2025  Ye Lei (叶磊)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------
+
+from tests import wl_test_bench
+
+def test_measure():
+    result = wl_test_bench.measure(lambda: [0] * 100_000, repeat = 2)
+
+    assert result['time'] >= 0
+    # Peaks of memory allocations are measured separately for each benchmark
+    assert result['mem_peak'] >= 100_000 * 8
+    assert wl_test_bench.measure(lambda: None, repeat = 1)['mem_peak'] < result['mem_peak']
+    assert 'mem_peak' not in wl_test_bench.measure(lambda: None, repeat = 1, mem = False)
+
+def test_compare_results():
+    results_baseline = {
+        'a[10k]': {'time': 1, 'mem_peak': 100},
+        'b[10k]': {'time': 1, 'mem_peak': 100},
+        'c[10k]': {'time': 1},
+        'd[10k]': {'err': 'Exception'},
+        'e[10k]': {'time': 1},
+        'e[100k]': {'time': 1},
+        'f[10k]': {'time': 1}
+    }
+    results = {
+        # Regressions of time and memory usage
+        'a[10k]': {'time': 1.5, 'mem_peak': 150},
+        # Within tolerance
+        'b[10k]': {'time': 1.1, 'mem_peak': 110},
+        # Benchmarks which fail now but pass in the baseline
+        'c[10k]': {'err': 'Exception'},
+        # Benchmarks which fail in the baseline are not compared
+        'd[10k]': {'time': 100},
+        # Benchmarks not in the baseline are not compared
+        'g[10k]': {'time': 100}
+    }
+
+    assert wl_test_bench.compare_results(results, results_baseline, tolerance = .2) == [
+        ('a[10k]', 'time', 1, 1.5, 1.5),
+        ('a[10k]', 'mem_peak', 100, 150, 1.5),
+        ('c[10k]', 'err', None, 'Exception', None),
+        # Missing benchmarks
+        ('e[100k]', 'missing', None, None, None),
+        ('e[10k]', 'missing', None, None, None),
+        ('f[10k]', 'missing', None, None, None)
+    ]
+
+    # Benchmarks which are filtered out or whose corpora are not used are not missing
+    regressions = wl_test_bench.compare_results(
+        results, results_baseline, tolerance = .2,
+        patterns = ['a*', 'e*'],
+        corpus_names = ['10k']
+    )
+
+    assert [(name, key) for name, key, *_ in regressions if key == 'missing'] == [('e[10k]', 'missing')]
+
+    # No regressions
+    assert not wl_test_bench.compare_results(results_baseline, results_baseline, tolerance = .2)
+
+if __name__ == '__main__':
+    test_measure()
+    test_compare_results()
@@ -0,0 +1,126 @@
+# ----------------------------------------------------------------------
+# Tests: Command-line interface
+# Copyright (C) 2018-2025  Ye Lei (叶磊)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------
+
+import csv
+import os
+import pickle
+import tempfile
+
+import openpyxl
+
+from tests import wl_test_init
+from wordless import wl_cli
+
+def test_cli():
+    main = wl_test_init.Wl_Test_Main(switch_lang_utils = 'fast')
+
+    with tempfile.TemporaryDirectory() as dir_temp:
+        path_settings = os.path.join(dir_temp, 'wl_settings.pickle')
+        file_paths = []
+
+        with open(path_settings, 'wb') as f:
+            settings_custom = main.settings_custom
+
+            for file_type in ('', '_ref'):
+                settings_custom['file_area'][f'files_open{file_type}'] = []
+                settings_custom['file_area'][f'files_closed{file_type}'] = []
+
+            pickle.dump(settings_custom, f)
+
+        for i, text in enumerate((
+            'The cat sat on the mat. The dog sat on the log.',
+            'A cat and a dog. The cat ran away from the dog.'
+        )):
+            file_paths.append(os.path.join(dir_temp, f'file_{i}.txt'))
+
+            with open(file_paths[-1], 'w', encoding = 'utf_8') as f:
+                f.write(text)
+
+        args_files = ['--lang', 'eng_us', '--encoding', 'utf_8', '--settings', path_settings, '--quiet']
+
+        for task in wl_cli.WORKERS:
+            file_path_exp = os.path.join(dir_temp, f'{task}.csv')
+
+            if task == 'keyword_extractor':
+                assert wl_cli.main([task, file_paths[0], '-r', file_paths[1], '-o', file_path_exp, *args_files]) == 0
+            elif task in wl_cli.TABS_SEARCH_TERMS:
+                # Search terms are required
+                assert wl_cli.main([task, *file_paths, '-o', file_path_exp, *args_files]) == 1
+                assert wl_cli.main([task, *file_paths, '-o', file_path_exp, '-t', 'cat', '-t', 'dog', *args_files]) == 0
+            else:
+                assert wl_cli.main([task, *file_paths, '-o', file_path_exp, *args_files]) == 0
+
+            with open(file_path_exp, 'r', encoding = 'utf_8', newline = '') as f:
+                rows = list(csv.reader(f))
+
+            assert rows[0][0] == 'Rank'
+            assert len(rows) > 1
+            assert all((len(row) == len(rows[0]) for row in rows))
+            # Ranks should be in ascending order
+            assert [int(row[0]) for row in rows[1:]] == sorted((int(row[0]) for row in rows[1:]))
+
+        # Export to Excel workbooks separately for each file
+        file_path_exp = os.path.join(dir_temp, 'wordlist.xlsx')
+
+        assert wl_cli.main(['wordlist_generator', *file_paths, '-o', file_path_exp, '--per-file', *args_files]) == 0
+
+        for file_path in file_paths:
+            file_name = os.path.splitext(os.path.basename(file_path))[0]
+            worksheet = openpyxl.load_workbook(os.path.join(dir_temp, f'wordlist_{file_name}.xlsx')).active
+
+            assert worksheet.cell(1, 1).value == 'Rank'
+            assert worksheet.max_row > 1
+
+def test_cli_per_file_same_names():
+    main = wl_test_init.Wl_Test_Main(switch_lang_utils = 'fast')
+
+    with tempfile.TemporaryDirectory() as dir_temp:
+        path_settings = os.path.join(dir_temp, 'wl_settings.pickle')
+        file_paths = []
+
+        with open(path_settings, 'wb') as f:
+            pickle.dump(main.settings_custom, f)
+
+        # Files with the same name in different folders
+        for i, text in enumerate(('The cat sat on the mat.', 'The dog sat on the log.')):
+            os.mkdir(os.path.join(dir_temp, str(i)))
+            file_paths.append(os.path.join(dir_temp, str(i), 'file.txt'))
+
+            with open(file_paths[-1], 'w', encoding = 'utf_8') as f:
+                f.write(text)
+
+        file_path_exp = os.path.join(dir_temp, 'wordlist.csv')
+
+        assert wl_cli.main([
+            'wordlist_generator', *file_paths, '-o', file_path_exp, '--per-file',
+            '--lang', 'eng_us', '--encoding', 'utf_8', '--settings', path_settings, '--quiet'
+        ]) == 0
+
+        tokens = []
+
+        for file_name in ('wordlist_file.csv', 'wordlist_file (2).csv'):
+            with open(os.path.join(dir_temp, file_name), 'r', encoding = 'utf_8', newline = '') as f:
+                tokens.append({row[1] for row in list(csv.reader(f))[1:]})
+
+        # Results of the first file should not be overwritten by those of the second file
+        assert 'cat' in tokens[0] and 'cat' not in tokens[1]
+        assert 'dog' in tokens[1] and 'dog' not in tokens[0]
+
+if __name__ == '__main__':
+    test_cli()
+    test_cli_per_file_same_names()
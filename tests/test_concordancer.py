@@ -40,11 +40,14 @@ def test_concordancer():
                 wl_test_init.select_test_files(main, no_files = (0,))
 
                 settings['generation_settings']['calc_sentiment_scores'] = False
+                settings['generation_settings']['sampling_method'] = 'None'
             # Multiple files
             case 1:
                 wl_test_init.select_test_files(main, no_files = (1, 2))
 
                 settings['generation_settings']['calc_sentiment_scores'] = True
+                settings['generation_settings']['sampling_method'] = 'Reservoir sampling'
+                settings['generation_settings']['sample_size'] = 5
             # Miscellaneous
             case _:
                 if main.settings_custom['file_area']['files_open'][i + 1]['name'] in {
@@ -77,24 +80,38 @@ def test_concordancer():
         worker_concordancer_fig.finished.connect(update_gui_fig)
         worker_concordancer_fig.run()
 
-def update_gui_table(err_msg, concordance_lines):
+def update_gui_table(err_msg, concordance_lines, num_hits):
     print(err_msg)
     assert not err_msg
     assert concordance_lines
+    assert num_hits >= len(concordance_lines)
+
+    if main_global.settings_custom['concordancer']['generation_settings']['sampling_method'] == 'Reservoir sampling':
+        assert len(concordance_lines) == min(num_hits, 5)
+    else:
+        assert len(concordance_lines) == num_hits
 
     for concordance_line in concordance_lines:
-        assert len(concordance_line) == 9
-
-        left_tokens_raw, left_tokens_search = concordance_line[0]
-        node_tokens_raw, node_tokens_search = concordance_line[1]
-        right_tokens_raw, right_tokens_search = concordance_line[2]
-
-        sentiment = concordance_line[3]
-        no_token, len_tokens = concordance_line[4]
-        no_sentence_seg, len_sentence_segs = concordance_line[5]
-        no_sentence, len_sentences = concordance_line[6]
-        no_para, len_paras = concordance_line[7]
-        file_name = concordance_line[8]
+        # Contexts are not generated by the worker unless sentiment scores are calculated
+        if not main_global.settings_custom['concordancer']['generation_settings']['calc_sentiment_scores']:
+            assert concordance_line.contexts is None
+
+        (
+            (left_tokens_raw, left_tokens_search),
+            (node_tokens_raw, node_tokens_search),
+            (right_tokens_raw, right_tokens_search)
+        ) = concordance_line.get_contexts()
+
+        sentiment = concordance_line.sentiment
+        no_token, len_tokens = concordance_line.no_token, concordance_line.file.num_tokens
+        no_sentence_seg, len_sentence_segs = concordance_line.no_sentence_seg, len(concordance_line.file.offsets_sentence_segs)
+        no_sentence, len_sentences = concordance_line.no_sentence, len(concordance_line.file.offsets_sentences)
+        no_para, len_paras = concordance_line.no_para, len(concordance_line.file.offsets_paras)
+        file_name = concordance_line.file.file_name
+
+        # Contexts should only be generated once
+        assert concordance_line.get_contexts() is concordance_line.contexts
+        assert concordance_line.file.get_contexts(concordance_line)[0][0] == left_tokens_raw
 
         file_names_selected = list(main_global.wl_file_area.get_selected_file_names())
 
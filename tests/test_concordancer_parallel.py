@@ -34,11 +34,16 @@ def test_concordancer_parallel():
                 settings['search_settings']['multi_search_mode'] = True
                 settings['search_settings']['search_terms'] = wl_test_init.SEARCH_TERMS
 
+                settings['generation_settings']['sampling_method'] = 'First N hits'
+                settings['generation_settings']['sample_size'] = 5
+
                 wl_test_init.select_test_files(main, no_files = (0, 1, 2))
             case 1:
                 settings['search_settings']['multi_search_mode'] = False
                 settings['search_settings']['search_term'] = ''
 
+                settings['generation_settings']['sampling_method'] = 'None'
+
                 wl_test_init.select_test_files(main, no_files = (8, 9, 10))
 
         global main_global
@@ -54,11 +59,16 @@ def test_concordancer_parallel():
         worker_concordancer_parallel.finished.connect(update_gui)
         worker_concordancer_parallel.run()
 
-def update_gui(err_msg, parallel_units, num_paras_max):
+def update_gui(err_msg, parallel_units, num_paras_max, num_hits):
     print(err_msg)
     assert not err_msg
     assert parallel_units
 
+    if main_global.settings_custom['concordancer_parallel']['generation_settings']['sampling_method'] == 'First N hits':
+        assert len(parallel_units) == min(num_hits, 5)
+    else:
+        assert len(parallel_units) == num_hits
+
     files_selected = list(main_global.wl_file_area.get_selected_files())
 
     # Test whether empty parallel units are removed
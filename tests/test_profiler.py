@@ -16,10 +16,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
-import collections
-
 import numpy
-import scipy
 
 from tests import (
     wl_test_file_area,
@@ -93,18 +90,18 @@ def update_gui(err_msg, texts_stats_files):
 
     for i, stats in enumerate(texts_stats_files):
         stats_readability = stats[0]
-        len_paras_sentences = numpy.array(stats[1])
-        len_paras_sentence_segs = numpy.array(stats[2])
-        len_paras_tokens = numpy.array(stats[3])
-        len_sentences = numpy.array(stats[4])
-        len_sentence_segs = numpy.array(stats[5])
-        len_tokens_syls = numpy.array(stats[6]) if stats[6] is not None else None
-        len_tokens_chars = numpy.array(stats[7])
-        len_types_syls = numpy.array(stats[8]) if stats[8] is not None else None
-        len_types_chars = numpy.array(stats[9])
-        len_syls = numpy.array(stats[10]) if stats[10] is not None else None
+        len_paras_sentences = stats[1]
+        len_paras_sentence_segs = stats[2]
+        len_paras_tokens = stats[3]
+        len_sentences = stats[4]
+        len_sentence_segs = stats[5]
+        len_tokens_syls = stats[6]
+        len_tokens_chars = stats[7]
+        len_types_syls = stats[8]
+        len_types_chars = stats[9]
+        len_syls = stats[10]
         stats_lexical_density_diversity = stats[11]
-        dds_sentences = stats[12]
+        dds = stats[12]
         mdds = stats[13]
         ndds = stats[14]
 
@@ -114,14 +111,14 @@ def update_gui(err_msg, texts_stats_files):
         count_tokens = len(len_tokens_chars)
         count_types = len(len_types_chars)
         count_syls = len(len_syls) if len_syls is not None else None
-        count_chars = numpy.sum(len_tokens_chars)
+        count_chars = len_tokens_chars.sum
 
-        count_sentences_lens.append(collections.Counter(len_sentences))
-        count_sentence_segs_lens.append(collections.Counter(len_sentence_segs))
+        count_sentences_lens.append(len_sentences.counts)
+        count_sentence_segs_lens.append(len_sentence_segs.counts)
         count_tokens_lens_syls.append(
-            collections.Counter(len_tokens_syls) if len_tokens_syls is not None else None
+            len_tokens_syls.counts if len_tokens_syls is not None else None
         )
-        count_tokens_lens_chars.append(collections.Counter(len_tokens_chars))
+        count_tokens_lens_chars.append(len_tokens_chars.counts)
 
         # Readability
         assert len(stats_readability) == 39
@@ -159,20 +156,20 @@ def update_gui(err_msg, texts_stats_files):
             assert count_syls
 
         # Lengths
-        assert len_paras_sentences.size
-        assert len_paras_sentence_segs.size
-        assert len_paras_tokens.size
-        assert len_sentences.size
-        assert len_sentence_segs.size
-        assert len_types_chars.size
+        assert len_paras_sentences
+        assert len_paras_sentence_segs
+        assert len_paras_tokens
+        assert len_sentences
+        assert len_sentence_segs
+        assert len_types_chars
 
         if files_selected[0]['name'] == '[xct] Tibetan tshegs':
             if settings_table['add_missing_ending_tshegs']:
-                assert list(len_tokens_chars) == [2, 2]
+                assert len_tokens_chars.counts == {2: 2}
             else:
-                assert list(len_tokens_chars) == [2, 1]
+                assert len_tokens_chars.counts == {2: 1, 1: 1}
         else:
-            assert len_tokens_chars.size
+            assert len_tokens_chars
 
         if files_selected[0]['name'] in {
             '[xct] Tibetan tshegs',
@@ -180,9 +177,9 @@ def update_gui(err_msg, texts_stats_files):
         }:
             assert len_syls is None
         else:
-            assert len_tokens_syls.size
-            assert len_types_syls.size
-            assert len_syls.size
+            assert len_tokens_syls
+            assert len_types_syls
+            assert len_syls
 
         # Lexical Diversity
         assert len(stats_lexical_density_diversity) == 28
@@ -197,17 +194,17 @@ def update_gui(err_msg, texts_stats_files):
             )
 
         # Syntactic Complexity
-        assert isinstance(dds_sentences, list) or dds_sentences == 'no_support'
+        assert isinstance(dds, numpy.ndarray) or dds == 'no_support'
         assert isinstance(mdds, numpy.ndarray) or mdds == 'no_support'
         assert isinstance(ndds, numpy.ndarray) or ndds == 'no_support'
 
         # Mean
-        assert numpy.mean(len_paras_sentences) == count_sentences / count_paras
-        assert numpy.mean(len_paras_sentence_segs) == count_sentence_segs / count_paras
-        assert numpy.mean(len_paras_tokens) == count_tokens / count_paras
-        assert numpy.mean(len_sentences) == count_tokens / count_sentences
-        assert numpy.mean(len_sentence_segs) == count_tokens / count_sentence_segs
-        assert numpy.mean(len_tokens_chars) == count_chars / count_tokens
+        assert len_paras_sentences.mean() == count_sentences / count_paras
+        assert len_paras_sentence_segs.mean() == count_sentence_segs / count_paras
+        assert len_paras_tokens.mean() == count_tokens / count_paras
+        assert len_sentences.mean() == count_tokens / count_sentences
+        assert len_sentence_segs.mean() == count_tokens / count_sentence_segs
+        assert len_tokens_chars.mean() == count_chars / count_tokens
 
         if files_selected[0]['name'] in {
             '[xct] Tibetan tshegs',
@@ -215,7 +212,7 @@ def update_gui(err_msg, texts_stats_files):
         }:
             assert count_syls is None
         else:
-            assert numpy.mean(len_tokens_syls) == count_syls / count_tokens
+            assert len_tokens_syls.mean() == count_syls / count_tokens
 
         # Range and interquartile range
         for lens in (
@@ -226,8 +223,8 @@ def update_gui(err_msg, texts_stats_files):
             len_sentence_segs,
             len_tokens_chars
         ):
-            assert numpy.ptp(lens) == max(lens) - min(lens)
-            assert scipy.stats.iqr(lens) == numpy.percentile(lens, 75) - numpy.percentile(lens, 25)
+            assert lens.ptp() == lens.max() - lens.min()
+            assert lens.iqr() == lens.percentile(75) - lens.percentile(25)
 
         if files_selected[0]['name'] in {
             '[xct] Tibetan tshegs',
@@ -235,8 +232,8 @@ def update_gui(err_msg, texts_stats_files):
         }:
             assert len_tokens_syls is None
         else:
-            assert numpy.ptp(len_tokens_syls) == max(len_tokens_syls) - min(len_tokens_syls)
-            assert scipy.stats.iqr(len_tokens_syls) == numpy.percentile(len_tokens_syls, 75) - numpy.percentile(len_tokens_syls, 25)
+            assert len_tokens_syls.ptp() == len_tokens_syls.max() - len_tokens_syls.min()
+            assert len_tokens_syls.iqr() == len_tokens_syls.percentile(75) - len_tokens_syls.percentile(25)
 
     # Count of n-token-long Sentences
     if any(count_sentences_lens):
@@ -250,7 +247,7 @@ def update_gui(err_msg, texts_stats_files):
                 for len_sentence, count_sentences_files in count_sentences_lens_files.items()
             ))
 
-            assert len_sentences_total == numpy.sum(stats[3])
+            assert len_sentences_total == stats[3].sum
 
     # Count of n-token-long Sentence Segments
     if any(count_sentence_segs_lens):
@@ -264,7 +261,7 @@ def update_gui(err_msg, texts_stats_files):
                 for len_sentence_seg, count_sentence_segs_files in count_sentence_segs_lens_files.items()
             ))
 
-            assert len_sentence_segs_total == numpy.sum(stats[3])
+            assert len_sentence_segs_total == stats[3].sum
 
     # Count of n-syllable-long Tokens
     if files_selected[0]['name'] in {
@@ -283,7 +280,7 @@ def update_gui(err_msg, texts_stats_files):
                 for len_token, count_tokens_files in count_tokens_lens_files.items()
             ))
 
-            assert len_tokens_total == numpy.sum(stats[6])
+            assert len_tokens_total == stats[6].sum
 
         # Token length should never be zero
         assert 0 not in count_tokens_lens_syls
@@ -300,7 +297,7 @@ def update_gui(err_msg, texts_stats_files):
                 for len_token, count_tokens_files in count_tokens_lens_files.items()
             ))
 
-            assert len_tokens_total == numpy.sum(stats[7])
+            assert len_tokens_total == stats[7].sum
 
         # Token length should never be zero
         assert 0 not in count_tokens_lens_chars
@@ -33,6 +33,22 @@ def test_check_custom_settings():
     assert wl_checks_misc.check_custom_settings(settings_custom, settings_default)
     assert not wl_checks_misc.check_custom_settings(settings_custom, {})
 
+def test_check_settings_delta():
+    settings_default = {
+        'key_1': 'val_1',
+        'key_2': {
+            'key_3': 'val_3',
+            'key_4': 'val_4'
+        }
+    }
+
+    assert wl_checks_misc.check_settings_delta({}, settings_default)
+    assert wl_checks_misc.check_settings_delta({'key_2': {'key_4': 'val_5'}}, settings_default)
+    assert not wl_checks_misc.check_settings_delta({'key_5': 'val_5'}, settings_default)
+    assert not wl_checks_misc.check_settings_delta({'key_2': {'key_5': 'val_5'}}, settings_default)
+    assert not wl_checks_misc.check_settings_delta({'key_1': {'key_5': 'val_5'}}, settings_default)
+    assert not wl_checks_misc.check_settings_delta({'key_2': 'val_2'}, settings_default)
+
 def test_check_dir():
     if os.path.exists('temp'):
         shutil.rmtree('temp')
@@ -49,6 +65,7 @@ def test_check_new_name():
         'new_name', ['new_name', 'new_name (2)', 'new_name (4)'],
         separator = '/'
     ) == 'new_name/2'
+    assert wl_checks_misc.check_new_name('new_name', {'new_name', 'new_name (2)'}) == 'new_name (3)'
 
 def test_check_new_path():
     if os.path.exists('temp'):
@@ -66,6 +83,7 @@ def test_check_new_path():
 
 if __name__ == '__main__':
     test_check_custom_settings()
+    test_check_settings_delta()
     test_check_dir()
     test_check_new_name()
     test_check_new_path()
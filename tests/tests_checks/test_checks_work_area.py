@@ -106,6 +106,11 @@ def test_check_err_table():
     wl_checks_work_area.check_err_table(main, '')
     wl_checks_work_area.check_err_table(main, 'test')
 
+def test_check_err_table_hits():
+    wl_checks_work_area.check_err_table_hits(main, '', 10, 10)
+    wl_checks_work_area.check_err_table_hits(main, '', 10, 100)
+    wl_checks_work_area.check_err_table_hits(main, 'test', 10, 100)
+
 def test_check_err_fig():
     wl_checks_work_area.check_err_fig(main, '')
     wl_checks_work_area.check_err_fig(main, 'test')
@@ -135,6 +140,7 @@ if __name__ == '__main__':
     test_check_postprocessing()
     test_check_err()
     test_check_err_table()
+    test_check_err_table_hits()
     test_check_err_fig()
     test_check_err_fig_word_cloud()
     test_check_err_exp_table()
@@ -18,6 +18,7 @@
 
 from tests import wl_test_init
 from wordless.wl_dialogs import wl_dialogs_misc
+from wordless.wl_utils import wl_instrumentation
 
 main = wl_test_init.Wl_Test_Main()
 
@@ -37,8 +38,22 @@ def test_wl_dialog_progress_download_model():
 def test_wl_dialog_restart_required():
     wl_dialogs_misc.Wl_Dialog_Restart_Required(main).open()
 
+def test_wl_dialog_profiling():
+    wl_instrumentation.start(track_mem = True)
+
+    with wl_instrumentation.stage('test', num_items = 10):
+        pass
+
+    trace = wl_instrumentation.stop()
+
+    wl_dialog_profiling = wl_dialogs_misc.Wl_Dialog_Profiling(main, trace)
+    wl_dialog_profiling.open()
+
+    assert wl_dialog_profiling.get_info().split('\n')[1].startswith('test\t1\t10\t')
+
 if __name__ == '__main__':
     test_wl_dialog_progress()
     test_wl_dialog_progress_process_data()
     test_wl_dialog_progress_download_model()
     test_wl_dialog_restart_required()
+    test_wl_dialog_profiling()
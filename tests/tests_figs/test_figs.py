@@ -18,6 +18,9 @@
 
 import os
 
+import matplotlib
+import networkx
+import numpy
 import pytest
 
 from tests import wl_test_init
@@ -27,6 +30,10 @@ from wordless.wl_utils import wl_excs
 def test_restore_matplotlib_rcparams():
     wl_figs.restore_matplotlib_rcparams()
 
+def test_get_rank_max():
+    assert wl_figs.get_rank_max({'rank_max_no_limit': True, 'rank_max': 50}) is None
+    assert wl_figs.get_rank_max({'rank_max_no_limit': False, 'rank_max': 50}) == 50
+
 def test_get_data_ranks():
     data_files_items = [(str(i), i) for i in range(100)]
     fig_settings_1_50 = {
@@ -43,6 +50,44 @@ def test_get_data_ranks():
     assert wl_figs.get_data_ranks(data_files_items, fig_settings_1_50) == [(str(i), i) for i in range(50)]
     assert wl_figs.get_data_ranks(data_files_items, fig_settings_50_100) == [(str(i), i) for i in range(49, 100)]
 
+def test_get_rank_max_word_cloud():
+    assert wl_figs.get_rank_max_word_cloud({'rank_min_no_limit': True, 'rank_max_no_limit': True}) == wl_figs.WORD_CLOUD_MAX_WORDS
+    assert wl_figs.get_rank_max_word_cloud({'rank_min_no_limit': False, 'rank_min': 11, 'rank_max_no_limit': True}) == wl_figs.WORD_CLOUD_MAX_WORDS + 10
+    assert wl_figs.get_rank_max_word_cloud({'rank_min_no_limit': True, 'rank_max_no_limit': False, 'rank_max': 50}) == 50
+
+def test_get_word_cloud_canvas_size():
+    assert wl_figs.get_word_cloud_canvas_size(1000, 500, 1_000_000) == (1000, 500, 1)
+    assert wl_figs.get_word_cloud_canvas_size(4000, 2000, 2_000_000) == (2000, 1000, 0.5)
+
+def test_fig_cache():
+    fig_cache = wl_figs.Wl_Fig_Cache(max_size = 2)
+
+    assert fig_cache.get('test_1') is None
+
+    fig_cache.set('test_1', 1)
+    fig_cache.set('test_2', 2)
+
+    assert fig_cache.get('test_1') == 1
+
+    # The least recently used item is evicted
+    fig_cache.set('test_3', 3)
+
+    assert len(fig_cache) == 2
+    assert fig_cache.get('test_2') is None
+
+    fig_cache.clear()
+
+    assert not fig_cache
+
+def test_get_line_chart_decimated_idxs():
+    vals = numpy.array([0, 5, 1, 3, 2, 9, 4, 6, 7, 8], dtype = numpy.float64)
+
+    assert wl_figs.get_line_chart_decimated_idxs(vals, 0, 10, num_buckets = 5).tolist() == list(range(10))
+    assert wl_figs.get_line_chart_decimated_idxs(vals, 0, 10, num_buckets = 2).tolist() == [0, 1, 5, 6, 9]
+    assert wl_figs.get_line_chart_decimated_idxs(vals, 2, 7, num_buckets = 1).tolist() == [2, 5, 6]
+    assert wl_figs.get_line_chart_decimated_idxs(vals, 8, 20, num_buckets = 1).tolist() == [8, 9]
+    assert not wl_figs.get_line_chart_decimated_idxs(vals, 20, 30, num_buckets = 1).size
+
 def test_generate_line_chart():
     main = wl_test_init.Wl_Test_Main(switch_lang_utils = 'fast')
     wl_test_init.select_test_files(main, no_files = (0, 1))
@@ -120,6 +165,35 @@ def test_generate_line_chart():
         label_x = 'test'
     )
 
+    # Decimated lines
+    matplotlib.pyplot.figure()
+
+    wl_figs.generate_line_chart(
+        main,
+        data_files_items = [
+            (str(i), [i, i])
+            for i in range(wl_figs.LINE_CHART_BUCKETS * 3)
+        ],
+        fig_settings = {
+            'rank_min_no_limit': True,
+            'rank_max_no_limit': True,
+            'use_data': 'test'
+        },
+        file_names_selected = main.wl_file_area.get_selected_file_names(),
+        label_x = 'test'
+    )
+
+    ax = matplotlib.pyplot.gca()
+
+    assert len(ax.lines[0].get_xdata()) <= wl_figs.LINE_CHART_BUCKETS * 2 + 2
+
+    # Lines are decimated again when zoomed in
+    ax.set_xlim(100, 200)
+
+    assert ax.lines[0].get_xdata().tolist() == list(range(100, 201))
+
+    matplotlib.pyplot.close()
+
 def test_generate_word_cloud():
     # Reload main to avoid file being reloaded
     main = wl_test_init.Wl_Test_Main(switch_lang_utils = 'fast')
@@ -190,6 +264,22 @@ def test_generate_word_cloud():
         }
     )
 
+    # Layouts are reused when only colors are changed
+    num_word_clouds = len(wl_figs.word_cloud_cache)
+    main.settings_custom['figs']['word_clouds']['font_settings']['font_color'] = 'Monochrome'
+
+    wl_figs.generate_word_cloud(
+        main,
+        data_file_items = data_file_items,
+        fig_settings = {
+            'rank_min_no_limit': True,
+            'rank_max_no_limit': True,
+            'use_data': 'p-value'
+        }
+    )
+
+    assert len(wl_figs.word_cloud_cache) == num_word_clouds
+
     main.settings_custom['figs']['word_clouds']['font_settings']['font'] = 'Custom'
     main.settings_custom['figs']['word_clouds']['font_settings']['font_path'] = ''
 
@@ -265,15 +355,61 @@ def test_generate_network_graph():
         }
     )
 
+    # Positions of nodes are reused when only colors are changed
+    num_layouts = len(wl_figs.network_graph_layout_cache)
+    main.settings_custom['figs']['network_graphs']['edge_settings']['edge_color'] = '#FF0000'
+
+    wl_figs.generate_network_graph(
+        main,
+        data_file_items = data_file_items,
+        fig_settings  = {
+            'rank_min_no_limit': True,
+            'rank_max_no_limit': True,
+            'use_data': 'test'
+        }
+    )
+
+    assert len(wl_figs.network_graph_layout_cache) == num_layouts
+
+    # Large graphs
+    data_file_items = [
+        ((str(node), str(collocate)), node * collocate)
+        for node in range(50)
+        for collocate in range(50)
+    ]
+
+    wl_figs.generate_network_graph(
+        main,
+        data_file_items = data_file_items,
+        fig_settings  = {
+            'rank_min_no_limit': True,
+            'rank_max_no_limit': True,
+            'use_data': 'test'
+        }
+    )
+
+def test_get_network_graph_layout():
+    graph = networkx.MultiDiGraph()
+    graph.add_edges_from((str(i), str(i + 1)) for i in range(wl_figs.NETWORK_GRAPH_NODES_MAX_SLOW_LAYOUTS + 1))
+
+    for layout in (networkx.kamada_kawai_layout, networkx.spring_layout, networkx.circular_layout):
+        assert len(wl_figs.get_network_graph_layout(graph, layout)) == len(graph)
+
 def test_show_fig():
     wl_figs.show_fig()
 
 if __name__ == '__main__':
     test_restore_matplotlib_rcparams()
+    test_get_rank_max()
     test_get_data_ranks()
+    test_get_rank_max_word_cloud()
+    test_get_word_cloud_canvas_size()
+    test_fig_cache()
 
+    test_get_line_chart_decimated_idxs()
     test_generate_line_chart()
     test_generate_word_cloud()
     test_generate_network_graph()
+    test_get_network_graph_layout()
 
     test_show_fig()
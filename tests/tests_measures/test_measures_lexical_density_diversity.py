@@ -42,6 +42,32 @@ text_tokens_101 = get_test_text(TOKENS_101)
 text_tokens_1000 = get_test_text(TOKENS_1000)
 text_tokens_225 = get_test_text(TOKENS_225)
 
+def test_get_freqs():
+    text = get_test_text(['a', 'b', 'a', 'c', 'a', 'b'])
+    wl_measures_lexical_density_diversity.get_freqs(main, text)
+
+    assert text.tokens_flat == text.get_tokens_flat()
+    assert text.token_ids.tolist() == [0, 1, 0, 2, 0, 1]
+    assert list(text.types_freqs.values()) == [3, 2, 1]
+    assert text.freqs.tolist() == [3, 2, 1]
+    assert text.freqs_nums_types == {3: 1, 2: 1, 1: 1}
+    assert text.spectrum_freqs.tolist() == [3, 2, 1]
+    assert text.spectrum_nums_types.tolist() == [1, 1, 1]
+    assert text.freqs_ranked.tolist() == [3, 2, 1]
+    assert text.ranks.tolist() == [1, 2, 3]
+
+    # Frequencies should only be computed once
+    types_freqs = text.types_freqs
+    wl_measures_lexical_density_diversity.get_freqs(main, text)
+
+    assert text.types_freqs is types_freqs
+
+def test_get_offsets_prev():
+    text = get_test_text(['a', 'b', 'a', 'c', 'a', 'b'])
+    wl_measures_lexical_density_diversity.get_offsets_prev(main, text)
+
+    assert text.offsets_prev.tolist() == [-1, -1, 0, -1, 2, 1]
+
 def test_brunets_index():
     w = wl_measures_lexical_density_diversity.brunets_index(main, text_tokens_100)
 
@@ -112,11 +138,23 @@ def test_msttr():
     assert msttr_100 == 5 / 100
     assert msttr_1000 == 0
 
+    assert wl_measures_lexical_density_diversity.msttrs(main, text_tokens_101, [100, 1000]) == [msttr_100, msttr_1000]
+
 def test_mtld():
     mtld_100 = wl_measures_lexical_density_diversity.mtld(main, text_tokens_100)
 
     assert mtld_100 == 100 / (14 + 0 / 0.28)
 
+    # Multiple factor sizes
+    mtlds = wl_measures_lexical_density_diversity.mtlds(main, text_tokens_101, [0.72, 0.5, 1])
+
+    for factor_size, mtld in zip([0.72, 0.5, 1], mtlds):
+        settings['mtld']['factor_size'] = factor_size
+
+        assert wl_measures_lexical_density_diversity.mtld(main, text_tokens_101) == mtld
+
+    settings['mtld']['factor_size'] = 0.72
+
 def test_mattr():
     mattr_100 = wl_measures_lexical_density_diversity.mattr(main, text_tokens_100)
     mattr_1000 = wl_measures_lexical_density_diversity.mattr(main, text_tokens_1000)
@@ -124,6 +162,13 @@ def test_mattr():
     assert mattr_100 == wl_measures_lexical_density_diversity.ttr(main, text_tokens_100)
     assert mattr_1000 == 5 / 500
 
+    assert wl_measures_lexical_density_diversity.mattrs(main, text_tokens_225, [1, 2, 225, 500]) == [
+        1,
+        numpy.mean([len(set(TOKENS_225[i : i + 2])) / 2 for i in range(224)]),
+        wl_measures_lexical_density_diversity.ttr(main, text_tokens_225),
+        wl_measures_lexical_density_diversity.ttr(main, text_tokens_225)
+    ]
+
 # Reference: Popescu I.-I., Mačutek, J, & Altmann, G. (2008). Word frequency and arc length. Glottometrics, 17, 21, 33.
 def test_popescu_macutek_altmanns_b1_b2_b3_b4_b5():
     b1, b2, b3, b4, b5 = wl_measures_lexical_density_diversity.popescu_macutek_altmanns_b1_b2_b3_b4_b5(main, text_tokens_225)
@@ -206,6 +251,18 @@ def test_vocdd():
     assert vocdd_100 > 0
     assert vocdd_1000 > 0
 
+    # Reproducible with the same random seed
+    text_tokens_225_copy = get_test_text(TOKENS_225)
+    vocdd_225 = wl_measures_lexical_density_diversity.vocdd(main, text_tokens_225)
+
+    assert wl_measures_lexical_density_diversity.vocdd(main, text_tokens_225_copy) == vocdd_225
+
+    settings['vocdd']['random_seed'] = 1
+
+    assert wl_measures_lexical_density_diversity.vocdd(main, text_tokens_225_copy) != vocdd_225
+
+    settings['vocdd']['random_seed'] = 0
+
 def test_yules_characteristic_k():
     k = wl_measures_lexical_density_diversity.yules_characteristic_k(main, text_tokens_100)
 
@@ -217,6 +274,8 @@ def test_yules_index_of_diversity():
     assert index_of_diversity == (100 ** 2) / (5 * 20 ** 2 - 100)
 
 if __name__ == '__main__':
+    test_get_freqs()
+    test_get_offsets_prev()
     test_brunets_index()
     test_cttr()
     test_fishers_index_of_diversity()
@@ -16,6 +16,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
+import numpy
+import scipy
+
 from tests import wl_test_init
 from wordless.wl_measures import wl_measures_misc
 
@@ -29,5 +32,38 @@ def test_modes():
     assert wl_measures_misc.modes([*range(10)]) == [*range(10)]
     assert not wl_measures_misc.modes([])
 
+def test_wl_hist():
+    nums = [1, 3, 3, 3, 2, 2, 1, 2, 5, 4]
+    hist = wl_measures_misc.Wl_Hist(nums[:5])
+    hist.merge(wl_measures_misc.Wl_Hist(nums[5:]))
+
+    assert hist.counts == {1: 2, 2: 3, 3: 3, 4: 1, 5: 1}
+    assert len(hist) == 10
+    assert hist.sum == 26
+
+    assert hist.mean() == numpy.mean(nums)
+    assert numpy.isclose(hist.std(), numpy.std(nums))
+    assert numpy.isclose(hist.var(), numpy.var(nums))
+    assert hist.min() == 1
+    assert hist.max() == 5
+    assert hist.ptp() == 4
+
+    for q in (0, 10, 25, 50, 75, 90, 100):
+        assert hist.percentile(q) == numpy.percentile(nums, q)
+
+    assert hist.median() == numpy.median(nums)
+    assert hist.iqr() == scipy.stats.iqr(nums)
+    assert hist.modes() == wl_measures_misc.modes(nums)
+
+    hist = wl_measures_misc.Wl_Hist.merge_hists([
+        wl_measures_misc.Wl_Hist({0: 3}),
+        wl_measures_misc.Wl_Hist()
+    ])
+
+    assert len(hist) == 3
+    assert hist.modes() == [0]
+    assert not wl_measures_misc.Wl_Hist()
+
 if __name__ == '__main__':
     test_modes()
+    test_wl_hist()
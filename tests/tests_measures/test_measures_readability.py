@@ -17,8 +17,11 @@
 # ----------------------------------------------------------------------
 
 import math
+import os
+import tempfile
 
 import numpy
+import pytest
 
 from tests import wl_test_init
 from wordless.wl_measures import wl_measures_readability
@@ -81,6 +84,87 @@ test_text_ukr_12 = wl_test_init.Wl_Test_Text(main, TOKENS_MULTILEVEL_12, lang =
 test_text_other_12 = wl_test_init.Wl_Test_Text(main, TOKENS_MULTILEVEL_12, lang = 'other')
 test_text_other_100 = wl_test_init.Wl_Test_Text(main, TOKENS_MULTILEVEL_100, lang = 'other')
 
+def test_get_nums():
+    text = wl_test_init.Wl_Test_Text(main, TOKENS_MULTILEVEL_12_HYPHEN)
+    wl_measures_readability.get_nums(main, text)
+
+    assert text.num_sentences == 3
+    assert text.num_words == 12
+    assert text.offsets_sentences_words == [0, 4, 8]
+    assert text.nums_chars_words.tolist() == [4, 2, 1, 8] * 2 + [4, 2, 2, 10]
+    assert text.nums_chars_alnum_words.tolist() == [4, 2, 1, 8] * 2 + [4, 2, 1, 9]
+    assert text.nums_ltrs_words.tolist() == [4, 2, 1, 8] * 2 + [4, 2, 1, 8]
+    assert (text.num_chars_all, text.num_chars_alnum, text.num_chars_alpha) == (48, 46, 45)
+    assert text.num_syls == numpy.sum(text.nums_syls_words) == sum((len(syls) for syls in text.syls_words))
+
+    # Tokens of texts should not be modified
+    assert all((token.syls is None for token in text.get_tokens_flat()))
+
+    assert wl_measures_readability.get_num_words_ltrs(text.nums_ltrs_words, len_min = 7) == 3
+    assert wl_measures_readability.get_num_words_ltrs(text.nums_ltrs_words, len_max = 3) == 6
+    assert wl_measures_readability.get_num_words_syls(text.nums_syls_words[:4], len_min = 1, len_max = 1) == 3
+
+def test_get_wordlist():
+    for wordlist in wl_measures_readability.WORDLISTS:
+        words = wl_measures_readability.get_wordlist(wordlist)
+
+        assert isinstance(words, frozenset)
+        assert words
+        assert all((word == word.lower() for word in words))
+        # Word lists should only be loaded once
+        assert wl_measures_readability.get_wordlist(wordlist) is words
+
+    # Unknown word lists
+    with pytest.raises(ValueError, match = 'Unknown word list'):
+        wl_measures_readability.get_wordlist('dale_300')
+
+    # Built-in word lists could not be overridden
+    with pytest.raises(ValueError, match = 'built-in'):
+        wl_measures_readability.register_wordlist('dale_3000', 'dale_300.txt')
+
+    # Word lists supplied by users
+    text = wl_test_init.Wl_Test_Text(main, TOKENS_MULTILEVEL_12)
+    wl_measures_readability.get_nums(main, text)
+
+    with tempfile.TemporaryDirectory() as dir_temp:
+        path = os.path.join(dir_temp, 'wordlist.txt')
+
+        with open(path, 'w', encoding = 'utf_8') as f:
+            f.write('This\nis\n')
+
+        wl_measures_readability.register_wordlist('custom', path)
+
+        try:
+            words = wl_measures_readability.get_wordlist('custom')
+
+            assert words == {'this', 'is'}
+            assert wl_measures_readability.get_wordlist('custom') is words
+            assert wl_measures_readability.get_flags_words_outside_list(text, wordlist = 'custom').tolist() == [False, False, True, True] * 3
+
+            # Word lists are reloaded if files have been modified
+            with open(path, 'a', encoding = 'utf_8') as f:
+                f.write('a\n')
+
+            os.utime(path, (0, 0))
+
+            assert wl_measures_readability.get_wordlist('custom') == {'this', 'is', 'a'}
+            assert wl_measures_readability.get_flags_words_outside_list(text, wordlist = 'custom').tolist() == [False, False, False, True] * 3
+        finally:
+            wl_measures_readability.unregister_wordlist('custom')
+
+    with pytest.raises(ValueError, match = 'Unknown word list'):
+        wl_measures_readability.get_wordlist('custom')
+
+def test_get_flags_words_outside_list():
+    text = wl_test_init.Wl_Test_Text(main, TOKENS_MULTILEVEL_12)
+    wl_measures_readability.get_nums(main, text)
+
+    flags = wl_measures_readability.get_flags_words_outside_list(text, wordlist = 'dale_3000')
+
+    assert flags.tolist() == [False] * 11 + [True]
+    assert wl_measures_readability.get_flags_words_outside_list(text, wordlist = 'dale_3000') is flags
+    assert wl_measures_readability.get_num_words_outside_list(text.words_flat, wordlist = 'dale_3000', use_word_types = True) == 1
+
 def test_rd():
     rd_ara_0 = wl_measures_readability.rd(main, test_text_ara_0)
     settings['rd']['variant'] = 'Policy One'
@@ -616,6 +700,10 @@ def test_wheeler_smiths_readability_formula():
     assert wheeler_smith_other_12 == 'no_support'
 
 if __name__ == '__main__':
+    test_get_nums()
+    test_get_wordlist()
+    test_get_flags_words_outside_list()
+
     test_rd()
     test_aari()
     test_ari()
@@ -20,31 +20,24 @@ import numpy
 
 from wordless.wl_measures import wl_measures_syntactic_complexity
 
+# Dependency distances of sentences: [1, 0, 1, -2, 2, 1, -3, 3, 2, 1, -4], [0, -1], [0], []
+DDS = [1, 0, 1, -2, 2, 1, -3, 3, 2, 1, -4, 0, -1, 0]
+OFFSETS = [0, 11, 13, 14]
+
 def test_mdd():
-    numpy.testing.assert_array_equal(wl_measures_syntactic_complexity.mdd(
-        [
-            [1, 0, 1, -2, 2, 1, -3, 3, 2, 1, -4],
-            [0, -1],
-            [0],
-            []
-        ]
-    ), (
+    numpy.testing.assert_array_equal(wl_measures_syntactic_complexity.mdd(DDS, OFFSETS), (
         numpy.array([2, 1])
     ))
 
 def test_ndd():
-    numpy.testing.assert_array_equal(wl_measures_syntactic_complexity.ndd(
-        [
-            [1, 0, 1, -2, 2, 1, -3, 3, 2, 1, -4],
-            [0, -1],
-            [0],
-            []
-        ],
-        [2, 1, 1, 1]
-    ), (
+    numpy.testing.assert_array_equal(wl_measures_syntactic_complexity.ndd(DDS, OFFSETS), (
         numpy.array([numpy.absolute(numpy.log(2 / numpy.sqrt(20))), 0])
     ))
 
+    # Empty texts
+    assert wl_measures_syntactic_complexity.mdd([], []).size == 0
+    assert wl_measures_syntactic_complexity.ndd([], []).size == 0
+
 if __name__ == '__main__':
     test_mdd()
     test_ndd()
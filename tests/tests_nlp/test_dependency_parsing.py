@@ -171,6 +171,60 @@ def wl_test_dependency_parse_fig_models(lang, dependency_parser, tokens):
 
     assert html_newlines
 
+def test_wl_dependency_parse_fig_tokens():
+    for lang in ('eng_us', 'ara'):
+        tokens = wl_texts.to_tokens(
+            ['Hi', 'take', 'it'],
+            lang = lang,
+            tags = ['_UH', '_VB', '_PRP'],
+            tags_universal = ['INTJ', 'VERB', 'PRON'],
+            lemmas = ['hi', 'take', 'it'],
+            dependency_relations = ['intj', 'ROOT', 'dobj'],
+            punc_marks = [',', None, '!']
+        )
+
+        for token in tokens:
+            token.head = tokens[1]
+
+        # Graphs should be built from stored dependencies without parsing sentences again
+        htmls = wl_dependency_parsing.wl_dependency_parse_fig(
+            main,
+            inputs = [tokens],
+            lang = lang,
+            dependency_parser = 'stanza_eng',
+            show_pos_tags = True,
+            show_fine_grained_pos_tags = False,
+            show_lemmas = True
+        )
+
+        assert len(htmls) == 1
+        assert 'Hi,_UH' in htmls[0]
+        assert 'INTJ' in htmls[0]
+        assert 'intj' in htmls[0]
+        assert 'ROOT' not in htmls[0]
+
+        htmls_fine_grained = wl_dependency_parsing.wl_dependency_parse_fig(
+            main,
+            inputs = [tokens],
+            lang = lang,
+            dependency_parser = 'stanza_eng',
+            show_pos_tags = True,
+            show_fine_grained_pos_tags = True
+        )
+
+        assert '>UH<' in htmls_fine_grained[0]
+
+        # Rendered graphs should be reused
+        assert wl_dependency_parsing.wl_dependency_parse_fig(
+            main,
+            inputs = [tokens],
+            lang = lang,
+            dependency_parser = 'stanza_eng',
+            show_pos_tags = True,
+            show_fine_grained_pos_tags = False,
+            show_lemmas = True
+        ) == htmls
+
 def test__get_pipelines_to_disable():
     wl_dependency_parsing._get_pipelines_to_disable(show_pos_tags = True, show_lemmas = True)
     wl_dependency_parsing._get_pipelines_to_disable(show_pos_tags = True, show_lemmas = False)
@@ -280,6 +334,7 @@ if __name__ == '__main__':
     for lang, dependency_parser in test_dependency_parsers:
         test_dependency_parse(lang, dependency_parser)
 
+    test_wl_dependency_parse_fig_tokens()
     test__get_pipelines_to_disable()
     test_wl_show_dependency_graphs()
     wl_test_dependency_parse_misc()
@@ -339,6 +339,22 @@ def wl_test_lemmatize_models(lang, lemmatizer, tokens, results):
         main.settings_custom['files']['misc_settings']['read_files_in_chunks_chars'] = main.settings_default['files']['misc_settings']['read_files_in_chunks_chars']
 
 def test_lemmatize_misc():
+    # Memoization of context-free lemmatizers
+    wl_lemmatization._lemmatize_simplemma.cache_clear()
+
+    tokens_lemmatized = wl_lemmatization.wl_lemmatize(
+        main,
+        inputs = wl_texts.to_tokens(['tests', 'took', 'tests'] * 10, lang = 'eng_us'),
+        lang = 'eng_us',
+        lemmatizer = 'simplemma_eng'
+    )
+    cache_info = wl_lemmatization._lemmatize_simplemma.cache_info()
+
+    assert wl_texts.get_token_properties(tokens_lemmatized, 'lemma') == ['test', 'take', 'test'] * 10
+    # Each token type is only lemmatized once
+    assert cache_info.misses == 2
+    assert cache_info.hits == 28
+
     # NLTK - WordNet lemmatizer
     wl_lemmatization.wl_lemmatize(
         main,
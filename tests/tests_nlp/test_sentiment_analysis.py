@@ -155,8 +155,56 @@ def test_sentiment_analyze_misc():
         lang = 'eng_us'
     )
 
+def test_sentiment_cache():
+    wl_sentiment_analysis.sentiment_cache.clear()
+
+    # Identical inputs should be analyzed only once
+    sentiment_scores = wl_sentiment_analysis.wl_sentiment_analyze(
+        main,
+        inputs = ['Good', 'Bad', ' Good ', ''],
+        lang = 'eng_us',
+        sentiment_analyzer = 'vader_eng'
+    )
+
+    assert sentiment_scores[0] == sentiment_scores[2] > 0
+    assert sentiment_scores[1] < 0
+    assert sentiment_scores[3] is None
+    assert len(wl_sentiment_analysis.sentiment_cache) == 2
+
+    assert wl_sentiment_analysis.wl_sentiment_analyze(
+        main,
+        inputs = [wl_texts.to_tokens(['Good'], lang = 'eng_us'), wl_texts.to_tokens(['Good'], lang = 'eng_us')],
+        lang = 'eng_us',
+        sentiment_analyzer = 'vader_eng'
+    ) == sentiment_scores[:1] * 2
+    assert len(wl_sentiment_analysis.sentiment_cache) == 3
+
+    # Cached scores should be reused
+    wl_sentiment_analysis.sentiment_cache.set('eng_us', 'vader_eng', 'Good', 0.5)
+
+    assert wl_sentiment_analysis.wl_sentiment_analyze(
+        main,
+        inputs = ['Good'],
+        lang = 'eng_us',
+        sentiment_analyzer = 'vader_eng'
+    ) == [0.5]
+
+    # Least-recently-used items should be evicted first
+    sentiment_cache = wl_sentiment_analysis.Wl_Sentiment_Cache(max_size = 2)
+    sentiment_cache.set('eng_us', 'vader_eng', 'a', 0.1)
+    sentiment_cache.set('eng_us', 'vader_eng', 'b', 0.2)
+    sentiment_cache.get('eng_us', 'vader_eng', 'a')
+    sentiment_cache.set('eng_us', 'vader_eng', 'c', 0.3)
+
+    assert len(sentiment_cache) == 2
+    assert sentiment_cache.get('eng_us', 'vader_eng', 'a') == 0.1
+    assert sentiment_cache.get('eng_us', 'vader_eng', 'b') is None
+
+    wl_sentiment_analysis.sentiment_cache.clear()
+
 if __name__ == '__main__':
     for lang, sentiment_analyzer in test_sentiment_analyzers:
         test_sentiment_analyze(lang, sentiment_analyzer)
 
     test_sentiment_analyze_misc()
+    test_sentiment_cache()
@@ -16,6 +16,10 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
+import os
+import pickle
+import tempfile
+
 import pytest
 
 from tests import (
@@ -250,8 +254,80 @@ def test_syl_tokenize_misc():
         lang = 'other'
     )
 
+def test_wl_syl_cache():
+    syl_cache = wl_syl_tokenization.Wl_Syl_Cache(max_size = 2)
+
+    syl_cache.set('eng_us', 'pyphen_eng_us', 'testing', ['test', 'ing'])
+    syl_cache.set('eng_us', 'pyphen_eng_us', 'tested', ['test', 'ed'])
+
+    assert syl_cache.get('eng_us', 'pyphen_eng_us', 'testing') == ['test', 'ing']
+    assert syl_cache.get('eng_gb', 'pyphen_eng_gb', 'testing') is None
+
+    # Least recently used items should be evicted first
+    syl_cache.set('eng_us', 'pyphen_eng_us', 'tests', ['tests'])
+
+    assert len(syl_cache) == 2
+    assert syl_cache.get('eng_us', 'pyphen_eng_us', 'tested') is None
+    assert syl_cache.get('eng_us', 'pyphen_eng_us', 'testing') == ['test', 'ing']
+
+    with tempfile.TemporaryDirectory() as dir_temp:
+        file_path = os.path.join(dir_temp, 'wl_cache_syls.pickle')
+
+        syl_cache.save(file_path)
+
+        syl_cache_loaded = wl_syl_tokenization.Wl_Syl_Cache()
+        syl_cache_loaded.load(file_path)
+
+        assert syl_cache_loaded.cache == syl_cache.cache
+
+        # Corrupt cache files
+        with open(file_path, 'wb') as f:
+            pass
+
+        syl_cache_loaded.load(file_path)
+
+        assert len(syl_cache_loaded) == 2
+
+        # Cache files whose classes could not be found
+        with open(file_path, 'wb') as f:
+            f.write(b'cwordless.wl_nlp.wl_syl_tokenization\nWl_Nonexistent\n.')
+
+        syl_cache_loaded.load(file_path)
+
+        assert len(syl_cache_loaded) == 2
+
+        # Cache files of other types
+        with open(file_path, 'wb') as f:
+            pickle.dump(['test'], f)
+
+        syl_cache_loaded.load(file_path)
+
+        assert len(syl_cache_loaded) == 2
+
+    syl_cache.set_max_size(1)
+
+    assert list(syl_cache.cache) == [('eng_us', 'pyphen_eng_us', 'testing')]
+
+    syl_cache.set_max_size(0)
+
+    assert not syl_cache
+
+    # Cache is shared by all calls
+    wl_syl_tokenization.syl_cache.clear()
+
+    tokens = wl_syl_tokenization.wl_syl_tokenize(
+        main,
+        inputs = wl_texts.to_tokens(['testing', 'testing'], lang = 'eng_us'),
+        lang = 'eng_us',
+        syl_tokenizer = 'pyphen_eng_us'
+    )
+
+    assert len(wl_syl_tokenization.syl_cache) == 1
+    assert wl_syl_tokenization.syl_cache.get('eng_us', 'pyphen_eng_us', 'testing') == list(tokens[0].syls)
+
 if __name__ == '__main__':
     for lang, syl_tokenizer in test_syl_tokenizers:
         test_syl_tokenize(lang, syl_tokenizer)
 
     test_syl_tokenize_misc()
+    test_wl_syl_cache()
@@ -17,8 +17,14 @@
 # ----------------------------------------------------------------------
 
 import copy
+import os
+import pickle
 
 from tests import wl_test_init
+from wordless.wl_measures import (
+    wl_measures_lexical_density_diversity,
+    wl_measures_readability
+)
 from wordless.wl_nlp import wl_texts
 
 main = wl_test_init.Wl_Test_Main()
@@ -121,6 +127,119 @@ def test_wl_text_total():
     assert text_total_2.lang == 'other'
     assert text_total_2.tagged
 
+    text_3 = wl_test_init.Wl_Test_Text(main, tokens_multilevel = [[[['a', 'b']]], [[['b', 'c']]]])
+    text_4 = wl_test_init.Wl_Test_Text(main, tokens_multilevel = [[[['c', 'd', 'e']]]])
+    text_total_3 = wl_texts.Wl_Text_Total(texts = [text_3, text_4])
+
+    # Paragraphs should not be copied
+    assert text_total_3.tokens_multilevel[0] is text_3.tokens_multilevel[0]
+    assert text_total_3.tokens_multilevel[2] is text_4.tokens_multilevel[0]
+    assert text_total_3.to_token_texts(flat = True) == ['a', 'b', 'b', 'c', 'c', 'd', 'e']
+    assert text_total_3.num_tokens == 7
+    assert text_total_3.num_types == 5
+
+    # Workers append the total to the list of texts of each file
+    texts = [
+        wl_test_init.Wl_Test_Text(main, tokens_multilevel = [[[['a', 'b']]], [[['b', 'c']]]]),
+        wl_test_init.Wl_Test_Text(main, tokens_multilevel = [[[['c', 'd', 'e']]]])
+    ]
+    texts.append(wl_texts.Wl_Text_Total(texts))
+    text_total_4 = texts[-1]
+
+    assert text_total_4 not in text_total_4.texts
+    assert len(text_total_4.texts) == 2
+
+    wl_measures_lexical_density_diversity.get_freqs(main, text_total_4)
+    wl_measures_readability.get_nums(main, text_total_4)
+
+    assert text_total_4.num_words == 7
+
+def test_wl_text_store():
+    # Unloaded texts are loaded on demand by the global store
+    text_store = wl_texts.text_store
+    text_1 = wl_test_init.Wl_Test_Text(main, tokens_multilevel = [[[['a', 'b']]]])
+    text_2 = wl_test_init.Wl_Test_Text(main, tokens_multilevel = [[[['c', 'd', 'e']]]])
+
+    text_store.add(text_1)
+    text_store.add(text_2)
+
+    assert len(text_store) == 2
+    assert text_store.get_mem() == 5 * wl_texts.MEM_TOKEN
+
+    # Unloading
+    text_store.unload(text_1)
+    path_unloaded = text_1.__dict__['path_unloaded']
+
+    assert os.path.exists(path_unloaded)
+    assert 'tokens_multilevel' not in text_1.__dict__
+    assert text_1.num_tokens == 2
+    assert text_store.get_mem() == 3 * wl_texts.MEM_TOKEN
+
+    # Unloaded texts are pickled along with their contents
+    text_1_copy = pickle.loads(pickle.dumps(text_1))
+
+    assert 'path_unloaded' not in text_1_copy.__dict__
+    assert text_1_copy.to_token_texts(flat = True) == ['a', 'b']
+
+    # Loading on demand
+    assert text_1.to_token_texts(flat = True) == ['a', 'b']
+    assert 'path_unloaded' not in text_1.__dict__
+    assert not os.path.exists(path_unloaded)
+    assert text_store.get_mem() == 5 * wl_texts.MEM_TOKEN
+
+    # Least recently used texts are unloaded first
+    text_store.mem_max = 4 * wl_texts.MEM_TOKEN
+    text_store.evict()
+
+    assert 'path_unloaded' in text_2.__dict__
+    assert 'path_unloaded' not in text_1.__dict__
+
+    text_store.load(text_2)
+
+    assert 'path_unloaded' in text_1.__dict__
+    assert 'path_unloaded' not in text_2.__dict__
+    assert text_store.get_mem() == 3 * wl_texts.MEM_TOKEN
+
+    # Pinned texts are not unloaded
+    texts_pinned = text_store.pin([text_1, text_2])
+    text_store.load(text_1)
+
+    assert text_store.get_mem() == 5 * wl_texts.MEM_TOKEN
+    assert 'path_unloaded' not in text_1.__dict__
+    assert 'path_unloaded' not in text_2.__dict__
+
+    text_store.unpin(texts_pinned)
+    del texts_pinned
+
+    assert 'path_unloaded' in text_2.__dict__
+    assert text_store.get_mem() == 2 * wl_texts.MEM_TOKEN
+
+    # Attributes cached on unloaded texts
+    text_store.load(text_2)
+    text_2.attr_cached = True
+    text_store.unload(text_2)
+
+    assert 'attr_cached' not in text_2.__dict__
+    assert wl_texts.is_cached(text_2, 'attr_cached')
+    assert not wl_texts.is_cached(text_2, 'attr_uncached')
+    assert 'path_unloaded' in text_1.__dict__
+
+    # Temporary files are removed when texts are garbage collected
+    path_unloaded = text_1.__dict__['path_unloaded']
+    del text_1
+
+    assert len(text_store) == 1
+    assert not os.path.exists(path_unloaded)
+
+    try:
+        _ = text_2.attr_nonexistent
+    except AttributeError:
+        pass
+    else:
+        assert False
+
+    text_store.mem_max = None
+
 if __name__ == '__main__':
     test_check_text()
     test_check_texts()
@@ -140,3 +259,4 @@ if __name__ == '__main__':
     test_update_token_properties()
 
     test_wl_text_total()
+    test_wl_text_store()
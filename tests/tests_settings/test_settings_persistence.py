@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------
+# Tests: Settings - Persistence
+# Copyright (C) 2018-2025  Ye Lei (叶磊)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import tempfile
+
+from tests import wl_test_init
+from wordless.wl_settings import wl_settings_persistence
+
+main = wl_test_init.Wl_Test_Main()
+
+settings_default = {
+    'section_1': {
+        'key_1': 'val_1',
+        'key_2': {
+            'key_3': [1, 2, 3],
+            'key_4': True
+        }
+    },
+    'section_2': {
+        'key_5': 1
+    },
+    'section_3': 'val_3'
+}
+
+def test_get_settings_delta():
+    settings_custom = wl_settings_persistence.copy_settings(settings_default)
+
+    assert not wl_settings_persistence.get_settings_delta(settings_custom, settings_default)
+
+    settings_custom['section_1']['key_2']['key_3'].append(4)
+    settings_custom['section_2']['key_5'] = 1.0
+    settings_custom['section_3'] = 'val_4'
+
+    assert wl_settings_persistence.get_settings_delta(settings_custom, settings_default) == {
+        'section_1': {'key_2': {'key_3': [1, 2, 3, 4]}},
+        # Types of values should be compared as well
+        'section_2': {'key_5': 1.0},
+        'section_3': 'val_4'
+    }
+
+def test_apply_settings_delta():
+    settings_custom = wl_settings_persistence.copy_settings(settings_default)
+    wl_settings_persistence.apply_settings_delta(settings_custom, {'section_1': {'key_2': {'key_4': False}}})
+
+    assert settings_custom['section_1'] == {
+        'key_1': 'val_1',
+        'key_2': {
+            'key_3': [1, 2, 3],
+            'key_4': False
+        }
+    }
+    assert settings_custom['section_2'] is not settings_default['section_2']
+
+def test_copy_settings():
+    settings = wl_settings_persistence.copy_settings(main.settings_default)
+
+    assert settings == main.settings_default
+    assert settings['pos_tagging'] is not main.settings_default['pos_tagging']
+
+def test_wl_settings_file():
+    with tempfile.TemporaryDirectory() as dir_temp:
+        file_path = os.path.join(dir_temp, 'wl_settings.pickle')
+        settings_file = wl_settings_persistence.Wl_Settings_File(file_path)
+
+        # Default settings are used if the settings file does not exist
+        settings_custom = settings_file.load(main.settings_default)
+
+        assert settings_custom == main.settings_default
+
+        settings_custom['general']['ui_settings']['font_size'] += 1
+        settings_file.save(settings_custom, main.settings_default, block = True)
+
+        # Only differences against default settings are saved
+        assert wl_settings_persistence.read_settings(file_path)[0] == {
+            'general': {'ui_settings': {'font_size': settings_custom['general']['ui_settings']['font_size']}}
+        }
+        # No temporary files should be left
+        assert os.listdir(dir_temp) == ['wl_settings.pickle']
+
+        settings_file = wl_settings_persistence.Wl_Settings_File(file_path)
+
+        assert settings_file.load(main.settings_default) == settings_custom
+
+        # The settings file is not rewritten if settings are unchanged
+        os.utime(file_path, (0, 0))
+        settings_file.save(settings_custom, main.settings_default)
+        settings_file.wait()
+
+        assert os.path.getmtime(file_path) == 0
+
+        # Settings modified after being saved are not written
+        settings_custom['general']['ui_settings']['font_size'] += 1
+        settings_file.save(settings_custom, main.settings_default)
+        settings_custom['general']['ui_settings']['font_size'] += 1
+        settings_file.wait()
+
+        assert wl_settings_persistence.read_settings(file_path)[0]['general']['ui_settings']['font_size'] == settings_custom['general']['ui_settings']['font_size'] - 1
+
+        # Sections which are corrupt or incompatible with the current version are reset
+        with open(file_path, 'wb') as f:
+            pickle.dump({
+                'format_ver': wl_settings_persistence.FORMAT_VER,
+                'sections': {
+                    'general': pickle.dumps({'ui_settings': {'font_size': 20}}),
+                    'files': b'',
+                    'tables': pickle.dumps({'key_nonexistent': 'val'})
+                }
+            }, f)
+
+        settings_custom = settings_file.load(main.settings_default)
+
+        assert settings_custom['general']['ui_settings']['font_size'] == 20
+        assert settings_custom['files'] == main.settings_default['files']
+        assert settings_custom['tables'] == main.settings_default['tables']
+        assert list(settings_file.sections) == ['general']
+
+        # Settings files saved by earlier versions of Wordless
+        settings_custom['general']['ui_settings']['font_size'] = 21
+
+        with open(file_path, 'wb') as f:
+            pickle.dump(settings_custom, f)
+
+        assert settings_file.load(main.settings_default) == settings_custom
+
+if __name__ == '__main__':
+    test_get_settings_delta()
+    test_apply_settings_delta()
+    test_copy_settings()
+    test_wl_settings_file()
@@ -29,6 +29,7 @@ def test_wl_settings_syl_tokenization():
     main.settings_syl_tokenization.load_settings(defaults = False)
     main.settings_syl_tokenization.load_settings(defaults = True)
     main.settings_syl_tokenization.apply_settings()
+    main.settings_syl_tokenization.clear_cache()
 
     main.settings_syl_tokenization.text_edit_preview_samples.setPlainText('')
     main.settings_syl_tokenization.preview_changed()
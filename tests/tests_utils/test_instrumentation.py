@@ -0,0 +1,107 @@
+# ----------------------------------------------------------------------
+# Tests: Utilities - Instrumentation
+# Copyright (C) 2018-2025  Ye Lei (叶磊)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------
+
+import json
+import os
+import tempfile
+import tracemalloc
+
+from wordless.wl_utils import wl_instrumentation
+
+@wl_instrumentation.log_stage('test/func')
+def func(num):
+    with wl_instrumentation.stage('test/nested', num_items = num):
+        return list(range(num))
+
+def test_stage():
+    # Not tracing
+    assert not wl_instrumentation.is_tracing()
+    assert func(10) == list(range(10))
+    assert wl_instrumentation.stop() is None
+
+    wl_instrumentation.start()
+
+    assert wl_instrumentation.is_tracing()
+
+    for _ in range(3):
+        func(10)
+
+    trace = wl_instrumentation.stop()
+
+    assert not wl_instrumentation.is_tracing()
+    assert trace.time_elapsed > 0
+    assert [stage[:3] for stage in trace.get_stages()] == [
+        ('test/func', 3, 0),
+        ('test/nested', 3, 30)
+    ]
+    # Memory usage is not tracked by default
+    assert trace.get_stages()[0][4] is None
+
+    # Nested calls
+    wl_instrumentation.start()
+    wl_instrumentation.start()
+
+    func(10)
+
+    assert wl_instrumentation.stop() is None
+
+    func(10)
+
+    trace = wl_instrumentation.stop()
+
+    assert trace.stages['test/func'][0] == 2
+
+def test_stage_mem():
+    wl_instrumentation.start(track_mem = True)
+
+    assert tracemalloc.is_tracing()
+
+    func(100000)
+
+    trace = wl_instrumentation.stop()
+
+    assert not tracemalloc.is_tracing()
+
+    stages = dict((stage[0], stage[1:]) for stage in trace.get_stages())
+
+    assert stages['test/nested'][3] > 0
+    # Peak memory usage of outer stages should include those of inner stages
+    assert stages['test/func'][3] >= stages['test/nested'][3]
+
+def test_dump():
+    wl_instrumentation.start()
+
+    func(10)
+
+    trace = wl_instrumentation.stop()
+
+    with tempfile.TemporaryDirectory() as dir_temp:
+        file_path = os.path.join(dir_temp, 'trace.json')
+        trace.dump(file_path)
+
+        with open(file_path, 'r', encoding = 'utf_8') as f:
+            trace_json = json.load(f)
+
+    assert [event['name'] for event in trace_json['traceEvents']] == ['test/nested', 'test/func']
+    assert all((event['ph'] == 'X' for event in trace_json['traceEvents']))
+    assert trace_json['otherData']['stages']['test/nested']['num_items'] == 10
+
+if __name__ == '__main__':
+    test_stage()
+    test_stage_mem()
+    test_dump()
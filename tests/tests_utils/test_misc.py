@@ -119,6 +119,40 @@ def test_normalize_nums():
     assert wl_misc.normalize_nums([1, 1, 1, 1, 1], 0, 100) == [50] * 5
     assert wl_misc.normalize_nums([1, 2, 3, 4, 5], 0, 0) == [0] * 5
 
+def test_wl_sampler_hits():
+    hits = list(range(100))
+
+    assert wl_misc.Wl_Sampler_Hits('none').sample(hits) == hits
+    assert wl_misc.Wl_Sampler_Hits('first', sample_size = 10).sample(hits) == hits[:10]
+    assert wl_misc.Wl_Sampler_Hits('first', sample_size = 1000).sample(hits) == hits
+
+    for seed in range(10):
+        sampler_hits = wl_misc.Wl_Sampler_Hits('reservoir', sample_size = 10, seed = seed)
+        hits_sampled = sampler_hits.sample(hits)
+
+        assert sampler_hits.num_hits == 100
+        assert len(hits_sampled) == 10
+        assert hits_sampled == sorted(set(hits_sampled))
+        # Samples should be reproducible with the same seed
+        assert wl_misc.Wl_Sampler_Hits('reservoir', sample_size = 10, seed = seed).sample(hits) == hits_sampled
+
+        hits_sampled = wl_misc.Wl_Sampler_Hits('systematic', sampling_interval = 10, seed = seed).sample(hits)
+
+        assert len(hits_sampled) == 10
+        assert all((hit_2 - hit_1 == 10 for hit_1, hit_2 in zip(hits_sampled, hits_sampled[1:])))
+
+    assert wl_misc.Wl_Sampler_Hits('reservoir', sample_size = 1000).sample(hits) == hits
+
+    # Only sampled hits need to be added
+    sampler_hits = wl_misc.Wl_Sampler_Hits('first', sample_size = 10)
+
+    for hit in hits:
+        if sampler_hits.keep_hit():
+            sampler_hits.add_hit(hit)
+
+    assert sampler_hits.get_hits() == hits[:10]
+    assert sampler_hits.num_hits == 100
+
 def test_check_noun_number():
     assert wl_misc.check_noun_number(0, 'test') == '0 tests'
     assert wl_misc.check_noun_number(0.5, 'test') == '0.5 tests'
@@ -139,4 +173,5 @@ if __name__ == '__main__':
     test_flatten_list()
     test_merge_dicts()
     test_normalize_nums()
+    test_wl_sampler_hits()
     test_check_noun_number()
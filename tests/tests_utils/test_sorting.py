@@ -37,6 +37,10 @@ def test_sorted_freq_files_items():
 
     assert wl_sorting.sorted_freq_files_items(freq_files_items, sort_by_col = 0, reverse = False) == freq_files_items_sorted_0
     assert wl_sorting.sorted_freq_files_items(freq_files_items, sort_by_col = 0, reverse = True) == freq_files_items_sorted_1
+    assert wl_sorting.sorted_freq_files_items(freq_files_items, sort_by_col = 0, top_k = 2) == freq_files_items_sorted_0[:2]
+    assert wl_sorting.sorted_freq_files_items(freq_files_items, sort_by_col = 0, reverse = True, top_k = 1) == freq_files_items_sorted_1[:1]
+    assert wl_sorting.sorted_freq_files_items(freq_files_items, top_k = 10) == freq_files_items_sorted_0
+    assert not wl_sorting.sorted_freq_files_items({})
 
 def test_sorted_freq_files_items_keyword_extractor():
     freq_files_items = {
@@ -57,6 +61,7 @@ def test_sorted_freq_files_items_keyword_extractor():
 
     assert wl_sorting.sorted_freq_files_items_keyword_extractor(freq_files_items, sort_by_col = 1, reverse = False) == freq_files_items_sorted_1
     assert wl_sorting.sorted_freq_files_items_keyword_extractor(freq_files_items, sort_by_col = 2, reverse = True) == freq_files_items_sorted_2
+    assert wl_sorting.sorted_freq_files_items_keyword_extractor(freq_files_items, sort_by_col = 1, top_k = 2) == freq_files_items_sorted_1[:2]
 
 def test_sorted_stats_files_items():
     stats_files_items = {
@@ -71,8 +76,32 @@ def test_sorted_stats_files_items():
     ]
 
     assert wl_sorting.sorted_stats_files_items(stats_files_items) == stats_files_items_sorted
+    assert wl_sorting.sorted_stats_files_items(stats_files_items, top_k = 1) == stats_files_items_sorted[:1]
+
+    # Statistics not computed
+    stats_files_items = {
+        'a': ((None, None, None, 10), (None, None, None, 10)),
+        'b': ((None, None, None, 20), (None, None, None, 10)),
+        'c': ((None, None, None, 10), (None, None, None, 10))
+    }
+    stats_files_items_sorted = [
+        ('b', ((None, None, None, 20), (None, None, None, 10))),
+        ('a', ((None, None, None, 10), (None, None, None, 10))),
+        ('c', ((None, None, None, 10), (None, None, None, 10)))
+    ]
+
+    assert wl_sorting.sorted_stats_files_items(stats_files_items) == stats_files_items_sorted
+
+def test_get_ranks():
+    vals_sorted = [10, 10, 5, 3, 3, 1]
+
+    assert wl_sorting.get_ranks(vals_sorted).tolist() == [1, 1, 3, 4, 4, 6]
+    assert wl_sorting.get_ranks(vals_sorted, continue_numbering_after_ties = True).tolist() == [1, 1, 2, 3, 3, 4]
+    assert wl_sorting.get_ranks(['a', 'a', 'b']).tolist() == [1, 1, 3]
+    assert not wl_sorting.get_ranks([]).tolist()
 
 if __name__ == '__main__':
     test_sorted_freq_files_items()
     test_sorted_freq_files_items_keyword_extractor()
     test_sorted_stats_files_items()
+    test_get_ranks()
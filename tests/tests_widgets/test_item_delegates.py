@@ -19,7 +19,10 @@
 from PyQt5 import QtWidgets
 
 from tests import wl_test_init
-from wordless.wl_widgets import wl_item_delegates
+from wordless.wl_widgets import (
+    wl_item_delegates,
+    wl_tables
+)
 
 main = wl_test_init.Wl_Test_Main()
 
@@ -35,6 +38,33 @@ def test_wl_item_delegate():
     item_delegate = wl_item_delegates.Wl_Item_Delegate(main)
     item_delegate.createEditor(main, 'test', 'test')
 
+def test_wl_item_delegate_num_data():
+    table = wl_tables.Wl_Table_Data(
+        main, tab = 'wordlist_generator',
+        headers = ('Frequency',), header_orientation = 'hor',
+        headers_int = {'Frequency'}, headers_cum = {'Frequency'}
+    )
+    table.model().setRowCount(2)
+    table.set_item_num(0, 0, 1000)
+    table.set_item_num(1, 0, 2000)
+
+    item_delegate = wl_item_delegates.Wl_Item_Delegate_Num_Data(main, table = table)
+    option = QtWidgets.QStyleOptionViewItem()
+
+    # Table settings are applied when cells are rendered
+    table.settings['tables']['misc_settings']['show_thousand_separators'] = False
+    item_delegate.initStyleOption(option, table.model().index(1, 0))
+
+    assert option.text == '2000'
+
+    table.table_settings['show_cum_data'] = True
+    table.toggle_cum_data()
+    item_delegate.initStyleOption(option, table.model().index(1, 0))
+
+    assert option.text == '3000'
+
+    table.settings['tables']['misc_settings']['show_thousand_separators'] = True
+
 def test_wl_item_delegate_combo_box():
     index_editable = wl_test_init.wl_test_index(0, 0)
     index_uneditable = wl_test_init.wl_test_index(0, 1)
@@ -53,5 +83,6 @@ def test_wl_item_delegate_combo_box_custom():
 if __name__ == '__main__':
     test_wl_item_delegate_uneditable()
     test_wl_item_delegate()
+    test_wl_item_delegate_num_data()
     test_wl_item_delegate_combo_box()
     test_wl_item_delegate_combo_box_custom()
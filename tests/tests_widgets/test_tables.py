@@ -290,6 +290,92 @@ def test_wl_table_data():
     table_hor.set_item_err(0, 0, 'test', alignment_hor = 'left')
     table_hor.set_item_err(0, 0, 'test', alignment_hor = 'right')
 
+def test_wl_table_data_num_data():
+    table = wl_tables.Wl_Table_Data(
+        main, tab = 'wordlist_generator',
+        headers = ('Frequency', 'Frequency %', 'Dispersion', 'p-value'), header_orientation = 'hor',
+        headers_int = {'Frequency'}, headers_pct = {'Frequency %'},
+        headers_float = {'Dispersion'}, headers_p_val = {'p-value'}
+    )
+
+    table.settings['tables']['misc_settings']['show_thousand_separators'] = True
+    table.model().setRowCount(2)
+
+    table.set_item_num(0, 0, 1000)
+    table.set_item_num(0, 1, 1, total = 3)
+    table.set_item_num(0, 2, 1234.5)
+    table.set_item_num(0, 3, 0.05)
+    table.set_item_err(1, 0, 'test')
+
+    precision_settings = table.settings['tables']['precision_settings']
+    precisions = precision_settings.copy()
+
+    # Changes of table settings take effect without modifying items
+    table.settings['tables']['misc_settings']['show_thousand_separators'] = False
+    precision_settings['precision_decimals'] = 1
+    precision_settings['precision_pcts'] = 0
+    precision_settings['precision_p_vals'] = 3
+
+    assert [table.get_item_text(0, col) for col in range(4)] == ['1000', '33%', '1234.5', '0.050']
+    assert table.model().item(0, 0).text() == '1,000'
+    # Error messages are left unchanged
+    assert table.get_num_text(1, 0) is None
+    assert table.get_item_text(1, 0) == 'test'
+
+    table.settings['tables']['misc_settings']['show_thousand_separators'] = True
+    precision_settings.update(precisions)
+
+def test_wl_table_data_cum_data():
+    table_hor = wl_tables.Wl_Table_Data(
+        main, tab = 'wordlist_generator',
+        headers = ('Frequency',), header_orientation = 'hor',
+        headers_int = {'Frequency'}, headers_cum = {'Frequency'}
+    )
+    table_vert = wl_tables.Wl_Table_Data(
+        main, tab = 'profiler',
+        headers = ('Count',), header_orientation = 'vert',
+        headers_int = {'Count'}, headers_cum = {'Count'}
+    )
+
+    table_hor.settings['tables']['misc_settings']['show_thousand_separators'] = True
+    table_hor.model().setRowCount(3)
+
+    for row, val in enumerate((1000, 200, 30)):
+        table_hor.set_item_num(row, 0, val)
+
+    table_hor.table_settings['show_cum_data'] = True
+    table_hor.toggle_cum_data()
+
+    assert [table_hor.get_item_text(row, 0) for row in range(3)] == ['1,000', '1,200', '1,230']
+    # Item texts are not modified
+    assert [table_hor.model().item(row, 0).text() for row in range(3)] == ['1,000', '200', '30']
+
+    table_hor.rows_filter = {1}
+    table_hor.filter_table()
+
+    assert [table_hor.get_item_text(row, 0) for row in (0, 2)] == ['1,000', '1,030']
+
+    table_hor.table_settings['show_cum_data'] = False
+    table_hor.toggle_cum_data()
+
+    assert [table_hor.get_item_text(row, 0) for row in range(3)] == ['1,000', '200', '30']
+    assert not table_hor.vals_cum
+
+    table_vert.model().setColumnCount(3)
+
+    for col, val in enumerate((1, 2, 3)):
+        table_vert.set_item_num(0, col, val)
+
+    table_vert.table_settings['show_cum_data'] = True
+    table_vert.toggle_cum_data()
+
+    # The total column is excluded
+    assert [table_vert.get_item_text(0, col) for col in range(3)] == ['1', '3', '3']
+
+    table_vert.clr_table()
+
+    assert not table_vert.vals_cum
+
 if __name__ == '__main__':
     test_wl_table()
     test_wl_worker_exp_table()
@@ -297,3 +383,5 @@ if __name__ == '__main__':
     test_wl_table_item()
     test_wl_table_item_err()
     test_wl_table_data()
+    test_wl_table_data_num_data()
+    test_wl_table_data_cum_data()
@@ -132,6 +132,30 @@ def test_wl_widgets_measures_collocation_keyword_extraction():
     wl_widgets.wl_widgets_measures_collocation_keyword_extraction(main, extraction_type = 'collocation')
     wl_widgets.wl_widgets_measures_collocation_keyword_extraction(main, extraction_type = 'keyword')
 
+def test_wl_widgets_sampling_settings():
+    (
+        _, combo_box_sampling_method,
+        _, spin_box_sample_size,
+        _, spin_box_sampling_interval,
+        _, spin_box_sampling_seed
+    ) = wl_widgets.wl_widgets_sampling_settings(main)
+
+    assert not spin_box_sample_size.isEnabled()
+    assert not spin_box_sampling_interval.isEnabled()
+    assert not spin_box_sampling_seed.isEnabled()
+
+    combo_box_sampling_method.setCurrentText('Reservoir sampling')
+
+    assert spin_box_sample_size.isEnabled()
+    assert not spin_box_sampling_interval.isEnabled()
+    assert spin_box_sampling_seed.isEnabled()
+
+    combo_box_sampling_method.setCurrentText('Systematic sampling')
+
+    assert not spin_box_sample_size.isEnabled()
+    assert spin_box_sampling_interval.isEnabled()
+    assert spin_box_sampling_seed.isEnabled()
+
 def test_wl_widgets_table_settings():
     table = QtWidgets.QTableView()
 
@@ -225,6 +249,7 @@ if __name__ == '__main__':
 
     test_wl_widgets_measures_wordlist_ngram_generation()
     test_wl_widgets_measures_collocation_keyword_extraction()
+    test_wl_widgets_sampling_settings()
 
     test_wl_widgets_table_settings()
 
@@ -0,0 +1,497 @@
+# ----------------------------------------------------------------------
+# Tests: Benchmarks
+# Copyright (C) 2018-2025  Ye Lei (叶磊)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------
+
+# Usage:
+#     python -m tests.wl_test_bench --sizes 10k 100k --save-baseline tests/wl_test_bench_baseline.json
+#     python -m tests.wl_test_bench --sizes 10k 100k --baseline tests/wl_test_bench_baseline.json
+
+import argparse
+import collections
+import fnmatch
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import traceback
+import tracemalloc
+
+import numpy
+
+from tests import (
+    wl_test_file_area,
+    wl_test_init
+)
+from wordless import (
+    wl_cli,
+    wl_colligation_extractor,
+    wl_collocation_extractor,
+    wl_concordancer,
+    wl_concordancer_parallel,
+    wl_dependency_parser,
+    wl_keyword_extractor,
+    wl_ngram_generator,
+    wl_profiler,
+    wl_wordlist_generator
+)
+from wordless.wl_measures import wl_measure_utils
+from wordless.wl_nlp import wl_token_processing
+
+SIZES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000
+}
+SEED = 42
+
+# Syllables used to build pseudo-words of synthetic corpora
+CONSONANTS = 'bcdfghjklmnprstvwz'
+VOWELS = 'aeiou'
+
+# Synthetic corpora
+def gen_vocab(vocab_size, seed = SEED):
+    rng = numpy.random.default_rng(seed)
+    syls = [f'{consonant}{vowel}' for consonant in CONSONANTS for vowel in VOWELS]
+    vocab = set()
+
+    while len(vocab) < vocab_size:
+        num_syls = rng.integers(1, 4)
+        vocab.add(''.join(rng.choice(syls, size = num_syls)))
+
+    return sorted(vocab)
+
+def gen_corpus(num_tokens, seed = SEED):
+    """Generate a text whose word frequencies follow Zipf's law.
+
+    The vocabulary depends only on the size of the corpus so that corpora generated with different seeds share most of their words.
+    """
+    vocab = gen_vocab(min(50_000, max(1000, num_tokens // 20)))
+    rng = numpy.random.default_rng(seed)
+
+    probs = 1 / numpy.arange(1, len(vocab) + 1) ** 1.07
+    probs /= probs.sum()
+
+    words = numpy.array(vocab)[rng.choice(len(vocab), size = num_tokens, p = probs)].tolist()
+    lens_sentences = rng.integers(5, 30, size = num_tokens // 5 + 1)
+
+    paras = []
+    sentences = []
+    i = 0
+
+    for len_sentence in lens_sentences:
+        if i >= num_tokens:
+            break
+
+        sentence = words[i : i + len_sentence]
+        sentence[0] = sentence[0].capitalize()
+        sentences.append(f"{' '.join(sentence)}.")
+
+        if len(sentences) == 10:
+            paras.append(' '.join(sentences))
+            sentences = []
+
+        i += len_sentence
+
+    if sentences:
+        paras.append(' '.join(sentences))
+
+    return '\n'.join(paras), vocab
+
+# Measurements
+def measure(func, repeat = 3, mem = True):
+    times = []
+
+    for _ in range(repeat):
+        gc.collect()
+
+        time_start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - time_start)
+
+    result = {'time': min(times)}
+
+    # Tracing memory allocations slows down execution, so memory usage is measured separately
+    # Peaks are traced from the start of each benchmark, unlike the peak resident set size of the process which never decreases between benchmarks
+    if mem:
+        gc.collect()
+
+        tracemalloc.start()
+        func()
+        result['mem_peak'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result
+
+# Benchmarks
+class Wl_Bench:
+    def __init__(self, main, corpus_name, file_paths, search_term, repeat = 3, mem = True, patterns = None):
+        self.main = main
+        self.corpus_name = corpus_name
+        self.file_paths = file_paths
+        self.search_term = search_term
+        self.repeat = repeat
+        self.mem = mem
+        self.patterns = patterns
+
+        self.dialog_progress = wl_cli.Wl_Progress_Cli(quiet = True)
+        self.results = {}
+
+    def run(self, name, func):
+        name = f'{name}[{self.corpus_name}]'
+
+        if self.patterns and not any((fnmatch.fnmatch(name, pattern) for pattern in self.patterns)):
+            return
+
+        try:
+            self.results[name] = measure(func, repeat = self.repeat, mem = self.mem)
+        except Exception: # pylint: disable=broad-exception-caught
+            self.results[name] = {'err': traceback.format_exc().strip().splitlines()[-1]}
+
+        print_result(name, self.results[name])
+
+    def open_files(self):
+        for file_type in ('', '_ref'):
+            self.main.settings_custom['file_area'][f'files_open{file_type}'].clear()
+
+        wl_cli.open_files(self.main, self.file_paths[:2], self.dialog_progress, file_type = 'observed')
+        wl_cli.open_files(self.main, self.file_paths[2:], self.dialog_progress, file_type = 'ref')
+
+        # Only the first file is analyzed except by the parallel concordancer
+        for file in self.main.settings_custom['file_area']['files_open'][1:]:
+            file['selected'] = False
+
+    def run_all(self):
+        settings = self.main.settings_custom
+
+        for tab in (
+            'ngram_generator', 'collocation_extractor', 'colligation_extractor',
+            'concordancer', 'concordancer_parallel', 'dependency_parser'
+        ):
+            settings[tab]['search_settings']['multi_search_mode'] = False
+            settings[tab]['search_settings']['search_term'] = self.search_term
+
+        # File area
+        self.run('file_area/open_files', self.open_files)
+        self.open_files()
+
+        text = self.main.settings_custom['file_area']['files_open'][0]['text']
+        text_ref = self.main.settings_custom['file_area']['files_open_ref'][0]['text']
+
+        # Token processing
+        self.run('token_processing/wl_process_tokens', lambda: wl_token_processing.wl_process_tokens(
+            self.main, text,
+            token_settings = settings['collocation_extractor']['token_settings']
+        ))
+        self.run('token_processing/wordlist_generator', lambda: wl_token_processing.wl_process_tokens_wordlist_generator(
+            self.main, text,
+            token_settings = settings['wordlist_generator']['token_settings'],
+            generation_settings = settings['wordlist_generator']['generation_settings']
+        ))
+        self.run('token_processing/ngram_generator', lambda: wl_token_processing.wl_process_tokens_ngram_generator(
+            self.main, text,
+            token_settings = settings['ngram_generator']['token_settings'],
+            search_settings = settings['ngram_generator']['search_settings']
+        ))
+        self.run('token_processing/concordancer', lambda: wl_token_processing.wl_process_tokens_concordancer(
+            self.main, text,
+            token_settings = settings['concordancer']['token_settings'],
+            search_settings = settings['concordancer']['search_settings']
+        ))
+        self.run('token_processing/profiler', lambda: wl_token_processing.wl_process_tokens_profiler(
+            self.main, text,
+            token_settings = settings['profiler']['token_settings'],
+            tab = 'all'
+        ))
+
+        # Workers
+        results_workers = {}
+
+        def run_worker(name, worker_cls, **kwargs):
+            results_workers[name] = wl_cli.run_worker(self.main, worker_cls, self.dialog_progress, **kwargs)
+
+        for tab, worker_cls in (
+            ('wordlist_generator', wl_wordlist_generator.Wl_Worker_Wordlist_Generator_Table),
+            ('ngram_generator', wl_ngram_generator.Wl_Worker_Ngram_Generator_Table),
+            ('collocation_extractor', wl_collocation_extractor.Wl_Worker_Collocation_Extractor_Table),
+            ('colligation_extractor', wl_colligation_extractor.Wl_Worker_Colligation_Extractor_Table),
+            ('keyword_extractor', wl_keyword_extractor.Wl_Worker_Keyword_Extractor_Table),
+            ('concordancer', wl_concordancer.Wl_Worker_Concordancer_Table),
+            ('dependency_parser', wl_dependency_parser.Wl_Worker_Dependency_Parser)
+        ):
+            self.run(f'workers/{tab}', lambda tab = tab, worker_cls = worker_cls: run_worker(tab, worker_cls))
+
+        for tab_profiler in ('readability', 'counts', 'lexical_density_diversity', 'syntactic_complexity', 'lens', 'len_breakdown'):
+            self.run(f'workers/profiler/{tab_profiler}', lambda tab_profiler = tab_profiler: run_worker(
+                'profiler',
+                wl_profiler.Wl_Worker_Profiler_Table,
+                tab = tab_profiler
+            ))
+
+        files = self.main.settings_custom['file_area']['files_open']
+
+        files[1]['selected'] = True
+        self.run('workers/concordancer_parallel', lambda: run_worker(
+            'concordancer_parallel',
+            wl_concordancer_parallel.Wl_Worker_Concordancer_Parallel_Table
+        ))
+        files[1]['selected'] = False
+
+        # Measures
+        self.run_measures(text.get_tokens_flat(), text_ref.get_tokens_flat())
+
+        # Tables
+        for tab, table_cls in (
+            ('wordlist_generator', wl_wordlist_generator.Wl_Table_Wordlist_Generator),
+            ('ngram_generator', wl_ngram_generator.Wl_Table_Ngram_Generator),
+            ('collocation_extractor', wl_collocation_extractor.Wl_Table_Collocation_Extractor),
+            ('concordancer', wl_concordancer.Wl_Table_Concordancer)
+        ):
+            if tab in results_workers:
+                table = table_cls(self.main)
+
+                self.run(f'tables/{tab}', lambda table = table, tab = tab: table.update_gui_table('', *results_workers[tab]))
+
+        return self.results
+
+    def run_measures(self, tokens, tokens_ref):
+        freqs = collections.Counter(tokens)
+        freqs_ref = collections.Counter(tokens_ref)
+        types = list(freqs | freqs_ref)
+
+        o11s = numpy.array([freqs.get(token, 0) for token in types], dtype = float)
+        o12s = numpy.array([freqs_ref.get(token, 0) for token in types], dtype = float)
+        o21s = len(tokens) - o11s
+        o22s = len(tokens_ref) - o12s
+
+        for measure_type, to_freqs_sections in (
+            ('measures_dispersion', wl_measure_utils.to_freqs_sections_dispersion),
+            ('measures_adjusted_freq', wl_measure_utils.to_freqs_sections_adjusted_freq)
+        ):
+            for measure, measure_settings in self.main.settings_global[measure_type].items():
+                if measure == 'none':
+                    continue
+
+                func = measure_settings['func']
+
+                # Same as in the wordlist generator
+                if measure_settings['type'] == 'parts_based':
+                    def run_measure(func = func, to_freqs_sections = to_freqs_sections):
+                        freqs_sections_tokens = to_freqs_sections(self.main, items_to_search = types, items = tokens)
+
+                        for freqs_sections in freqs_sections_tokens.values():
+                            func(self.main, freqs_sections)
+                elif measure_settings['type'] == 'dist_based':
+                    def run_measure(func = func):
+                        for token in types:
+                            func(self.main, tokens, token)
+
+                self.run(f'{measure_type}/{measure}', run_measure)
+
+        for measure_type, to_freqs_sections, arg_measure in (
+            ('tests_statistical_significance', wl_measure_utils.to_freqs_sections_statistical_significance, 'test_statistical_significance'),
+            ('measures_bayes_factor', wl_measure_utils.to_freqs_sections_bayes_factor, 'measure_bayes_factor'),
+            ('measures_effect_size', None, None)
+        ):
+            for measure, measure_settings in self.main.settings_global[measure_type].items():
+                if measure == 'none':
+                    continue
+
+                func = measure_settings['func']
+
+                # Same as in the keyword extractor
+                if measure_settings.get('to_sections'):
+                    def run_measure(func = func, to_freqs_sections = to_freqs_sections, arg_measure = arg_measure, measure = measure):
+                        freqs_sections_tokens = to_freqs_sections(
+                            self.main,
+                            items_to_search = types,
+                            items_x1 = tokens,
+                            items_x2 = tokens_ref,
+                            **{arg_measure: measure}
+                        )
+
+                        freqs_x1s = numpy.array([freqs_sections_tokens[token][0] for token in types], dtype = float)
+                        freqs_x2s = numpy.array([freqs_sections_tokens[token][1] for token in types], dtype = float)
+
+                        func(self.main, freqs_x1s, freqs_x2s)
+                # Only used by the collocation extractor
+                elif measure == 'z_test_berry_rogghe':
+                    def run_measure(func = func):
+                        func(self.main, o11s, o12s, o21s, o22s, span = 5)
+                else:
+                    def run_measure(func = func):
+                        func(self.main, o11s, o12s, o21s, o22s)
+
+                self.run(f'{measure_type}/{measure}', run_measure)
+
+# Results
+def format_bytes(num_bytes):
+    if num_bytes is None:
+        return '-'
+
+    return f'{num_bytes / 1024 ** 2:.1f} MB'
+
+def print_result(name, result):
+    if 'err' in result:
+        print(f"{name:<72} ERROR: {result['err']}", flush = True)
+    else:
+        print(f"{name:<72} {result['time']:>10.4f} s {format_bytes(result.get('mem_peak')):>12}", flush = True)
+
+def compare_results(results, results_baseline, tolerance, patterns = None, corpus_names = None):
+    regressions = []
+
+    for name, result in results.items():
+        result_baseline = results_baseline.get(name)
+
+        if not result_baseline:
+            continue
+
+        # Benchmarks which pass in the baseline but fail now
+        if 'err' in result:
+            if 'err' not in result_baseline:
+                regressions.append((name, 'err', None, result['err'], None))
+
+            continue
+
+        if 'err' in result_baseline:
+            continue
+
+        for key in ('time', 'mem_peak'):
+            if result.get(key) is not None and result_baseline.get(key):
+                ratio = result[key] / result_baseline[key]
+
+                if ratio > 1 + tolerance:
+                    regressions.append((name, key, result_baseline[key], result[key], ratio))
+
+    # Benchmarks in the baseline which should have been run but are missing from the results
+    for name in sorted(results_baseline.keys() - results.keys()):
+        if (
+            (not patterns or any((fnmatch.fnmatch(name, pattern) for pattern in patterns)))
+            and (corpus_names is None or any((name.endswith(f'[{corpus_name}]') for corpus_name in corpus_names)))
+        ):
+            regressions.append((name, 'missing', None, None, None))
+
+    return regressions
+
+def get_meta(args):
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': numpy.__version__,
+        'seed': args.seed,
+        'sizes': args.sizes,
+        'repeat': args.repeat
+    }
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(
+        prog = 'python -m tests.wl_test_bench',
+        description = 'Benchmark opening files, token processing, workers, measures, and table rendering on synthetic and bundled corpora.'
+    )
+
+    parser.add_argument('--sizes', nargs = '+', default = ['10k', '100k'], choices = list(SIZES), help = 'sizes of synthetic corpora')
+    parser.add_argument('--bundled', action = 'store_true', help = 'also benchmark the corpora bundled with tests')
+    parser.add_argument('--seed', type = int, default = SEED, help = 'seed used to generate synthetic corpora')
+    parser.add_argument('--repeat', type = int, default = 3, help = 'number of runs of each benchmark (the fastest run is recorded)')
+    parser.add_argument('--no-mem', action = 'store_true', help = 'do not measure peak memory allocations')
+    parser.add_argument('-k', '--filter', nargs = '+', dest = 'patterns', help = 'only run benchmarks whose names match the patterns (e.g. "measures_dispersion/*")')
+    parser.add_argument('--save-baseline', help = 'path of the JSON file to save results to')
+    parser.add_argument('--baseline', help = 'path of the JSON file of results to compare against')
+    parser.add_argument('--tolerance', type = float, default = .2, help = 'relative slowdown or memory increase reported as a regression')
+
+    args = parser.parse_args(argv)
+
+    main_wl = wl_test_init.Wl_Test_Main(switch_lang_utils = 'fast')
+    results = {}
+
+    with tempfile.TemporaryDirectory() as dir_temp:
+        main_wl.settings_custom['general']['imp']['temp_files']['default_path'] = os.path.join(dir_temp, 'imports')
+
+        main_wl.settings_custom['file_area']['dialog_open_corpora']['auto_detect_encodings'] = False
+        main_wl.settings_custom['file_area']['dialog_open_corpora']['auto_detect_langs'] = False
+        main_wl.settings_custom['files']['default_settings']['encoding'] = 'utf_8'
+        main_wl.settings_custom['files']['default_settings']['lang'] = 'eng_us'
+
+        corpora = []
+
+        for size in args.sizes:
+            file_paths = []
+
+            # 2 observed files and 1 reference file
+            for i in range(3):
+                text, vocab = gen_corpus(SIZES[size], seed = args.seed + i)
+                file_paths.append(os.path.join(dir_temp, f'synthetic_{size}_{i}.txt'))
+
+                with open(file_paths[-1], 'w', encoding = 'utf_8') as f:
+                    f.write(text)
+
+            corpora.append((f'synthetic_{size}', file_paths, vocab[0]))
+
+        if args.bundled:
+            file_paths = wl_test_file_area.FILES_TESTS
+
+            corpora.append(('bundled', [file_paths[0], file_paths[1 % len(file_paths)], file_paths[-1]], 'take'))
+
+        for corpus_name, file_paths, search_term in corpora:
+            print(f'Corpus: {corpus_name}', flush = True)
+
+            bench = Wl_Bench(
+                main_wl, corpus_name, file_paths, search_term,
+                repeat = args.repeat,
+                mem = not args.no_mem,
+                patterns = args.patterns
+            )
+            results.update(bench.run_all())
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding = 'utf_8') as f:
+            json.dump({'meta': get_meta(args), 'results': results}, f, ensure_ascii = False, indent = 4)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding = 'utf_8') as f:
+            baseline = json.load(f)
+
+        if (meta := get_meta(args)) != baseline['meta']:
+            print(f"Warning: the baseline was recorded with different settings ({baseline['meta']}) from the current ones ({meta}).")
+
+        regressions = compare_results(
+            results, baseline['results'], args.tolerance,
+            patterns = args.patterns,
+            corpus_names = [corpus_name for corpus_name, _, _ in corpora]
+        )
+
+        for name, key, val_baseline, val, ratio in regressions:
+            match key:
+                case 'err':
+                    print(f'Regression: {name} fails: {val}')
+                case 'missing':
+                    print(f'Regression: {name} is missing from the results')
+                case _:
+                    print(f'Regression: {name} ({key}): {val_baseline:.4g} -> {val:.4g} ({ratio:.2f}x)')
+
+        if regressions:
+            return 1
+
+        print('No regressions found.')
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -40,7 +40,10 @@ from wordless.wl_settings import (
     wl_settings_global
 )
 from wordless.wl_utils import wl_misc
-from wordless.wl_widgets import wl_tables
+from wordless.wl_widgets import (
+    wl_item_delegates,
+    wl_tables
+)
 
 # English
 SEARCH_TERMS = ['take', 'ལ་']
@@ -251,11 +254,14 @@ class Wl_Test_Table(wl_tables.Wl_Table_Data):
         self.rows_filter = set()
         self.rows_sample = set()
 
+        self.vals_cum = {}
+
         self.settings_global = wl_settings_global.init_settings_global()
         self.settings = wl_settings_default.init_settings_default(self)
 
         self.setModel(QtGui.QStandardItemModel())
         self.model().table = self
+        self.setItemDelegate(wl_item_delegates.Wl_Item_Delegate_Num_Data(self, table = self))
 
         if headers is not None:
             self.model().setHorizontalHeaderLabels(self.headers)
@@ -70,11 +70,14 @@ def check_file_paths_dup(main, new_file_paths, file_paths = None):
         if file_paths is None:
             file_paths = [file['path_orig'] for file in main.settings_custom['file_area']['files_open']]
 
+        file_paths = set(file_paths)
+
         for new_file_path in new_file_paths:
-            if new_file_path in file_paths + file_paths_ok:
+            if new_file_path in file_paths:
                 file_paths_dup.append(new_file_path)
             else:
                 file_paths_ok.append(new_file_path)
+                file_paths.add(new_file_path)
 
     return file_paths_ok, file_paths_dup
 
@@ -37,6 +37,22 @@ def check_custom_settings(settings_custom, settings_default):
 
     return bool(keys_custom == keys_default)
 
+# Only keys in the differences are checked
+def check_settings_delta(settings_delta, settings_default):
+    for key, value in settings_delta.items():
+        if key not in settings_default:
+            return False
+
+        value_default = settings_default[key]
+
+        if isinstance(value_default, dict):
+            if not isinstance(value, dict) or not check_settings_delta(value, value_default):
+                return False
+        elif isinstance(value, dict):
+            return False
+
+    return True
+
 def check_dir(dir_name):
     if not os.path.exists(dir_name):
         pathlib.Path(dir_name).mkdir(parents = True, exist_ok = True)
@@ -45,7 +61,10 @@ def check_dir(dir_name):
 
 def check_new_name(new_name, names, separator = None):
     i = 2
-    names = set(names)
+
+    # Sets of names are not copied so that they could be updated and reused by callers
+    if not isinstance(names, (set, frozenset)):
+        names = set(names)
 
     if new_name in names:
         while True:
@@ -212,6 +212,13 @@ def check_err_table(main, err_msg):
     if not err_msg:
         main.statusBar().showMessage(_tr('wl_checks_work_area', 'Table generated successfully.'))
 
+# Report the total number of hits if only some of them are sampled
+def check_err_table_hits(main, err_msg, num_hits_sampled, num_hits):
+    check_err_table(main, err_msg)
+
+    if not err_msg and num_hits_sampled < num_hits:
+        main.statusBar().showMessage(_tr('wl_checks_work_area', 'Table generated successfully. {} out of {} hits have been sampled.').format(num_hits_sampled, num_hits))
+
 def check_err_fig(main, err_msg):
     check_err(main, err_msg)
 
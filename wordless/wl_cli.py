@@ -0,0 +1,345 @@
+# ----------------------------------------------------------------------
+# Wordless: Command-line interface
+# Copyright (C) 2018-2025  Ye Lei (叶磊)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------
+
+# Usage: python -m wordless.wl_cli wordlist_generator file_1.txt file_2.txt -o results.xlsx
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import types
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from wordless import (
+    wl_colligation_extractor,
+    wl_collocation_extractor,
+    wl_file_area,
+    wl_keyword_extractor,
+    wl_ngram_generator,
+    wl_wordlist_generator
+)
+from wordless.wl_checks import (
+    wl_checks_misc,
+    wl_checks_work_area
+)
+from wordless.wl_settings import (
+    wl_settings_default,
+    wl_settings_global,
+    wl_settings_persistence
+)
+from wordless.wl_widgets import wl_tables
+
+_tr = QtCore.QCoreApplication.translate
+
+WORKERS = {
+    'wordlist_generator': wl_wordlist_generator.Wl_Worker_Wordlist_Generator_Table,
+    'ngram_generator': wl_ngram_generator.Wl_Worker_Ngram_Generator_Table,
+    'collocation_extractor': wl_collocation_extractor.Wl_Worker_Collocation_Extractor_Table,
+    'colligation_extractor': wl_colligation_extractor.Wl_Worker_Colligation_Extractor_Table,
+    'keyword_extractor': wl_keyword_extractor.Wl_Worker_Keyword_Extractor_Table
+}
+# Results are put into the same tables as in the GUI so that they are exported in the same way
+TABLES = {
+    'wordlist_generator': wl_wordlist_generator.Wl_Table_Wordlist_Generator,
+    'ngram_generator': wl_ngram_generator.Wl_Table_Ngram_Generator,
+    'collocation_extractor': wl_collocation_extractor.Wl_Table_Collocation_Extractor,
+    'colligation_extractor': wl_colligation_extractor.Wl_Table_Colligation_Extractor,
+    'keyword_extractor': wl_keyword_extractor.Wl_Table_Keyword_Extractor
+}
+
+# Analyses which require search terms
+TABS_SEARCH_TERMS = {'ngram_generator', 'collocation_extractor', 'colligation_extractor'}
+
+class Wl_Exc_Cli(Exception):
+    pass
+
+# The QApplication instance is required by the default settings and the workers, though no windows are ever shown
+def get_app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+
+class Wl_Main_Cli(QtWidgets.QMainWindow):
+    def __init__(self, path_settings = None):
+        app = get_app()
+
+        super().__init__()
+
+        self.app = app
+
+        # Global and default settings
+        self.settings_global = wl_settings_global.init_settings_global()
+        self.settings_default = wl_settings_default.init_settings_default(self)
+
+        # Custom settings
+        self.settings_custom = wl_settings_persistence.copy_settings(self.settings_default)
+
+        if path_settings:
+            # Only settings different from default settings are saved
+            settings_delta = wl_settings_persistence.read_settings(path_settings)[0]
+
+            if not wl_checks_misc.check_settings_delta(settings_delta, self.settings_default):
+                raise Wl_Exc_Cli(_tr('wl_cli', 'The settings file "{}" is not compatible with the current version of Wordless.').format(path_settings))
+
+            wl_settings_persistence.apply_settings_delta(self.settings_custom, settings_delta)
+
+        # Files opened in the GUI are not restored
+        for file_type in ('', '_ref'):
+            self.settings_custom['file_area'][f'files_open{file_type}'] = []
+            self.settings_custom['file_area'][f'files_closed{file_type}'] = []
+
+        # Work area, to which dialogs of tables are connected
+        self.wl_work_area = QtWidgets.QTabWidget(self)
+
+        # File area
+        self.wl_file_area = Wl_File_Area_Cli(self, file_type = 'observed')
+        self.wl_file_area_ref = Wl_File_Area_Cli(self, file_type = 'ref')
+
+        # Menu items updated by tables
+        self.action_edit_results_search = QtWidgets.QAction(self)
+        self.action_edit_results_filter = QtWidgets.QAction(self)
+        self.action_edit_results_sample = QtWidgets.QAction(self)
+        self.action_edit_results_sort = QtWidgets.QAction(self)
+
+class Wl_File_Area_Cli:
+    get_files = wl_file_area.Wrapper_File_Area.get_files
+    get_file_names = wl_file_area.Wrapper_File_Area.get_file_names
+    get_selected_files = wl_file_area.Wrapper_File_Area.get_selected_files
+    get_selected_file_names = wl_file_area.Wrapper_File_Area.get_selected_file_names
+    find_file_by_name = wl_file_area.Wrapper_File_Area.find_file_by_name
+    find_files_by_name = wl_file_area.Wrapper_File_Area.find_files_by_name
+
+    def __init__(self, main, file_type = 'observed'):
+        self.main = main
+        self.file_type = file_type
+
+        if self.file_type == 'observed':
+            self.settings_suffix = ''
+        elif self.file_type == 'ref':
+            self.settings_suffix = '_ref'
+
+        # Changes of files are watched by tables
+        self.table_files = QtWidgets.QTableView()
+        self.table_files.setModel(QtGui.QStandardItemModel())
+
+class Wl_Progress_Cli(QtCore.QObject):
+    def __init__(self, quiet = False):
+        super().__init__()
+
+        self.quiet = quiet
+
+    def update_progress(self, text):
+        if not self.quiet:
+            print(text, file = sys.stderr, flush = True)
+
+def run_worker(main, worker_cls, dialog_progress, **kwargs):
+    results = []
+
+    worker = worker_cls(main, dialog_progress = dialog_progress, **kwargs)
+    worker.finished.connect(lambda *args: results.extend(args))
+    # Run in the current thread since there is no event loop to wait for
+    worker.run()
+
+    err_msg = results[0]
+
+    if err_msg:
+        raise Wl_Exc_Cli(err_msg)
+
+    return results[1:]
+
+def open_files(main, file_paths, dialog_progress, file_type = 'observed'):
+    if file_type == 'observed':
+        file_area = main.wl_file_area
+    elif file_type == 'ref':
+        file_area = main.wl_file_area_ref
+
+    new_files, = run_worker(
+        main, wl_file_area.Wl_Worker_Add_Files, dialog_progress,
+        file_paths = file_paths,
+        table = types.SimpleNamespace(files_to_open = []),
+        file_area = file_area
+    )
+    new_files, = run_worker(
+        main, wl_file_area.Wl_Worker_Open_Files, dialog_progress,
+        files_to_open = new_files,
+        file_type = file_type
+    )
+
+    file_area.get_files().extend(new_files)
+
+    return new_files
+
+# Results
+def gen_table(main, tab, results):
+    # Check for results before the table is generated, since there are no windows in which to report errors
+    if not any(results[0]):
+        raise Wl_Exc_Cli(_tr('wl_cli', 'Data processing has completed successfully, but there are no results to export.'))
+
+    table = TABLES[tab](main)
+    table.table_settings.update(main.settings_custom[tab]['table_settings'])
+    table.update_gui_table('', *results)
+
+    if table.is_empty():
+        raise Wl_Exc_Cli(_tr('wl_cli', 'An error occurred while generating the table of {}.').format(tab))
+
+    return table
+
+def exp_table(main, table, file_path, dialog_progress):
+    run_worker(
+        main, wl_tables.Wl_Worker_Exp_Table, dialog_progress,
+        table = table,
+        file_path = file_path,
+        # Tables are exported to CSV files unless Excel workbooks are specified
+        file_type = '(*.xlsx)' if os.path.splitext(file_path)[1].lower() == '.xlsx' else '(*.csv)',
+        rows_to_exp = table.get_visible_rows()
+    )
+
+def run_task(args):
+    tab, file_paths, file_paths_ref, file_path_exp, options = args
+
+    main = Wl_Main_Cli(path_settings = options['settings'])
+    dialog_progress = Wl_Progress_Cli(quiet = options['quiet'])
+
+    # Search terms
+    if tab in TABS_SEARCH_TERMS:
+        search_settings = main.settings_custom[tab]['search_settings']
+
+        if options['search_terms']:
+            search_settings['multi_search_mode'] = True
+            search_settings['search_terms'] = options['search_terms']
+
+        if not wl_checks_work_area.check_search_terms(main, search_settings, show_warning = False):
+            raise Wl_Exc_Cli(_tr('wl_cli', 'No search terms have been specified for {}.').format(tab))
+
+    with tempfile.TemporaryDirectory() as dir_temp:
+        main.settings_custom['general']['imp']['temp_files']['default_path'] = dir_temp
+
+        # Settings of files
+        settings_files = main.settings_custom['files']['default_settings']
+        settings_open_corpora = main.settings_custom['file_area']['dialog_open_corpora']
+
+        if options['encoding']:
+            settings_files['encoding'] = options['encoding']
+            settings_open_corpora['auto_detect_encodings'] = False
+
+        if options['lang']:
+            settings_files['lang'] = options['lang']
+            settings_open_corpora['auto_detect_langs'] = False
+
+        settings_files['tokenized'] = options['tokenized']
+        settings_files['tagged'] = options['tagged']
+
+        open_files(main, file_paths, dialog_progress, file_type = 'observed')
+
+        if tab == 'keyword_extractor':
+            open_files(main, file_paths_ref, dialog_progress, file_type = 'ref')
+
+        results = run_worker(main, WORKERS[tab], dialog_progress)
+
+        table = gen_table(main, tab, results)
+        exp_table(main, table, file_path_exp, dialog_progress)
+
+    return file_path_exp
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog = 'python -m wordless.wl_cli',
+        description = 'Run Wordless analyses without the graphical user interface and export the results to CSV files or Excel workbooks.'
+    )
+
+    parser.add_argument('task', choices = list(WORKERS), help = 'the analysis to run')
+    parser.add_argument('files', nargs = '+', help = 'observed files')
+    parser.add_argument('-o', '--output', required = True, help = 'path of the exported table (*.csv or *.xlsx)')
+    parser.add_argument('-r', '--ref', nargs = '+', default = [], help = 'reference files (required by keyword_extractor)')
+    parser.add_argument('-s', '--settings', help = 'path of a settings file saved by Wordless (wl_settings.pickle)')
+    parser.add_argument(
+        '-t', '--search-term', action = 'append', default = [], dest = 'search_terms',
+        help = 'search term (may be repeated) used by ngram_generator, collocation_extractor, and colligation_extractor'
+    )
+    parser.add_argument('--lang', help = 'language code of the files (e.g. eng_us), disabling language detection')
+    parser.add_argument('--encoding', help = 'encoding of the files (e.g. utf_8), disabling encoding detection')
+    parser.add_argument('--tokenized', action = 'store_true', help = 'the files are already tokenized')
+    parser.add_argument('--tagged', action = 'store_true', help = 'the files are already tagged')
+    parser.add_argument(
+        '--per-file', action = 'store_true',
+        help = 'analyze each file separately and export one table per file (OUTPUT_<file name>.csv/xlsx)'
+    )
+    parser.add_argument('-j', '--jobs', type = int, default = 1, help = 'number of processes used with --per-file (0 to use all cores)')
+    parser.add_argument('-q', '--quiet', action = 'store_true', help = 'do not print progress')
+
+    return parser
+
+def main(argv = None):
+    multiprocessing.freeze_support()
+
+    # Windows are never shown in batch mode
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    if args.task == 'keyword_extractor' and not args.ref:
+        parser.error(_tr('wl_cli', 'reference files must be specified with --ref for keyword_extractor'))
+
+    options = {
+        'settings': args.settings,
+        'lang': args.lang,
+        'encoding': args.encoding,
+        'tokenized': args.tokenized,
+        'tagged': args.tagged,
+        'search_terms': args.search_terms,
+        'quiet': args.quiet
+    }
+
+    if args.per_file:
+        output_stem, output_ext = os.path.splitext(args.output)
+        tasks = []
+        file_names = set()
+
+        for file_path in args.files:
+            # Files with the same name (e.g. a/x.txt and b/x.docx) are exported to different tables
+            file_name = wl_checks_misc.check_new_name(
+                os.path.splitext(os.path.basename(file_path))[0],
+                file_names
+            )
+            file_names.add(file_name)
+
+            tasks.append((args.task, [file_path], args.ref, f'{output_stem}_{file_name}{output_ext}', options))
+    else:
+        tasks = [(args.task, args.files, args.ref, args.output, options)]
+
+    num_jobs = min(args.jobs if args.jobs > 0 else os.cpu_count(), len(tasks))
+
+    try:
+        if num_jobs > 1:
+            # Each process creates its own QApplication instance
+            with multiprocessing.get_context('spawn').Pool(num_jobs) as pool:
+                for file_path_exp in pool.imap(run_task, tasks):
+                    print(file_path_exp)
+        else:
+            for task in tasks:
+                print(run_task(task))
+    except Wl_Exc_Cli as exc:
+        print(str(exc), file = sys.stderr)
+
+        return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
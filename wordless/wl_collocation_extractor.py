@@ -42,6 +42,7 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import (
     wl_excs,
+    wl_instrumentation,
     wl_misc,
     wl_sorting,
     wl_threading
@@ -591,6 +592,7 @@ class Wl_Table_Collocation_Extractor(wl_tables.Wl_Table_Data):
                     self.update_gui_table
                 )
 
+    @wl_instrumentation.log_stage('tables/collocation_extractor')
     def update_gui_table(self, err_msg, collocations_freqs_files, collocations_stats_files):
         if wl_checks_work_area.check_results(self.main, err_msg, collocations_freqs_files):
             try:
@@ -857,6 +859,7 @@ class Wl_Table_Collocation_Extractor(wl_tables.Wl_Table_Data):
                     self.update_gui_fig
                 )
 
+    @wl_instrumentation.log_stage('figs/collocation_extractor')
     def update_gui_fig(self, err_msg, collocations_freqs_files, collocations_stats_files):
         if wl_checks_work_area.check_results(self.main, err_msg, collocations_freqs_files):
             hide_dialog_err_fatal = False
@@ -1257,22 +1260,25 @@ class Wl_Worker_Collocation_Extractor(wl_threading.Wl_Worker):
                         test_stats = [None] * num_collocations_all
                         p_vals = [None] * num_collocations_all
                     else:
-                        if test_statistical_significance == 'z_test_berry_rogghe':
-                            test_stats, p_vals = func_statistical_significance(self.main, o11s, o12s, o21s, o22s, span)
-                        else:
-                            test_stats, p_vals = func_statistical_significance(self.main, o11s, o12s, o21s, o22s)
+                        with wl_instrumentation.stage('measures/statistical_significance', num_items = num_collocations_all):
+                            if test_statistical_significance == 'z_test_berry_rogghe':
+                                test_stats, p_vals = func_statistical_significance(self.main, o11s, o12s, o21s, o22s, span)
+                            else:
+                                test_stats, p_vals = func_statistical_significance(self.main, o11s, o12s, o21s, o22s)
 
                     # Bayes Factor
                     if measure_bayes_factor == 'none':
                         bayes_factors = [None] * num_collocations_all
                     else:
-                        bayes_factors = func_bayes_factor(self.main, o11s, o12s, o21s, o22s)
+                        with wl_instrumentation.stage('measures/bayes_factor', num_items = num_collocations_all):
+                            bayes_factors = func_bayes_factor(self.main, o11s, o12s, o21s, o22s)
 
                     # Effect Size
                     if measure_effect_size == 'none':
                         effect_sizes = [None] * num_collocations_all
                     else:
-                        effect_sizes = func_effect_size(self.main, o11s, o12s, o21s, o22s)
+                        with wl_instrumentation.stage('measures/effect_size', num_items = num_collocations_all):
+                            effect_sizes = func_effect_size(self.main, o11s, o12s, o21s, o22s)
 
                     for i, (node, collocate) in enumerate(collocations_all):
                         if not self._running:
@@ -19,6 +19,7 @@
 # pylint: disable=broad-exception-caught
 import bisect
 import copy
+import itertools
 import traceback
 
 import matplotlib
@@ -39,6 +40,7 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import (
     wl_excs,
+    wl_instrumentation,
     wl_misc,
     wl_threading
 )
@@ -216,6 +218,13 @@ class Wrapper_Concordancer(wl_layouts.Wl_Wrapper):
         self.spin_box_context_len_right_sentence.setRange(0, 1000)
         self.spin_box_context_len_right_para.setRange(0, 100)
 
+        (
+            self.label_sampling_method, self.combo_box_sampling_method,
+            self.label_sample_size, self.spin_box_sample_size,
+            self.label_sampling_interval, self.spin_box_sampling_interval,
+            self.label_sampling_seed, self.spin_box_sampling_seed
+        ) = wl_widgets.wl_widgets_sampling_settings(self)
+
         self.checkbox_calc_sentiment_scores.stateChanged.connect(self.generation_settings_changed)
 
         self.spin_box_context_len_left_char.valueChanged.connect(self.generation_settings_changed)
@@ -230,6 +239,11 @@ class Wrapper_Concordancer(wl_layouts.Wl_Wrapper):
         self.spin_box_context_len_right_para.valueChanged.connect(self.generation_settings_changed)
         self.combo_box_context_len_unit.currentTextChanged.connect(self.generation_settings_changed)
 
+        self.combo_box_sampling_method.currentTextChanged.connect(self.generation_settings_changed)
+        self.spin_box_sample_size.valueChanged.connect(self.generation_settings_changed)
+        self.spin_box_sampling_interval.valueChanged.connect(self.generation_settings_changed)
+        self.spin_box_sampling_seed.valueChanged.connect(self.generation_settings_changed)
+
         self.group_box_generation_settings.setLayout(wl_layouts.Wl_Layout())
         self.group_box_generation_settings.layout().addWidget(self.checkbox_calc_sentiment_scores, 0, 0, 1, 2)
 
@@ -240,6 +254,17 @@ class Wrapper_Concordancer(wl_layouts.Wl_Wrapper):
         self.group_box_generation_settings.layout().addWidget(self.label_context_len_unit, 3, 0)
         self.group_box_generation_settings.layout().addWidget(self.combo_box_context_len_unit, 3, 1)
 
+        self.group_box_generation_settings.layout().addWidget(wl_layouts.Wl_Separator(self), 4, 0, 1, 2)
+
+        self.group_box_generation_settings.layout().addWidget(self.label_sampling_method, 5, 0)
+        self.group_box_generation_settings.layout().addWidget(self.combo_box_sampling_method, 5, 1)
+        self.group_box_generation_settings.layout().addWidget(self.label_sample_size, 6, 0)
+        self.group_box_generation_settings.layout().addWidget(self.spin_box_sample_size, 6, 1)
+        self.group_box_generation_settings.layout().addWidget(self.label_sampling_interval, 7, 0)
+        self.group_box_generation_settings.layout().addWidget(self.spin_box_sampling_interval, 7, 1)
+        self.group_box_generation_settings.layout().addWidget(self.label_sampling_seed, 8, 0)
+        self.group_box_generation_settings.layout().addWidget(self.spin_box_sampling_seed, 8, 1)
+
         self.group_box_generation_settings.layout().setColumnStretch(1, 1)
 
         # Table Settings
@@ -356,6 +381,11 @@ class Wrapper_Concordancer(wl_layouts.Wl_Wrapper):
         self.spin_box_context_len_right_para.setValue(settings['generation_settings']['context_len_right_para'])
         self.combo_box_context_len_unit.setCurrentText(settings['generation_settings']['context_len_unit'])
 
+        self.combo_box_sampling_method.setCurrentText(settings['generation_settings']['sampling_method'])
+        self.spin_box_sample_size.setValue(settings['generation_settings']['sample_size'])
+        self.spin_box_sampling_interval.setValue(settings['generation_settings']['sampling_interval'])
+        self.spin_box_sampling_seed.setValue(settings['generation_settings']['sampling_seed'])
+
         # Table Settings
         self.checkbox_show_pct_data.setChecked(settings['table_settings']['show_pct_data'])
 
@@ -418,6 +448,11 @@ class Wrapper_Concordancer(wl_layouts.Wl_Wrapper):
         settings['context_len_right_para'] = self.spin_box_context_len_right_para.value()
         settings['context_len_unit'] = self.combo_box_context_len_unit.currentText()
 
+        settings['sampling_method'] = self.combo_box_sampling_method.currentText()
+        settings['sample_size'] = self.spin_box_sample_size.value()
+        settings['sampling_interval'] = self.spin_box_sampling_interval.value()
+        settings['sampling_seed'] = self.spin_box_sampling_seed.value()
+
         # Unit of context length
         if settings['context_len_unit'] == self.tr('Character'):
             self.stacked_widget_context_len_left.setCurrentIndex(0)
@@ -514,7 +549,8 @@ class Wl_Table_Concordancer(wl_tables.Wl_Table_Data):
                     self.update_gui_table
                 )
 
-    def update_gui_table(self, err_msg, concordance_lines):
+    @wl_instrumentation.log_stage('tables/concordancer')
+    def update_gui_table(self, err_msg, concordance_lines, num_hits):
         if wl_checks_work_area.check_results(self.main, err_msg, concordance_lines):
             try:
                 self.settings = copy.deepcopy(self.main.settings_custom)
@@ -537,16 +573,18 @@ class Wl_Table_Concordancer(wl_tables.Wl_Table_Data):
                 node_color = self.main.settings_custom['tables']['concordancer']['sorting_settings']['highlight_colors']['lvl_1']
 
                 for i, concordance_line in enumerate(concordance_lines):
-                    left_tokens_raw, left_tokens_search = concordance_line[0]
-                    node_tokens_raw, node_tokens_search = concordance_line[1]
-                    right_tokens_raw, right_tokens_search = concordance_line[2]
-
-                    sentiment = concordance_line[3]
-                    no_token, len_tokens = concordance_line[4]
-                    no_sentence_seg, len_sentence_segs = concordance_line[5]
-                    no_sentence, len_sentences = concordance_line[6]
-                    no_para, len_paras = concordance_line[7]
-                    file_name = concordance_line[8]
+                    (
+                        (left_tokens_raw, left_tokens_search),
+                        (node_tokens_raw, node_tokens_search),
+                        (right_tokens_raw, right_tokens_search)
+                    ) = concordance_line.get_contexts()
+
+                    sentiment = concordance_line.sentiment
+                    no_token, len_tokens = concordance_line.no_token, concordance_line.file.num_tokens
+                    no_sentence_seg, len_sentence_segs = concordance_line.no_sentence_seg, len(concordance_line.file.offsets_sentence_segs)
+                    no_sentence, len_sentences = concordance_line.no_sentence, len(concordance_line.file.offsets_sentences)
+                    no_para, len_paras = concordance_line.no_para, len(concordance_line.file.offsets_paras)
+                    file_name = concordance_line.file.file_name
 
                     # Left
                     self.setIndexWidget(
@@ -617,7 +655,7 @@ class Wl_Table_Concordancer(wl_tables.Wl_Table_Data):
             except Exception:
                 err_msg = traceback.format_exc()
             finally:
-                wl_checks_work_area.check_err_table(self.main, err_msg)
+                wl_checks_work_area.check_err_table_hits(self.main, err_msg, len(concordance_lines), num_hits)
 
     @wl_misc.log_time
     def generate_fig(self):
@@ -643,6 +681,7 @@ class Wl_Table_Concordancer(wl_tables.Wl_Table_Data):
                     self.update_gui_fig
                 )
 
+    @wl_instrumentation.log_stage('figs/concordancer')
     def update_gui_fig(self, err_msg, points, labels):
         if wl_checks_work_area.check_results(self.main, err_msg, points):
             try:
@@ -693,34 +732,200 @@ class Wl_Table_Concordancer(wl_tables.Wl_Table_Data):
             finally:
                 wl_checks_work_area.check_err_fig(self.main, err_msg)
 
+# Tokens, offsets, and context settings shared by all concordance lines of the same file
+class Wl_Concordance_File:
+    def __init__(self, text, file_name, context_len_unit, settings):
+        self.tokens = text.get_tokens_flat()
+        self.num_tokens = text.num_tokens
+        self.offsets_paras, self.offsets_sentences, self.offsets_sentence_segs = text.get_offsets()
+        self.lang = text.lang
+        self.file_name = file_name
+
+        self.context_len_unit = context_len_unit
+        self.context_len_left = settings['generation_settings'][f'context_len_left_{context_len_unit}']
+        self.context_len_right = settings['generation_settings'][f'context_len_right_{context_len_unit}']
+        self.punc_marks = settings['token_settings']['punc_marks']
+
+    def get_context_left_chars(self, i):
+        tokens_left = []
+        len_context = 0
+        i_token = i - 1
+
+        while len_context < self.context_len_left and i_token >= 0:
+            token = self.tokens[i_token]
+            len_token = len(token)
+
+            if len_context + len_token > self.context_len_left:
+                tokens_left.append(wl_texts.set_token_text(token, token[-(self.context_len_left - len_context):]))
+            else:
+                tokens_left.append(token)
+
+            len_context += len_token
+            i_token -= 1
+
+        tokens_left.reverse()
+
+        return tokens_left
+
+    def get_context_right_chars(self, i):
+        tokens_right = []
+        len_context = 0
+        i_token = i
+
+        while len_context < self.context_len_right and i_token < self.num_tokens:
+            token = self.tokens[i_token]
+            len_token = len(token)
+
+            if len_context + len_token > self.context_len_right:
+                tokens_right.append(wl_texts.set_token_text(token, token[: self.context_len_right - len_context]))
+            else:
+                tokens_right.append(token)
+
+            len_context += len_token
+            i_token += 1
+
+        return tokens_right
+
+    def get_tokens_search(self, tokens):
+        # Remove empty tokens for searching in results
+        if self.punc_marks:
+            tokens_search = [token for token in tokens if token]
+        # Convert trailing punctuation marks, if any, to separate tokens for searching
+        else:
+            tokens_search = []
+
+            for token in tokens:
+                if token:
+                    tokens_search.append(token)
+
+                    if token.punc_mark:
+                        tokens_search.append(wl_texts.Wl_Token(token.punc_mark, lang = token.lang))
+
+        return tokens_search
+
+    def get_contexts(self, concordance_line):
+        i = concordance_line.no_token - 1
+        i_right = i + concordance_line.len_node
+
+        node_tokens = self.tokens[i : i_right]
+
+        if self.context_len_unit == 'char':
+            left_tokens = self.get_context_left_chars(i)
+            right_tokens = self.get_context_right_chars(i_right)
+        elif self.context_len_unit == 'token':
+            left_tokens = self.tokens[max(0, i - self.context_len_left) : i]
+            right_tokens = self.tokens[i_right : i_right + self.context_len_right]
+        else:
+            if self.context_len_unit == 'sentence_seg':
+                offsets_unit = self.offsets_sentence_segs
+                no_unit = concordance_line.no_sentence_seg
+            elif self.context_len_unit == 'sentence':
+                offsets_unit = self.offsets_sentences
+                no_unit = concordance_line.no_sentence
+            elif self.context_len_unit == 'para':
+                offsets_unit = self.offsets_paras
+                no_unit = concordance_line.no_para
+
+            offset_start = offsets_unit[max(0, no_unit - 1 - self.context_len_left)]
+
+            if no_unit + self.context_len_right > len(offsets_unit) - 1:
+                offset_end = None
+            else:
+                offset_end = offsets_unit[no_unit + self.context_len_right]
+
+            left_tokens = self.tokens[offset_start:i]
+            right_tokens = self.tokens[i_right:offset_end]
+
+        if self.punc_marks:
+            node_tokens_search = node_tokens
+        else:
+            node_tokens_search = []
+
+            for token in node_tokens:
+                node_tokens_search.append(token)
+
+                if token.punc_mark:
+                    node_tokens_search.append(wl_texts.Wl_Token(token.punc_mark, lang = token.lang))
+
+        return (
+            [wl_nlp_utils.escape_tokens(wl_texts.to_display_texts(left_tokens, punc_mark = True)), self.get_tokens_search(left_tokens)],
+            [wl_nlp_utils.escape_tokens(wl_texts.to_display_texts(node_tokens, punc_mark = True)), node_tokens_search],
+            [wl_nlp_utils.escape_tokens(wl_texts.to_display_texts(right_tokens, punc_mark = True)), self.get_tokens_search(right_tokens)]
+        )
+
+# Hits of search terms are recorded by their positions, and their contexts are only generated when needed
+class Wl_Concordance_Line:
+    __slots__ = ('file', 'no_token', 'len_node', 'no_sentence_seg', 'no_sentence', 'no_para', 'contexts', 'sentiment')
+
+    def __init__(self, file, no_token, len_node, no_sentence_seg, no_sentence, no_para):
+        self.file = file
+        self.no_token = no_token
+        self.len_node = len_node
+        self.no_sentence_seg = no_sentence_seg
+        self.no_sentence = no_sentence
+        self.no_para = no_para
+        self.contexts = None
+        self.sentiment = None
+
+    def get_contexts(self):
+        if self.contexts is None:
+            self.contexts = self.file.get_contexts(self)
+
+        return self.contexts
+
 class Wl_Worker_Concordancer_Table(wl_threading.Wl_Worker):
-    finished = QtCore.pyqtSignal(str, list)
+    finished = QtCore.pyqtSignal(str, list, int)
 
     def run(self):
         err_msg = ''
         concordance_lines = []
+        num_hits = 0
 
         try:
             settings = self.main.settings_custom['concordancer']
 
+            # Width Unit
+            if settings['generation_settings']['context_len_unit'] == self.tr('Character'):
+                context_len_unit = 'char'
+            elif settings['generation_settings']['context_len_unit'] == self.tr('Token'):
+                context_len_unit = 'token'
+            elif settings['generation_settings']['context_len_unit'] == self.tr('Sentence segment'):
+                context_len_unit = 'sentence_seg'
+            elif settings['generation_settings']['context_len_unit'] == self.tr('Sentence'):
+                context_len_unit = 'sentence'
+            elif settings['generation_settings']['context_len_unit'] == self.tr('Paragraph'):
+                context_len_unit = 'para'
+
+            # Sampling Method
+            if settings['generation_settings']['sampling_method'] == self.tr('None'):
+                sampling_method = 'none'
+            elif settings['generation_settings']['sampling_method'] == self.tr('First N hits'):
+                sampling_method = 'first'
+            elif settings['generation_settings']['sampling_method'] == self.tr('Reservoir sampling'):
+                sampling_method = 'reservoir'
+            elif settings['generation_settings']['sampling_method'] == self.tr('Systematic sampling'):
+                sampling_method = 'systematic'
+
+            # Hits are sampled across all files as they are found, so that concordance lines are only generated for sampled hits
+            sampler_hits = wl_misc.Wl_Sampler_Hits(
+                sampling_method,
+                sample_size = settings['generation_settings']['sample_size'],
+                sampling_interval = settings['generation_settings']['sampling_interval'],
+                seed = settings['generation_settings']['sampling_seed']
+            )
+
             for file in self.main.wl_file_area.get_selected_files():
                 if not self._running:
                     raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                concordance_lines_file = []
-
                 text = wl_token_processing.wl_process_tokens_concordancer(
                     self.main, file['text'],
                     token_settings = settings['token_settings'],
                     search_settings = settings['search_settings']
                 )
 
-                tokens = text.get_tokens_flat()
-                (
-                    offsets_paras,
-                    offsets_sentences,
-                    offsets_sentence_segs
-                ) = text.get_offsets()
+                concordance_file = Wl_Concordance_File(text, file['name'], context_len_unit, settings)
+                tokens = concordance_file.tokens
 
                 search_terms = wl_matching.match_search_terms_ngrams(
                     self.main, tokens,
@@ -746,12 +951,6 @@ class Wl_Worker_Concordancer_Table(wl_threading.Wl_Worker):
                     len_search_term_min = 0
                     len_search_term_max = 0
 
-                len_paras = len(offsets_paras)
-                len_sentences = len(offsets_sentences)
-                len_sentence_segs = len(offsets_sentence_segs)
-
-                sentiment_inputs = []
-
                 for len_search_term in range(len_search_term_min, len_search_term_max + 1):
                     for i, ngram in enumerate(wl_nlp_utils.ngrams(tokens, len_search_term)):
                         if not self._running:
@@ -765,192 +964,52 @@ class Wl_Worker_Concordancer_Table(wl_threading.Wl_Worker):
                                 search_terms_incl = search_terms_incl,
                                 search_terms_excl = search_terms_excl
                             )
+                            and sampler_hits.keep_hit()
                         ):
-                            concordance_line = []
+                            sampler_hits.add_hit(Wl_Concordance_Line(
+                                concordance_file,
+                                no_token = i + 1,
+                                len_node = len_search_term,
+                                no_sentence_seg = bisect.bisect(concordance_file.offsets_sentence_segs, i),
+                                no_sentence = bisect.bisect(concordance_file.offsets_sentences, i),
+                                no_para = bisect.bisect(concordance_file.offsets_paras, i)
+                            ))
 
-                            # No.
-                            no_sentence_seg = bisect.bisect(offsets_sentence_segs, i)
-                            no_sentence = bisect.bisect(offsets_sentences, i)
-                            no_para = bisect.bisect(offsets_paras, i)
+            concordance_lines = sampler_hits.get_hits()
+            num_hits = sampler_hits.num_hits
 
-                            node_tokens_raw = wl_nlp_utils.escape_tokens(wl_texts.to_display_texts(
-                                ngram,
-                                punc_mark = True
-                            ))
+            # Sentiment
+            if settings['generation_settings']['calc_sentiment_scores']:
+                for concordance_file, concordance_lines_file in itertools.groupby(concordance_lines, key = lambda line: line.file):
+                    concordance_lines_file = list(concordance_lines_file)
 
-                            # Width Unit
-                            if settings['generation_settings']['context_len_unit'] == self.tr('Character'):
-                                len_context_left = 0
-                                len_context_right = 0
-
-                                left_tokens_raw = []
-                                right_tokens_raw = []
-
-                                context_len_left_char = settings['generation_settings']['context_len_left_char']
-                                context_len_right_char = settings['generation_settings']['context_len_right_char']
-
-                                while len_context_left < context_len_left_char:
-                                    if i - 1 - len(left_tokens_raw) < 0:
-                                        break
-                                    else:
-                                        token_next = tokens[i - 1 - len(left_tokens_raw)]
-                                        len_token_next = len(token_next)
-
-                                    if len_context_left + len_token_next > context_len_left_char:
-                                        left_tokens_raw.insert(0, wl_texts.set_token_text(
-                                            token_next,
-                                            token_next[-(context_len_left_char - len_context_left):]
-                                        ))
-                                    else:
-                                        left_tokens_raw.insert(0, token_next)
-
-                                    len_context_left += len_token_next
-
-                                while len_context_right < context_len_right_char:
-                                    if i + len_search_term + len(right_tokens_raw) > text.num_tokens - 1:
-                                        break
-                                    else:
-                                        token_next = tokens[i + len_search_term + len(right_tokens_raw)]
-                                        len_token_next = len(token_next)
-
-                                    if len_context_right + len_token_next > context_len_right_char:
-                                        right_tokens_raw.append(wl_texts.set_token_text(
-                                            token_next,
-                                            token_next[: context_len_right_char - len_context_right]
-                                        ))
-                                    else:
-                                        right_tokens_raw.append(token_next)
-
-                                    len_context_right += len_token_next
-                            elif settings['generation_settings']['context_len_unit'] == self.tr('Token'):
-                                context_len_left_token = settings['generation_settings']['context_len_left_token']
-                                context_len_right_token = settings['generation_settings']['context_len_right_token']
-
-                                left_tokens_raw = tokens[max(0, i - context_len_left_token) : i]
-                                right_tokens_raw = tokens[i + len_search_term : i + len_search_term + context_len_right_token]
-                            else:
-                                if settings['generation_settings']['context_len_unit'] == self.tr('Sentence segment'):
-                                    context_len_unit = 'sentence_seg'
-                                    offsets_unit = offsets_sentence_segs
-                                    no_unit = no_sentence_seg
-                                    len_unit = len_sentence_segs
-                                elif settings['generation_settings']['context_len_unit'] == self.tr('Sentence'):
-                                    context_len_unit = 'sentence'
-                                    offsets_unit = offsets_sentences
-                                    no_unit = no_sentence
-                                    len_unit = len_sentences
-                                elif settings['generation_settings']['context_len_unit'] == self.tr('Paragraph'):
-                                    context_len_unit = 'para'
-                                    offsets_unit = offsets_paras
-                                    no_unit = no_para
-                                    len_unit = len_paras
-
-                                context_len_left = settings['generation_settings'][f'context_len_left_{context_len_unit}']
-                                context_len_right = settings['generation_settings'][f'context_len_right_{context_len_unit}']
-
-                                offset_start = offsets_unit[max(0, no_unit - 1 - context_len_left)]
-
-                                if no_unit + context_len_right > len_unit - 1:
-                                    offset_end = None
-                                else:
-                                    offset_end = offsets_unit[no_unit + context_len_right]
-
-                                left_tokens_raw = tokens[offset_start:i]
-                                right_tokens_raw = tokens[i + len_search_term : offset_end]
-
-                            if settings['token_settings']['punc_marks']:
-                                node_tokens_search = list(ngram)
-
-                                # Remove empty tokens for searching in results
-                                left_tokens_search = [token for token in copy.deepcopy(left_tokens_raw) if token]
-                                right_tokens_search = [token for token in copy.deepcopy(right_tokens_raw) if token]
-                            # Convert trailing punctuation marks, if any, to separate tokens for searching
-                            else:
-                                node_tokens_search = []
-                                left_tokens_search = []
-                                right_tokens_search = []
-
-                                for token in list(ngram):
-                                    node_tokens_search.append(token)
-
-                                    if token.punc_mark:
-                                        node_tokens_search.append(wl_texts.Wl_Token(token.punc_mark, lang = token.lang))
-
-                                for token in copy.deepcopy(left_tokens_raw):
-                                    if token:
-                                        left_tokens_search.append(token)
-
-                                        if token.punc_mark:
-                                            left_tokens_search.append(wl_texts.Wl_Token(token.punc_mark, lang = token.lang))
-
-                                for token in copy.deepcopy(right_tokens_raw):
-                                    if token:
-                                        right_tokens_search.append(token)
-
-                                        if token.punc_mark:
-                                            right_tokens_search.append(wl_texts.Wl_Token(token.punc_mark, lang = token.lang))
-
-                            left_tokens_raw = wl_nlp_utils.escape_tokens(wl_texts.to_display_texts(
-                                left_tokens_raw,
-                                punc_mark = True
-                            ))
-                            right_tokens_raw = wl_nlp_utils.escape_tokens(wl_texts.to_display_texts(
-                                right_tokens_raw,
-                                punc_mark = True
-                            ))
+                    if concordance_file.lang in self.main.settings_global['sentiment_analyzers']:
+                        sentiment_inputs = []
 
-                            # Left
-                            concordance_line.append([left_tokens_raw, left_tokens_search])
-                            # Node
-                            concordance_line.append([node_tokens_raw, node_tokens_search])
-                            # Right
-                            concordance_line.append([right_tokens_raw, right_tokens_search])
-
-                            # Sentiment
-                            if (
-                                settings['generation_settings']['calc_sentiment_scores']
-                                and text.lang in self.main.settings_global['sentiment_analyzers']
-                            ):
-                                sentiment_inputs.append([*left_tokens_search, *node_tokens_search, *right_tokens_search])
-
-                            # Token No.
-                            concordance_line.append([i + 1, text.num_tokens])
-                            # Sentence Segment No.
-                            concordance_line.append([no_sentence_seg, len_sentence_segs])
-                            # Sentence No.
-                            concordance_line.append([no_sentence, len_sentences])
-                            # Paragraph No.
-                            concordance_line.append([no_para, len_paras])
-                            # File
-                            concordance_line.append(file['name'])
-
-                            concordance_lines_file.append(concordance_line)
+                        for concordance_line in concordance_lines_file:
+                            # Contexts are only generated in advance for sentiment analysis and are reused when rendering the table
+                            (_, left_tokens_search), (_, node_tokens_search), (_, right_tokens_search) = concordance_line.get_contexts()
+
+                            sentiment_inputs.append([*left_tokens_search, *node_tokens_search, *right_tokens_search])
 
-                if settings['generation_settings']['calc_sentiment_scores']:
-                    if sentiment_inputs:
                         sentiment_scores = wl_sentiment_analysis.wl_sentiment_analyze(
                             self.main,
                             inputs = sentiment_inputs,
-                            lang = text.lang
+                            lang = concordance_file.lang
                         )
 
                         for concordance_line, sentiment_score in zip(concordance_lines_file, sentiment_scores):
-                            concordance_line.insert(3, sentiment_score)
+                            concordance_line.sentiment = sentiment_score
                     else:
                         for concordance_line in concordance_lines_file:
-                            concordance_line.insert(3, self.tr('No language support'))
-                else:
-                    for concordance_line in concordance_lines_file:
-                        concordance_line.insert(3, None)
-
-                concordance_lines.extend(concordance_lines_file)
+                            concordance_line.sentiment = self.tr('No language support')
         except wl_excs.Wl_Exc_Aborted:
             err_msg = 'aborted'
         except Exception:
             err_msg = traceback.format_exc()
 
         self.progress_updated.emit(self.tr('Rendering table...'))
-        self.finished.emit(err_msg, concordance_lines)
+        self.finished.emit(err_msg, concordance_lines, num_hits)
 
 class Wl_Worker_Concordancer_Fig(wl_threading.Wl_Worker):
     finished = QtCore.pyqtSignal(str, list, list)
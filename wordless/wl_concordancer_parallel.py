@@ -38,6 +38,7 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import (
     wl_excs,
+    wl_instrumentation,
     wl_misc,
     wl_threading
 )
@@ -160,6 +161,33 @@ class Wrapper_Concordancer_Parallel(wl_layouts.Wl_Wrapper):
 
         self.group_box_search_settings.layout().addLayout(layout_context_settings, 10, 0, 1, 2)
 
+        # Generation Settings
+        self.group_box_generation_settings = QtWidgets.QGroupBox(self.tr('Generation Settings'), self)
+
+        (
+            self.label_sampling_method, self.combo_box_sampling_method,
+            self.label_sample_size, self.spin_box_sample_size,
+            self.label_sampling_interval, self.spin_box_sampling_interval,
+            self.label_sampling_seed, self.spin_box_sampling_seed
+        ) = wl_widgets.wl_widgets_sampling_settings(self)
+
+        self.combo_box_sampling_method.currentTextChanged.connect(self.generation_settings_changed)
+        self.spin_box_sample_size.valueChanged.connect(self.generation_settings_changed)
+        self.spin_box_sampling_interval.valueChanged.connect(self.generation_settings_changed)
+        self.spin_box_sampling_seed.valueChanged.connect(self.generation_settings_changed)
+
+        self.group_box_generation_settings.setLayout(wl_layouts.Wl_Layout())
+        self.group_box_generation_settings.layout().addWidget(self.label_sampling_method, 0, 0)
+        self.group_box_generation_settings.layout().addWidget(self.combo_box_sampling_method, 0, 1)
+        self.group_box_generation_settings.layout().addWidget(self.label_sample_size, 1, 0)
+        self.group_box_generation_settings.layout().addWidget(self.spin_box_sample_size, 1, 1)
+        self.group_box_generation_settings.layout().addWidget(self.label_sampling_interval, 2, 0)
+        self.group_box_generation_settings.layout().addWidget(self.spin_box_sampling_interval, 2, 1)
+        self.group_box_generation_settings.layout().addWidget(self.label_sampling_seed, 3, 0)
+        self.group_box_generation_settings.layout().addWidget(self.spin_box_sampling_seed, 3, 1)
+
+        self.group_box_generation_settings.layout().setColumnStretch(1, 1)
+
         # Table Settings
         self.group_box_table_settings = QtWidgets.QGroupBox(self.tr('Table Settings'), self)
 
@@ -175,7 +203,8 @@ class Wrapper_Concordancer_Parallel(wl_layouts.Wl_Wrapper):
 
         self.wrapper_settings.layout().addWidget(self.group_box_token_settings, 0, 0)
         self.wrapper_settings.layout().addWidget(self.group_box_search_settings, 1, 0)
-        self.wrapper_settings.layout().addWidget(self.group_box_table_settings, 2, 0)
+        self.wrapper_settings.layout().addWidget(self.group_box_generation_settings, 2, 0)
+        self.wrapper_settings.layout().addWidget(self.group_box_table_settings, 3, 0)
 
         self.load_settings()
 
@@ -210,11 +239,18 @@ class Wrapper_Concordancer_Parallel(wl_layouts.Wl_Wrapper):
         if defaults:
             self.main.wl_context_settings_concordancer.load_settings(defaults = True)
 
+        # Generation Settings
+        self.combo_box_sampling_method.setCurrentText(settings['generation_settings']['sampling_method'])
+        self.spin_box_sample_size.setValue(settings['generation_settings']['sample_size'])
+        self.spin_box_sampling_interval.setValue(settings['generation_settings']['sampling_interval'])
+        self.spin_box_sampling_seed.setValue(settings['generation_settings']['sampling_seed'])
+
         # Table Settings
         self.checkbox_show_pct_data.setChecked(settings['table_settings']['show_pct_data'])
 
         self.token_settings_changed()
         self.search_settings_changed()
+        self.generation_settings_changed()
         self.table_settings_changed()
 
     def token_settings_changed(self):
@@ -242,6 +278,14 @@ class Wrapper_Concordancer_Parallel(wl_layouts.Wl_Wrapper):
         settings['match_without_tags'] = self.checkbox_match_without_tags.isChecked()
         settings['match_tags'] = self.checkbox_match_tags.isChecked()
 
+    def generation_settings_changed(self):
+        settings = self.main.settings_custom['concordancer_parallel']['generation_settings']
+
+        settings['sampling_method'] = self.combo_box_sampling_method.currentText()
+        settings['sample_size'] = self.spin_box_sample_size.value()
+        settings['sampling_interval'] = self.spin_box_sampling_interval.value()
+        settings['sampling_seed'] = self.spin_box_sampling_seed.value()
+
     def table_settings_changed(self):
         settings = self.main.settings_custom['concordancer_parallel']['table_settings']
 
@@ -307,7 +351,8 @@ class Wl_Table_Concordancer_Parallel(wl_tables.Wl_Table_Data):
         else:
             wl_checks_work_area.wl_status_bar_missing_search_terms(self.main)
 
-    def update_gui_table(self, err_msg, parallel_units, num_paras_max):
+    @wl_instrumentation.log_stage('tables/concordancer_parallel')
+    def update_gui_table(self, err_msg, parallel_units, num_paras_max, num_hits):
         if wl_checks_work_area.check_results(self.main, err_msg, parallel_units):
             try:
                 self.settings = copy.deepcopy(self.main.settings_custom)
@@ -342,16 +387,18 @@ class Wl_Table_Concordancer_Parallel(wl_tables.Wl_Table_Data):
             except Exception:
                 err_msg = traceback.format_exc()
             finally:
-                wl_checks_work_area.check_err_table(self.main, err_msg)
+                wl_checks_work_area.check_err_table_hits(self.main, err_msg, len(parallel_units), num_hits)
 
 class Wl_Worker_Concordancer_Parallel_Table(wl_threading.Wl_Worker):
-    finished = QtCore.pyqtSignal(str, list, int)
+    finished = QtCore.pyqtSignal(str, list, int, int)
 
     def run(self):
         err_msg = ''
         texts = []
         parallel_units = {}
         offsets_paras_files = []
+        num_paras_max = 0
+        num_hits = 0
 
         try:
             settings = self.main.settings_custom['concordancer_parallel']
@@ -454,6 +501,29 @@ class Wl_Worker_Concordancer_Parallel_Table(wl_threading.Wl_Worker):
 
                         parallel_units[j] = [[] for _ in range(len_files)]
 
+            # Sampling Method
+            if settings['generation_settings']['sampling_method'] == self.tr('None'):
+                sampling_method = 'none'
+            elif settings['generation_settings']['sampling_method'] == self.tr('First N hits'):
+                sampling_method = 'first'
+            elif settings['generation_settings']['sampling_method'] == self.tr('Reservoir sampling'):
+                sampling_method = 'reservoir'
+            elif settings['generation_settings']['sampling_method'] == self.tr('Systematic sampling'):
+                sampling_method = 'systematic'
+
+            # Parallel units are sampled before being rendered
+            num_hits = len(parallel_units)
+            parallel_unit_nos = wl_misc.Wl_Sampler_Hits(
+                sampling_method,
+                sample_size = settings['generation_settings']['sample_size'],
+                sampling_interval = settings['generation_settings']['sampling_interval'],
+                seed = settings['generation_settings']['sampling_seed']
+            ).sample(sorted(parallel_units))
+            parallel_units = {
+                parallel_unit_no: parallel_units[parallel_unit_no]
+                for parallel_unit_no in parallel_unit_nos
+            }
+
             node_color = self.main.settings_custom['tables']['parallel_concordancer']['highlight_color_settings']['search_term_color']
 
             for i, (text, offsets_paras) in enumerate(zip(texts, offsets_paras_files)):
@@ -508,4 +578,4 @@ class Wl_Worker_Concordancer_Parallel_Table(wl_threading.Wl_Worker):
             err_msg = traceback.format_exc()
 
         self.progress_updated.emit(self.tr('Rendering table...'))
-        self.finished.emit(err_msg, parallel_units, num_paras_max)
+        self.finished.emit(err_msg, parallel_units, num_paras_max, num_hits)
@@ -37,6 +37,7 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import (
     wl_excs,
+    wl_instrumentation,
     wl_misc,
     wl_threading
 )
@@ -417,6 +418,7 @@ class Wl_Table_Dependency_Parser(wl_tables.Wl_Table_Data):
                     self.update_gui_table
                 )
 
+    @wl_instrumentation.log_stage('tables/dependency_parser')
     def update_gui_table(self, err_msg, results):
         if wl_checks_work_area.check_results(self.main, err_msg, results):
             try:
@@ -473,45 +475,48 @@ class Wl_Table_Dependency_Parser(wl_tables.Wl_Table_Data):
 
     @wl_misc.log_time
     def generate_fig(self):
-        err_msg = ''
-
-        try:
-            sentences_rendered = set()
-            htmls = []
+        sentences_fig = []
+        sentences_selected = set()
+        file_langs = {
+            file['name']: file['lang']
+            for file in self.settings['file_area']['files_open']
+        }
+
+        for row in self.get_selected_rows():
+            sentence = self.indexWidget(self.model().index(row, 5)).tokens_fig
+
+            # Rows of the same sentence share the same list of tokens
+            if id(sentence) not in sentences_selected:
+                sentences_fig.append((sentence, file_langs[self.model().item(row, 8).text()]))
+                sentences_selected.add(id(sentence))
+
+        self.worker_dependency_parser_fig = Wl_Worker_Dependency_Parser_Fig(
+            self.main,
+            dialog_progress = wl_dialogs_misc.Wl_Dialog_Progress_Process_Data(self.main),
+            sentences_fig = sentences_fig
+        )
 
-            fig_settings = self.main.settings_custom['dependency_parser']['fig_settings']
+        self.thread_dependency_parser_fig = QtCore.QThread()
+        wl_threading.start_worker_in_thread(
+            self.worker_dependency_parser_fig,
+            self.thread_dependency_parser_fig,
+            self.update_gui_fig
+        )
 
-            for row in self.get_selected_rows():
-                sentence = tuple(self.indexWidget(self.model().index(row, 5)).tokens_fig)
-
-                if sentence not in sentences_rendered:
-                    for file in self.settings['file_area']['files_open']:
-                        if file['name'] == self.model().item(row, 8).text():
-                            file_selected = file
-
-                    htmls.extend(wl_dependency_parsing.wl_dependency_parse_fig(
-                        self.main,
-                        inputs = [sentence],
-                        lang = file_selected['lang'],
-                        show_pos_tags = fig_settings['show_pos_tags'],
-                        show_fine_grained_pos_tags = fig_settings['show_fine_grained_pos_tags'],
-                        show_lemmas = fig_settings['show_pos_tags'] and fig_settings['show_lemmas'],
-                        # Handled by Token Settings - Punctuation marks
-                        collapse_punc_marks = False,
-                        compact_mode = fig_settings['compact_mode']
-                    ))
-
-                    sentences_rendered.add(sentence)
-
-            wl_dependency_parsing.wl_show_dependency_graphs(
-                self.main,
-                htmls = htmls,
-                show_in_separate_tabs = fig_settings['show_in_separate_tabs']
-            )
+    @wl_instrumentation.log_stage('figs/dependency_parser')
+    def update_gui_fig(self, err_msg, htmls):
+        try:
+            if not err_msg:
+                wl_dependency_parsing.wl_show_dependency_graphs(
+                    self.main,
+                    htmls = htmls,
+                    show_in_separate_tabs = self.main.settings_custom['dependency_parser']['fig_settings']['show_in_separate_tabs']
+                )
         except Exception:
             err_msg = traceback.format_exc()
         finally:
-            wl_checks_work_area.check_err_fig(self.main, err_msg)
+            if err_msg != 'aborted':
+                wl_checks_work_area.check_err_fig(self.main, err_msg)
 
 class Wl_Worker_Dependency_Parser(wl_threading.Wl_Worker):
     finished = QtCore.pyqtSignal(str, list)
@@ -562,6 +567,7 @@ class Wl_Worker_Dependency_Parser(wl_threading.Wl_Worker):
                 for para in text.tokens_multilevel:
                     for sentence in para:
                         sentence = list(wl_misc.flatten_list(sentence))
+                        sentence_tokens_fig = None
 
                         for i, token in enumerate(sentence):
                             if not self._running:
@@ -608,7 +614,10 @@ class Wl_Worker_Dependency_Parser(wl_threading.Wl_Worker):
 
                                 # Sentence
                                 sentence_tokens_raw = []
-                                sentence_tokens_fig = []
+
+                                # Copy the whole sentence at once so that heads of copied tokens are also copied tokens in the sentence
+                                if sentence_tokens_fig is None:
+                                    sentence_tokens_fig = copy.deepcopy(sentence)
 
                                 # Highlight heads and dependents
                                 for sentence_token in sentence:
@@ -629,8 +638,6 @@ class Wl_Worker_Dependency_Parser(wl_threading.Wl_Worker):
                                             wl_nlp_utils.escape_token(sentence_token.display_text(punc_mark = True))
                                         )
 
-                                    sentence_tokens_fig.append(copy.deepcopy(sentence_token))
-
                                 if settings['token_settings']['punc_marks']:
                                     # Remove empty tokens for searching in results
                                     sentence_tokens_search = [
@@ -679,3 +686,38 @@ class Wl_Worker_Dependency_Parser(wl_threading.Wl_Worker):
 
         self.progress_updated.emit(self.tr('Rendering table...'))
         self.finished.emit(err_msg, results)
+
+class Wl_Worker_Dependency_Parser_Fig(wl_threading.Wl_Worker):
+    finished = QtCore.pyqtSignal(str, list)
+
+    def run(self):
+        err_msg = ''
+        htmls = []
+
+        try:
+            fig_settings = self.main.settings_custom['dependency_parser']['fig_settings']
+            len_sentences = len(self.sentences_fig)
+
+            for i, (sentence, lang) in enumerate(self.sentences_fig):
+                if not self._running:
+                    raise wl_excs.Wl_Exc_Aborted(self.main)
+
+                self.progress_updated.emit(self.tr('Generating dependency graphs... ({} / {})').format(i + 1, len_sentences))
+
+                htmls.extend(wl_dependency_parsing.wl_dependency_parse_fig(
+                    self.main,
+                    inputs = [sentence],
+                    lang = lang,
+                    show_pos_tags = fig_settings['show_pos_tags'],
+                    show_fine_grained_pos_tags = fig_settings['show_fine_grained_pos_tags'],
+                    show_lemmas = fig_settings['show_pos_tags'] and fig_settings['show_lemmas'],
+                    # Handled by Token Settings - Punctuation marks
+                    collapse_punc_marks = False,
+                    compact_mode = fig_settings['compact_mode']
+                ))
+        except wl_excs.Wl_Exc_Aborted:
+            err_msg = 'aborted'
+        except Exception:
+            err_msg = traceback.format_exc()
+
+        self.finished.emit(err_msg, htmls)
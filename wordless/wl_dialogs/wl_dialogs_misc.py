@@ -20,6 +20,7 @@ import datetime
 import time
 
 from PyQt5 import QtCore
+from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 
 from wordless.wl_dialogs import wl_dialogs
@@ -120,3 +121,47 @@ class Wl_Dialog_Restart_Required(wl_dialogs.Wl_Dialog_Info):
         self.layout_buttons.addWidget(self.button_cancel, 0, 2)
 
         self.layout_buttons.setColumnStretch(0, 1)
+
+class Wl_Dialog_Profiling(wl_dialogs.Wl_Dialog_Info_Copy):
+    def __init__(self, parent, trace):
+        super().__init__(
+            parent,
+            title = _tr('wl_dialogs_misc', 'Profiling Results'),
+            width = 700,
+            height = 400,
+            is_plain_text = True
+        )
+
+        self.label_profiling = wl_labels.Wl_Label_Dialog(
+            _tr('wl_dialogs_misc', '''
+                <div>Data processing finished in {:.2f} seconds. The elapsed time of each stage includes those of the stages called within it.</div>
+            ''').format(trace.time_elapsed),
+            self
+        )
+
+        self.text_edit_info.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.text_edit_info.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+
+        # Tab-separated so that results could be pasted into spreadsheets
+        rows = [[
+            _tr('wl_dialogs_misc', 'Stage'),
+            _tr('wl_dialogs_misc', 'Calls'),
+            _tr('wl_dialogs_misc', 'Items'),
+            _tr('wl_dialogs_misc', 'Time (s)'),
+            _tr('wl_dialogs_misc', 'Time %'),
+            _tr('wl_dialogs_misc', 'Peak Memory (MB)')
+        ]]
+
+        for name, num_calls, num_items, time_elapsed, mem_peak in trace.get_stages():
+            rows.append([
+                name,
+                str(num_calls),
+                str(num_items),
+                f'{time_elapsed:.3f}',
+                f'{time_elapsed / trace.time_elapsed:.2%}' if trace.time_elapsed else '0.00%',
+                f'{mem_peak / 1024 / 1024:.2f}' if mem_peak is not None else '-'
+            ])
+
+        self.set_info('\n'.join(('\t'.join(row) for row in rows)))
+
+        self.layout_info.addWidget(self.label_profiling, 0, 0, 1, 2)
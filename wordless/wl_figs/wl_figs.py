@@ -16,11 +16,14 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
+import collections
+import math
 import os
 import re
 
 import matplotlib
 import matplotlib.pyplot
+import matplotlib.ticker
 import networkx
 import numpy
 import PIL
@@ -42,18 +45,129 @@ _tr = QtCore.QCoreApplication.translate
 def restore_matplotlib_rcparams():
     matplotlib.pyplot.rcParams['savefig.facecolor'] = 'auto'
 
+def get_rank_max(fig_settings):
+    if fig_settings['rank_max_no_limit']:
+        return None
+    else:
+        return fig_settings['rank_max']
+
 def get_data_ranks(data_files_items, fig_settings):
     if fig_settings['rank_min_no_limit']:
         rank_min = 1
     else:
         rank_min = fig_settings['rank_min']
 
-    if fig_settings['rank_max_no_limit']:
-        rank_max = None
+    return data_files_items[rank_min - 1 : get_rank_max(fig_settings)]
+
+# Lines with more values than twice the number of buckets are decimated
+LINE_CHART_BUCKETS = 1000
+# Maximum number of tick labels on the x-axis when there are more items than this
+LINE_CHART_TICKS_MAX = 100
+# Maximum number of rows in legends
+LINE_CHART_LEGEND_ROWS_MAX = 20
+
+# Maximum number of words displayed in word clouds
+WORD_CLOUD_MAX_WORDS = 200
+
+def get_rank_max_word_cloud(fig_settings):
+    # Only the top-ranked items are displayed in word clouds
+    if fig_settings['rank_min_no_limit']:
+        rank_max = WORD_CLOUD_MAX_WORDS
+    else:
+        rank_max = fig_settings['rank_min'] - 1 + WORD_CLOUD_MAX_WORDS
+
+    if not fig_settings['rank_max_no_limit']:
+        rank_max = min(rank_max, fig_settings['rank_max'])
+
+    return rank_max
+
+# Graphs with more nodes than this are laid out with fewer iterations of the spring layout
+NETWORK_GRAPH_NODES_MAX_SLOW_LAYOUTS = 500
+# Edges of graphs with more edges than this are drawn as line collections without arrows
+NETWORK_GRAPH_EDGES_MAX_PATCHES = 1000
+# Only labels of top-ranked edges are drawn
+NETWORK_GRAPH_EDGE_LABELS_MAX = 500
+
+def get_network_graph_layout(graph, layout):
+    # The Kamada-Kawai and spring layouts are too slow for large graphs
+    if (
+        len(graph) > NETWORK_GRAPH_NODES_MAX_SLOW_LAYOUTS
+        and layout in (networkx.kamada_kawai_layout, networkx.spring_layout)
+    ):
+        # Nodes are initially placed by the spectral layout so that fewer iterations are needed
+        return networkx.spring_layout(
+            graph,
+            pos = networkx.spectral_layout(graph),
+            iterations = max(5, 50 * NETWORK_GRAPH_NODES_MAX_SLOW_LAYOUTS // len(graph))
+        )
     else:
-        rank_max = fig_settings['rank_max']
+        return layout(graph)
+
+def get_word_cloud_canvas_size(width, height, pixels_max):
+    ratio = min(1, math.sqrt(pixels_max / (width * height)))
+
+    return max(1, round(width * ratio)), max(1, round(height * ratio)), ratio
 
-    return data_files_items[rank_min - 1 : rank_max]
+class Wl_Fig_Cache:
+    """Cache of layouts of figures with least-recently-used items evicted first."""
+
+    def __init__(self, max_size = 20):
+        self.max_size = max_size
+        # Data and settings that affect layouts -> layout
+        self.cache = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self.cache)
+
+    def get(self, key):
+        layout = self.cache.get(key)
+
+        if layout is not None:
+            self.cache.move_to_end(key)
+
+        return layout
+
+    def set(self, key, layout):
+        self.cache[key] = layout
+
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last = False)
+
+    def clear(self):
+        self.cache.clear()
+
+# (Items, values, canvas, mask, and layout settings) -> word cloud
+word_cloud_cache = Wl_Fig_Cache()
+# (Edges, layout) -> positions of nodes
+network_graph_layout_cache = Wl_Fig_Cache()
+
+def get_line_chart_decimated_idxs(vals, idx_min, idx_max, num_buckets = LINE_CHART_BUCKETS):
+    """Return indices of values to be plotted within the range of ranks.
+
+    If there are more values than twice the number of buckets, the values are divided into buckets and only the minimum and maximum values in each bucket are kept, so the shape of lines is preserved.
+    """
+    idx_min = max(0, idx_min)
+    idx_max = min(len(vals), idx_max)
+    num_vals = idx_max - idx_min
+
+    if num_vals <= num_buckets * 2:
+        return numpy.arange(idx_min, max(idx_min, idx_max))
+
+    bucket_size = math.ceil(num_vals / num_buckets)
+    num_buckets = math.ceil(num_vals / bucket_size)
+
+    # The last bucket is padded with its last value, which is never selected before its first occurrence
+    buckets = numpy.pad(vals[idx_min:idx_max], (0, num_buckets * bucket_size - num_vals), mode = 'edge')
+    buckets = buckets.reshape(num_buckets, bucket_size)
+    offsets = numpy.arange(num_buckets) * bucket_size + idx_min
+
+    idxs = numpy.concatenate((
+        [idx_min, idx_max - 1],
+        offsets + numpy.argmin(buckets, axis = 1),
+        offsets + numpy.argmax(buckets, axis = 1)
+    ))
+
+    return numpy.unique(idxs)
 
 def generate_line_chart(
     main,
@@ -63,26 +177,24 @@ def generate_line_chart(
     restore_matplotlib_rcparams()
 
     data_files_items = get_data_ranks(data_files_items, fig_settings)
+    file_names_selected = list(file_names_selected)
 
     items = [item for item, vals in data_files_items]
-    vals = numpy.array([vals for item, vals in data_files_items])
+    vals = numpy.array([vals for item, vals in data_files_items], dtype = numpy.float64).reshape(len(items), len(file_names_selected))
 
     # Frequency data
     if (
         fig_settings['use_data'] == _tr('wl_figs', 'Frequency')
         or re.search(_tr('wl_figs', r'^[LR][1-9][0-9]*$'), fig_settings['use_data'])
     ):
+        if fig_settings['use_pct']:
+            total_freqs = vals.sum(axis = 0)
+
         if fig_settings['use_cumulative']:
             vals = numpy.cumsum(vals, axis = 0)
 
         if fig_settings['use_pct']:
-            total_freqs = numpy.array([vals for item, vals in data_files_items]).sum(axis = 0)
-
-            for i, (file_name, total_freq) in enumerate(zip(file_names_selected, total_freqs)):
-                matplotlib.pyplot.plot(vals[:, i] / total_freq * 100, label = file_name)
-        else:
-            for i, file_name in enumerate(file_names_selected):
-                matplotlib.pyplot.plot(vals[:, i], label = file_name)
+            vals = vals / total_freqs * 100
 
         if fig_settings['use_cumulative']:
             if fig_settings['use_pct']:
@@ -96,20 +208,49 @@ def generate_line_chart(
                 matplotlib.pyplot.ylabel(_tr('wl_figs', 'Frequency'))
     # Non-frequency data
     else:
-        for i, file_name in enumerate(file_names_selected):
-            matplotlib.pyplot.plot(vals[:, i], label = file_name)
-
         matplotlib.pyplot.ylabel(fig_settings['use_data'])
 
+    vals_files = [numpy.ascontiguousarray(vals[:, i]) for i in range(len(file_names_selected))]
+    lines = []
+
+    for vals_file, file_name in zip(vals_files, file_names_selected):
+        idxs = get_line_chart_decimated_idxs(vals_file, 0, len(items))
+
+        lines.extend(matplotlib.pyplot.plot(idxs, vals_file[idxs], label = file_name))
+
+    ax = matplotlib.pyplot.gca()
+
+    # Lines are decimated again within the visible range of ranks when zoomed in or out
+    if len(items) > LINE_CHART_BUCKETS * 2:
+        def xlim_changed(ax):
+            x_min, x_max = ax.get_xlim()
+
+            for line, vals_file in zip(lines, vals_files):
+                idxs = get_line_chart_decimated_idxs(vals_file, math.floor(x_min), math.ceil(x_max) + 1)
+
+                line.set_data(idxs, vals_file[idxs])
+
+        ax.callbacks.connect('xlim_changed', xlim_changed)
+
     matplotlib.pyplot.xlabel(label_x)
-    matplotlib.pyplot.xticks(
-        range(len(items)),
-        labels = items,
-        rotation = 90
-    )
+
+    if len(items) <= LINE_CHART_TICKS_MAX:
+        matplotlib.pyplot.xticks(
+            range(len(items)),
+            labels = items,
+            rotation = 90
+        )
+    # Only a limited number of tick labels are chosen from the visible range of ranks
+    else:
+        ax.xaxis.set_major_locator(matplotlib.ticker.MaxNLocator(nbins = LINE_CHART_TICKS_MAX, integer = True))
+        ax.xaxis.set_major_formatter(matplotlib.ticker.FuncFormatter(
+            lambda x, pos: items[int(x)] if x == int(x) and 0 <= x < len(items) else ''
+        ))
+        ax.tick_params(axis = 'x', labelrotation = 90)
 
     matplotlib.pyplot.grid(True, color = 'silver')
-    matplotlib.pyplot.legend()
+    # Legends are split into columns when there are many files
+    matplotlib.pyplot.legend(ncols = math.ceil(len(file_names_selected) / LINE_CHART_LEGEND_ROWS_MAX))
 
 def generate_word_cloud(main, data_file_items, fig_settings):
     restore_matplotlib_rcparams()
@@ -139,6 +280,13 @@ def generate_word_cloud(main, data_file_items, fig_settings):
     if vals[vals == 0].size > 0:
         vals += 1e-15
 
+    # Only the top-ranked items are laid out by WordCloud
+    if len(items) > WORD_CLOUD_MAX_WORDS:
+        idxs = numpy.argsort(-vals, kind = 'stable')[:WORD_CLOUD_MAX_WORDS]
+
+        items = [items[i] for i in idxs]
+        vals = vals[idxs]
+
     settings = main.settings_custom['figs']['word_clouds']
     desktop_widget = QtWidgets.QDesktopWidget()
 
@@ -154,11 +302,6 @@ def generate_word_cloud(main, data_file_items, fig_settings):
     else:
         relative_scaling = settings['font_settings']['relative_scaling']
 
-    if settings['font_settings']['font_color'] == _tr('wl_figs', 'Monochrome'):
-        color_func = lambda *args, **kwargs: settings['font_settings']['font_color_monochrome'] # pylint: disable=unnecessary-lambda-assignment
-    elif settings['font_settings']['font_color'] == _tr('wl_figs', 'Colormap'):
-        color_func = None
-
     if settings['bg_settings']['bg_color_transparent']:
         # Modify Matplotlib's global settings
         matplotlib.pyplot.rcParams['savefig.facecolor'] = (0, 0, 0, 0)
@@ -169,34 +312,78 @@ def generate_word_cloud(main, data_file_items, fig_settings):
         bg_color = settings['bg_settings']['bg_color']
         mode = 'RGB'
 
+    pixels_max = settings['advanced_settings']['canvas_size_max'] * 1_000_000
+
     try:
         if settings['mask_settings']['mask_settings']:
-            mask = numpy.array(PIL.Image.open(settings['mask_settings']['mask_path']))
+            mask_path = settings['mask_settings']['mask_path']
+            mask_img = PIL.Image.open(mask_path)
+
+            width, height, ratio = get_word_cloud_canvas_size(mask_img.width, mask_img.height, pixels_max)
+
+            if ratio < 1:
+                mask_img = mask_img.resize((width, height), resample = PIL.Image.NEAREST)
+
+            mask = numpy.array(mask_img)
+            mask_key = (mask_path, os.path.getmtime(mask_path), width, height)
         else:
-            mask = None
+            width, height, ratio = get_word_cloud_canvas_size(desktop_widget.width(), desktop_widget.height(), pixels_max)
 
-        word_cloud = wordcloud.WordCloud(
-            width = desktop_widget.width(),
-            height = desktop_widget.height(),
-            font_path = font_path,
-            min_font_size = settings['font_settings']['font_size_min'],
-            max_font_size = settings['font_settings']['font_size_max'],
-            relative_scaling = relative_scaling,
-            color_func = color_func,
-            colormap = settings['font_settings']['font_color_colormap'],
-            background_color = bg_color,
-            mode = mode,
-            mask = mask,
-            # Known issue: Error when background is transparent and contour width > 0
-            # Reference: https://github.com/amueller/word_cloud/issues/501
-            contour_width = settings['mask_settings']['contour_width'],
-            contour_color = settings['mask_settings']['contour_color'],
-            # The ratio of times to try horizontal fitting as opposed to vertical, ranging from 0 to 1 inclusive
-            prefer_horizontal = settings['advanced_settings']['prefer_hor'] / 100,
-            repeat = settings['advanced_settings']['allow_repeated_words']
+            mask = None
+            mask_key = None
+
+        # Font sizes are scaled along with the canvas
+        font_size_min = max(1, round(settings['font_settings']['font_size_min'] * ratio))
+        font_size_max = max(font_size_min, round(settings['font_settings']['font_size_max'] * ratio))
+
+        # Only settings that affect the layout of word clouds are included in the key
+        key = (
+            tuple(items), tuple(vals.tolist()),
+            width, height, mask_key,
+            font_path, font_size_min, font_size_max, relative_scaling,
+            settings['advanced_settings']['prefer_hor'],
+            settings['advanced_settings']['allow_repeated_words']
         )
-
-        word_cloud.generate_from_frequencies(dict(zip(items, vals)))
+        word_cloud = word_cloud_cache.get(key)
+
+        if word_cloud is None:
+            word_cloud = wordcloud.WordCloud(
+                width = width,
+                height = height,
+                font_path = font_path,
+                min_font_size = font_size_min,
+                max_font_size = font_size_max,
+                relative_scaling = relative_scaling,
+                colormap = settings['font_settings']['font_color_colormap'],
+                mask = mask,
+                # The ratio of times to try horizontal fitting as opposed to vertical, ranging from 0 to 1 inclusive
+                prefer_horizontal = settings['advanced_settings']['prefer_hor'] / 100,
+                max_words = WORD_CLOUD_MAX_WORDS,
+                repeat = settings['advanced_settings']['allow_repeated_words']
+            )
+
+            word_cloud.generate_from_frequencies(dict(zip(items, vals)))
+
+            word_cloud_cache.set(key, word_cloud)
+
+        # Colors, backgrounds, and contours are applied to the cached layout
+        if settings['font_settings']['font_color'] == _tr('wl_figs', 'Monochrome'):
+            word_cloud.recolor(color_func = lambda *args, **kwargs: settings['font_settings']['font_color_monochrome'])
+        elif settings['font_settings']['font_color'] == _tr('wl_figs', 'Colormap'):
+            word_cloud.recolor(colormap = settings['font_settings']['font_color_colormap'])
+
+        word_cloud.background_color = bg_color
+        word_cloud.mode = mode
+        # Known issue: Error when background is transparent and contour width > 0
+        # Reference: https://github.com/amueller/word_cloud/issues/501
+        word_cloud.contour_width = settings['mask_settings']['contour_width']
+        word_cloud.contour_color = settings['mask_settings']['contour_color']
+
+        # Word clouds are laid out on the capped canvas and then drawn at the original resolution
+        if settings['advanced_settings']['upscale_canvas']:
+            word_cloud.scale = 1 / ratio
+        else:
+            word_cloud.scale = 1
 
         matplotlib.pyplot.imshow(word_cloud, interpolation = 'bilinear')
         matplotlib.pyplot.axis('off')
@@ -269,7 +456,14 @@ def generate_network_graph(main, data_file_items, fig_settings):
     graph = networkx.MultiDiGraph()
     graph.add_edges_from(data_file_items)
 
-    pos = settings['advanced_settings']['layout'](graph)
+    # Positions of nodes are reused when only colors or styles are changed
+    key = (tuple(data_file_items), settings['advanced_settings']['layout'])
+    pos = network_graph_layout_cache.get(key)
+
+    if pos is None:
+        pos = get_network_graph_layout(graph, settings['advanced_settings']['layout'])
+
+        network_graph_layout_cache.set(key, pos)
 
     if settings['node_settings']['same_as_node_color']:
         border_color = None
@@ -311,6 +505,19 @@ def generate_network_graph(main, data_file_items, fig_settings):
         for item, val in data_file_items.items()
     }
 
+    # Drawing edges as individual arrows is slow for large graphs
+    if len(data_file_items) > NETWORK_GRAPH_EDGES_MAX_PATCHES:
+        edge_settings_arrows = {'arrows': False}
+    else:
+        edge_settings_arrows = {
+            'connectionstyle': settings['edge_settings']['connection_style'],
+            'arrowstyle': settings['edge_settings']['arrow_style'],
+            'arrowsize': settings['edge_settings']['arrow_size'],
+            # Used to determine edge positions
+            'node_shape': settings['node_settings']['node_shape'],
+            'node_size': settings['node_settings']['node_size']
+        }
+
     networkx.draw_networkx_edges(
         graph,
         pos = pos,
@@ -321,21 +528,27 @@ def generate_network_graph(main, data_file_items, fig_settings):
             normalized_max = settings['edge_settings']['edge_width_max'],
             reverse = reverse
         ),
-        connectionstyle = settings['edge_settings']['connection_style'],
         style = settings['edge_settings']['edge_style'],
         edge_color = settings['edge_settings']['edge_color'],
         alpha = settings['edge_settings']['edge_opacity'],
-        arrowstyle = settings['edge_settings']['arrow_style'],
-        arrowsize = settings['edge_settings']['arrow_size'],
-        # Used to determine edge positions
-        node_shape = settings['node_settings']['node_shape'],
-        node_size = settings['node_settings']['node_size']
+        **edge_settings_arrows
     )
 
+    # Labels of edges are ordered by their ranks
+    edge_labels = dict(list(data_file_items.items())[:NETWORK_GRAPH_EDGE_LABELS_MAX])
+
+    if len(data_file_items) > NETWORK_GRAPH_EDGES_MAX_PATCHES:
+        edge_label_settings_arrows = {}
+    else:
+        edge_label_settings_arrows = {
+            # Used to determine edge label positions
+            'connectionstyle': settings['edge_settings']['connection_style']
+        }
+
     networkx.draw_networkx_edge_labels(
         graph,
         pos = pos,
-        edge_labels = data_file_items,
+        edge_labels = edge_labels,
         label_pos = settings['edge_label_settings']['label_position'],
         rotate = settings['edge_label_settings']['rotate_labels'],
         font_family = settings['edge_label_settings']['font_family'],
@@ -345,8 +558,7 @@ def generate_network_graph(main, data_file_items, fig_settings):
         alpha = settings['edge_label_settings']['label_opacity'],
         horizontalalignment = settings['edge_label_settings']['hor_alignment'],
         verticalalignment = settings['edge_label_settings']['vert_alignment'],
-        # Used to determine edge label positions
-        connectionstyle = settings['edge_settings']['connection_style']
+        **edge_label_settings_arrows
     )
 
 def show_fig():
@@ -65,16 +65,23 @@ def wl_fig_freqs(main, freq_files_items, tab):
         ]
 
     col_sort_by_file = file_names_selected.index(fig_settings['sort_by_file'])
+    # Only items within the rank range need to be sorted
+    if fig_settings['graph_type'] == _tr('wl_figs_freqs', 'Word cloud'):
+        rank_max = wl_figs.get_rank_max_word_cloud(fig_settings)
+    else:
+        rank_max = wl_figs.get_rank_max(fig_settings)
 
     if tab == 'keyword_extractor':
         freq_files_items = wl_sorting.sorted_freq_files_items_keyword_extractor(
             freq_files_items,
-            sort_by_col = col_sort_by_file
+            sort_by_col = col_sort_by_file,
+            top_k = rank_max
         )
     else:
         freq_files_items = wl_sorting.sorted_freq_files_items(
             freq_files_items,
-            sort_by_col = col_sort_by_file
+            sort_by_col = col_sort_by_file,
+            top_k = rank_max
         )
 
     # Line Chart
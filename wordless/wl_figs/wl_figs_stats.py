@@ -54,17 +54,24 @@ def wl_fig_stats(main, stat_files_items, tab):
 
     file_names_selected = [*main.wl_file_area.get_selected_file_names(), _tr('wl_figs_stats', 'Total')]
     col_sort_by_file = file_names_selected.index(fig_settings['sort_by_file'])
+    # Only items within the rank range need to be sorted
+    if fig_settings['graph_type'] == _tr('wl_figs_stats', 'Word cloud'):
+        rank_max = wl_figs.get_rank_max_word_cloud(fig_settings)
+    else:
+        rank_max = wl_figs.get_rank_max(fig_settings)
 
     if fig_settings['use_data'] == _tr('wl_figs_stats', 'p-value'):
         stat_files_items = wl_sorting.sorted_freq_files_items(
             stat_files_items,
             sort_by_col = col_sort_by_file,
-            reverse = True
+            reverse = True,
+            top_k = rank_max
         )
     else:
         stat_files_items = wl_sorting.sorted_freq_files_items(
             stat_files_items,
-            sort_by_col = col_sort_by_file
+            sort_by_col = col_sort_by_file,
+            top_k = rank_max
         )
 
     # Line Chart
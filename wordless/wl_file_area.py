@@ -96,6 +96,12 @@ class Wrapper_File_Area(wl_layouts.Wl_Wrapper):
 
         self.wrapper_table.layout().setColumnStretch(1, 1)
 
+        # Texts of files restored from the last session are unloaded when needed
+        wl_texts.text_store.update_settings(self.main)
+
+        for file in self.get_files():
+            wl_texts.text_store.add(file['text'])
+
         # Load files
         self.table_files.update_table()
 
@@ -134,12 +140,20 @@ class Wrapper_File_Area(wl_layouts.Wl_Wrapper):
         return None
 
     def find_files_by_name(self, file_names, selected_only = False):
+        if selected_only:
+            files = self.get_selected_files()
+        else:
+            files = self.get_files()
+
+        # Look up files by their names in a hash table instead of scanning all files for each name
+        files = {file['name']: file for file in reversed(list(files))}
         files = [
-            self.find_file_by_name(file_name, selected_only = selected_only)
+            files[file_name]
             for file_name in file_names
+            if file_name in files
         ]
 
-        return (file for file in files if file)
+        return (file for file in files)
 
 # References:
 #     https://stackoverflow.com/a/29621256
@@ -189,25 +203,38 @@ class Wl_Table_Header_Files(QtWidgets.QHeaderView):
 
             self.update()
 
+    # Signals are emitted only once after check states of all rows are changed
     def select_all(self):
         self._is_checked = True
 
+        self.table.disable_updates()
+
         for i in range(self.model().rowCount()):
             self.model().item(i, 0).setCheckState(QtCore.Qt.Checked)
 
+        self.table.enable_updates()
+
     def deselect_all(self):
         self._is_checked = True
 
+        self.table.disable_updates()
+
         for i in range(self.model().rowCount()):
             self.model().item(i, 0).setCheckState(QtCore.Qt.Unchecked)
 
+        self.table.enable_updates()
+
     def invert_selection(self):
+        self.table.disable_updates()
+
         for i in range(self.model().rowCount()):
             if self.model().item(i, 0).checkState() == QtCore.Qt.Checked:
                 self.model().item(i, 0).setCheckState(QtCore.Qt.Unchecked)
             else:
                 self.model().item(i, 0).setCheckState(QtCore.Qt.Checked)
 
+        self.table.enable_updates()
+
 class Wl_Table_Files(wl_tables.Wl_Table):
     def __init__(self, parent):
         super().__init__(
@@ -376,6 +403,24 @@ class Wl_Table_Files(wl_tables.Wl_Table):
         else:
             self.main.action_file_close_selected.setEnabled(False)
 
+    def _set_row(self, row, file):
+        item_name = QtGui.QStandardItem(file['name'])
+        # Record file properties
+        item_name.wl_file = file
+        item_name.setCheckable(True)
+
+        if file['selected']:
+            item_name.setCheckState(QtCore.Qt.Checked)
+        else:
+            item_name.setCheckState(QtCore.Qt.Unchecked)
+
+        self.model().setItem(row, 0, item_name)
+        self.model().setItem(row, 1, QtGui.QStandardItem(file['path_orig']))
+        self.model().setItem(row, 2, QtGui.QStandardItem(wl_conversion.to_encoding_text(self.main, file['encoding'])))
+        self.model().setItem(row, 3, QtGui.QStandardItem(wl_conversion.to_lang_text(self.main, file['lang'])))
+        self.model().setItem(row, 4, QtGui.QStandardItem(wl_conversion.to_yes_no_text(file['tokenized'])))
+        self.model().setItem(row, 5, QtGui.QStandardItem(wl_conversion.to_yes_no_text(file['tagged'])))
+
     def update_table(self):
         if (files := self.main.settings_custom['file_area'][f'files_open{self.settings_suffix}']):
             self.clr_table(len(files))
@@ -383,22 +428,7 @@ class Wl_Table_Files(wl_tables.Wl_Table):
             self.disable_updates()
 
             for i, file in enumerate(files):
-                item_name = QtGui.QStandardItem(file['name'])
-                # Record file properties
-                item_name.wl_file = file
-                item_name.setCheckable(True)
-
-                if file['selected']:
-                    item_name.setCheckState(QtCore.Qt.Checked)
-                else:
-                    item_name.setCheckState(QtCore.Qt.Unchecked)
-
-                self.model().setItem(i, 0, item_name)
-                self.model().setItem(i, 1, QtGui.QStandardItem(file['path_orig']))
-                self.model().setItem(i, 2, QtGui.QStandardItem(wl_conversion.to_encoding_text(self.main, file['encoding'])))
-                self.model().setItem(i, 3, QtGui.QStandardItem(wl_conversion.to_lang_text(self.main, file['lang'])))
-                self.model().setItem(i, 4, QtGui.QStandardItem(wl_conversion.to_yes_no_text(file['tokenized'])))
-                self.model().setItem(i, 5, QtGui.QStandardItem(wl_conversion.to_yes_no_text(file['tagged'])))
+                self._set_row(i, file)
 
             self.enable_updates()
         else:
@@ -406,6 +436,23 @@ class Wl_Table_Files(wl_tables.Wl_Table):
 
         self.update_labels()
 
+    # Only rows of newly opened files are added to the table
+    def add_rows(self, files):
+        if self.is_empty():
+            self.update_table()
+        elif files:
+            self.disable_updates()
+
+            num_rows = self.model().rowCount()
+            self.model().setRowCount(num_rows + len(files))
+
+            for i, file in enumerate(files):
+                self._set_row(num_rows + i, file)
+
+            self.enable_updates()
+
+            self.update_labels()
+
     def update_labels(self):
         files = self.file_area.get_files()
         files_selected = list(self.file_area.get_selected_files())
@@ -475,7 +522,7 @@ class Wl_Table_Files(wl_tables.Wl_Table):
             len_files_old = len(self.main.settings_custom['file_area'][f'files_open{self.settings_suffix}'])
 
             self.main.settings_custom['file_area'][f'files_open{self.settings_suffix}'].extend(new_files)
-            self.update_table()
+            self.add_rows(new_files)
 
             self.dialog_open_corpora.accept()
 
@@ -508,6 +555,9 @@ class Wl_Table_Files(wl_tables.Wl_Table):
             if os.path.exists(file_to_remove['path']):
                 os.remove(file_to_remove['path'])
 
+            # Only paths of closed files are needed when reopening them
+            wl_texts.text_store.unload(file_to_remove['text'])
+
         self.update_table()
 
     def close_selected(self):
@@ -670,9 +720,7 @@ class Wl_Dialog_Open_Corpora(wl_dialogs.Wl_Dialog):
 
     def update_gui(self, err_msg, new_files):
         if wl_checks_files.check_err_file_area(self, err_msg):
-            self.table_files.files_to_open.extend(new_files)
-
-            self.table_files.update_table()
+            self.table_files.add_rows(new_files)
 
             if self.file_paths_empty or self.file_paths_unsupported or self.file_paths_dup:
                 dialog_err_files = wl_dialogs_errs.Wl_Dialog_Err_Files(self.main, title = self.tr('Error Adding Files'))
@@ -817,6 +865,15 @@ class Table_Open_Files(wl_tables.Wl_Table_Add_Ins_Del_Clr):
 
         super().clr_table(num_headers = num_headers)
 
+    def _set_row(self, row, file):
+        self.model().setItem(row, 0, QtGui.QStandardItem(file['path_orig']))
+        self.model().setItem(row, 1, QtGui.QStandardItem(wl_conversion.to_encoding_text(self.main, file['encoding'])))
+        self.model().setItem(row, 2, QtGui.QStandardItem(wl_conversion.to_lang_text(self.main, file['lang'])))
+        self.model().setItem(row, 3, QtGui.QStandardItem(wl_conversion.to_yes_no_text(file['tokenized'])))
+        self.model().setItem(row, 4, QtGui.QStandardItem(wl_conversion.to_yes_no_text(file['tagged'])))
+
+        self.model().item(row, 0).file = file
+
     def update_table(self):
         files = self.files_to_open
 
@@ -826,18 +883,29 @@ class Table_Open_Files(wl_tables.Wl_Table_Add_Ins_Del_Clr):
             self.disable_updates()
 
             for i, file in enumerate(files):
-                self.model().setItem(i, 0, QtGui.QStandardItem(file['path_orig']))
-                self.model().setItem(i, 1, QtGui.QStandardItem(wl_conversion.to_encoding_text(self.main, file['encoding'])))
-                self.model().setItem(i, 2, QtGui.QStandardItem(wl_conversion.to_lang_text(self.main, file['lang'])))
-                self.model().setItem(i, 3, QtGui.QStandardItem(wl_conversion.to_yes_no_text(file['tokenized'])))
-                self.model().setItem(i, 4, QtGui.QStandardItem(wl_conversion.to_yes_no_text(file['tagged'])))
-
-                self.model().item(i, 0).file = file
+                self._set_row(i, file)
 
             self.enable_updates()
         else:
             self.clr_table()
 
+    # Only rows of newly added files are added to the table
+    def add_rows(self, files):
+        if self.is_empty():
+            self.files_to_open.extend(files)
+            self.update_table()
+        elif files:
+            self.disable_updates()
+
+            num_rows = self.model().rowCount()
+            self.model().setRowCount(num_rows + len(files))
+
+            for i, file in enumerate(files):
+                self._set_row(num_rows + i, file)
+
+            # Files to open are collected from the table when signals are emitted
+            self.enable_updates()
+
 class Wl_Dialog_Opening_Nontext_Files(wl_dialogs.Wl_Dialog_Info):
     def __init__(self, main):
         super().__init__(
@@ -1089,6 +1157,11 @@ class Wl_Worker_Add_Files(wl_threading.Wl_Worker):
 
         try:
             len_file_paths = len(self.file_paths)
+            # Names of files in the file area and files to be opened, updated as new files are added
+            file_names = {
+                *self.file_area.get_file_names(),
+                *(file['name'] for file in self.table.files_to_open)
+            }
 
             for i, file_path in enumerate(self.file_paths):
                 if not self._running:
@@ -1103,12 +1176,6 @@ class Wl_Worker_Add_Files(wl_threading.Wl_Worker):
                 new_file = {'selected': True, 'path_orig': file_path}
 
                 # Check for duplicate file names
-                file_names = (
-                    *self.file_area.get_file_names(),
-                    *[file['name'] for file in self.table.files_to_open],
-                    *[new_file['name'] for new_file in new_files]
-                )
-
                 new_file['name'] = new_file['name_old'] = wl_checks_misc.check_new_name(file_name, file_names)
 
                 # Path, Tokenized, Tagged
@@ -1156,6 +1223,7 @@ class Wl_Worker_Add_Files(wl_threading.Wl_Worker):
                         new_file['lang'] = self.main.settings_custom['files']['default_settings']['lang']
 
                     new_files.append(new_file)
+                    file_names.add(new_file['name'])
                 # Translation memory files
                 else:
                     lines_src = []
@@ -1208,6 +1276,8 @@ class Wl_Worker_Add_Files(wl_threading.Wl_Worker):
 
                     new_files.append(new_file_src)
                     new_files.append(new_file_tgt)
+                    file_names.add(new_file_src['name'])
+                    file_names.add(new_file_tgt['name'])
 
         except wl_excs.Wl_Exc_Aborted:
             err_msg = 'aborted'
@@ -1229,6 +1299,7 @@ class Wl_Worker_Open_Files(wl_threading.Wl_Worker):
 
         try:
             len_files = len(self.files_to_open)
+            wl_texts.text_store.update_settings(self.main)
             # Regex for headers
             tags_header = wl_matching.get_re_tags_with_tokens(self.main, tag_type = 'header')
             RE_TAGS_HEADER = re.compile(tags_header)
@@ -1281,6 +1352,9 @@ class Wl_Worker_Open_Files(wl_threading.Wl_Worker):
                 elif self.file_type == 'ref':
                     file['text'] = wl_texts.Wl_Text_Ref(self.main, file)
 
+                # Least-recently-used texts are unloaded if the memory limit is exceeded
+                wl_texts.text_store.add(file['text'])
+
                 new_files.append(file)
         except wl_excs.Wl_Exc_Aborted:
             err_msg = 'aborted'
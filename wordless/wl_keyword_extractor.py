@@ -43,6 +43,7 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import (
     wl_excs,
+    wl_instrumentation,
     wl_misc,
     wl_sorting,
     wl_threading
@@ -454,6 +455,7 @@ class Wl_Table_Keyword_Extractor(wl_tables.Wl_Table_Data):
                 self.wl_dialog_missing_corpus_ref()
                 self.wl_status_bar_msg_missing_corpus_ref()
 
+    @wl_instrumentation.log_stage('tables/keyword_extractor')
     def update_gui_table(self, err_msg, keywords_freq_files, keywords_stats_files):
         if wl_checks_work_area.check_results(self.main, err_msg, keywords_freq_files):
             try:
@@ -678,6 +680,7 @@ class Wl_Table_Keyword_Extractor(wl_tables.Wl_Table_Data):
                 self.wl_dialog_missing_corpus_ref()
                 self.wl_status_bar_msg_missing_corpus_ref()
 
+    @wl_instrumentation.log_stage('figs/keyword_extractor')
     def update_gui_fig(self, err_msg, keywords_freq_files, keywords_stats_files):
         if wl_checks_work_area.check_results(self.main, err_msg, keywords_freq_files):
             hide_dialog_err_fatal = False
@@ -805,7 +808,12 @@ class Wl_Worker_Keyword_Extractor(wl_threading.Wl_Worker):
 
                 texts.append(wl_texts.Wl_Text_Total(texts))
 
-                self.keywords_freq_files.append(sum(self.keywords_freq_files[1:], collections.Counter()))
+                keywords_freq_total = collections.Counter()
+
+                for keywords_freq_file in self.keywords_freq_files[1:]:
+                    keywords_freq_total.update(keywords_freq_file)
+
+                self.keywords_freq_files.append(keywords_freq_total)
 
             # Remove tokens that do not appear in any observed corpus
             self.keywords_freq_files[0] = {
@@ -909,25 +917,28 @@ class Wl_Worker_Keyword_Extractor(wl_threading.Wl_Worker):
                         test_stats = [None] * num_keywords_all
                         p_vals = [None] * num_keywords_all
                     else:
-                        if to_sections_statistical_significance:
-                            test_stats, p_vals = func_statistical_significance(self.main, freqs_x1s_statistical_significance, freqs_x2s_statistical_significance)
-                        else:
-                            test_stats, p_vals = func_statistical_significance(self.main, o11s, o12s, o21s, o22s)
+                        with wl_instrumentation.stage('measures/statistical_significance', num_items = num_keywords_all):
+                            if to_sections_statistical_significance:
+                                test_stats, p_vals = func_statistical_significance(self.main, freqs_x1s_statistical_significance, freqs_x2s_statistical_significance)
+                            else:
+                                test_stats, p_vals = func_statistical_significance(self.main, o11s, o12s, o21s, o22s)
 
                     # Bayes Factor
                     if measure_bayes_factor == 'none':
                         bayes_factors = [None] * num_keywords_all
                     else:
-                        if to_sections_bayes_factor:
-                            bayes_factors = func_bayes_factor(self.main, freqs_x1s_bayes_factor, freqs_x2s_bayes_factor)
-                        else:
-                            bayes_factors = func_bayes_factor(self.main, o11s, o12s, o21s, o22s)
+                        with wl_instrumentation.stage('measures/bayes_factor', num_items = num_keywords_all):
+                            if to_sections_bayes_factor:
+                                bayes_factors = func_bayes_factor(self.main, freqs_x1s_bayes_factor, freqs_x2s_bayes_factor)
+                            else:
+                                bayes_factors = func_bayes_factor(self.main, o11s, o12s, o21s, o22s)
 
                     # Effect Size
                     if measure_effect_size == 'none':
                         effect_sizes = [None] * num_keywords_all
                     else:
-                        effect_sizes = func_effect_size(self.main, o11s, o12s, o21s, o22s)
+                        with wl_instrumentation.stage('measures/effect_size', num_items = num_keywords_all):
+                            effect_sizes = func_effect_size(self.main, o11s, o12s, o21s, o22s)
 
                     for i, token in enumerate(keywords_all):
                         if not self._running:
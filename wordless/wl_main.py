@@ -69,15 +69,16 @@ from wordless import (
     wl_colligation_extractor,
     wl_keyword_extractor
 )
-from wordless.wl_checks import wl_checks_misc
 from wordless.wl_dialogs import (
     wl_dialogs,
     wl_dialogs_misc
 )
+from wordless.wl_nlp import wl_syl_tokenization
 from wordless.wl_settings import (
     wl_settings,
     wl_settings_default,
-    wl_settings_global
+    wl_settings_global,
+    wl_settings_persistence
 )
 from wordless.wl_utils import (
     wl_misc,
@@ -214,27 +215,25 @@ class Wl_Main(QtWidgets.QMainWindow):
         self.settings_default = wl_settings_default.init_settings_default(self)
 
         # Custom settings
-        if os.path.exists(file_settings):
-            with open(file_settings, 'rb') as f:
-                try:
-                    settings_custom = pickle.load(f)
+        self.settings_file = wl_settings_persistence.Wl_Settings_File(file_settings)
 
-                    if wl_checks_misc.check_custom_settings(settings_custom, self.settings_default):
-                        self.settings_custom = settings_custom
-                    else:
-                        self.settings_custom = copy.deepcopy(self.settings_default)
-                # Use default settings if the pickle file is empty
-                except EOFError:
-                    self.settings_custom = copy.deepcopy(self.settings_default)
+        try:
+            self.settings_custom = self.settings_file.load(self.settings_default)
+        # Use default settings if the pickle file is empty or corrupt
+        except (EOFError, pickle.UnpicklingError):
+            self.settings_custom = wl_settings_persistence.copy_settings(self.settings_default)
 
-                    os.remove(file_settings)
-        else:
-            self.settings_custom = copy.deepcopy(self.settings_default)
+            os.remove(file_settings)
 
         if os.path.exists(file_settings_display_lang):
             with open(file_settings_display_lang, 'rb') as f:
                 self.settings_custom['menu']['prefs']['display_lang'] = pickle.load(f)
 
+        # Cache of syllables
+        if self.settings_custom['syl_tokenization']['cache_settings']['save_cache']:
+            wl_syl_tokenization.syl_cache.set_max_size(self.settings_custom['syl_tokenization']['cache_settings']['max_cache_size'])
+            wl_syl_tokenization.syl_cache.load(file_cache_syls)
+
         self.loading_window.show_message(self.tr('Initializing main window...'))
 
         # Font
@@ -644,6 +643,8 @@ class Wl_Main(QtWidgets.QMainWindow):
                             pickle.dump(action.lang, f)
 
                         # Remove settings file
+                        self.settings_file.wait()
+
                         if os.path.exists(file_settings):
                             os.remove(file_settings)
 
@@ -737,8 +738,13 @@ class Wl_Main(QtWidgets.QMainWindow):
         self.settings_custom['menu']['prefs']['layouts']['colligation_extractor'] = self.wl_work_area.widget(7).splitter.sizes()
         self.settings_custom['menu']['prefs']['layouts']['keyword_extractor'] = self.wl_work_area.widget(8).splitter.sizes()
 
-        with open(file_settings, 'wb') as f:
-            pickle.dump(self.settings_custom, f)
+        # Settings are saved in the background
+        self.settings_file.save(self.settings_custom, self.settings_default)
+
+        if self.settings_custom['syl_tokenization']['cache_settings']['save_cache']:
+            wl_syl_tokenization.syl_cache.save(file_cache_syls)
+        elif os.path.exists(file_cache_syls):
+            os.remove(file_cache_syls)
 
     def restart(self, save_settings = True):
         # pylint: disable=consider-using-with
@@ -746,6 +752,9 @@ class Wl_Main(QtWidgets.QMainWindow):
         if save_settings:
             self.save_settings()
 
+            # The new instance should not be started until settings have been saved
+            self.settings_file.wait()
+
         if getattr(sys, '_MEIPASS', False):
             if is_windows:
                 subprocess.Popen([wl_paths.get_path_file('Wordless.exe', internal = False)])
@@ -1391,6 +1400,7 @@ class Wl_Dialog_About(wl_dialogs.Wl_Dialog_Info):
 if __name__ == '__main__':
     file_settings = wl_paths.get_path_file('wl_settings.pickle', internal = False)
     file_settings_display_lang = wl_paths.get_path_file('wl_settings_display_lang.pickle', internal = False)
+    file_cache_syls = wl_paths.get_path_file('wl_cache_syls.pickle', internal = False)
 
     first_startup = not os.path.exists(file_settings)
     corrupt_settings_file = False
@@ -1399,16 +1409,17 @@ if __name__ == '__main__':
     global_font_size = wl_settings_default.DEFAULT_FONT_SIZE
 
     if not first_startup:
-        with open(file_settings, 'rb') as f:
-            try:
-                settings_custom = pickle.load(f)
-
-                ui_scaling = settings_custom['general']['ui_settings']['interface_scaling']
-                global_font_family = settings_custom['general']['ui_settings']['font_family']
-                global_font_size = settings_custom['general']['ui_settings']['font_size']
-            # Empty pickle file
-            except EOFError:
-                corrupt_settings_file = True
+        try:
+            settings_delta = wl_settings_persistence.read_settings(file_settings)[0]
+            # Only settings different from default settings are saved
+            settings_ui = settings_delta.get('general', {}).get('ui_settings', {})
+
+            ui_scaling = settings_ui.get('interface_scaling', ui_scaling)
+            global_font_family = settings_ui.get('font_family', global_font_family)
+            global_font_size = settings_ui.get('font_size', global_font_size)
+        # Empty or corrupt pickle file
+        except (EOFError, pickle.UnpicklingError):
+            corrupt_settings_file = True
 
     # Remove the empty pickle file
     if corrupt_settings_file:
@@ -19,19 +19,85 @@
 # pylint: disable=unused-argument
 
 import collections
-import random
 
 import numpy
 from PyQt5 import QtCore
 import scipy
 
 from wordless.wl_nlp import (
-    wl_nlp_utils,
-    wl_pos_tagging
+    wl_pos_tagging,
+    wl_texts
 )
 
 _tr = QtCore.QCoreApplication.translate
 
+def get_freqs(main, text):
+    # Frequencies of types, frequency spectrum, and rank-frequency distribution are computed only once for each text
+    if not wl_texts.is_cached(text, 'types_freqs'):
+        type_ids = {}
+
+        # IDs of types of the total are merged from those of each file instead of hashing all tokens again
+        if isinstance(text, wl_texts.Wl_Text_Total):
+            token_ids = []
+            text.tokens_flat = []
+
+            for text_file in text.texts:
+                get_freqs(main, text_file)
+
+                # Map IDs of types in each file to IDs of types in the total
+                type_ids_file = numpy.fromiter(
+                    (type_ids.setdefault(type_, len(type_ids)) for type_ in text_file.types),
+                    dtype = numpy.int64,
+                    count = len(text_file.types)
+                )
+
+                token_ids.append(type_ids_file[text_file.token_ids])
+                text.tokens_flat.extend(text_file.tokens_flat)
+
+            text.token_ids = numpy.concatenate(token_ids)
+        else:
+            text.tokens_flat = text.get_tokens_flat()
+
+            # Map tokens to integer IDs of types in order of first occurrences
+            # Tokens are hashed by their display texts, which are faster to hash directly as strings
+            text.token_ids = numpy.fromiter(
+                (type_ids.setdefault(token.display_text(), len(type_ids)) for token in text.tokens_flat),
+                dtype = numpy.int64,
+                count = len(text.tokens_flat)
+            )
+
+        text.types = list(type_ids)
+
+        # Frequencies of types in order of first occurrences
+        freqs = numpy.bincount(text.token_ids, minlength = len(type_ids))
+        offsets_types = numpy.unique(text.token_ids, return_index = True)[1]
+
+        text.freqs = freqs.astype(float)
+        text.types_freqs = collections.Counter(dict(zip(
+            (text.tokens_flat[offset] for offset in offsets_types),
+            freqs.tolist()
+        )))
+
+        # Frequency spectrum (frequencies -> numbers of types with the frequency)
+        text.freqs_nums_types = collections.Counter(text.types_freqs.values())
+        text.spectrum_freqs = numpy.array(list(text.freqs_nums_types), dtype = float)
+        text.spectrum_nums_types = numpy.array(list(text.freqs_nums_types.values()), dtype = float)
+
+        # Rank-frequency distribution
+        text.freqs_ranked = numpy.sort(text.freqs)[::-1]
+        text.ranks = numpy.arange(1, len(text.freqs_ranked) + 1, dtype = float)
+
+def get_offsets_prev(main, text):
+    # Offsets of the previous occurrences of the same types (-1 for first occurrences)
+    if not wl_texts.is_cached(text, 'offsets_prev'):
+        get_freqs(main, text)
+
+        offsets = numpy.argsort(text.token_ids, kind = 'stable')
+        same_types = text.token_ids[offsets[1:]] == text.token_ids[offsets[:-1]]
+
+        text.offsets_prev = numpy.full(len(text.token_ids), -1, dtype = numpy.int64)
+        text.offsets_prev[offsets[1:][same_types]] = offsets[:-1][same_types]
+
 # Brunet's index
 # Reference: Brunet, E. (1978). Le vocabulaire de Jean Giraudoux: Structure et evolution. Slatkine. | p. 57
 def brunets_index(main, text):
@@ -70,12 +136,9 @@ def fishers_index_of_diversity(main, text):
 # Herdan's vₘ
 # Reference: Herdan, G. (1955). A new derivation and interpretation of Yule's ‘Characteristic’ K. Zeitschrift für Angewandte Mathematik und Physik (ZAMP), 6(4), 332–339. https://doi.org/10.1007/BF01587632
 def herdans_vm(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    freqs_nums_types = collections.Counter(types_freqs.values())
+    get_freqs(main, text)
 
-    freqs = numpy.array(list(freqs_nums_types))
-    nums_types = numpy.array(list(freqs_nums_types.values()))
-    s2 = numpy.sum(nums_types * numpy.square(freqs))
+    s2 = numpy.sum(text.spectrum_nums_types * numpy.square(text.spectrum_freqs))
     vm = s2 / (text.num_tokens ** 2) - 1 / text.num_types
 
     return vm
@@ -85,30 +148,25 @@ def herdans_vm(main, text):
 def hdd(main, text):
     sample_size = main.settings_custom['measures']['lexical_density_diversity']['hdd']['sample_size']
 
-    tokens_freqs = collections.Counter(text.get_tokens_flat())
-    ttrs = numpy.empty(len(list(tokens_freqs)))
+    get_freqs(main, text)
 
     # Short texts
     sample_size = min(sample_size, text.num_tokens)
 
-    for i, freq in enumerate(tokens_freqs.values()):
-        ttrs[i] = scipy.stats.hypergeom.pmf(k = 0, M = text.num_tokens, n = freq, N = sample_size)
-
     # The probability that each type appears at least once in the sample
-    ttrs = 1 - ttrs
+    ttrs = 1 - scipy.stats.hypergeom.pmf(k = 0, M = text.num_tokens, n = text.freqs, N = sample_size)
     ttrs *= 1 / sample_size
 
-    return sum(ttrs)
+    return numpy.sum(ttrs)
 
 # Honoré's statistic
 # References:
 #     Honoré, A. (1979). Some simple measures of richness of vocabulary. Association of Literary and Linguistic Computing Bulletin, 7(2), 172–177.
 #     Bucks, R. S., Singh, S., Cuerden, J. M., & Wilcock, G. K. (2000). Analysis of spontaneous, conversational speech in dementia of Alzheimer type: Evaluation of an objective technique for analysing lexical performance. Aphasiology, 14(1), 71–91. https://doi.org/10.1080/026870300401603
 def honores_stat(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    freqs_nums_types = collections.Counter(types_freqs.values())
+    get_freqs(main, text)
 
-    if (denominator := 1 - freqs_nums_types[1] / text.num_types):
+    if (denominator := 1 - text.freqs_nums_types[1] / text.num_types):
         r = 100 * numpy.log(text.num_tokens / denominator)
     else:
         r = 0
@@ -119,11 +177,13 @@ def honores_stat(main, text):
 # Reference: Halliday, M. A. K. (1989). Spoken and written language (2nd ed.). Oxford University Press. | p. 64
 def lexical_density(main, text):
     if text.lang in main.settings_global['pos_taggers']:
-        wl_pos_tagging.wl_pos_tag_universal(main, text.get_tokens_flat(), lang = text.lang, tagged = text.tagged)
+        get_freqs(main, text)
+
+        wl_pos_tagging.wl_pos_tag_universal(main, text.tokens_flat, lang = text.lang, tagged = text.tagged)
 
         num_content_words = sum((
             1
-            for token in text.get_tokens_flat()
+            for token in text.tokens_flat
             if token.content_function == _tr('wl_measures_lexical_density_diversity', 'Content words')
         ))
         num_tokens = text.num_tokens
@@ -172,91 +232,128 @@ def logttr(main, text):
 def msttr(main, text):
     num_tokens_seg = main.settings_custom['measures']['lexical_density_diversity']['msttr']['num_tokens_in_each_seg']
 
-    ttrs = [
-        len(set(tokens_seg)) / num_tokens_seg
-        for tokens_seg in wl_nlp_utils.to_sections_unequal(text.get_tokens_flat(), num_tokens_seg)
+    return msttrs(main, text, [num_tokens_seg])[0]
+
+def msttrs(main, text, nums_tokens_seg):
+    get_offsets_prev(main, text)
+
+    msttrs_segs = []
+    offsets = numpy.arange(len(text.token_ids))
+
+    for num_tokens_seg in nums_tokens_seg:
         # Discard the last segment of text if its length is shorter than other segments
-        if len(tokens_seg) == num_tokens_seg
-    ]
+        num_segs = len(text.token_ids) // num_tokens_seg
 
-    if ttrs:
-        msttr = numpy.mean(ttrs)
-    else:
-        msttr = 0
+        if num_segs:
+            segs = offsets[:num_segs * num_tokens_seg] // num_tokens_seg
+            # A token is the first occurrence of its type in a segment if its previous occurrence is before the segment
+            first_occurrences = text.offsets_prev[:num_segs * num_tokens_seg] < segs * num_tokens_seg
+            ttrs = numpy.bincount(segs[first_occurrences], minlength = num_segs) / num_tokens_seg
 
-    return msttr
+            msttrs_segs.append(numpy.mean(ttrs))
+        else:
+            msttrs_segs.append(0)
+
+    return msttrs_segs
 
 # Measure of textual lexical diversity
 # References:
 #     McCarthy, P. M. (2005). An assessment of the range and usefulness of lexical diversity measures and the potential of the measure of textual, lexical diversity (MTLD) (Publication No. 3199485) [Doctoral dissertation, The University of Memphis]. ProQuest Dissertations and Theses Global. | pp. 95–96, 99–100
 #     McCarthy, P. M., & Jarvis, S. (2010). MTLD, vocd-D, and HD-D: A validation study of sophisticated approaches to lexical diversity assessment. Behavior Research Methods, 42(2), 381–392. https://doi.org/10.3758/BRM.42.2.381
 def mtld(main, text):
-    mtlds = numpy.empty(shape = 2)
     factor_size = main.settings_custom['measures']['lexical_density_diversity']['mtld']['factor_size']
-    tokens = text.get_tokens_flat()
 
-    for i in range(2):
-        num_factors = 0
-        counter = collections.Counter()
+    return mtlds(main, text, [factor_size])[0]
 
-        # Backward MTLD
-        if i == 1:
-            tokens = reversed(tokens)
-
-        for j, token in enumerate(tokens):
-            counter[token] += 1
-            num_types_counter = len(list(counter))
-            ttr = num_types_counter / counter.total()
+def mtlds(main, text, factor_sizes):
+    get_freqs(main, text)
 
-            if ttr <= factor_size:
-                num_factors += 1
+    num_tokens = len(text.token_ids)
+    num_factor_sizes = len(factor_sizes)
+    mtlds_factor_sizes = numpy.empty(shape = (num_factor_sizes, 2))
 
-                counter.clear()
-            # The last incomplete factor
-            elif j == text.num_tokens - 1:
-                if factor_size < 1:
-                    num_factors += (1 - ttr) / (1 - factor_size)
+    for i in range(2):
+        token_ids = text.token_ids.tolist()
 
-        if num_factors:
-            mtlds[i] = text.num_tokens / num_factors
-        else:
-            mtlds[i] = 0
+        # Backward MTLD
+        if i == 1:
+            token_ids.reverse()
+
+        # Numbers of tokens and types in the current factor, and the numbers of factors for each factor size
+        nums_tokens_factor = [0] * num_factor_sizes
+        nums_types_factor = [0] * num_factor_sizes
+        nums_factors = [0] * num_factor_sizes
+        # The factor in which each type was last seen, so that counters need not be cleared when new factors start
+        factors_last_seen = [[-1] * text.num_types for _ in range(num_factor_sizes)]
+
+        for j, token_id in enumerate(token_ids):
+            for k, factor_size in enumerate(factor_sizes):
+                factors_last_seen_factor_size = factors_last_seen[k]
+
+                nums_tokens_factor[k] += 1
+
+                if factors_last_seen_factor_size[token_id] != nums_factors[k]:
+                    factors_last_seen_factor_size[token_id] = nums_factors[k]
+                    nums_types_factor[k] += 1
+
+                ttr = nums_types_factor[k] / nums_tokens_factor[k]
+
+                if ttr <= factor_size:
+                    nums_factors[k] += 1
+                    nums_tokens_factor[k] = 0
+                    nums_types_factor[k] = 0
+                # The last incomplete factor
+                elif j == num_tokens - 1:
+                    if factor_size < 1:
+                        nums_factors[k] += (1 - ttr) / (1 - factor_size)
+
+        for k, num_factors in enumerate(nums_factors):
+            if num_factors:
+                mtlds_factor_sizes[k, i] = num_tokens / num_factors
+            else:
+                mtlds_factor_sizes[k, i] = 0
 
-    return numpy.mean(mtlds)
+    return [numpy.mean(mtlds_factor_size) for mtlds_factor_size in mtlds_factor_sizes]
 
 # Moving-average TTR
 # Reference: Covington, M. A., & McFall, J. D. (2010). Cutting the Gordian knot: The moving-average type-token ratio (MATTR). Journal of Quantitative Linguistics, 17(2), 94–100. https://doi.org/10.1080/09296171003643098
 def mattr(main, text):
     window_size = main.settings_custom['measures']['lexical_density_diversity']['mattr']['window_size']
 
-    num_windows = max(1, text.num_tokens - window_size + 1)
-    ttrs = numpy.empty(shape = num_windows)
-    tokens = text.get_tokens_flat()
+    return mattrs(main, text, [window_size])[0]
 
-    counter = collections.Counter(tokens[:window_size])
+def mattrs(main, text, window_sizes):
+    get_offsets_prev(main, text)
 
-    ttrs[0] = len(list(counter)) / counter.total()
+    mattrs_window_sizes = []
+    num_tokens = len(text.token_ids)
+    offsets = numpy.arange(num_tokens)
 
-    if num_windows > 1:
-        for i in range(num_windows - 1):
-            counter[tokens[window_size + i]] += 1
-            counter[tokens[i]] -= 1
+    for window_size in window_sizes:
+        # Short texts
+        window_size = min(window_size, num_tokens)
+        num_windows = num_tokens - window_size + 1
 
-            if counter[tokens[i]] == 0:
-                counter.pop(tokens[i])
+        # Each token is counted as a new type in windows that start after the previous occurrence of its type and contain the token
+        windows_start = numpy.maximum(text.offsets_prev + 1, offsets - window_size + 1)
+        windows_end = numpy.minimum(offsets, num_windows - 1)
+        counted = windows_start <= windows_end
 
-            ttrs[i + 1] = len(list(counter))
+        nums_types = numpy.cumsum(
+            numpy.bincount(windows_start[counted], minlength = num_windows + 1)
+            - numpy.bincount(windows_end[counted] + 1, minlength = num_windows + 1)
+        )[:num_windows]
 
-        ttrs[1:] /= window_size
+        mattrs_window_sizes.append(numpy.mean(nums_types / window_size))
 
-    return numpy.mean(ttrs)
+    return mattrs_window_sizes
 
 # Popescu-Mačutek-Altmann's B₁/B₂/B₃/B₄/B₅
 # Reference: Popescu I.-I., Mačutek, J, & Altmann, G. (2008). Word frequency and arc length. Glottometrics, 17, 18–42.
 def popescu_macutek_altmanns_b1_b2_b3_b4_b5(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    freqs = numpy.array(sorted(types_freqs.values(), reverse = True))
-    freqs_nums_types = collections.Counter(types_freqs.values())
+    get_freqs(main, text)
+
+    freqs = text.freqs_ranked
 
     l = numpy.sum(numpy.sqrt(numpy.square(freqs[:-1] - freqs[1:]) + 1))
     l_min = numpy.sqrt(numpy.square(text.num_types - 1) + numpy.square(freqs[0] - 1))
@@ -271,20 +368,17 @@ def popescu_macutek_altmanns_b1_b2_b3_b4_b5(main, text):
 
     b3 = (text.num_types - 1) / l
     b4 = (freqs[0] - 1) / l
-    b5 = freqs_nums_types[1] / l
+    b5 = text.freqs_nums_types[1] / l
 
     return b1, b2, b3, b4, b5
 
 # Popescu's R₁
 # Reference: Popescu, I.-I. (2009). Word frequency studies. Mouton de Gruyter. | pp. 18, 30, 33
 def popescus_r1(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    ranks = numpy.empty(shape = text.num_types)
-    freqs = numpy.empty(shape = text.num_types)
+    get_freqs(main, text)
 
-    for i, freq in enumerate(sorted(types_freqs.values(), reverse = True)):
-        ranks[i] = i + 1
-        freqs[i] = freq
+    ranks = text.ranks
+    freqs = text.freqs_ranked
 
     h = 0
 
@@ -312,8 +406,9 @@ def popescus_r1(main, text):
 # Popescu's R₂
 # Reference: Popescu, I.-I. (2009). Word frequency studies. Mouton de Gruyter. | pp. 35–36, 38
 def popescus_r2(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    freqs_nums_types = sorted(collections.Counter(types_freqs.values()).items())
+    get_freqs(main, text)
+
+    freqs_nums_types = sorted(text.freqs_nums_types.items())
     freqs = numpy.array([freq for freq, _ in freqs_nums_types])
     nums_types = numpy.array([num_types for _, num_types in freqs_nums_types])
 
@@ -347,24 +442,10 @@ def popescus_r2(main, text):
 # Popescu's R₃
 # Reference: Popescu, I.-I. (2009). Word frequency studies. Mouton de Gruyter. | pp. 48–49, 53
 def popescus_r3(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    ranks_freqs = [
-        (i + 1, freq)
-        for i, freq in enumerate(sorted(types_freqs.values(), reverse = True))
-    ]
-
-    rs_rel = numpy.empty(shape = text.num_types)
-    fs_rel = numpy.empty(shape = text.num_types)
-    freq_cum = 0
-
-    for i, (rank, freq) in enumerate(ranks_freqs):
-        freq_cum += freq
+    get_freqs(main, text)
 
-        rs_rel[i] = rank
-        fs_rel[i] = freq_cum
-
-    rs_rel /= text.num_types
-    fs_rel /= text.num_tokens
+    rs_rel = text.ranks / text.num_types
+    fs_rel = numpy.cumsum(text.freqs_ranked) / text.num_tokens
 
     drs = numpy.sqrt(numpy.square(rs_rel) + numpy.square(1 - fs_rel))
     m = numpy.argmin(drs) + 1 # m refers to rank
@@ -376,16 +457,9 @@ def popescus_r3(main, text):
 # Popescu's R₄
 # Reference: Popescu, I.-I. (2009). Word frequency studies. Mouton de Gruyter. | p. 57
 def popescus_r4(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-
-    ranks = numpy.empty(shape = text.num_types)
-    freqs = numpy.empty(shape = text.num_types)
-
-    for i, freq in enumerate(sorted(types_freqs.values(), reverse = True)):
-        ranks[i] = i + 1
-        freqs[i] = freq
+    get_freqs(main, text)
 
-    r4 = 1 - (text.num_types + 1 - 2 / text.num_tokens * numpy.sum(ranks * freqs)) / text.num_types
+    r4 = 1 - (text.num_types + 1 - 2 / text.num_tokens * numpy.sum(text.ranks * text.freqs_ranked)) / text.num_types
 
     return r4
 
@@ -394,16 +468,12 @@ def popescus_r4(main, text):
 def repeat_rate(main, text):
     use_data = main.settings_custom['measures']['lexical_density_diversity']['repeat_rate']['use_data']
 
-    types_freqs = collections.Counter(text.get_tokens_flat())
+    get_freqs(main, text)
 
     if use_data == _tr('wl_measures_lexical_density_diversity', 'Rank-frequency distribution'):
-        freqs = numpy.array(list(types_freqs.values()))
-
-        rr = numpy.sum(numpy.square(freqs)) / numpy.square(text.num_tokens)
+        rr = numpy.sum(numpy.square(text.freqs)) / numpy.square(text.num_tokens)
     elif use_data == _tr('wl_measures_lexical_density_diversity', 'Frequency spectrum'):
-        nums_types = numpy.array(list(collections.Counter(types_freqs.values()).values()))
-
-        rr = numpy.sum(numpy.square(nums_types)) / numpy.square(text.num_types)
+        rr = numpy.sum(numpy.square(text.spectrum_nums_types)) / numpy.square(text.num_types)
 
     return rr
 
@@ -419,14 +489,12 @@ def rttr(main, text):
 def shannon_entropy(main, text):
     use_data = main.settings_custom['measures']['lexical_density_diversity']['shannon_entropy']['use_data']
 
-    types_freqs = collections.Counter(text.get_tokens_flat())
+    get_freqs(main, text)
 
     if use_data == _tr('wl_measures_lexical_density_diversity', 'Rank-frequency distribution'):
-        freqs = numpy.array(list(types_freqs.values()))
-        ps = freqs / text.num_tokens
+        ps = text.freqs / text.num_tokens
     elif use_data == _tr('wl_measures_lexical_density_diversity', 'Frequency spectrum'):
-        nums_types = numpy.array(list(collections.Counter(types_freqs.values()).values()))
-        ps = nums_types / text.num_types
+        ps = text.spectrum_nums_types / text.num_types
 
     h = -numpy.sum(ps * numpy.log2(ps))
 
@@ -435,12 +503,9 @@ def shannon_entropy(main, text):
 # Simpson's l
 # Reference: Simpson, E. H. (1949). Measurement of diversity. Nature, 163, 688. https://doi.org/10.1038/163688a0
 def simpsons_l(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    freqs_nums_types = collections.Counter(types_freqs.values())
-    freqs = numpy.array(list(freqs_nums_types))
-    nums_types = numpy.array(list(freqs_nums_types.values()))
+    get_freqs(main, text)
 
-    s2 = numpy.sum(nums_types * numpy.square(freqs))
+    s2 = numpy.sum(text.spectrum_nums_types * numpy.square(text.spectrum_freqs))
     l = (s2 - text.num_tokens) / (text.num_tokens * (text.num_tokens - 1))
 
     return l
@@ -456,21 +521,29 @@ def vocdd(main, text):
     def ttr(n, d):
         return (d / n) * (numpy.sqrt(1 + 2 * n / d) - 1)
 
-    tokens = text.get_tokens_flat()
-    ttr_ys = numpy.empty(shape = 16)
-
-    for i, n in enumerate(range(35, 51)):
-        ttrs = numpy.empty(shape = 100)
+    random_seed = main.settings_custom['measures']['lexical_density_diversity']['vocdd']['random_seed']
 
-        for j in range(100):
-            if n <= text.num_tokens:
-                sample = random.sample(tokens, k = n)
-            else:
-                sample = tokens
+    get_freqs(main, text)
 
-            ttrs[j] = len(set(sample)) / len(sample)
+    # Results are reproducible across runs with the same random seed
+    rng = numpy.random.default_rng(random_seed)
+    num_tokens = len(text.token_ids)
+    ttr_ys = numpy.empty(shape = 16)
 
-        ttr_ys[i] = numpy.mean(ttrs)
+    for i, n in enumerate(range(35, 51)):
+        if n <= num_tokens:
+            # 100 samples of n tokens drawn without replacement
+            samples = text.token_ids[numpy.stack([
+                rng.choice(num_tokens, size = n, replace = False)
+                for _ in range(100)
+            ])]
+            samples.sort(axis = 1)
+
+            # Count types in all samples at once
+            nums_types = 1 + numpy.count_nonzero(samples[:, 1:] != samples[:, :-1], axis = 1)
+            ttr_ys[i] = numpy.mean(nums_types / n)
+        else:
+            ttr_ys[i] = text.num_types / num_tokens
 
     popt, _ = scipy.optimize.curve_fit( # pylint: disable=unbalanced-tuple-unpacking
         f = ttr,
@@ -483,12 +556,9 @@ def vocdd(main, text):
 # Yule's characteristic K
 # Reference: Yule, G. U. (1944). The statistical study of literary vocabulary. Cambridge University Press. | pp. 52–53
 def yules_characteristic_k(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    freqs_nums_types = collections.Counter(types_freqs.values())
-    freqs = numpy.array(list(freqs_nums_types))
-    nums_types = numpy.array(list(freqs_nums_types.values()))
+    get_freqs(main, text)
 
-    s2 = numpy.sum(nums_types * numpy.square(freqs))
+    s2 = numpy.sum(text.spectrum_nums_types * numpy.square(text.spectrum_freqs))
     k = 10000 * ((s2 - text.num_tokens) / (text.num_tokens ** 2))
 
     return k
@@ -496,12 +566,9 @@ def yules_characteristic_k(main, text):
 # Yule's Index of Diversity
 # Reference: Williams, C. B. (1970). Style and vocabulary: Numerical studies. Griffin. | p. 100
 def yules_index_of_diversity(main, text):
-    types_freqs = collections.Counter(text.get_tokens_flat())
-    freqs_nums_types = collections.Counter(types_freqs.values())
-    freqs = numpy.array(list(freqs_nums_types))
-    nums_types = numpy.array(list(freqs_nums_types.values()))
+    get_freqs(main, text)
 
-    s2 = numpy.sum(nums_types * numpy.square(freqs))
+    s2 = numpy.sum(text.spectrum_nums_types * numpy.square(text.spectrum_freqs))
 
     if (divisor := s2 - text.num_tokens):
         index_of_diversity = (text.num_tokens ** 2) / divisor
@@ -16,6 +16,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
+import collections
+
 import numpy
 
 def modes(inputs):
@@ -32,3 +34,93 @@ def modes(inputs):
                 inputs_modes.append(val)
 
     return inputs_modes
+
+class Wl_Hist:
+    """Histogram of integer values (e.g. lengths) with running moments.
+
+    Statistics are computed from counts of distinct values and are equal to those computed by NumPy/SciPy from the full list of values.
+    """
+
+    def __init__(self, vals = ()):
+        # Value -> count
+        self.counts = collections.Counter()
+        # Running moments
+        self.num = 0
+        self.sum = 0
+        self.sum_squares = 0
+
+        self.update(vals)
+
+    def update(self, vals):
+        """Add values or a mapping of values to counts to the histogram."""
+        counts = vals if isinstance(vals, dict) else collections.Counter(vals)
+
+        for val, count in counts.items():
+            if count:
+                self.counts[val] += count
+                self.num += count
+                self.sum += val * count
+                self.sum_squares += val * val * count
+
+    def merge(self, hist):
+        self.update(hist.counts)
+
+    @classmethod
+    def merge_hists(cls, hists):
+        hist_merged = cls()
+
+        for hist in hists:
+            hist_merged.merge(hist)
+
+        return hist_merged
+
+    def __len__(self):
+        return self.num
+
+    def _get_vals_cum_counts(self):
+        vals = numpy.array(sorted(self.counts))
+        cum_counts = numpy.cumsum([self.counts[val] for val in vals])
+
+        return vals, cum_counts
+
+    def mean(self):
+        return self.sum / self.num
+
+    def var(self):
+        # Computed with integers to avoid the loss of precision before the final division
+        return (self.num * self.sum_squares - self.sum ** 2) / self.num ** 2
+
+    def std(self):
+        return numpy.sqrt(self.var())
+
+    def min(self):
+        return min(self.counts)
+
+    def max(self):
+        return max(self.counts)
+
+    def ptp(self):
+        return self.max() - self.min()
+
+    def percentile(self, q):
+        # Linear interpolation between the two nearest values, same as numpy.percentile
+        vals, cum_counts = self._get_vals_cum_counts()
+
+        i = q / 100 * (self.num - 1)
+        i_lower = int(numpy.floor(i))
+        i_upper = min(i_lower + 1, self.num - 1)
+
+        val_lower, val_upper = vals[numpy.searchsorted(cum_counts, [i_lower, i_upper], side = 'right')]
+
+        return val_lower + (val_upper - val_lower) * (i - i_lower)
+
+    def median(self):
+        return self.percentile(50)
+
+    def iqr(self):
+        return self.percentile(75) - self.percentile(25)
+
+    def modes(self):
+        count_max = max(self.counts.values(), default = 0)
+
+        return sorted((val for val, count in self.counts.items() if count == count_max))
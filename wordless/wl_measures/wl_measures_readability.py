@@ -17,8 +17,12 @@
 # ----------------------------------------------------------------------
 
 import bisect
+import collections
 import copy
+import functools
+import itertools
 import math
+import os
 import random
 import re
 
@@ -41,8 +45,11 @@ from wordless.wl_utils import (
 _tr = QtCore.QCoreApplication.translate
 
 def get_nums(main, text):
+    if isinstance(text, wl_texts.Wl_Text_Total):
+        return get_nums_total(main, text)
+
     # Number of sentences
-    if 'num_sentences' not in text.__dict__:
+    if not wl_texts.is_cached(text, 'num_sentences'):
         text.words_multilevel = []
 
         for para in text.tokens_multilevel:
@@ -52,11 +59,12 @@ def get_nums(main, text):
                 text.words_multilevel[-1].append([])
 
                 for sentence_seg in sentence:
-                    text.words_multilevel[-1][-1].append(copy.deepcopy([
-                        token
+                    # Shallow copies suffice since only token properties are modified
+                    text.words_multilevel[-1][-1].append([
+                        copy.copy(token)
                         for token in sentence_seg
                         if wl_checks_tokens.is_word_alphanumeric(token)
-                    ]))
+                    ])
 
         text.sentences = [
             list(wl_misc.flatten_list(sentence))
@@ -66,119 +74,170 @@ def get_nums(main, text):
         text.num_sentences = len(text.sentences)
 
     # Number of words with at least one letter or numeral
-    if 'num_words' not in text.__dict__:
+    if not wl_texts.is_cached(text, 'num_words'):
         text.words_flat = list(wl_misc.flatten_list(text.words_multilevel))
         text.num_words = len(text.words_flat)
         text.num_word_types = len(set(text.words_flat))
 
+        # Offsets of sentences using words (punctuation marks already excluded)
+        text.offsets_sentences_words = [0, *itertools.accumulate((len(sentence) for sentence in text.sentences))][:-1]
+
     # Number of syllables
-    if 'num_syls' not in text.__dict__ and text.lang in main.settings_global['syl_tokenizers']:
+    if not wl_texts.is_cached(text, 'num_syls') and text.lang in main.settings_global['syl_tokenizers']:
         wl_syl_tokenization.wl_syl_tokenize(main, text.words_flat, lang = text.lang)
-        text.num_syls = sum((len(word.syls) for word in text.words_flat))
+
+        text.syls_words = wl_texts.get_token_properties(text.words_flat, 'syls')
+        text.nums_syls_words = numpy.array([len(syls) for syls in text.syls_words], dtype = numpy.int64)
+        text.num_syls = int(numpy.sum(text.nums_syls_words))
 
     # Number of characters
-    if 'num_chars_all' not in text.__dict__:
-        text.num_chars_all = 0
-        text.num_chars_alnum = 0
-        text.num_chars_alpha = 0
+    if not wl_texts.is_cached(text, 'num_chars_all'):
+        text.nums_chars_words = numpy.array([len(word) for word in text.words_flat], dtype = numpy.int64)
+        text.nums_chars_alnum_words = numpy.array([sum(map(str.isalnum, word)) for word in text.words_flat], dtype = numpy.int64)
+        text.nums_ltrs_words = numpy.array([sum(map(str.isalpha, word)) for word in text.words_flat], dtype = numpy.int64)
+
+        text.num_chars_all = int(numpy.sum(text.nums_chars_words))
+        text.num_chars_alnum = int(numpy.sum(text.nums_chars_alnum_words))
+        text.num_chars_alpha = int(numpy.sum(text.nums_ltrs_words))
+
+    return text
 
-        for token in text.words_flat:
-            for char in token:
-                text.num_chars_all += 1
+def get_nums_total(main, text):
+    # Numbers of the total are merged from those of each file instead of being recomputed
+    if not wl_texts.is_cached(text, 'num_sentences'):
+        texts = [get_nums(main, text_file) for text_file in text.texts]
+
+        text.words_multilevel = [para for text_file in texts for para in text_file.words_multilevel]
+        text.sentences = [sentence for text_file in texts for sentence in text_file.sentences]
+        text.num_sentences = len(text.sentences)
+
+        text.words_flat = [word for text_file in texts for word in text_file.words_flat]
+        text.num_words = len(text.words_flat)
+        text.num_word_types = len(set(text.words_flat))
+        text.offsets_sentences_words = [0, *itertools.accumulate((len(sentence) for sentence in text.sentences))][:-1]
 
-                if char.isalpha():
-                    text.num_chars_alnum += 1
-                    text.num_chars_alpha += 1
-                elif char.isalnum():
-                    text.num_chars_alnum += 1
+        if text.lang in main.settings_global['syl_tokenizers']:
+            text.syls_words = [syls for text_file in texts for syls in text_file.syls_words]
+            text.nums_syls_words = numpy.concatenate([text_file.nums_syls_words for text_file in texts])
+            text.num_syls = sum((text_file.num_syls for text_file in texts))
+
+        text.nums_chars_words = numpy.concatenate([text_file.nums_chars_words for text_file in texts])
+        text.nums_chars_alnum_words = numpy.concatenate([text_file.nums_chars_alnum_words for text_file in texts])
+        text.nums_ltrs_words = numpy.concatenate([text_file.nums_ltrs_words for text_file in texts])
+
+        text.num_chars_all = sum((text_file.num_chars_all for text_file in texts))
+        text.num_chars_alnum = sum((text_file.num_chars_alnum for text_file in texts))
+        text.num_chars_alpha = sum((text_file.num_chars_alpha for text_file in texts))
 
     return text
 
-def get_num_words_ltrs(words, len_min = 1, len_max = None):
+def _count_lens(lens, len_min, len_max):
     if len_max:
-        return len([
-            True
-            for word in words
-            if len_min <= len([char for char in word if char.isalpha()]) <= len_max
-        ])
+        return int(numpy.count_nonzero((lens >= len_min) & (lens <= len_max)))
     else:
-        return len([
-            True
-            for word in words
-            if len([char for char in word if char.isalpha()]) >= len_min
-        ])
+        return int(numpy.count_nonzero(lens >= len_min))
 
-def get_num_words_syls(words, len_min = 1, len_max = None):
-    if len_max:
-        return sum((
-            1
-            for word in words
-            if len_min <= len(word.syls) <= len_max
-        ))
-    else:
-        return sum((
-            1
-            for word in words
-            if len(word.syls) >= len_min
-        ))
+def get_num_words_ltrs(nums_ltrs_words, len_min = 1, len_max = None):
+    return _count_lens(nums_ltrs_words, len_min, len_max)
+
+def get_num_words_syls(nums_syls_words, len_min = 1, len_max = None):
+    return _count_lens(nums_syls_words, len_min, len_max)
 
 def pos_tag_words(main, text):
-    text.words_flat = wl_pos_tagging.wl_pos_tag_universal(main, text.words_flat, lang = text.lang, tagged = text.tagged)
+    # Words are only POS-tagged once for all measures
+    if not wl_texts.is_cached(text, 'pos_tags_words'):
+        text.words_flat = wl_pos_tagging.wl_pos_tag_universal(main, text.words_flat, lang = text.lang, tagged = text.tagged)
+
+        text.pos_tags_words = [
+            frozenset(tag_universal.split('/'))
+            for tag_universal in wl_texts.get_token_properties(text.words_flat, 'tag_universal')
+        ]
+        text.nums_words_pos_tags = collections.Counter((
+            pos_tag
+            for pos_tags in text.pos_tags_words
+            for pos_tag in pos_tags
+        ))
 
-def get_num_words_pos_tag(words, pos_tag):
-    return sum((1 for word in words if pos_tag in word.tag_universal.split('/')))
+def get_num_words_pos_tag(pos_tags_words, pos_tag):
+    return sum((1 for pos_tags in pos_tags_words if pos_tag in pos_tags))
 
-def get_nums_words_pos_tags(words, pos_tags):
+def get_nums_words_pos_tags(pos_tags_words, pos_tags):
     return [
-        get_num_words_pos_tag(words, pos_tag)
+        get_num_words_pos_tag(pos_tags_words, pos_tag)
         for pos_tag in pos_tags
     ]
 
+WORDLISTS = {
+    'bamberger_vanecek': 'bamberger_vanecek_most_common_words_1000.txt',
+    'dale_769': 'dale_list_easy_words_769.txt',
+    'dale_3000': 'dale_list_easy_words_3000.txt',
+    'luong_nguyen_dinh': 'luong_nguyen_dinh_freq_syls_easy_1000.txt',
+    'spache': 'spache_word_list.txt'
+}
+
+# Word lists supplied by users, which are registered by names
+WORDLISTS_CUSTOM = {}
+
+def register_wordlist(wordlist, path):
+    if wordlist in WORDLISTS:
+        raise ValueError(f'Word list "{wordlist}" is built-in and could not be registered')
+
+    WORDLISTS_CUSTOM[wordlist] = os.path.abspath(path)
+
+def unregister_wordlist(wordlist):
+    WORDLISTS_CUSTOM.pop(wordlist, None)
+
+# Word lists are loaded only once and shared by all texts and workers, and are reloaded if files have been modified
+@functools.lru_cache(maxsize = 32)
+def _load_wordlist(path, mtime): # pylint: disable=unused-argument
+    with open(path, 'r', encoding = 'utf_8') as f:
+        # Ignore case
+        return frozenset((word.lower() for line in f if (word := line.strip())))
+
+def get_wordlist(wordlist):
+    if wordlist in WORDLISTS:
+        path = wl_paths.get_path_data(WORDLISTS[wordlist])
+    elif wordlist in WORDLISTS_CUSTOM:
+        path = WORDLISTS_CUSTOM[wordlist]
+    else:
+        raise ValueError(f'Unknown word list "{wordlist}", which should be one of: {", ".join([*WORDLISTS, *WORDLISTS_CUSTOM])}')
+
+    return _load_wordlist(path, os.path.getmtime(path))
+
 def get_num_words_outside_list(words, wordlist, use_word_types = False):
-    words_inside_wordlist = set()
-    num_words_outside_wordlist = 0
-
-    # Load wordlist
-    if wordlist == 'bamberger_vanecek':
-        file_name = 'bamberger_vanecek_most_common_words_1000'
-    elif wordlist == 'dale_769':
-        file_name = 'dale_list_easy_words_769'
-    elif wordlist == 'dale_3000':
-        file_name = 'dale_list_easy_words_3000'
-    elif wordlist == 'luong_nguyen_dinh':
-        file_name = 'luong_nguyen_dinh_freq_syls_easy_1000'
-    elif wordlist == 'spache':
-        file_name = 'spache_word_list'
-
-    with open(wl_paths.get_path_data(f'{file_name}.txt'), 'r', encoding = 'utf_8') as f:
-        for line in f:
-            word = line.strip()
-
-            if word:
-                # Ignore case
-                words_inside_wordlist.add(word.lower())
+    words_inside_wordlist = get_wordlist(wordlist)
 
     if use_word_types:
         words = set(words)
-        words_inside_wordlist = set(words_inside_wordlist)
 
-    for word in words:
-        if word.lower() not in words_inside_wordlist:
-            num_words_outside_wordlist += 1
+    return sum((1 for word in words if word.lower() not in words_inside_wordlist))
 
-    return num_words_outside_wordlist
+def get_flags_words_outside_list(text, wordlist):
+    if not wl_texts.is_cached(text, 'flags_words_outside_lists'):
+        text.flags_words_outside_lists = {}
 
-def get_num_sentences_sample(text, sample, sample_start):
-    # Calculate sentence offsets using words (punctuation marks already excluded)
-    if 'offsets_sentences_words' not in text.__dict__:
-        text.offsets_sentences_words = []
-        num_tokens = 0
+    words_inside_wordlist = get_wordlist(wordlist)
 
-        for sentence in text.sentences:
-            text.offsets_sentences_words.append(num_tokens)
+    # Flags are recomputed if word lists have been reloaded
+    if (
+        wordlist not in text.flags_words_outside_lists
+        or text.flags_words_outside_lists[wordlist][0] is not words_inside_wordlist
+    ):
+        words = list(map(str, text.words_flat))
+        # Look up each word type only once
+        types_outside_wordlist = {
+            word: word.lower() not in words_inside_wordlist
+            for word in set(words)
+        }
+
+        text.flags_words_outside_lists[wordlist] = (
+            words_inside_wordlist,
+            numpy.array([types_outside_wordlist[word] for word in words], dtype = bool)
+        )
 
-            num_tokens += len(sentence)
+    return text.flags_words_outside_lists[wordlist][1]
 
+def get_num_sentences_sample(text, sample, sample_start):
     return (
         bisect.bisect(text.offsets_sentences_words, sample_start + len(sample))
         - bisect.bisect(text.offsets_sentences_words, sample_start)
@@ -266,7 +325,7 @@ def bormuths_cloze_mean(main, text):
         text = get_nums(main, text)
 
         if text.num_sentences and text.num_words:
-            ddl = get_num_words_outside_list(text.words_flat, wordlist = 'dale_3000')
+            ddl = int(numpy.count_nonzero(get_flags_words_outside_list(text, wordlist = 'dale_3000')))
             m = (
                 0.886593
                 - 0.083640 * (text.num_chars_alpha / text.num_words)
@@ -329,7 +388,7 @@ def colemans_readability_formula(main, text):
         text = get_nums(main, text)
 
         if text.num_words:
-            num_words_1_syl = get_num_words_syls(text.words_flat, len_min = 1, len_max = 1)
+            num_words_1_syl = get_num_words_syls(text.nums_syls_words, len_min = 1, len_max = 1)
 
             match variant:
                 case '1':
@@ -345,10 +404,7 @@ def colemans_readability_formula(main, text):
                     )
                 case '3':
                     pos_tag_words(main, text)
-                    num_prons = get_num_words_pos_tag(
-                        words = text.words_flat,
-                        pos_tag = 'PRON'
-                    )
+                    num_prons = text.nums_words_pos_tags['PRON']
 
                     cloze_pct = (
                         1.07 * (num_words_1_syl / text.num_words * 100)
@@ -358,10 +414,8 @@ def colemans_readability_formula(main, text):
                     )
                 case '4':
                     pos_tag_words(main, text)
-                    num_prons, num_preps = get_nums_words_pos_tags(
-                        words = text.words_flat,
-                        pos_tags = ['PRON', 'ADP']
-                    )
+                    num_prons = text.nums_words_pos_tags['PRON']
+                    num_preps = text.nums_words_pos_tags['ADP']
 
                     cloze_pct = (
                         1.04 * (num_words_1_syl / text.num_words * 100)
@@ -410,7 +464,7 @@ def x_c50(main, text):
         settings = main.settings_custom['measures']['readability']['x_c50']
 
         if text.num_words and text.num_sentences:
-            num_difficult_words = get_num_words_outside_list(text.words_flat, wordlist = 'dale_3000')
+            num_difficult_words = int(numpy.count_nonzero(get_flags_words_outside_list(text, wordlist = 'dale_3000')))
 
             if settings['variant'] == _tr('wl_measures_readability', 'Original'):
                 x_c50 = (
@@ -687,7 +741,7 @@ def re_farr_jenkins_paterson(main, text):
         text = get_nums(main, text)
 
         if text.num_words and text.num_sentences:
-            num_words_1_syl = get_num_words_syls(text.words_flat, len_min = 1, len_max = 1)
+            num_words_1_syl = get_num_words_syls(text.nums_syls_words, len_min = 1, len_max = 1)
 
             if main.settings_custom['measures']['readability']['re_farr_jenkins_paterson']['use_powers_sumner_kearl_variant']:
                 re = (
@@ -716,9 +770,11 @@ def rgl(main, text):
 
         if text.num_words >= 150:
             sample_start = random.randint(0, text.num_words - 150)
-            sample = text.words_flat[sample_start : sample_start + 150]
-
-            num_words_1_syl = get_num_words_syls(sample, len_min = 1, len_max = 1)
+            num_words_1_syl = get_num_words_syls(
+                text.nums_syls_words[sample_start : sample_start + 150],
+                len_min = 1,
+                len_max = 1
+            )
             rgl = 20.43 - 0.11 * num_words_1_syl
         else:
             rgl = 'text_too_short'
@@ -788,15 +844,16 @@ def fog_index(main, text):
                 ):
                     pos_tag_words(main, text)
 
-                    for word in text.words_flat:
-                        if (
-                            'PROPN' not in word.tag_universal.split('/')
-                            and (
-                                (len(word.syls) == 3 and not word.endswith('ed') and not word.endswith('es'))
-                                or len(word.syls) > 3
-                            )
-                        ):
-                            num_hard_words += 1
+                    flags_propns = numpy.array(['PROPN' in pos_tags for pos_tags in text.pos_tags_words], dtype = bool)
+                    flags_ed_es = numpy.array([word.endswith(('ed', 'es')) for word in text.words_flat], dtype = bool)
+
+                    num_hard_words = int(numpy.count_nonzero(
+                        ~flags_propns
+                        & (
+                            ((text.nums_syls_words == 3) & ~flags_ed_es)
+                            | (text.nums_syls_words > 3)
+                        )
+                    ))
 
                     if variant_eng == _tr('wl_measures_readability', 'Original'):
                         fog_index = (
@@ -810,7 +867,7 @@ def fog_index(main, text):
                             + 0.0984 * (num_hard_words / text.num_words * 100)
                         )
                 elif variant_eng == _tr('wl_measures_readability', 'Navy'):
-                    num_words_3_plus_syls = get_num_words_syls(text.words_flat, len_min = 3)
+                    num_words_3_plus_syls = get_num_words_syls(text.nums_syls_words, len_min = 3)
 
                     fog_index = (
                         ((text.num_words + 2 * num_words_3_plus_syls) / text.num_sentences - 3)
@@ -827,8 +884,8 @@ def fog_index(main, text):
                 )
                 lemmas_syls = wl_texts.get_token_properties(lemmas, 'syls')
 
-                for word, syls in zip(text.words_flat, lemmas_syls):
-                    if len(syls) > 4 and 'PROPN' not in word.tag_universal.split('/'):
+                for pos_tags, syls in zip(text.pos_tags_words, lemmas_syls):
+                    if len(syls) > 4 and 'PROPN' not in pos_tags:
                         num_hard_words += 1
 
                 fog_index = (
@@ -874,10 +931,7 @@ def mu(main, text):
 
         if text.num_words >= 2:
             # Excluding numbers and punctuation marks
-            lens_words_letters = numpy.array([
-                len([char for char in word if char.isalpha()])
-                for word in text.words_flat
-            ])
+            lens_words_letters = text.nums_ltrs_words
 
             mu = (
                 (text.num_words / (text.num_words - 1))
@@ -906,12 +960,8 @@ def lensear_write_formula(main, text):
             sample = text.words_flat[sample_start : sample_start + 100]
 
             num_words_1_syl = 0
-            sysl_sample = wl_texts.get_token_properties(
-                wl_syl_tokenization.wl_syl_tokenize(main, sample, lang = text.lang),
-                'syls'
-            )
 
-            for syls in sysl_sample:
+            for syls in text.syls_words[sample_start : sample_start + 100]:
                 if len(syls) == 1 and syls[0].lower() not in {'the', 'is', 'are', 'was', 'were'}:
                     num_words_1_syl += 1
 
@@ -938,7 +988,7 @@ def lix(main, text):
     if text.num_words and text.num_sentences:
         text = get_nums(main, text)
 
-        num_long_words = get_num_words_ltrs(text.words_flat, len_min = 7)
+        num_long_words = get_num_words_ltrs(text.nums_ltrs_words, len_min = 7)
         lix = text.num_words / text.num_sentences + 100 * (num_long_words / text.num_words)
     else:
         lix = 'text_too_short'
@@ -958,10 +1008,7 @@ def lorge_readability_index(main, text):
 
         if text.num_sentences and text.num_words:
             pos_tag_words(main, text)
-            num_preps = get_num_words_pos_tag(
-                words = text.words_flat,
-                pos_tag = 'ADP'
-            )
+            num_preps = text.nums_words_pos_tags['ADP']
             num_hard_words = get_num_words_outside_list(
                 text.words_flat,
                 wordlist = 'dale_769',
@@ -1019,7 +1066,7 @@ def eflaw(main, text):
         text = get_nums(main, text)
 
         if text.num_sentences:
-            num_mini_words = get_num_words_ltrs(text.words_flat, len_max = 3)
+            num_mini_words = get_num_words_ltrs(text.nums_ltrs_words, len_max = 3)
             eflaw = (text.num_words + num_mini_words) / text.num_sentences
         else:
             eflaw = 'text_too_short'
@@ -1039,9 +1086,9 @@ def nwl(main, text):
 
             sw = get_num_words_outside_list(text.words_flat, wordlist = 'bamberger_vanecek', use_word_types = True) / text.num_word_types * 100
             s_100 = text.num_sentences / text.num_words * 100
-            ms = get_num_words_syls(text.words_flat, len_min = 3) / text.num_words * 100
+            ms = get_num_words_syls(text.nums_syls_words, len_min = 3) / text.num_words * 100
             sl = text.num_words / text.num_sentences
-            iw = get_num_words_ltrs(text.words_flat, len_min = 7) / text.num_words * 100
+            iw = get_num_words_ltrs(text.nums_ltrs_words, len_min = 7) / text.num_words * 100
 
             if variant == '1':
                 nwl = 0.2032 * sw - 0.1715 * s_100 + 0.1594 * ms - 0.0746 * ms - 0.145
@@ -1065,10 +1112,10 @@ def nws(main, text):
         if text.num_words and text.num_sentences:
             variant = main.settings_custom['measures']['readability']['nws']['variant']
 
-            ms = get_num_words_syls(text.words_flat, len_min = 3) / text.num_words * 100
+            ms = get_num_words_syls(text.nums_syls_words, len_min = 3) / text.num_words * 100
             sl = text.num_words / text.num_sentences
-            iw = get_num_words_ltrs(text.words_flat, len_min = 7) / text.num_words * 100
-            es = get_num_words_syls(text.words_flat, len_min = 1, len_max = 1) / text.num_words * 100
+            iw = get_num_words_ltrs(text.nums_ltrs_words, len_min = 7) / text.num_words * 100
+            es = get_num_words_syls(text.nums_syls_words, len_min = 1, len_max = 1) / text.num_words * 100
 
             if variant == '1':
                 nws = 0.1935 * ms + 0.1672 * sl + 0.1297 * iw - 0.0327 * es - 0.875
@@ -1129,7 +1176,7 @@ def osman(main, text):
 
             a = text.num_words
             b = text.num_sentences
-            c = get_num_words_ltrs(text.words_flat, len_min = 6)
+            c = get_num_words_ltrs(text.nums_ltrs_words, len_min = 6)
             d = numpy.sum(nums_syls_tokens)
             g = numpy.sum(nums_syls_tokens > 4)
             h = 0
@@ -1166,7 +1213,7 @@ def rix(main, text):
     text = get_nums(main, text)
 
     if text.num_sentences:
-        num_long_words = get_num_words_ltrs(text.words_flat, len_min = 7)
+        num_long_words = get_num_words_ltrs(text.nums_ltrs_words, len_min = 7)
         rix = num_long_words / text.num_sentences
     else:
         rix = 'text_too_short'
@@ -1186,18 +1233,20 @@ def smog_grading(main, text):
             # Calculate the index for the 10 sentences at the middle of the text
             sample_start_mid = text.num_sentences // 2 - 5
             sample = (
-                text.sentences[:10]
-                + text.sentences[sample_start_mid : sample_start_mid + 10]
-                + text.sentences[-10:]
+                list(range(10))
+                + list(range(sample_start_mid, sample_start_mid + 10))
+                + list(range(text.num_sentences - 10, text.num_sentences))
             )
 
             # Calculate the number of words with 3 or more syllables
             num_words_3_plus_syls = 0
+            offsets_sentences = [*text.offsets_sentences_words, text.num_words]
 
-            for sentence in sample:
-                sentence = wl_syl_tokenization.wl_syl_tokenize(main, sentence, lang = text.lang)
-
-                num_words_3_plus_syls += get_num_words_syls(sentence, len_min = 3)
+            for i in sample:
+                num_words_3_plus_syls += get_num_words_syls(
+                    text.nums_syls_words[offsets_sentences[i] : offsets_sentences[i + 1]],
+                    len_min = 3
+                )
 
             if text.lang.startswith('deu_'):
                 g = numpy.sqrt(num_words_3_plus_syls / text.num_sentences * 30) - 2
@@ -1233,14 +1282,18 @@ def spache_readability_formula(main, text):
                 num_sentences = get_num_sentences_sample(text, sample, sample_start)
 
                 if main.settings_custom['measures']['readability']['spache_readability_formula']['use_rev_formula']:
-                    num_difficult_words = get_num_words_outside_list(sample, wordlist = 'spache')
+                    num_difficult_words = int(numpy.count_nonzero(
+                        get_flags_words_outside_list(text, wordlist = 'spache')[sample_start : sample_start + 100]
+                    ))
                     grade_lvls.append(
                         0.121 * (100 / num_sentences)
                         + 0.082 * (num_difficult_words)
                         + 0.659
                     )
                 else:
-                    num_difficult_words = get_num_words_outside_list(sample, wordlist = 'dale_769')
+                    num_difficult_words = int(numpy.count_nonzero(
+                        get_flags_words_outside_list(text, wordlist = 'dale_769')[sample_start : sample_start + 100]
+                    ))
                     grade_lvls.append(
                         0.141 * (100 / num_sentences)
                         + 0.086 * (num_difficult_words)
@@ -1264,15 +1317,12 @@ def strain_index(main, text):
         text = get_nums(main, text)
 
         if text.num_sentences >= 3:
-            num_syls = 0
-
-            for sentence in text.sentences[:3]:
-                words_syls = wl_texts.get_token_properties(
-                    wl_syl_tokenization.wl_syl_tokenize(main, sentence, lang = text.lang),
-                    'syls'
-                )
+            if text.num_sentences > 3:
+                num_words_3_sentences = text.offsets_sentences_words[3]
+            else:
+                num_words_3_sentences = text.num_words
 
-                num_syls += sum((len(syls) for syls in words_syls))
+            num_syls = int(numpy.sum(text.nums_syls_words[:num_words_3_sentences]))
 
             strain_index = num_syls / 10
         else:
@@ -1296,11 +1346,11 @@ def trankle_bailers_readability_formula(main, text):
             sample_start = random.randint(0, text.num_words - 100)
             sample = text.words_flat[sample_start : sample_start + 100]
 
-            num_chars_alnum = sum((1 for token in sample for char in token if char.isalnum()))
+            num_chars_alnum = int(numpy.sum(text.nums_chars_alnum_words[sample_start : sample_start + 100]))
             num_sentences = get_num_sentences_sample(text, sample, sample_start)
 
             num_preps, num_cconjs, num_sconjs = get_nums_words_pos_tags( # pylint: disable=unbalanced-tuple-unpacking
-                words = sample,
+                text.pos_tags_words[sample_start : sample_start + 100],
                 pos_tags = ['ADP', 'CCONJ', 'SCONJ']
             )
 
@@ -1404,7 +1454,7 @@ def wheeler_smiths_readability_formula(main, text):
                 tokens = wl_misc.flatten_list(text.tokens_multilevel_with_puncs),
                 re_terminators = RE_UNIT_TERMINATORS
             ))
-            num_words_2_syls = get_num_words_syls(text.words_flat, len_min = 2)
+            num_words_2_syls = get_num_words_syls(text.nums_syls_words, len_min = 2)
 
             wheeler_smith = (
                 (text.num_words / num_units)
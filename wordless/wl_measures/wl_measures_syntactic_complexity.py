@@ -18,65 +18,48 @@
 
 import numpy
 
+def _get_sums_lens_sentences(dds, offsets):
+    dds = numpy.asarray(dds, dtype = numpy.int64)
+    offsets = numpy.asarray(offsets, dtype = numpy.int64)
+
+    lens_sentences = numpy.diff(offsets, append = len(dds))
+    # Segment reductions are only done over non-empty sentences, as numpy.add.reduceat does not support empty segments
+    offsets_non_empty = offsets[lens_sentences > 0]
+
+    if offsets_non_empty.size:
+        # Roots are excluded since their dependency distances are 0
+        sums = numpy.add.reduceat(numpy.absolute(dds), offsets_non_empty)
+        lens_no_roots = numpy.add.reduceat((dds != 0).astype(numpy.int64), offsets_non_empty)
+    else:
+        sums = lens_no_roots = numpy.zeros(0, dtype = numpy.int64)
+
+    return sums, lens_no_roots, offsets_non_empty
+
 # Mean dependency distance
 # Reference: Liu, H., Hudson, R., & Feng, Z. (2009). Using a Chinese treebank to measure dependency distance. *Corpus Linguistics and Linguistic Theory*, *5*(2), 161–175. https://doi.org/10.1515/CLLT.2009.007
-def mdd(dds_sentences):
-    # Remove roots
-    dds_sentences = [
-        numpy.array(dds)
-        for dds in dds_sentences
-    ]
-    dds_sentences = [
-        dds[dds != 0]
-        for dds in dds_sentences
-    ]
+def mdd(dds, offsets):
+    sums, lens_no_roots, _ = _get_sums_lens_sentences(dds, offsets)
 
-    # Remove empty arrays
-    dds_sentences = [
-        dds
-        for dds in dds_sentences
-        if dds.size
-    ]
+    # Sentences with only roots are excluded
+    sentences_no_roots = lens_no_roots > 0
 
-    # Remove signs
-    dds_sentences = [
-        numpy.absolute(dds)
-        for dds in dds_sentences
-    ]
-
-    return numpy.array([
-        numpy.mean(dds)
-        for dds in dds_sentences
-    ])
+    return sums[sentences_no_roots] / lens_no_roots[sentences_no_roots]
 
 # Normalized dependency distance
 # Reference: Lei, L., & Jockers, M. L. (2018). Normalized dependency distance: Proposing a new measure. Quantitative Linguistics, 27(1), 62–79. https://doi.org/10.1080/09296174.2018.1504615
-def ndd(dds_sentences, root_dists):
-    mdds = mdd(dds_sentences)
-
-    for i, (dds, _) in reversed(list(enumerate(zip(dds_sentences, root_dists)))):
-        if dds in ([], [0]):
-            del root_dists[i]
-
-    root_dists = numpy.array(root_dists)
+def ndd(dds, offsets):
+    dds = numpy.asarray(dds, dtype = numpy.int64)
+    sums, lens_no_roots, offsets_non_empty = _get_sums_lens_sentences(dds, offsets)
 
-    # Remove roots
-    dds_sentences = [
-        numpy.array(dds)
-        for dds in dds_sentences
-    ]
-    dds_sentences = [
-        dds[dds != 0]
-        for dds in dds_sentences
-    ]
+    sentences_no_roots = lens_no_roots > 0
+    mdds = sums[sentences_no_roots] / lens_no_roots[sentences_no_roots]
 
-    # Remove empty arrays
-    dds_sentences = [
-        dds
-        for dds in dds_sentences
-        if dds.size
-    ]
+    # Root distances (starting from 1) are the positions of the first roots in sentences
+    roots = numpy.flatnonzero(dds == 0)
+    sentences_roots = numpy.searchsorted(offsets_non_empty, roots, side = 'right') - 1
+    sentences_roots, roots_first = numpy.unique(sentences_roots, return_index = True)
 
-    len_sentences = numpy.array([dds.size for dds in dds_sentences])
+    root_dists = numpy.zeros(len(offsets_non_empty), dtype = numpy.int64)
+    root_dists[sentences_roots] = roots[roots_first] - offsets_non_empty[sentences_roots] + 1
 
-    return numpy.absolute(numpy.log(mdds / (numpy.sqrt(root_dists * len_sentences))))
+    return numpy.absolute(numpy.log(mdds / numpy.sqrt(root_dists[sentences_no_roots] * lens_no_roots[sentences_no_roots])))
@@ -41,6 +41,7 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import (
     wl_excs,
+    wl_instrumentation,
     wl_misc,
     wl_sorting,
     wl_threading
@@ -607,6 +608,7 @@ class Wl_Table_Ngram_Generator(wl_tables.Wl_Table_Data):
                     self.update_gui_table
                 )
 
+    @wl_instrumentation.log_stage('tables/ngram_generator')
     def update_gui_table(self, err_msg, ngrams_freq_files, ngrams_stats_files):
         if wl_checks_work_area.check_results(self.main, err_msg, ngrams_freq_files):
             try:
@@ -756,6 +758,7 @@ class Wl_Table_Ngram_Generator(wl_tables.Wl_Table_Data):
                     self.update_gui_fig
                 )
 
+    @wl_instrumentation.log_stage('figs/ngram_generator')
     def update_gui_fig(self, err_msg, ngrams_freq_files, ngrams_stats_files):
         if wl_checks_work_area.check_results(self.main, err_msg, ngrams_freq_files):
             hide_dialog_err_fatal = False
@@ -942,10 +945,12 @@ class Wl_Worker_Ngram_Generator(wl_threading.Wl_Worker):
 
                 texts.append(wl_texts.Wl_Text_Total(texts))
 
-                self.ngrams_freq_files.append(sum([
-                    collections.Counter(ngrams_freq_file)
-                    for ngrams_freq_file in self.ngrams_freq_files
-                ], collections.Counter()))
+                ngrams_freq_total = collections.Counter()
+
+                for ngrams_freq_file in self.ngrams_freq_files:
+                    ngrams_freq_total.update(ngrams_freq_file)
+
+                self.ngrams_freq_files.append(ngrams_freq_total)
 
             # Dispersion & Adjusted Frequency
             measure_dispersion = settings['generation_settings']['measure_dispersion']
@@ -980,76 +985,78 @@ class Wl_Worker_Ngram_Generator(wl_threading.Wl_Worker):
                         ngrams_lens[ngram_size] = list(wl_nlp_utils.ngrams(tokens, ngram_size))
 
                 # Dispersion
-                if measure_dispersion == 'none':
-                    ngrams_stats_file = {
-                        ngram: [None]
-                        for ngram in ngrams_total
-                    }
-                elif type_dispersion == 'parts_based':
-                    freqs_sections_ngrams = {}
-
-                    for ngram_size, ngram_list in ngrams_lens.items():
-                        if not self._running:
-                            raise wl_excs.Wl_Exc_Aborted(self.main)
-
-                        ngrams_total_len = [ngram for ngram in ngrams_total if len(ngram) == ngram_size]
+                with wl_instrumentation.stage('measures/dispersion', num_items = len(ngrams_total)):
+                    if measure_dispersion == 'none':
+                        ngrams_stats_file = {
+                            ngram: [None]
+                            for ngram in ngrams_total
+                        }
+                    elif type_dispersion == 'parts_based':
+                        freqs_sections_ngrams = {}
 
-                        freqs_sections_ngrams.update(wl_measure_utils.to_freqs_sections_dispersion(
-                            self.main,
-                            items_to_search = ngrams_total_len,
-                            items = ngram_list
-                        ))
+                        for ngram_size, ngram_list in ngrams_lens.items():
+                            if not self._running:
+                                raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                    for ngram, freqs in freqs_sections_ngrams.items():
-                        if not self._running:
-                            raise wl_excs.Wl_Exc_Aborted(self.main)
+                            ngrams_total_len = [ngram for ngram in ngrams_total if len(ngram) == ngram_size]
 
-                        ngrams_stats_file[ngram] = [func_dispersion(self.main, freqs)]
-                elif type_dispersion == 'dist_based':
-                    for ngram_size, ngram_list in ngrams_lens.items():
-                        ngrams_total_len = [ngram for ngram in ngrams_total if len(ngram) == ngram_size]
+                            freqs_sections_ngrams.update(wl_measure_utils.to_freqs_sections_dispersion(
+                                self.main,
+                                items_to_search = ngrams_total_len,
+                                items = ngram_list
+                            ))
 
-                        for ngram in ngrams_total_len:
+                        for ngram, freqs in freqs_sections_ngrams.items():
                             if not self._running:
                                 raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                            ngrams_stats_file[ngram] = [func_dispersion(self.main, ngram_list, ngram)]
+                            ngrams_stats_file[ngram] = [func_dispersion(self.main, freqs)]
+                    elif type_dispersion == 'dist_based':
+                        for ngram_size, ngram_list in ngrams_lens.items():
+                            ngrams_total_len = [ngram for ngram in ngrams_total if len(ngram) == ngram_size]
 
-                # Adjusted Frequency
-                if measure_adjusted_freq == 'none':
-                    ngrams_stats_file = {
-                        ngram: stats + [None]
-                        for ngram, stats in ngrams_stats_file.items()
-                    }
-                elif type_adjusted_freq == 'parts_based':
-                    freqs_sections_ngrams = {}
-
-                    for ngram_size, ngram_list in ngrams_lens.items():
-                        if not self._running:
-                            raise wl_excs.Wl_Exc_Aborted(self.main)
+                            for ngram in ngrams_total_len:
+                                if not self._running:
+                                    raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                        ngrams_total_len = [ngram for ngram in ngrams_total if len(ngram) == ngram_size]
+                                ngrams_stats_file[ngram] = [func_dispersion(self.main, ngram_list, ngram)]
 
-                        freqs_sections_ngrams.update(wl_measure_utils.to_freqs_sections_adjusted_freq(
-                            self.main,
-                            items_to_search = ngrams_total_len,
-                            items = ngram_list
-                        ))
+                # Adjusted Frequency
+                with wl_instrumentation.stage('measures/adjusted_freq', num_items = len(ngrams_total)):
+                    if measure_adjusted_freq == 'none':
+                        ngrams_stats_file = {
+                            ngram: stats + [None]
+                            for ngram, stats in ngrams_stats_file.items()
+                        }
+                    elif type_adjusted_freq == 'parts_based':
+                        freqs_sections_ngrams = {}
 
-                    for ngram, freqs in freqs_sections_ngrams.items():
-                        if not self._running:
-                            raise wl_excs.Wl_Exc_Aborted(self.main)
+                        for ngram_size, ngram_list in ngrams_lens.items():
+                            if not self._running:
+                                raise wl_excs.Wl_Exc_Aborted(self.main)
+
+                            ngrams_total_len = [ngram for ngram in ngrams_total if len(ngram) == ngram_size]
 
-                        ngrams_stats_file[ngram].append(func_adjusted_freq(self.main, freqs))
-                elif type_adjusted_freq == 'dist_based':
-                    for ngram_size, ngram_list in ngrams_lens.items():
-                        ngrams_total_len = [ngram for ngram in ngrams_total if len(ngram) == ngram_size]
+                            freqs_sections_ngrams.update(wl_measure_utils.to_freqs_sections_adjusted_freq(
+                                self.main,
+                                items_to_search = ngrams_total_len,
+                                items = ngram_list
+                            ))
 
-                        for ngram in ngrams_total_len:
+                        for ngram, freqs in freqs_sections_ngrams.items():
                             if not self._running:
                                 raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                            ngrams_stats_file[ngram].append(func_adjusted_freq(self.main, ngram_list, ngram))
+                            ngrams_stats_file[ngram].append(func_adjusted_freq(self.main, freqs))
+                    elif type_adjusted_freq == 'dist_based':
+                        for ngram_size, ngram_list in ngrams_lens.items():
+                            ngrams_total_len = [ngram for ngram in ngrams_total if len(ngram) == ngram_size]
+
+                            for ngram in ngrams_total_len:
+                                if not self._running:
+                                    raise wl_excs.Wl_Exc_Aborted(self.main)
+
+                                ngrams_stats_file[ngram].append(func_adjusted_freq(self.main, ngram_list, ngram))
 
                 self.ngrams_stats_files.append(ngrams_stats_file)
 
@@ -17,6 +17,8 @@
 # ----------------------------------------------------------------------
 
 import bisect
+import copy
+import functools
 import os
 import shutil
 import subprocess
@@ -31,7 +33,9 @@ from wordless.wl_checks import (
 )
 from wordless.wl_dialogs import wl_dialogs
 from wordless.wl_nlp import (
+    wl_lemmatization,
     wl_nlp_utils,
+    wl_pos_tagging,
     wl_texts
 )
 from wordless.wl_settings import wl_settings_default
@@ -45,6 +49,12 @@ _tr = QtCore.QCoreApplication.translate
 
 is_windows, is_macos, is_linux = wl_misc.check_os()
 
+LANGS_RTL = {
+    'ara', 'heb', 'kmr', 'fas', 'snd', 'urd',
+    # Unsupported by Stanza: Aramaic, Azerbaijani, Kurdish (Sorani), Maldivian, Fulah, Mazanderani, N'Ko, Pushto, Rohingya, Syriac
+    'arc', 'aze', 'ckb', 'div', 'ful', 'mzn', 'nqo', 'pus', 'rhg', 'syr'
+}
+
 def wl_dependency_parse(main, inputs, lang, dependency_parser = 'default', force = False):
     if (
         not isinstance(inputs, str)
@@ -316,15 +326,14 @@ def wl_dependency_parse_fig(
     if dependency_parser == 'default':
         dependency_parser = main.settings_custom['dependency_parsing']['dependency_parser_settings'][lang]
 
-    wl_nlp_utils.init_dependency_parsers(
-        main,
-        lang = lang,
-        dependency_parser = dependency_parser,
-        tokenized = not isinstance(inputs, str)
-    )
-
     # Only for Settings - Dependency Parsing - Preview
     if isinstance(inputs, str):
+        wl_nlp_utils.init_dependency_parsers(
+            main,
+            lang = lang,
+            dependency_parser = dependency_parser
+        )
+
         htmls = wl_dependency_parse_fig_text(
             main, inputs,
             lang, dependency_parser,
@@ -354,7 +363,7 @@ def _get_pipelines_to_disable(show_pos_tags, show_lemmas):
 
     return pipelines_to_disable
 
-def to_displacy_sentence(lang, sentence, token_properties = None):
+def to_displacy_sentence(lang, sentence):
     words = []
     tags = []
     pos = []
@@ -365,25 +374,11 @@ def to_displacy_sentence(lang, sentence, token_properties = None):
     nlp = spacy.blank('en')
 
     # RTL languages
-    if lang in {
-        'ara', 'heb', 'kmr', 'fas', 'snd', 'urd',
-        # Unsupported by Stanza: Aramaic, Azerbaijani, Kurdish (Sorani), Maldivian, Fulah, Mazanderani, N'Ko, Pushto, Rohingya, Syriac
-        'arc', 'aze', 'ckb', 'div', 'ful', 'mzn', 'nqo', 'pus', 'rhg', 'syr'
-    }:
+    if lang in LANGS_RTL:
         len_sentence = len(sentence.words)
 
-        if token_properties is not None:
-            token_properties = list(reversed(token_properties))
-
-        for i, word in enumerate(reversed(sentence.words)):
-            if token_properties is None:
-                words.append(word.text)
-            else:
-                words.append(
-                    word.text
-                    + (token_properties[i]['punc_mark'] or '')
-                    + (token_properties[i]['tag'] or '')
-                )
+        for word in reversed(sentence.words):
+            words.append(word.text)
 
             if word.xpos is not None:
                 tags.append(word.xpos)
@@ -404,15 +399,8 @@ def to_displacy_sentence(lang, sentence, token_properties = None):
             else:
                 heads.append(len_sentence - word.head)
     else:
-        for i, word in enumerate(sentence.words):
-            if token_properties is None:
-                words.append(word.text)
-            else:
-                words.append(
-                    word.text
-                    + (token_properties[i]['punc_mark'] or '')
-                    + (token_properties[i]['tag'] or '')
-                )
+        for word in sentence.words:
+            words.append(word.text)
 
             if word.xpos is not None:
                 tags.append(word.xpos)
@@ -513,93 +501,104 @@ def wl_dependency_parse_fig_tokens(
 ):
     htmls = []
 
-    options = {
-        'fine_grained': show_fine_grained_pos_tags,
-        'add_lemma': show_lemmas,
-        'collapse_punct': collapse_punc_marks,
-        'compact': compact_mode
-    }
-
-    # spaCy
-    if dependency_parser.startswith('spacy_'):
-        nlp = main.__dict__[f'spacy_nlp_{wl_conversion.remove_lang_code_suffixes(lang)}']
-
-        with nlp.select_pipes(disable = (
-            pipeline
-            for pipeline in _get_pipelines_to_disable(show_pos_tags, show_lemmas)
-            if nlp.has_pipe(pipeline)
-        )):
-            docs = []
-            token_properties = []
-
-            for tokens in sentences:
-                texts, token_properties_sentence = wl_texts.split_texts_properties(tokens)
-
-                for token_section in wl_nlp_utils.split_tokens(main, texts, dependency_parser):
-                    docs.append(spacy.tokens.Doc(nlp.vocab, words = token_section, spaces = [True] * len(token_section)))
+    options = (
+        ('fine_grained', show_fine_grained_pos_tags),
+        ('add_lemma', show_lemmas),
+        ('collapse_punct', collapse_punc_marks),
+        ('compact', compact_mode)
+    )
 
-                token_properties.extend(token_properties_sentence)
+    separator = main.settings_custom['pos_tagging']['pos_tagger_settings']['separator_between_tokens_pos_tags']
 
-            i_tag = 0
+    for sentence in sentences:
+        # Dependency graphs are built from heads and dependency relations already stored in tokens, and sentences are only parsed if they have not been parsed yet
+        if all((token.dependency_relation is None for token in sentence)):
+            sentence = wl_dependency_parse(main, copy.deepcopy(sentence), lang, dependency_parser, force = True)
 
-            for doc in nlp.pipe(docs):
-                for sentence in doc.sents:
-                    displacy_dict = spacy.displacy.parse_deps(sentence, options = options)
+        texts = [str(token) or (token.punc_mark or '') for token in sentence]
 
-                    for token, word in zip(sentence, displacy_dict['words']):
-                        properties = token_properties[i_tag + token.i]
-                        word['text'] += (properties['punc_mark'] or '') + (properties['tag'] or '')
+        if show_pos_tags:
+            if show_fine_grained_pos_tags:
+                tags = [
+                    (token.tag or '').removeprefix(separator).strip()
+                    for token in sentence
+                ]
+            else:
+                tags = [token.tag_universal or '' for token in sentence]
 
-                    htmls.append(spacy.displacy.render(
-                        displacy_dict,
-                        style = 'dep',
-                        minify = True,
-                        options = options,
-                        manual = True
-                    ))
+            # Assign POS tags to copies of tokens if they have not been tagged
+            if not all(tags) and lang in main.settings_global['pos_taggers']:
+                tokens_tagged = wl_pos_tagging.wl_pos_tag(main, wl_texts.to_tokens(texts, lang = lang), lang)
 
-                i_tag += len(doc)
-    # Stanza
-    elif dependency_parser.startswith('stanza_'):
-        if lang not in {'zho_cn', 'zho_tw'}:
-            lang_stanza = wl_conversion.remove_lang_code_suffixes(lang)
+                if show_fine_grained_pos_tags:
+                    tags = [token.tag.removeprefix(separator).strip() for token in tokens_tagged]
+                else:
+                    tags = [token.tag_universal for token in tokens_tagged]
         else:
-            lang_stanza = lang
+            tags = [''] * len(sentence)
 
-        docs = []
-        token_properties = []
+        if show_lemmas:
+            if any((token.lemma is None for token in sentence)):
+                lemmas = wl_texts.get_token_properties(
+                    wl_lemmatization.wl_lemmatize(main, wl_texts.to_tokens(texts, lang = lang), lang),
+                    'lemma'
+                )
+            else:
+                lemmas = wl_texts.get_token_properties(sentence, 'lemma')
+        else:
+            lemmas = [None] * len(sentence)
 
-        for tokens in sentences:
-            texts, token_properties_sentence = wl_texts.split_texts_properties(tokens)
+        # Heads are identified by their positions in the sentence
+        i_tokens = {id(token): i for i, token in enumerate(sentence)}
 
-            for token_section in wl_nlp_utils.split_tokens(main, texts, dependency_parser):
-                docs.append([token_section])
+        words = []
+        arcs = []
 
-            token_properties.extend(token_properties_sentence)
+        for i, (token, tag, lemma) in enumerate(zip(sentence, tags, lemmas)):
+            words.append((token.display_text(punc_mark = True), tag, lemma))
 
-        nlp = main.__dict__[f'stanza_nlp_{lang_stanza}']
-        i_tag = 0
+            # Heads of punctuation marks are removed if punctuation marks are not counted as separate tokens
+            i_head = i_tokens.get(id(token.head), i)
 
-        for doc in nlp.bulk_process(docs):
-            for sentence in doc.sentences:
-                num_words = len(sentence.words)
+            if i < i_head:
+                arcs.append((i, i_head, token.dependency_relation, 'left'))
+            elif i > i_head:
+                arcs.append((i_head, i, token.dependency_relation, 'right'))
 
-                displacy_dict = to_displacy_sentence(
-                    lang, sentence,
-                    token_properties = token_properties[i_tag : i_tag + num_words]
-                )
+        # RTL languages
+        if lang in LANGS_RTL:
+            len_sentence = len(words)
 
-                htmls.append(spacy.displacy.render(
-                    displacy_dict,
-                    style = 'dep',
-                    minify = True,
-                    options = options
-                ))
+            words.reverse()
+            arcs = [
+                (len_sentence - 1 - end, len_sentence - 1 - start, label, 'right' if direction == 'left' else 'left')
+                for start, end, label, direction in arcs
+            ]
 
-                i_tag += num_words
+        htmls.append(render_dependency_graph(tuple(words), tuple(arcs), options))
 
     return htmls
 
+# Rendered dependency graphs are cached and reused when the same sentences are rendered again with the same options
+@functools.lru_cache(maxsize = 10000)
+def render_dependency_graph(words, arcs, options):
+    return spacy.displacy.render(
+        {
+            'words': [
+                {'text': text, 'tag': tag, 'lemma': lemma}
+                for text, tag, lemma in words
+            ],
+            'arcs': [
+                {'start': start, 'end': end, 'label': label, 'dir': direction}
+                for start, end, label, direction in arcs
+            ]
+        },
+        style = 'dep',
+        minify = True,
+        options = dict(options),
+        manual = True
+    )
+
 def wl_show_dependency_graphs(parent, htmls, show_in_separate_tabs):
     # pylint: disable=consider-using-with
     DIR_PATH = os.path.join(wl_settings_default.DEFAULT_DIR_EXPS, '_dependency_parsing_figs')
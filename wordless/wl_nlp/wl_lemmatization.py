@@ -16,6 +16,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
+import functools
 import re
 
 import nltk
@@ -33,6 +34,27 @@ from wordless.wl_utils import wl_conversion
 
 _tr = QtCore.QCoreApplication.translate
 
+# Lemmas of context-free lemmatizers are cached by token types
+@functools.lru_cache(maxsize = 1000000)
+def _lemmatize_simplemma(token, lang):
+    return simplemma.lemmatize(token, lang = lang)
+
+@functools.lru_cache(maxsize = 1000000)
+def _lemmatize_nltk_wordnet(token, tag_universal):
+    word_net_lemmatizer = nltk.WordNetLemmatizer()
+
+    match tag_universal:
+        case 'ADJ':
+            return word_net_lemmatizer.lemmatize(token, pos = nltk.corpus.wordnet.ADJ)
+        case 'NOUN' | 'PROPN':
+            return word_net_lemmatizer.lemmatize(token, pos = nltk.corpus.wordnet.NOUN)
+        case 'ADV':
+            return word_net_lemmatizer.lemmatize(token, pos = nltk.corpus.wordnet.ADV)
+        case 'VERB' | 'AUX':
+            return word_net_lemmatizer.lemmatize(token, pos = nltk.corpus.wordnet.VERB)
+        case _:
+            return word_net_lemmatizer.lemmatize(token)
+
 def wl_lemmatize(main, inputs, lang, lemmatizer = 'default', force = False):
     if (
         not isinstance(inputs, str)
@@ -166,28 +188,15 @@ def wl_lemmatize_text(main, text, lang, lemmatizer):
                     tokens_line = wl_texts.to_display_texts(tokens_line)
 
                     tokens.extend((str(token) for token in tokens_line))
-                    lemmas.extend((simplemma.lemmatize(token, lang = lang) for token in tokens_line))
+                    lemmas.extend((_lemmatize_simplemma(str(token), lang) for token in tokens_line))
                 # English
                 elif lemmatizer == 'nltk_wordnet':
-                    word_net_lemmatizer = nltk.WordNetLemmatizer()
-
                     for token in wl_pos_tagging.wl_pos_tag_universal(
                         main, line_clean,
                         lang = 'eng_us'
                     ):
                         tokens.append(str(token))
-
-                        match token.tag_universal:
-                            case 'ADJ':
-                                lemmas.append(word_net_lemmatizer.lemmatize(str(token), pos = nltk.corpus.wordnet.ADJ))
-                            case 'NOUN' | 'PROPN':
-                                lemmas.append(word_net_lemmatizer.lemmatize(str(token), pos = nltk.corpus.wordnet.NOUN))
-                            case 'ADV':
-                                lemmas.append(word_net_lemmatizer.lemmatize(str(token), pos = nltk.corpus.wordnet.ADV))
-                            case 'VERB' | 'AUX':
-                                lemmas.append(word_net_lemmatizer.lemmatize(str(token), pos = nltk.corpus.wordnet.VERB))
-                            case _:
-                                lemmas.append(word_net_lemmatizer.lemmatize(str(token)))
+                        lemmas.append(_lemmatize_nltk_wordnet(str(token), token.tag_universal))
                 # Japanese
                 elif lemmatizer == 'sudachipy_jpn':
                     for token in main.sudachipy_word_tokenizer.tokenize(line_clean):
@@ -203,7 +212,7 @@ def wl_lemmatize_text(main, text, lang, lemmatizer):
 
                     for token in wl_word_tokenization.wl_word_tokenize_flat(main, line_clean, lang = lang):
                         tokens.append(str(token))
-                        lemmas.append(morphological_analyzer.parse(token)[0].normal_form)
+                        lemmas.append(wl_nlp_utils.pymorphy3_parse(morphological_analyzer, str(token)).normal_form)
                 # Tibetan
                 elif lemmatizer in {'botok_xct', 'modern_botok_bod'}:
                     for token in main.__dict__[f'{lemmatizer[:-4]}_word_tokenizer'].tokenize(line_clean):
@@ -298,27 +307,15 @@ def wl_lemmatize_tokens(main, inputs, lang, lemmatizer):
                         lang_simplemma = wl_conversion.to_iso_639_1(main, lang, no_suffix = True)
 
                 lemma_tokens.extend(tokens.copy())
-                lemmas.extend((simplemma.lemmatize(token, lang = lang_simplemma) for token in tokens))
+                lemmas.extend((_lemmatize_simplemma(str(token), lang_simplemma) for token in tokens))
             # English
             elif lemmatizer == 'nltk_wordnet':
-                word_net_lemmatizer = nltk.WordNetLemmatizer()
-
                 for token in wl_pos_tagging.wl_pos_tag_universal(
                     main,
                     inputs = wl_texts.to_tokens(tokens, lang = 'eng_us'),
                     lang = 'eng_us'
                 ):
-                    match token.tag_universal:
-                        case 'ADJ':
-                            lemmas.append(word_net_lemmatizer.lemmatize(str(token), pos = nltk.corpus.wordnet.ADJ))
-                        case 'NOUN' | 'PROPN':
-                            lemmas.append(word_net_lemmatizer.lemmatize(str(token), pos = nltk.corpus.wordnet.NOUN))
-                        case 'ADV':
-                            lemmas.append(word_net_lemmatizer.lemmatize(str(token), pos = nltk.corpus.wordnet.ADV))
-                        case 'VERB' | 'AUX':
-                            lemmas.append(word_net_lemmatizer.lemmatize(str(token), pos = nltk.corpus.wordnet.VERB))
-                        case _:
-                            lemmas.append(word_net_lemmatizer.lemmatize(str(token)))
+                    lemmas.append(_lemmatize_nltk_wordnet(str(token), token.tag_universal))
 
                 lemma_tokens.extend(tokens.copy())
             # Japanese
@@ -335,7 +332,7 @@ def wl_lemmatize_tokens(main, inputs, lang, lemmatizer):
                         morphological_analyzer = main.pymorphy3_morphological_analyzer_ukr
 
                 for token in tokens:
-                    lemmas.append(morphological_analyzer.parse(token)[0].normal_form)
+                    lemmas.append(wl_nlp_utils.pymorphy3_parse(morphological_analyzer, str(token)).normal_form)
 
                 lemma_tokens.extend(tokens.copy())
             # Tibetan
@@ -26,6 +26,7 @@ from wordless.wl_nlp import (
     wl_lemmatization,
     wl_texts
 )
+from wordless.wl_utils import wl_instrumentation
 
 _tr = QtCore.QCoreApplication.translate
 
@@ -352,6 +353,7 @@ def match_ngrams(
 
     return search_results
 
+@wl_instrumentation.log_stage('matching/match_search_terms_tokens')
 def match_search_terms_tokens(
     main, tokens,
     lang, token_settings, search_settings
@@ -366,6 +368,7 @@ def match_search_terms_tokens(
 
     return search_terms
 
+@wl_instrumentation.log_stage('matching/match_search_terms_ngrams')
 def match_search_terms_ngrams(
     main, tokens,
     lang, token_settings, search_settings
@@ -381,6 +384,7 @@ def match_search_terms_ngrams(
     return search_terms
 
 # Context
+@wl_instrumentation.log_stage('matching/match_search_terms_context')
 def match_search_terms_context(
     main, tokens,
     lang, token_settings, context_settings
@@ -17,6 +17,7 @@
 # ----------------------------------------------------------------------
 
 import collections
+import functools
 import html
 import importlib
 import itertools
@@ -42,6 +43,7 @@ import spacy
 import spacy_pkuseg
 import stanza
 import sudachipy
+import vaderSentiment.vaderSentiment
 
 from wordless.wl_checks import wl_checks_work_area
 from wordless.wl_dialogs import wl_dialogs_misc
@@ -593,6 +595,11 @@ def init_pos_taggers(main, lang, pos_tagger, tokenized = False):
     elif pos_tagger == 'modern_botok_bod':
         init_model_spacy(main, 'bod')
 
+# Analyses of pymorphy3's morphological analyzers are context-free and are cached by token types for both lemmatization and POS tagging
+@functools.lru_cache(maxsize = 1000000)
+def pymorphy3_parse(morphological_analyzer, token):
+    return morphological_analyzer.parse(token)[0]
+
 def init_lemmatizers(main, lang, lemmatizer, tokenized = False):
     # spaCy
     if lemmatizer.startswith('spacy_'):
@@ -625,6 +632,10 @@ def init_sentiment_analyzers(main, lang, sentiment_analyzer, tokenized = False):
     # Stanza
     if sentiment_analyzer.startswith('stanza_'):
         init_model_stanza(main, lang, lang_util = 'sentiment_analyzer', tokenized = tokenized)
+    # VADER
+    elif sentiment_analyzer == 'vader_eng':
+        if 'vader_sentiment_analyzer' not in main.__dict__:
+            main.vader_sentiment_analyzer = vaderSentiment.vaderSentiment.SentimentIntensityAnalyzer()
 
 # Make sure tokenization is not modified during NLP processing
 def align_tokens(tokens_raw, tokens_processed, results, prefer_raw = False):
@@ -358,7 +358,7 @@ def wl_pos_tag_text(main, text, lang, pos_tagger, tagset):
 
                         for token in wl_texts.to_token_texts(tokens):
                             tokens_tagged.append(token)
-                            tags.append(morphological_analyzer.parse(token)[0].tag._POS)
+                            tags.append(wl_nlp_utils.pymorphy3_parse(morphological_analyzer, str(token)).tag._POS)
                     # Thai
                     case 'pythainlp_perceptron_blackboard' | 'pythainlp_perceptron_orchid' | 'pythainlp_perceptron_pud':
                         tokens = wl_word_tokenization.wl_word_tokenize_flat(main, line_clean, lang = lang)
@@ -517,7 +517,7 @@ def wl_pos_tag_tokens(main, tokens, lang, pos_tagger, tagset):
 
                     for token in tokens:
                         tokens_tagged.append(token)
-                        tags.append(morphological_analyzer.parse(token)[0].tag._POS)
+                        tags.append(wl_nlp_utils.pymorphy3_parse(morphological_analyzer, str(token)).tag._POS)
                 # Thai
                 case 'pythainlp_perceptron_blackboard' | 'pythainlp_perceptron_orchid' | 'pythainlp_perceptron_pud':
                     match pos_tagger:
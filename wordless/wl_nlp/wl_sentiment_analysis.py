@@ -19,9 +19,9 @@
 # pylint: disable=unused-argument
 
 import collections
+import threading
 
 import underthesea
-import vaderSentiment.vaderSentiment
 
 from wordless.wl_nlp import (
     wl_nlp_utils,
@@ -29,24 +29,93 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import wl_conversion
 
+class Wl_Sentiment_Cache:
+    """Cache of sentiment scores of inputs shared by all files and work areas with least-recently-used items evicted first."""
+
+    def __init__(self, max_size = 100000):
+        self.max_size = max_size
+        # (Language, sentiment analyzer, text or token texts) -> sentiment score
+        self.cache = collections.OrderedDict()
+
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.cache)
+
+    def get(self, lang, sentiment_analyzer, sentence):
+        with self.lock:
+            key = (lang, sentiment_analyzer, sentence)
+            sentiment_score = self.cache.get(key)
+
+            if sentiment_score is not None:
+                self.cache.move_to_end(key)
+
+            return sentiment_score
+
+    def set(self, lang, sentiment_analyzer, sentence, sentiment_score):
+        with self.lock:
+            self.cache[(lang, sentiment_analyzer, sentence)] = sentiment_score
+
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last = False)
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+sentiment_cache = Wl_Sentiment_Cache()
+
 def wl_sentiment_analyze(main, inputs, lang, sentiment_analyzer = 'default'):
     if sentiment_analyzer == 'default':
         sentiment_analyzer = main.settings_custom['sentiment_analysis']['sentiment_analyzer_settings'][lang]
 
     if inputs:
+        tokenized = not isinstance(inputs[0], str)
+
         wl_nlp_utils.init_sentiment_analyzers(
             main,
             lang = lang,
             sentiment_analyzer = sentiment_analyzer,
-            tokenized = not isinstance(inputs[0], str)
+            tokenized = tokenized
         )
 
-        # Only for Settings - Sentiment Analysis - Preview
-        if isinstance(inputs[0], str):
-            sentiment_scores = wl_sentiment_analyze_text(main, inputs, lang, sentiment_analyzer)
         # Only for Concordancer - Sentiment Score
+        if tokenized:
+            sentences = [tuple(wl_texts.to_token_texts(tokens)) for tokens in inputs]
+        # Only for Settings - Sentiment Analysis - Preview
         else:
-            sentiment_scores = wl_sentiment_analyze_tokens(main, inputs, lang, sentiment_analyzer)
+            sentences = [sentence.strip() for sentence in inputs]
+
+        # Identical inputs (e.g. concordance lines of repeated phrases) are only analyzed once, and cached scores are reused
+        sentiment_scores_sentences = {}
+
+        for sentence in sentences:
+            if (
+                sentence not in sentiment_scores_sentences
+                and (sentiment_score := sentiment_cache.get(lang, sentiment_analyzer, sentence)) is not None
+            ):
+                sentiment_scores_sentences[sentence] = sentiment_score
+
+        sentences_to_analyze = list(dict.fromkeys((
+            sentence
+            for sentence in sentences
+            if sentence not in sentiment_scores_sentences
+        )))
+
+        if sentences_to_analyze:
+            if tokenized:
+                sentiment_scores = wl_sentiment_analyze_tokens(main, sentences_to_analyze, lang, sentiment_analyzer)
+            else:
+                sentiment_scores = wl_sentiment_analyze_text(main, sentences_to_analyze, lang, sentiment_analyzer)
+
+            for sentence, sentiment_score in zip(sentences_to_analyze, sentiment_scores):
+                sentiment_scores_sentences[sentence] = sentiment_score
+
+                # Empty inputs are not cached
+                if sentiment_score is not None:
+                    sentiment_cache.set(lang, sentiment_analyzer, sentence, sentiment_score)
+
+        sentiment_scores = [sentiment_scores_sentences[sentence] for sentence in sentences]
     else:
         sentiment_scores = []
 
@@ -64,12 +133,16 @@ def wl_sentiment_analyze_text(main, sentences, lang, sentiment_analyzer):
 
         nlp = main.__dict__[f'stanza_nlp_{lang_stanza}']
 
+        sentences = [sentence.strip() for sentence in sentences]
+        # All non-empty inputs are processed in one batch
+        docs = iter(nlp.bulk_process([sentence for sentence in sentences if sentence]))
+
         for sentence in sentences:
-            if (sentence := sentence.strip()):
+            if sentence:
                 # If the input is split into multiple sentences, use the sentiment with the highest frequency as the sentiment score of the input
                 sentiments = []
 
-                for sentenge_seg in nlp(sentence).sentences:
+                for sentenge_seg in next(docs).sentences:
                     sentiments.append(sentenge_seg.sentiment)
 
                 sentiment_scores.append(collections.Counter(sentiments).most_common(1)[0][0] - 1)
@@ -77,11 +150,9 @@ def wl_sentiment_analyze_text(main, sentences, lang, sentiment_analyzer):
                 sentiment_scores.append(None)
     # VADER
     elif sentiment_analyzer == 'vader_eng':
-        analyzer = vaderSentiment.vaderSentiment.SentimentIntensityAnalyzer()
-
         for sentence in sentences:
             if (sentence := sentence.strip()):
-                sentiment_scores.append(analyzer.polarity_scores(sentence)['compound'])
+                sentiment_scores.append(main.vader_sentiment_analyzer.polarity_scores(sentence)['compound'])
             else:
                 sentiment_scores.append(None)
     # Vietnamese
@@ -114,17 +185,24 @@ def wl_sentiment_analyze_tokens(main, sentences, lang, sentiment_analyzer):
 
         nlp = main.__dict__[f'stanza_nlp_{lang_stanza}']
 
-        for sentence_tokens in sentences:
-            # If the input is too long, use the sentiment with the highest frequency as the sentiment score of the input
-            sentiments = []
+        # Sections of all inputs are processed in one batch
+        docs = []
+        i_sentences = []
+
+        for i, sentence_tokens in enumerate(sentences):
+            for tokens in wl_nlp_utils.split_tokens(main, sentence_tokens, sentiment_analyzer):
+                docs.append([wl_texts.to_token_texts(tokens)])
+                i_sentences.append(i)
+
+        # If the input is too long, use the sentiment with the highest frequency as the sentiment score of the input
+        sentiments_sentences = [[] for _ in sentences]
 
-            for doc in nlp.bulk_process([
-                [wl_texts.to_token_texts(tokens)]
-                for tokens in wl_nlp_utils.split_tokens(main, sentence_tokens, sentiment_analyzer)
-            ]):
+        if docs:
+            for i, doc in zip(i_sentences, nlp.bulk_process(docs)):
                 for sentence in doc.sentences:
-                    sentiments.append(sentence.sentiment)
+                    sentiments_sentences[i].append(sentence.sentiment)
 
+        for sentiments in sentiments_sentences:
             if sentiments:
                 sentiment_scores.append(collections.Counter(sentiments).most_common(1)[0][0] - 1)
             else:
@@ -16,7 +16,11 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
+import collections
+import os
+import pickle
 import re
+import threading
 
 import pythainlp
 
@@ -27,6 +31,78 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import wl_misc
 
+class Wl_Syl_Cache:
+    """Cache of syllables of words shared by all files and work areas with least-recently-used items evicted first."""
+
+    def __init__(self, max_size = 100000):
+        self.max_size = max_size
+        # (Language, syllable tokenizer, word) -> syllables
+        self.cache = collections.OrderedDict()
+
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.cache)
+
+    def get(self, lang, syl_tokenizer, token):
+        with self.lock:
+            key = (lang, syl_tokenizer, token)
+            syls = self.cache.get(key)
+
+            if syls is not None:
+                self.cache.move_to_end(key)
+
+            return syls
+
+    def set(self, lang, syl_tokenizer, token, syls):
+        with self.lock:
+            if self.max_size:
+                self.cache[(lang, syl_tokenizer, token)] = syls
+
+                self.evict()
+
+    def set_max_size(self, max_size):
+        with self.lock:
+            self.max_size = max_size
+
+            self.evict()
+
+    def evict(self):
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last = False)
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+    def load(self, file_path):
+        if os.path.exists(file_path):
+            with open(file_path, 'rb') as f:
+                try:
+                    cache = pickle.load(f)
+                # Ignore corrupt cache files or those saved by incompatible versions
+                except (EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError, TypeError):
+                    cache = {}
+
+            if not isinstance(cache, dict):
+                cache = {}
+
+            with self.lock:
+                # Items loaded are less recently used than existing ones
+                cache.update(self.cache)
+
+                self.cache = collections.OrderedDict(cache)
+                self.evict()
+
+    def save(self, file_path):
+        with self.lock:
+            cache = dict(self.cache)
+
+        with open(file_path, 'wb') as f:
+            pickle.dump(cache, f)
+
+syl_cache = Wl_Syl_Cache()
+
 def wl_syl_tokenize(main, inputs, lang, syl_tokenizer = 'default', force = False):
     if (
         not isinstance(inputs, str)
@@ -108,31 +184,38 @@ def wl_syl_tokenize_text(main, text, lang, syl_tokenizer):
 def wl_syl_tokenize_tokens(main, tokens, lang, syl_tokenizer):
     tokens_syls = {}
 
+    syl_cache.set_max_size(main.settings_custom['syl_tokenization']['cache_settings']['max_cache_size'])
+
     # Only syllabify types as context information is not needed
     for token in set(tokens):
         if token:
-            # NLTK
-            if syl_tokenizer == 'nltk_legality':
-                nltk_syl_tokenizer_legality = main.__dict__['nltk_syl_tokenizer_legality']
-
-                tokens_syls[token] = nltk_syl_tokenizer_legality.tokenize(token)
-            elif syl_tokenizer == 'nltk_sonority_sequencing':
-                nltk_syl_tokenizer_sonority_sequencing = main.__dict__['nltk_syl_tokenizer_sonority_sequencing']
-
-                tokens_syls[token] = nltk_syl_tokenizer_sonority_sequencing.tokenize(token)
-            # Pyphen
-            elif syl_tokenizer.startswith('pyphen_'):
-                pyphen_syl_tokenizer = main.__dict__[f'pyphen_syl_tokenizer_{lang}']
-                syls = re.split(r'\-+', pyphen_syl_tokenizer.inserted(token))
-
-                if any(syls):
-                    tokens_syls[token] = syls
-                else:
-                    tokens_syls[token] = [token]
-            # Thai
-            elif syl_tokenizer == 'pythainlp_han_solo':
-                tokens_syls[token] = pythainlp.tokenize.syllable_tokenize(token, engine = 'han_solo')
-            elif syl_tokenizer == 'pythainlp_syl_dict':
-                tokens_syls[token] = pythainlp.tokenize.syllable_tokenize(token, engine = 'dict')
+            syls = syl_cache.get(lang, syl_tokenizer, token)
+
+            if syls is None:
+                # NLTK
+                if syl_tokenizer == 'nltk_legality':
+                    nltk_syl_tokenizer_legality = main.__dict__['nltk_syl_tokenizer_legality']
+
+                    syls = nltk_syl_tokenizer_legality.tokenize(token)
+                elif syl_tokenizer == 'nltk_sonority_sequencing':
+                    nltk_syl_tokenizer_sonority_sequencing = main.__dict__['nltk_syl_tokenizer_sonority_sequencing']
+
+                    syls = nltk_syl_tokenizer_sonority_sequencing.tokenize(token)
+                # Pyphen
+                elif syl_tokenizer.startswith('pyphen_'):
+                    pyphen_syl_tokenizer = main.__dict__[f'pyphen_syl_tokenizer_{lang}']
+                    syls = re.split(r'\-+', pyphen_syl_tokenizer.inserted(token))
+
+                    if not any(syls):
+                        syls = [token]
+                # Thai
+                elif syl_tokenizer == 'pythainlp_han_solo':
+                    syls = pythainlp.tokenize.syllable_tokenize(token, engine = 'han_solo')
+                elif syl_tokenizer == 'pythainlp_syl_dict':
+                    syls = pythainlp.tokenize.syllable_tokenize(token, engine = 'dict')
+
+                syl_cache.set(lang, syl_tokenizer, token, syls)
+
+            tokens_syls[token] = syls
 
     return [tokens_syls[token] if token else [] for token in tokens]
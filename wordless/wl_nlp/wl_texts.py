@@ -16,11 +16,19 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
-import copy
+import collections
+import functools
+import itertools
 import os
+import pickle
 import re
+import shutil
+import tempfile
+import threading
+import weakref
 
 import bs4
+import numpy
 from PyQt5 import QtCore
 
 from wordless.wl_nlp import (
@@ -34,6 +42,10 @@ from wordless.wl_utils import wl_misc
 _tr = QtCore.QCoreApplication.translate
 
 RE_VIE_TOKENIZED = re.compile(r'(?<!^)_(?!$)')
+# Attributes of texts that are kept in memory when texts are unloaded
+ATTRS_TEXTS_RESIDENT = {'main', 'lang', 'tokenized', 'tagged', 'num_tokens', 'num_types', 'path_unloaded'}
+# Estimated memory usage of each token in bytes, including token properties and tokens with punctuation marks
+MEM_TOKEN = 600
 
 def check_text(text):
     return (text if text is not None else '')
@@ -221,6 +233,170 @@ def update_token_properties(tokens, tokens_src):
         token.update_properties(token_src)
 
 # Texts
+class Wl_Text_Store:
+    """Store of texts of opened files which unloads least-recently-used texts into temporary files when their estimated memory usage exceeds the limit."""
+
+    def __init__(self):
+        # Maximum memory usage of loaded texts in bytes
+        self.mem_max = None
+        # Estimated memory usage of loaded texts in bytes
+        self.mem = 0
+        self.dir_temp = None
+
+        # ID of texts -> weak references to texts
+        self.refs = {}
+        # IDs of loaded texts ordered from least to most recently used -> estimated memory usage of texts
+        self.texts_loaded = collections.OrderedDict()
+        # ID of texts -> paths to temporary files of unloaded texts
+        self.paths_unloaded = {}
+        # ID of texts -> number of times that texts are pinned
+        self.texts_pinned = {}
+
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.refs)
+
+    def update_settings(self, main):
+        settings = main.settings_custom['files']['misc_settings']
+
+        with self.lock:
+            if settings['text_mem_max_no_limit']:
+                self.mem_max = None
+            else:
+                self.mem_max = settings['text_mem_max'] * 1024 * 1024
+
+            self.evict()
+
+    def get_dir_temp(self):
+        if self.dir_temp is None:
+            self.dir_temp = tempfile.mkdtemp(prefix = 'wordless_texts_')
+
+            # Remove temporary files on exit
+            weakref.finalize(self, shutil.rmtree, self.dir_temp, ignore_errors = True)
+
+        return self.dir_temp
+
+    def get_text(self, text_id):
+        if (ref := self.refs.get(text_id)) is not None:
+            return ref()
+
+        return None
+
+    def get_mem(self):
+        return self.mem
+
+    def add(self, text):
+        with self.lock:
+            text_id = id(text)
+
+            if text_id not in self.refs:
+                self.refs[text_id] = weakref.ref(text, functools.partial(self._text_deleted, text_id))
+
+            if 'path_unloaded' not in text.__dict__:
+                if text_id not in self.texts_loaded:
+                    self.texts_loaded[text_id] = text.num_tokens * MEM_TOKEN
+                    self.mem += self.texts_loaded[text_id]
+
+                self.texts_loaded.move_to_end(text_id)
+
+                self.evict(text_keep = text)
+
+    def _text_deleted(self, text_id, ref): # pylint: disable=unused-argument
+        with self.lock:
+            self.refs.pop(text_id, None)
+            self.texts_pinned.pop(text_id, None)
+            self.mem -= self.texts_loaded.pop(text_id, 0)
+
+            path = self.paths_unloaded.pop(text_id, None)
+
+            # Modules might have been cleared on exit, in which case temporary files are removed along with the temporary folder
+            if path and os is not None and os.path.exists(path):
+                os.remove(path)
+
+    def pin(self, texts):
+        """Prevent texts from being unloaded until they are unpinned, e.g. while being used by workers."""
+        texts = list(texts)
+
+        with self.lock:
+            for text in texts:
+                self.texts_pinned[id(text)] = self.texts_pinned.get(id(text), 0) + 1
+
+        return texts
+
+    def unpin(self, texts):
+        with self.lock:
+            for text in texts:
+                text_id = id(text)
+
+                if (num_pins := self.texts_pinned.get(text_id, 0)) > 1:
+                    self.texts_pinned[text_id] = num_pins - 1
+                else:
+                    self.texts_pinned.pop(text_id, None)
+
+            self.evict()
+
+    def load(self, text):
+        with self.lock:
+            if (path := text.__dict__.pop('path_unloaded', None)):
+                with open(path, 'rb') as f:
+                    # Attributes set after the text is unloaded are not overwritten
+                    for attr, val in pickle.load(f).items():
+                        text.__dict__.setdefault(attr, val)
+
+                os.remove(path)
+                self.paths_unloaded.pop(id(text), None)
+
+            self.add(text)
+
+    def unload(self, text):
+        with self.lock:
+            if 'path_unloaded' not in text.__dict__:
+                state = {
+                    attr: val
+                    for attr, val in text.__dict__.items()
+                    if attr not in ATTRS_TEXTS_RESIDENT
+                }
+
+                fd, path = tempfile.mkstemp(suffix = '.pickle', dir = self.get_dir_temp())
+
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(state, f, protocol = pickle.HIGHEST_PROTOCOL)
+
+                for attr in state:
+                    del text.__dict__[attr]
+
+                text.path_unloaded = path
+                self.paths_unloaded[id(text)] = path
+
+            self.mem -= self.texts_loaded.pop(id(text), 0)
+
+    def evict(self, text_keep = None):
+        with self.lock:
+            if self.mem_max is not None:
+                num_skipped = 0
+
+                while self.mem > self.mem_max and num_skipped < len(self.texts_loaded):
+                    text_id = next(iter(self.texts_loaded))
+                    text = self.get_text(text_id)
+
+                    # Texts in use are regarded as most recently used
+                    if text is None or text is text_keep or text_id in self.texts_pinned:
+                        self.texts_loaded.move_to_end(text_id)
+
+                        num_skipped += 1
+                    else:
+                        self.unload(text)
+
+text_store = Wl_Text_Store()
+
+def is_cached(text, attr):
+    """Check whether the attribute has been computed and cached on the text, including texts that have been unloaded."""
+    if 'path_unloaded' in text.__dict__:
+        text_store.load(text)
+
+    return attr in text.__dict__
+
 class Wl_Text:
     def __init__(self, main, file):
         self.main = main
@@ -415,6 +591,30 @@ class Wl_Text:
         # Remove Wl_Main object from the text since it cannot be pickled
         del self.main
 
+    # Only called when attributes are not found
+    def __getattr__(self, name):
+        # Unloaded texts are loaded on demand
+        if not name.startswith('__') and 'path_unloaded' in self.__dict__:
+            text_store.load(self)
+
+            if name in self.__dict__:
+                return self.__dict__[name]
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    # Unloaded texts are pickled or copied along with their contents in temporary files
+    def __getstate__(self):
+        # Temporary files should not be removed by loading texts in other threads while being read
+        with text_store.lock:
+            state = self.__dict__.copy()
+
+            if (path := state.pop('path_unloaded', None)):
+                with open(path, 'rb') as f:
+                    for attr, val in pickle.load(f).items():
+                        state.setdefault(attr, val)
+
+        return state
+
     # Check whether there are tags at the start of the text
     def check_tags_text_start(self, text):
         re_tag_text_start = re.compile(fr"\s*({wl_matching.get_re_tags(self.main, tag_type = 'body')})")
@@ -699,26 +899,37 @@ class Wl_Text_Total(Wl_Text):
         if len({text.lang for text in texts}) == 1:
             self.lang = texts[0].lang
 
-            if all((hasattr(text, 'dds_sentences') for text in texts)):
-                self.dds_sentences = sum((text.dds_sentences for text in texts), [])
-                self.dds_sentences_no_punc = sum((text.dds_sentences_no_punc for text in texts), [])
-                self.root_dists = sum((text.root_dists for text in texts), [])
-                self.root_dists_no_punc = sum((text.root_dists_no_punc for text in texts), [])
+            if all((hasattr(text, 'dds') for text in texts)):
+                self.dds = numpy.concatenate([text.dds for text in texts])
+                self.dds_no_punc = numpy.concatenate([text.dds_no_punc for text in texts])
+                # Offsets of sentences are shifted by the numbers of dependency distances in previous texts
+                self.offsets_sentences_dds = numpy.concatenate([
+                    text.offsets_sentences_dds + num_dds_prev
+                    for text, num_dds_prev in zip(texts, itertools.accumulate((len(text.dds) for text in texts), initial = 0))
+                ])
         else:
             self.lang = 'other'
 
         self.tagged = any((text.tagged for text in texts))
+        # Texts are copied since callers append the total to the list of texts afterwards
+        self.texts = list(texts)
 
+        # Paragraphs are shared with texts of each file instead of being copied, since texts of each file are not modified after being processed
         self.tokens_multilevel = [
-            copy.deepcopy(para)
+            para
             for text in texts
             for para in text.tokens_multilevel
         ]
 
         self.tokens_multilevel_with_puncs = [
-            copy.deepcopy(para)
+            para
             for text in texts
             for para in text.tokens_multilevel_with_puncs
         ]
 
-        self.update_num_tokens()
+        self.num_tokens = sum((text.num_tokens for text in texts))
+
+    # Types may overlap between files, so the number of types is only counted when needed
+    @functools.cached_property
+    def num_types(self):
+        return len(set(self.get_tokens_flat()))
@@ -17,6 +17,9 @@
 # ----------------------------------------------------------------------
 
 import copy
+import itertools
+
+import numpy
 
 from wordless.wl_checks import wl_checks_tokens
 from wordless.wl_nlp import (
@@ -28,9 +31,13 @@ from wordless.wl_nlp import (
     wl_texts,
     wl_word_detokenization
 )
-from wordless.wl_utils import wl_misc
+from wordless.wl_utils import (
+    wl_instrumentation,
+    wl_misc
+)
 
 # Assign part-of-speech tags
+@wl_instrumentation.log_stage('token_processing/pos_tag')
 def text_pos_tag(main, text, settings):
     if settings['assign_pos_tags'] and not text.tagged:
         wl_pos_tagging.wl_pos_tag(
@@ -40,6 +47,7 @@ def text_pos_tag(main, text, settings):
         )
 
 # Apply lemmatization / Match inflected forms
+@wl_instrumentation.log_stage('token_processing/lemmatize')
 def text_lemmatize(main, text, token_settings, search_settings = None):
     search_settings = search_settings or {
         'match_inflected_forms': False,
@@ -65,6 +73,7 @@ def text_lemmatize(main, text, token_settings, search_settings = None):
         )
 
 # Syllable tokenization
+@wl_instrumentation.log_stage('token_processing/syl_tokenize')
 def text_syl_tokenize(main, text):
     wl_syl_tokenization.wl_syl_tokenize(
         main,
@@ -87,6 +96,7 @@ def text_use_tags_only(text, settings):
         text.set_token_properties('punc_mark', None)
 
 # Filter stop words after token texts have been converted to lowercase, replaced by lemmas, or replaced by tags
+@wl_instrumentation.log_stage('token_processing/filter_stop_words')
 def text_filter_stop_words(main, text, settings):
     if settings['filter_stop_words']:
         stop_words = wl_stop_word_lists.wl_get_stop_word_list(main, lang = text.lang)
@@ -129,6 +139,7 @@ def remove_empty_paras(tokens_multilevel):
 
     return tokens_multilevel
 
+@wl_instrumentation.log_stage('token_processing/process_tokens')
 def wl_process_tokens(main, text, token_settings, search_settings = None):
     settings = copy.deepcopy(token_settings)
 
@@ -254,6 +265,7 @@ def wl_process_tokens_ngram_generator(main, text, token_settings, search_setting
 
     return text_modified
 
+@wl_instrumentation.log_stage('token_processing/process_tokens_profiler')
 def wl_process_tokens_profiler(main, text, token_settings, tab):
     # Punctuation marks must be preserved for some readability measures (e.g. Wheeler & Smith's Readability Formula)
     text.tokens_multilevel_with_puncs = copy.deepcopy(text.tokens_multilevel)
@@ -289,30 +301,20 @@ def wl_process_tokens_profiler(main, text, token_settings, tab):
                     lang = text.lang,
                 )
 
-        # For calculating Normalized Dependency Distance
-        if not hasattr(text, 'dds_sentences'):
-            text.dds_sentences = [
-                [token.dd for token in list(wl_misc.flatten_list(sentence))]
-                for para in text.tokens_multilevel
-                for sentence in para
-            ]
-
-            text.dds_sentences_no_punc = [
-                [token.dd_no_punc for token in list(wl_misc.flatten_list(sentence))]
+        # Dependency distances of all sentences are stored in flat arrays with offsets of sentences
+        if not hasattr(text, 'dds'):
+            tokens_sentences = [
+                list(wl_misc.flatten_list(sentence))
                 for para in text.tokens_multilevel
                 for sentence in para
             ]
 
-            # Root distances start with 1
-            text.root_dists = [
-                dds.index(0) + 1
-                for dds in text.dds_sentences
-            ]
+            tokens_flat = list(itertools.chain.from_iterable(tokens_sentences))
 
-            text.root_dists_no_punc = [
-                dds.index(0) + 1
-                for dds in text.dds_sentences_no_punc
-            ]
+            text.dds = numpy.array([token.dd for token in tokens_flat], dtype = numpy.int64)
+            text.dds_no_punc = numpy.array([token.dd_no_punc for token in tokens_flat], dtype = numpy.int64)
+            lens_sentences = numpy.array([len(tokens) for tokens in tokens_sentences], dtype = numpy.int64)
+            text.offsets_sentences_dds = numpy.cumsum(lens_sentences) - lens_sentences
 
     text_modified = wl_process_tokens_ngram_generator(main, text, token_settings)
     text_modified.tokens_multilevel = remove_empty_tokens(text_modified.tokens_multilevel)
@@ -351,6 +353,7 @@ def wl_process_tokens_colligation_extractor(main, text, token_settings, search_s
 
     return text_modified
 
+@wl_instrumentation.log_stage('token_processing/process_tokens_concordancer')
 def wl_process_tokens_concordancer(main, text, token_settings, search_settings, preserve_blank_lines = False):
     text_pos_tag(main, text, token_settings)
     text_lemmatize(main, text, token_settings, search_settings)
@@ -422,6 +425,7 @@ def wl_process_tokens_concordancer(main, text, token_settings, search_settings,
 
     return text_modified
 
+@wl_instrumentation.log_stage('token_processing/process_tokens_dependency_parser')
 def wl_process_tokens_dependency_parser(main, text, token_settings, search_settings):
     # Do not modify original sentence tokenization during dependency parsing
     for para in text.tokens_multilevel:
@@ -17,7 +17,6 @@
 # ----------------------------------------------------------------------
 
 # pylint: disable=broad-exception-caught
-import collections
 import copy
 import csv
 import os
@@ -52,6 +51,7 @@ from wordless.wl_nlp import (
 )
 from wordless.wl_utils import (
     wl_excs,
+    wl_instrumentation,
     wl_misc,
     wl_threading
 )
@@ -359,11 +359,12 @@ class Wrapper_Profiler(wl_layouts.Wl_Wrapper):
                 self.update_gui_table
             )
 
+    @wl_instrumentation.log_stage('tables/profiler')
     def update_gui_table(self, err_msg, text_stats_files):
         # Skip if the text is empty
-        len_tokens = text_stats_files[-1][7] if text_stats_files else []
+        num_tokens = len(text_stats_files[-1][7]) if text_stats_files else 0
 
-        if wl_checks_work_area.check_results(self.main, err_msg, len_tokens):
+        if wl_checks_work_area.check_results(self.main, err_msg, [num_tokens]):
             for table in self.tables:
                 err_msg = table.update_gui_table(err_msg, text_stats_files)
 
@@ -563,6 +564,7 @@ class Wl_Table_Profiler(wl_tables.Wl_Table_Data):
                 self.update_gui_table
             )
 
+    @wl_instrumentation.log_stage('tables/profiler')
     def update_gui_table(self, err_msg, text_stats_files):
         raise NotImplementedError
 
@@ -617,11 +619,12 @@ class Wl_Table_Profiler_Readability(Wl_Table_Profiler):
             headers_float = set(HEADERS_READABILITY),
         )
 
+    @wl_instrumentation.log_stage('tables/profiler')
     def update_gui_table(self, err_msg, text_stats_files):
         # Skip if the text is empty
-        len_tokens = text_stats_files[-1][7] if text_stats_files else []
+        num_tokens = len(text_stats_files[-1][7]) if text_stats_files else 0
 
-        if wl_checks_work_area.check_results(self.main, err_msg, len_tokens):
+        if wl_checks_work_area.check_results(self.main, err_msg, [num_tokens]):
             try:
                 self.settings = copy.deepcopy(self.main.settings_custom)
 
@@ -693,11 +696,12 @@ class Wl_Table_Profiler_Counts(Wl_Table_Profiler):
             headers_cum = {*HEADERS_COUNTS[:8], *HEADERS_COUNTS[10:]}
         )
 
+    @wl_instrumentation.log_stage('tables/profiler')
     def update_gui_table(self, err_msg, text_stats_files):
         # Skip if the text is empty
-        len_tokens = text_stats_files[-1][7] if text_stats_files else []
+        num_tokens = len(text_stats_files[-1][7]) if text_stats_files else 0
 
-        if wl_checks_work_area.check_results(self.main, err_msg, len_tokens):
+        if wl_checks_work_area.check_results(self.main, err_msg, [num_tokens]):
             try:
                 self.settings = copy.deepcopy(self.main.settings_custom)
 
@@ -718,25 +722,18 @@ class Wl_Table_Profiler_Counts(Wl_Table_Profiler):
                 count_tokens_total = len(text_stats_files[-1][7])
                 count_types_total = len(text_stats_files[-1][9])
                 count_syls_total = len(text_stats_files[-1][10]) if text_stats_files[-1][10] is not None else None
-                count_chars_total = sum(text_stats_files[-1][7])
+                count_chars_total = text_stats_files[-1][7].sum
 
                 self.disable_updates()
 
                 for i, stats in enumerate(text_stats_files):
-                    len_paras_sentences = numpy.array(stats[1])
-                    len_sentences = numpy.array(stats[4])
-                    len_sentence_segs = numpy.array(stats[5])
-                    len_tokens_chars = numpy.array(stats[7])
-                    len_types_chars = numpy.array(stats[9])
-                    len_syls = numpy.array(stats[10]) if stats[10] is not None else None
-
-                    count_paras = len(len_paras_sentences)
-                    count_sentences = len(len_sentences)
-                    count_sentence_segs = len(len_sentence_segs)
-                    count_tokens = len(len_tokens_chars)
-                    count_types = len(len_types_chars)
-                    count_syls = len(len_syls) if len_syls is not None else None
-                    count_chars = numpy.sum(len_tokens_chars)
+                    count_paras = len(stats[1])
+                    count_sentences = len(stats[4])
+                    count_sentence_segs = len(stats[5])
+                    count_tokens = len(stats[7])
+                    count_types = len(stats[9])
+                    count_syls = len(stats[10]) if stats[10] is not None else None
+                    count_chars = stats[7].sum
 
                     # Count of Paragraphs
                     self.set_item_num(0, i, count_paras)
@@ -825,11 +822,12 @@ class Wl_Table_Profiler_Lexical_Density_Diversity(Wl_Table_Profiler):
             headers_float = set(HEADERS_LEXICAL_DENSITY_DIVERSITY)
         )
 
+    @wl_instrumentation.log_stage('tables/profiler')
     def update_gui_table(self, err_msg, text_stats_files):
         # Skip if the text is empty
-        len_tokens = text_stats_files[-1][7] if text_stats_files else []
+        num_tokens = len(text_stats_files[-1][7]) if text_stats_files else 0
 
-        if wl_checks_work_area.check_results(self.main, err_msg, len_tokens):
+        if wl_checks_work_area.check_results(self.main, err_msg, [num_tokens]):
             try:
                 self.settings = copy.deepcopy(self.main.settings_custom)
 
@@ -938,11 +936,12 @@ class Wl_Table_Profiler_Syntactic_Complexity(Wl_Table_Profiler):
             ), start = ()))
         )
 
+    @wl_instrumentation.log_stage('tables/profiler')
     def update_gui_table(self, err_msg, text_stats_files):
         # Skip if the text is empty
-        len_tokens = text_stats_files[-1][7] if text_stats_files else []
+        num_tokens = len(text_stats_files[-1][7]) if text_stats_files else 0
 
-        if wl_checks_work_area.check_results(self.main, err_msg, len_tokens):
+        if wl_checks_work_area.check_results(self.main, err_msg, [num_tokens]):
             try:
                 self.settings = copy.deepcopy(self.main.settings_custom)
 
@@ -960,34 +959,34 @@ class Wl_Table_Profiler_Syntactic_Complexity(Wl_Table_Profiler):
                 self.disable_updates()
 
                 for i, stats in enumerate(text_stats_files):
-                    dds_sentences = stats[12]
+                    dds = stats[12]
                     mdds = stats[13]
                     ndds = stats[14]
 
-                    if dds_sentences == 'no_support':
+                    if isinstance(dds, str) and dds == 'no_support':
                         for j in range(42):
                             self.set_item_err(j, i, text = self.tr('No language support'), alignment_hor = 'right')
                     else:
                         # Dependency Distance
-                        dds_sentences = numpy.array(list(wl_misc.flatten_list(dds_sentences)))
-                        dds_sentences = dds_sentences[dds_sentences != 0]
-
-                        self.set_item_num(0, i, numpy.mean(dds_sentences))
-                        self.set_item_num(1, i, numpy.std(dds_sentences))
-                        self.set_item_num(2, i, numpy.var(dds_sentences))
-                        self.set_item_num(3, i, numpy.min(dds_sentences))
-                        self.set_item_num(4, i, numpy.percentile(dds_sentences, 25))
-                        self.set_item_num(5, i, numpy.median(dds_sentences))
-                        self.set_item_num(6, i, numpy.percentile(dds_sentences, 75))
-                        self.set_item_num(7, i, numpy.max(dds_sentences))
-                        self.set_item_num(8, i, numpy.ptp(dds_sentences))
-                        self.set_item_num(9, i, scipy.stats.iqr(dds_sentences))
+                        # Exclude roots
+                        dds = dds[dds != 0]
+
+                        self.set_item_num(0, i, numpy.mean(dds))
+                        self.set_item_num(1, i, numpy.std(dds))
+                        self.set_item_num(2, i, numpy.var(dds))
+                        self.set_item_num(3, i, numpy.min(dds))
+                        self.set_item_num(4, i, numpy.percentile(dds, 25))
+                        self.set_item_num(5, i, numpy.median(dds))
+                        self.set_item_num(6, i, numpy.percentile(dds, 75))
+                        self.set_item_num(7, i, numpy.max(dds))
+                        self.set_item_num(8, i, numpy.ptp(dds))
+                        self.set_item_num(9, i, scipy.stats.iqr(dds))
                         self.model().setItem(10, i, wl_tables.Wl_Table_Item(', '.join([
-                            str(mode) for mode in wl_measures_misc.modes(dds_sentences)
+                            str(mode) for mode in wl_measures_misc.modes(dds)
                         ])))
 
                         # Absolute Dependency Distance
-                        adds = numpy.absolute(dds_sentences)
+                        adds = numpy.absolute(dds)
 
                         self.set_item_num(11, i, numpy.mean(adds))
                         self.set_item_num(12, i, numpy.std(adds))
@@ -1204,11 +1203,12 @@ class Wl_Table_Profiler_Lens(Wl_Table_Profiler):
             ), start = ()))
         )
 
+    @wl_instrumentation.log_stage('tables/profiler')
     def update_gui_table(self, err_msg, text_stats_files):
         # Skip if the text is empty
-        len_tokens = text_stats_files[-1][7] if text_stats_files else []
+        num_tokens = len(text_stats_files[-1][7]) if text_stats_files else 0
 
-        if wl_checks_work_area.check_results(self.main, err_msg, len_tokens):
+        if wl_checks_work_area.check_results(self.main, err_msg, [num_tokens]):
             try:
                 self.settings = copy.deepcopy(self.main.settings_custom)
 
@@ -1226,16 +1226,13 @@ class Wl_Table_Profiler_Lens(Wl_Table_Profiler):
                 self.disable_updates()
 
                 for i, stats in enumerate(text_stats_files):
-                    len_paras_sentences = numpy.array(stats[1])
-                    len_paras_sentence_segs = numpy.array(stats[2])
-                    len_paras_tokens = numpy.array(stats[3])
-                    len_sentences = numpy.array(stats[4])
-                    len_sentence_segs = numpy.array(stats[5])
-                    len_tokens_syls = numpy.array(stats[6]) if stats[6] is not None else None
-                    len_tokens_chars = numpy.array(stats[7])
-                    len_types_syls = numpy.array(stats[8]) if stats[8] is not None else None
-                    len_types_chars = numpy.array(stats[9])
-                    len_syls = numpy.array(stats[10]) if stats[10] is not None else None
+                    (
+                        len_paras_sentences, len_paras_sentence_segs, len_paras_tokens,
+                        len_sentences, len_sentence_segs,
+                        len_tokens_syls, len_tokens_chars,
+                        len_types_syls, len_types_chars,
+                        len_syls
+                    ) = stats[1:11]
 
                     # Paragraph Length in Sentences / Sentence Segments / Tokens
                     # Sentence / Sentence Segment Length in Tokens
@@ -1251,19 +1248,19 @@ class Wl_Table_Profiler_Lens(Wl_Table_Profiler):
                             len_tokens_chars, len_types_chars
                         )
                     ):
-                        if lens.any():
-                            self.set_item_num(row, i, numpy.mean(lens))
-                            self.set_item_num(row + 1, i, numpy.std(lens))
-                            self.set_item_num(row + 2, i, numpy.var(lens))
-                            self.set_item_num(row + 3, i, numpy.min(lens))
-                            self.set_item_num(row + 4, i, numpy.percentile(lens, 25))
-                            self.set_item_num(row + 5, i, numpy.median(lens))
-                            self.set_item_num(row + 6, i, numpy.percentile(lens, 75))
-                            self.set_item_num(row + 7, i, numpy.max(lens))
-                            self.set_item_num(row + 8, i, numpy.ptp(lens))
-                            self.set_item_num(row + 9, i, scipy.stats.iqr(lens))
+                        if any(lens.counts):
+                            self.set_item_num(row, i, lens.mean())
+                            self.set_item_num(row + 1, i, lens.std())
+                            self.set_item_num(row + 2, i, lens.var())
+                            self.set_item_num(row + 3, i, lens.min())
+                            self.set_item_num(row + 4, i, lens.percentile(25))
+                            self.set_item_num(row + 5, i, lens.median())
+                            self.set_item_num(row + 6, i, lens.percentile(75))
+                            self.set_item_num(row + 7, i, lens.max())
+                            self.set_item_num(row + 8, i, lens.ptp())
+                            self.set_item_num(row + 9, i, lens.iqr())
                             self.model().setItem(row + 10, i, wl_tables.Wl_Table_Item(', '.join([
-                                str(mode) for mode in wl_measures_misc.modes(lens)
+                                str(mode) for mode in lens.modes()
                             ])))
                         else:
                             for j in range(10):
@@ -1280,19 +1277,19 @@ class Wl_Table_Profiler_Lens(Wl_Table_Profiler):
                         (len_tokens_syls, len_types_syls, len_syls)
                     ):
                         if lens is not None:
-                            if lens.any():
-                                self.set_item_num(row, i, numpy.mean(lens))
-                                self.set_item_num(row + 1, i, numpy.std(lens))
-                                self.set_item_num(row + 2, i, numpy.var(lens))
-                                self.set_item_num(row + 3, i, numpy.min(lens))
-                                self.set_item_num(row + 4, i, numpy.percentile(lens, 25))
-                                self.set_item_num(row + 5, i, numpy.median(lens))
-                                self.set_item_num(row + 6, i, numpy.percentile(lens, 75))
-                                self.set_item_num(row + 7, i, numpy.max(lens))
-                                self.set_item_num(row + 8, i, numpy.ptp(lens))
-                                self.set_item_num(row + 9, i, scipy.stats.iqr(lens))
+                            if any(lens.counts):
+                                self.set_item_num(row, i, lens.mean())
+                                self.set_item_num(row + 1, i, lens.std())
+                                self.set_item_num(row + 2, i, lens.var())
+                                self.set_item_num(row + 3, i, lens.min())
+                                self.set_item_num(row + 4, i, lens.percentile(25))
+                                self.set_item_num(row + 5, i, lens.median())
+                                self.set_item_num(row + 6, i, lens.percentile(75))
+                                self.set_item_num(row + 7, i, lens.max())
+                                self.set_item_num(row + 8, i, lens.ptp())
+                                self.set_item_num(row + 9, i, lens.iqr())
                                 self.model().setItem(row + 10, i, wl_tables.Wl_Table_Item(', '.join([
-                                    str(mode) for mode in wl_measures_misc.modes(lens)
+                                    str(mode) for mode in lens.modes()
                                 ])))
                             else:
                                 for j in range(10):
@@ -1324,11 +1321,12 @@ class Wl_Table_Profiler_Len_Breakdown(Wl_Table_Profiler):
             headers = ()
         )
 
+    @wl_instrumentation.log_stage('tables/profiler')
     def update_gui_table(self, err_msg, text_stats_files):
         # Skip if the text is empty
-        len_tokens = text_stats_files[-1][7] if text_stats_files else []
+        num_tokens = len(text_stats_files[-1][7]) if text_stats_files else 0
 
-        if wl_checks_work_area.check_results(self.main, err_msg, len_tokens):
+        if wl_checks_work_area.check_results(self.main, err_msg, [num_tokens]):
             try:
                 self.settings = copy.deepcopy(self.main.settings_custom)
 
@@ -1351,17 +1349,17 @@ class Wl_Table_Profiler_Len_Breakdown(Wl_Table_Profiler):
                 self.disable_updates()
 
                 for stats in text_stats_files:
-                    len_sentences = numpy.array(stats[4])
-                    len_sentence_segs = numpy.array(stats[5])
-                    len_tokens_syls = numpy.array(stats[6]) if stats[6] is not None else None
-                    len_tokens_chars = numpy.array(stats[7])
+                    len_sentences = stats[4]
+                    len_sentence_segs = stats[5]
+                    len_tokens_syls = stats[6]
+                    len_tokens_chars = stats[7]
 
-                    count_sentences_lens.append(collections.Counter(len_sentences))
-                    count_sentence_segs_lens.append(collections.Counter(len_sentence_segs))
+                    count_sentences_lens.append(len_sentences.counts)
+                    count_sentence_segs_lens.append(len_sentence_segs.counts)
                     count_tokens_lens_syls.append(
-                        collections.Counter(len_tokens_syls) if len_tokens_syls is not None else None
+                        len_tokens_syls.counts if len_tokens_syls is not None else None
                     )
-                    count_tokens_lens_chars.append(collections.Counter(len_tokens_chars))
+                    count_tokens_lens_chars.append(len_tokens_chars.counts)
 
                 # Count of n-token-long Sentences
                 if any(count_sentences_lens):
@@ -1561,47 +1559,48 @@ class Wl_Worker_Profiler(wl_threading.Wl_Worker):
 
                 # Readability
                 if self.tab in {'readability', 'all'}:
-                    stats_readability = [
-                        wl_measures_readability.rd(self.main, text),
-                        wl_measures_readability.aari(self.main, text),
-                        wl_measures_readability.ari(self.main, text),
-                        wl_measures_readability.bormuths_cloze_mean(self.main, text),
-                        wl_measures_readability.bormuths_gp(self.main, text),
-                        wl_measures_readability.coleman_liau_index(self.main, text),
-                        wl_measures_readability.colemans_readability_formula(self.main, text),
-                        wl_measures_readability.crawfords_readability_formula(self.main, text),
-                        wl_measures_readability.x_c50(self.main, text),
-                        wl_measures_readability.danielson_bryans_readability_formula(self.main, text),
-                        wl_measures_readability.dawoods_readability_formula(self.main, text),
-                        wl_measures_readability.drp(self.main, text),
-                        wl_measures_readability.devereux_readability_index(self.main, text),
-                        wl_measures_readability.dickes_steiwer_handformel(self.main, text),
-                        wl_measures_readability.elf(self.main, text),
-                        wl_measures_readability.gl(self.main, text),
-                        wl_measures_readability.re_flesch(self.main, text),
-                        wl_measures_readability.re_farr_jenkins_paterson(self.main, text),
-                        wl_measures_readability.rgl(self.main, text),
-                        wl_measures_readability.fuckss_stilcharakteristik(self.main, text),
-                        wl_measures_readability.gulpease(self.main, text),
-                        wl_measures_readability.fog_index(self.main, text),
-                        wl_measures_readability.cp(self.main, text),
-                        wl_measures_readability.mu(self.main, text),
-                        wl_measures_readability.lensear_write_formula(self.main, text),
-                        wl_measures_readability.lix(self.main, text),
-                        wl_measures_readability.lorge_readability_index(self.main, text),
-                        wl_measures_readability.luong_nguyen_dinhs_readability_formula(self.main, text),
-                        wl_measures_readability.eflaw(self.main, text),
-                        wl_measures_readability.nwl(self.main, text),
-                        wl_measures_readability.nws(self.main, text),
-                        wl_measures_readability.osman(self.main, text),
-                        wl_measures_readability.rix(self.main, text),
-                        wl_measures_readability.smog_grading(self.main, text),
-                        wl_measures_readability.spache_readability_formula(self.main, text),
-                        wl_measures_readability.strain_index(self.main, text),
-                        wl_measures_readability.trankle_bailers_readability_formula(self.main, text),
-                        wl_measures_readability.td(self.main, text),
-                        wl_measures_readability.wheeler_smiths_readability_formula(self.main, text)
-                    ]
+                    with wl_instrumentation.stage('measures/readability', num_items = text.num_tokens):
+                        stats_readability = [
+                            wl_measures_readability.rd(self.main, text),
+                            wl_measures_readability.aari(self.main, text),
+                            wl_measures_readability.ari(self.main, text),
+                            wl_measures_readability.bormuths_cloze_mean(self.main, text),
+                            wl_measures_readability.bormuths_gp(self.main, text),
+                            wl_measures_readability.coleman_liau_index(self.main, text),
+                            wl_measures_readability.colemans_readability_formula(self.main, text),
+                            wl_measures_readability.crawfords_readability_formula(self.main, text),
+                            wl_measures_readability.x_c50(self.main, text),
+                            wl_measures_readability.danielson_bryans_readability_formula(self.main, text),
+                            wl_measures_readability.dawoods_readability_formula(self.main, text),
+                            wl_measures_readability.drp(self.main, text),
+                            wl_measures_readability.devereux_readability_index(self.main, text),
+                            wl_measures_readability.dickes_steiwer_handformel(self.main, text),
+                            wl_measures_readability.elf(self.main, text),
+                            wl_measures_readability.gl(self.main, text),
+                            wl_measures_readability.re_flesch(self.main, text),
+                            wl_measures_readability.re_farr_jenkins_paterson(self.main, text),
+                            wl_measures_readability.rgl(self.main, text),
+                            wl_measures_readability.fuckss_stilcharakteristik(self.main, text),
+                            wl_measures_readability.gulpease(self.main, text),
+                            wl_measures_readability.fog_index(self.main, text),
+                            wl_measures_readability.cp(self.main, text),
+                            wl_measures_readability.mu(self.main, text),
+                            wl_measures_readability.lensear_write_formula(self.main, text),
+                            wl_measures_readability.lix(self.main, text),
+                            wl_measures_readability.lorge_readability_index(self.main, text),
+                            wl_measures_readability.luong_nguyen_dinhs_readability_formula(self.main, text),
+                            wl_measures_readability.eflaw(self.main, text),
+                            wl_measures_readability.nwl(self.main, text),
+                            wl_measures_readability.nws(self.main, text),
+                            wl_measures_readability.osman(self.main, text),
+                            wl_measures_readability.rix(self.main, text),
+                            wl_measures_readability.smog_grading(self.main, text),
+                            wl_measures_readability.spache_readability_formula(self.main, text),
+                            wl_measures_readability.strain_index(self.main, text),
+                            wl_measures_readability.trankle_bailers_readability_formula(self.main, text),
+                            wl_measures_readability.td(self.main, text),
+                            wl_measures_readability.wheeler_smiths_readability_formula(self.main, text)
+                        ]
                 else:
                     stats_readability = None
 
@@ -1612,36 +1611,6 @@ class Wl_Worker_Profiler(wl_threading.Wl_Worker):
                     tokens = text.get_tokens_flat()
                     tokens = wl_nlp_utils.add_missing_ending_tshegs(self.main, tokens, tab = 'profiler')
 
-                    # Paragraph length
-                    len_paras_sentences = [
-                        len(para)
-                        for para in text.tokens_multilevel
-                    ]
-
-                    len_paras_sentence_segs = [
-                        sum((len(sentence) for sentence in para))
-                        for para in text.tokens_multilevel
-                    ]
-
-                    len_paras_tokens = [
-                        sum((len(sentence_seg) for sentence in para for sentence_seg in sentence))
-                        for para in text.tokens_multilevel
-                    ]
-
-                    # Sentence length
-                    len_sentences = [
-                        sum((len(sentence_seg) for sentence_seg in sentence))
-                        for para in text.tokens_multilevel
-                        for sentence in para
-                    ]
-
-                    len_sentence_segs = [
-                        len(sentence_seg)
-                        for para in text.tokens_multilevel
-                        for sentence in para
-                        for sentence_seg in sentence
-                    ]
-
                     if text.lang in self.main.settings_global['syl_tokenizers']:
                         syls_tokens = text.get_token_properties('syls', flat = True)
 
@@ -1650,25 +1619,76 @@ class Wl_Worker_Profiler(wl_threading.Wl_Worker):
                             syls_tokens[i] = tuple(syl for syl in syls if not wl_checks_tokens.is_punc(syl))
 
                         syls_tokens = [syls for syls in syls_tokens if syls]
+                    else:
+                        syls_tokens = None
+
+                    # Histograms of the total are merged from those of each file, except those of types which may overlap between files
+                    if isinstance(text, wl_texts.Wl_Text_Total):
+                        stats_files = self.text_stats_files
+
+                        len_paras_sentences = wl_measures_misc.Wl_Hist.merge_hists((stats[1] for stats in stats_files))
+                        len_paras_sentence_segs = wl_measures_misc.Wl_Hist.merge_hists((stats[2] for stats in stats_files))
+                        len_paras_tokens = wl_measures_misc.Wl_Hist.merge_hists((stats[3] for stats in stats_files))
+                        len_sentences = wl_measures_misc.Wl_Hist.merge_hists((stats[4] for stats in stats_files))
+                        len_sentence_segs = wl_measures_misc.Wl_Hist.merge_hists((stats[5] for stats in stats_files))
+                        len_tokens_chars = wl_measures_misc.Wl_Hist.merge_hists((stats[7] for stats in stats_files))
+
+                        if syls_tokens is not None:
+                            len_tokens_syls = wl_measures_misc.Wl_Hist.merge_hists((stats[6] for stats in stats_files))
+                            len_syls = wl_measures_misc.Wl_Hist.merge_hists((stats[10] for stats in stats_files))
+                        else:
+                            len_tokens_syls = None
+                            len_syls = None
+                    else:
+                        # Paragraph length
+                        len_paras_sentences = wl_measures_misc.Wl_Hist(
+                            len(para)
+                            for para in text.tokens_multilevel
+                        )
+
+                        len_paras_sentence_segs = wl_measures_misc.Wl_Hist(
+                            sum((len(sentence) for sentence in para))
+                            for para in text.tokens_multilevel
+                        )
+
+                        len_paras_tokens = wl_measures_misc.Wl_Hist(
+                            sum((len(sentence_seg) for sentence in para for sentence_seg in sentence))
+                            for para in text.tokens_multilevel
+                        )
+
+                        # Sentence length
+                        len_sentences = wl_measures_misc.Wl_Hist(
+                            sum((len(sentence_seg) for sentence_seg in sentence))
+                            for para in text.tokens_multilevel
+                            for sentence in para
+                        )
+
+                        len_sentence_segs = wl_measures_misc.Wl_Hist(
+                            len(sentence_seg)
+                            for para in text.tokens_multilevel
+                            for sentence in para
+                            for sentence_seg in sentence
+                        )
+
+                        if syls_tokens is not None:
+                            # Token length
+                            len_tokens_syls = wl_measures_misc.Wl_Hist(len(syls) for syls in syls_tokens)
+                            # Syllable length
+                            len_syls = wl_measures_misc.Wl_Hist(len(syl) for syls in syls_tokens for syl in syls)
+                        else:
+                            len_tokens_syls = None
+                            len_syls = None
 
                         # Token length
-                        len_tokens_syls = [len(syls) for syls in syls_tokens]
-                        # Type length
-                        len_types_syls = [len(syls) for syls in set(syls_tokens)]
-                        # Syllable length
-                        len_syls = [len(syl) for syls in syls_tokens for syl in syls]
+                        len_tokens_chars = wl_measures_misc.Wl_Hist(len(token) for token in tokens)
+
+                    # Type length
+                    if syls_tokens is not None:
+                        len_types_syls = wl_measures_misc.Wl_Hist(len(syls) for syls in set(syls_tokens))
                     else:
-                        # Token length
-                        len_tokens_syls = None
-                        # Type length
                         len_types_syls = None
-                        # Syllable length
-                        len_syls = None
 
-                    # Token length
-                    len_tokens_chars = [len(token) for token in tokens]
-                    # Type length
-                    len_types_chars = [len(token_type) for token_type in set(tokens)]
+                    len_types_chars = wl_measures_misc.Wl_Hist(len(token_type) for token_type in set(tokens))
                 else:
                     len_paras_sentences = None
                     len_paras_sentence_segs = None
@@ -1677,7 +1697,7 @@ class Wl_Worker_Profiler(wl_threading.Wl_Worker):
                     len_sentence_segs = None
                     len_tokens_syls = None
                     # For testing if the text is empty
-                    len_tokens_chars = [-1] * text.num_tokens
+                    len_tokens_chars = wl_measures_misc.Wl_Hist({-1: text.num_tokens})
                     len_types_syls = None
                     len_types_chars = None
                     len_syls = None
@@ -1688,32 +1708,33 @@ class Wl_Worker_Profiler(wl_threading.Wl_Worker):
                         raise wl_excs.Wl_Exc_Aborted(self.main)
 
                     if text.num_tokens:
-                        stats_lexical_density_diversity = [
-                            wl_measures_lexical_density_diversity.brunets_index(self.main, text),
-                            wl_measures_lexical_density_diversity.cttr(self.main, text),
-                            wl_measures_lexical_density_diversity.fishers_index_of_diversity(self.main, text),
-                            wl_measures_lexical_density_diversity.herdans_vm(self.main, text),
-                            wl_measures_lexical_density_diversity.hdd(self.main, text),
-                            wl_measures_lexical_density_diversity.honores_stat(self.main, text),
-                            wl_measures_lexical_density_diversity.lexical_density(self.main, text),
-                            wl_measures_lexical_density_diversity.logttr(self.main, text),
-                            wl_measures_lexical_density_diversity.msttr(self.main, text),
-                            wl_measures_lexical_density_diversity.mtld(self.main, text),
-                            wl_measures_lexical_density_diversity.mattr(self.main, text),
-                            *wl_measures_lexical_density_diversity.popescu_macutek_altmanns_b1_b2_b3_b4_b5(self.main, text),
-                            wl_measures_lexical_density_diversity.popescus_r1(self.main, text),
-                            wl_measures_lexical_density_diversity.popescus_r2(self.main, text),
-                            wl_measures_lexical_density_diversity.popescus_r3(self.main, text),
-                            wl_measures_lexical_density_diversity.popescus_r4(self.main, text),
-                            wl_measures_lexical_density_diversity.repeat_rate(self.main, text),
-                            wl_measures_lexical_density_diversity.rttr(self.main, text),
-                            wl_measures_lexical_density_diversity.shannon_entropy(self.main, text),
-                            wl_measures_lexical_density_diversity.simpsons_l(self.main, text),
-                            wl_measures_lexical_density_diversity.ttr(self.main, text),
-                            wl_measures_lexical_density_diversity.vocdd(self.main, text),
-                            wl_measures_lexical_density_diversity.yules_characteristic_k(self.main, text),
-                            wl_measures_lexical_density_diversity.yules_index_of_diversity(self.main, text)
-                        ]
+                        with wl_instrumentation.stage('measures/lexical_density_diversity', num_items = text.num_tokens):
+                            stats_lexical_density_diversity = [
+                                wl_measures_lexical_density_diversity.brunets_index(self.main, text),
+                                wl_measures_lexical_density_diversity.cttr(self.main, text),
+                                wl_measures_lexical_density_diversity.fishers_index_of_diversity(self.main, text),
+                                wl_measures_lexical_density_diversity.herdans_vm(self.main, text),
+                                wl_measures_lexical_density_diversity.hdd(self.main, text),
+                                wl_measures_lexical_density_diversity.honores_stat(self.main, text),
+                                wl_measures_lexical_density_diversity.lexical_density(self.main, text),
+                                wl_measures_lexical_density_diversity.logttr(self.main, text),
+                                wl_measures_lexical_density_diversity.msttr(self.main, text),
+                                wl_measures_lexical_density_diversity.mtld(self.main, text),
+                                wl_measures_lexical_density_diversity.mattr(self.main, text),
+                                *wl_measures_lexical_density_diversity.popescu_macutek_altmanns_b1_b2_b3_b4_b5(self.main, text),
+                                wl_measures_lexical_density_diversity.popescus_r1(self.main, text),
+                                wl_measures_lexical_density_diversity.popescus_r2(self.main, text),
+                                wl_measures_lexical_density_diversity.popescus_r3(self.main, text),
+                                wl_measures_lexical_density_diversity.popescus_r4(self.main, text),
+                                wl_measures_lexical_density_diversity.repeat_rate(self.main, text),
+                                wl_measures_lexical_density_diversity.rttr(self.main, text),
+                                wl_measures_lexical_density_diversity.shannon_entropy(self.main, text),
+                                wl_measures_lexical_density_diversity.simpsons_l(self.main, text),
+                                wl_measures_lexical_density_diversity.ttr(self.main, text),
+                                wl_measures_lexical_density_diversity.vocdd(self.main, text),
+                                wl_measures_lexical_density_diversity.yules_characteristic_k(self.main, text),
+                                wl_measures_lexical_density_diversity.yules_index_of_diversity(self.main, text)
+                            ]
                     else:
                         stats_lexical_density_diversity = [0] * 28
                 else:
@@ -1726,20 +1747,19 @@ class Wl_Worker_Profiler(wl_threading.Wl_Worker):
 
                     if text.lang in self.main.settings_global['dependency_parsers']:
                         if settings['token_settings']['punc_marks']:
-                            dds_sentences = text.dds_sentences.copy()
-                            root_dists = text.root_dists.copy()
+                            dds = text.dds
                         else:
-                            dds_sentences = text.dds_sentences_no_punc.copy()
-                            root_dists = text.root_dists_no_punc.copy()
+                            dds = text.dds_no_punc
 
-                        mdds = wl_measures_syntactic_complexity.mdd(dds_sentences)
-                        ndds = wl_measures_syntactic_complexity.ndd(dds_sentences, root_dists)
+                        with wl_instrumentation.stage('measures/syntactic_complexity', num_items = text.num_tokens):
+                            mdds = wl_measures_syntactic_complexity.mdd(dds, text.offsets_sentences_dds)
+                            ndds = wl_measures_syntactic_complexity.ndd(dds, text.offsets_sentences_dds)
                     else:
-                        dds_sentences = 'no_support'
+                        dds = 'no_support'
                         mdds = 'no_support'
                         ndds = 'no_support'
                 else:
-                    dds_sentences = None
+                    dds = None
                     mdds = None
                     ndds = None
 
@@ -1756,7 +1776,7 @@ class Wl_Worker_Profiler(wl_threading.Wl_Worker):
                     len_types_chars,
                     len_syls,
                     stats_lexical_density_diversity,
-                    dds_sentences,
+                    dds,
                     mdds,
                     ndds
                 ])
@@ -426,12 +426,12 @@ class Wl_Worker_Results_Search(wl_threading.Wl_Worker):
                                 ):
                                     results[(row, col)] = wl_texts.display_texts_to_tokens(
                                         self.main,
-                                        (table.model().item(row, col).text().replace(',', ''),)
+                                        (table.get_item_text(row, col).replace(',', ''),)
                                     )
                                 else:
                                     results[(row, col)] = wl_texts.display_texts_to_tokens(
                                         self.main,
-                                        (table.model().item(row, col).text(),)
+                                        (table.get_item_text(row, col),)
                                     )
 
                 items = [token for text in results.values() for token in text]
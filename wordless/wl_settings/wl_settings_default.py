@@ -249,7 +249,12 @@ def init_settings_default(main):
                 'context_len_right_sentence_seg': 0,
                 'context_len_right_sentence': 0,
                 'context_len_right_para': 0,
-                'context_len_unit': _tr('wl_settings_default', 'Token')
+                'context_len_unit': _tr('wl_settings_default', 'Token'),
+
+                'sampling_method': _tr('wl_settings_default', 'None'),
+                'sample_size': 1000,
+                'sampling_interval': 10,
+                'sampling_seed': 0
             },
 
             'table_settings': {
@@ -358,6 +363,13 @@ def init_settings_default(main):
                 }
             },
 
+            'generation_settings': {
+                'sampling_method': _tr('wl_settings_default', 'None'),
+                'sample_size': 1000,
+                'sampling_interval': 10,
+                'sampling_seed': 0
+            },
+
             'table_settings': {
                 'show_pct_data': True
             },
@@ -1284,6 +1296,13 @@ def init_settings_default(main):
                 'check_updates_on_startup': True
             },
 
+            'profiling_settings': {
+                'enable_profiling': False,
+                'track_mem_usage': False,
+                'show_breakdown': True,
+                'save_traces': False
+            },
+
             'misc_settings': {
                 'always_confirm_on_exit': True
             },
@@ -1347,7 +1366,10 @@ def init_settings_default(main):
 
             'misc_settings': {
                 'display_warning_when_opening_nontext_files': True,
-                'read_files_in_chunks_chars': 100000
+                'read_files_in_chunks_chars': 100000,
+                # In megabytes
+                'text_mem_max': 4096,
+                'text_mem_max_no_limit': False
             },
 
             # Settings - Files - Tags
@@ -1674,6 +1696,11 @@ def init_settings_default(main):
                 'zul': 'pyphen_zul'
             },
 
+            'cache_settings': {
+                'max_cache_size': 100000,
+                'save_cache': False
+            },
+
             'preview': {
                 'preview_lang': 'eng_us',
                 'preview_samples': '',
@@ -2495,6 +2522,10 @@ def init_settings_default(main):
 
                 'shannon_entropy': {
                     'use_data': _tr('wl_settings_default', 'Rank-frequency distribution')
+                },
+
+                'vocdd': {
+                    'random_seed': 0
                 }
             },
 
@@ -2640,7 +2671,10 @@ def init_settings_default(main):
 
                 'advanced_settings': {
                     'prefer_hor': 90,
-                    'allow_repeated_words': False
+                    'allow_repeated_words': False,
+                    # In megapixels
+                    'canvas_size_max': 2,
+                    'upscale_canvas': True
                 }
             },
 
@@ -301,14 +301,22 @@ class Wl_Settings_Figs_Word_Clouds(wl_settings.Wl_Settings_Node):
         self.label_prefer_hor = QtWidgets.QLabel(self.tr('Prefer horizontal:'), self)
         self.spin_box_prefer_hor = wl_boxes.Wl_Spin_Box(self)
         self.checkbox_allow_repeated_words = QtWidgets.QCheckBox(self.tr('Allow repeated words'), self)
+        self.label_canvas_size_max = QtWidgets.QLabel(self.tr('Maximum canvas size:'), self)
+        self.spin_box_canvas_size_max = wl_boxes.Wl_Spin_Box(self)
+        self.checkbox_upscale_canvas = QtWidgets.QCheckBox(self.tr('Upscale word clouds to screen resolution'), self)
 
         self.spin_box_prefer_hor.setRange(0, 100)
         self.spin_box_prefer_hor.setSuffix('%')
+        self.spin_box_canvas_size_max.setRange(1, 100)
+        self.spin_box_canvas_size_max.setSuffix(self.tr(' megapixels'))
 
         self.group_box_advanced_settings.setLayout(wl_layouts.Wl_Layout())
         self.group_box_advanced_settings.layout().addWidget(self.label_prefer_hor, 0, 0)
         self.group_box_advanced_settings.layout().addWidget(self.spin_box_prefer_hor, 0, 1)
         self.group_box_advanced_settings.layout().addWidget(self.checkbox_allow_repeated_words, 1, 0, 1, 2)
+        self.group_box_advanced_settings.layout().addWidget(self.label_canvas_size_max, 2, 0)
+        self.group_box_advanced_settings.layout().addWidget(self.spin_box_canvas_size_max, 2, 1)
+        self.group_box_advanced_settings.layout().addWidget(self.checkbox_upscale_canvas, 3, 0, 1, 2)
 
         self.group_box_advanced_settings.layout().setColumnStretch(2, 1)
 
@@ -382,6 +390,8 @@ class Wl_Settings_Figs_Word_Clouds(wl_settings.Wl_Settings_Node):
         # Advanced Settings
         self.spin_box_prefer_hor.setValue(settings['advanced_settings']['prefer_hor'])
         self.checkbox_allow_repeated_words.setChecked(settings['advanced_settings']['allow_repeated_words'])
+        self.spin_box_canvas_size_max.setValue(settings['advanced_settings']['canvas_size_max'])
+        self.checkbox_upscale_canvas.setChecked(settings['advanced_settings']['upscale_canvas'])
 
         self.font_settings_changed()
 
@@ -434,6 +444,8 @@ class Wl_Settings_Figs_Word_Clouds(wl_settings.Wl_Settings_Node):
         # Advanced Settings
         self.settings_custom['advanced_settings']['prefer_hor'] = self.spin_box_prefer_hor.value()
         self.settings_custom['advanced_settings']['allow_repeated_words'] = self.checkbox_allow_repeated_words.isChecked()
+        self.settings_custom['advanced_settings']['canvas_size_max'] = self.spin_box_canvas_size_max.value()
+        self.settings_custom['advanced_settings']['upscale_canvas'] = self.checkbox_upscale_canvas.isChecked()
 
         return True
 
@@ -25,7 +25,10 @@ from PyQt5 import QtWidgets
 
 from wordless.wl_checks import wl_checks_misc
 from wordless.wl_dialogs import wl_dialogs
-from wordless.wl_nlp import wl_matching
+from wordless.wl_nlp import (
+    wl_matching,
+    wl_texts
+)
 from wordless.wl_settings import wl_settings
 from wordless.wl_utils import (
     wl_conversion,
@@ -99,13 +102,24 @@ class Wl_Settings_Files(wl_settings.Wl_Settings_Node):
         self.spin_box_read_files_in_chunks = wl_boxes.Wl_Spin_Box(self)
         self.label_read_files_in_chunks_chars = QtWidgets.QLabel(self.tr('characters'), self)
 
+        self.label_text_mem_max = QtWidgets.QLabel(self.tr('Unload least recently used texts when their memory usage exceeds'), self)
+        (
+            self.spin_box_text_mem_max,
+            self.checkbox_text_mem_max_no_limit
+        ) = wl_boxes.wl_spin_box_no_limit(self)
+
         self.spin_box_read_files_in_chunks.setRange(100, 1000000)
+        self.spin_box_text_mem_max.setRange(1, 1048576)
+        self.spin_box_text_mem_max.setSuffix(self.tr(' MB'))
 
         self.group_box_misc_settings.setLayout(wl_layouts.Wl_Layout())
         self.group_box_misc_settings.layout().addWidget(self.checkbox_display_warning_when_opening_nontext_files, 0, 0, 1, 3)
         self.group_box_misc_settings.layout().addWidget(self.label_read_files_in_chunks, 1, 0)
         self.group_box_misc_settings.layout().addWidget(self.spin_box_read_files_in_chunks, 1, 1)
         self.group_box_misc_settings.layout().addWidget(self.label_read_files_in_chunks_chars, 1, 2)
+        self.group_box_misc_settings.layout().addWidget(self.label_text_mem_max, 2, 0)
+        self.group_box_misc_settings.layout().addWidget(self.spin_box_text_mem_max, 2, 1)
+        self.group_box_misc_settings.layout().addWidget(self.checkbox_text_mem_max_no_limit, 2, 2)
 
         self.group_box_misc_settings.layout().setColumnStretch(3, 1)
 
@@ -134,6 +148,8 @@ class Wl_Settings_Files(wl_settings.Wl_Settings_Node):
         # Miscellaneous Settings
         self.checkbox_display_warning_when_opening_nontext_files.setChecked(settings['misc_settings']['display_warning_when_opening_nontext_files'])
         self.spin_box_read_files_in_chunks.setValue(settings['misc_settings']['read_files_in_chunks_chars'])
+        self.spin_box_text_mem_max.setValue(settings['misc_settings']['text_mem_max'])
+        self.checkbox_text_mem_max_no_limit.setChecked(settings['misc_settings']['text_mem_max_no_limit'])
 
     def apply_settings(self):
         # Default Settings
@@ -149,6 +165,10 @@ class Wl_Settings_Files(wl_settings.Wl_Settings_Node):
         # Miscellaneous Settings
         self.settings_custom['misc_settings']['display_warning_when_opening_nontext_files'] = self.checkbox_display_warning_when_opening_nontext_files.isChecked()
         self.settings_custom['misc_settings']['read_files_in_chunks_chars'] = self.spin_box_read_files_in_chunks.value()
+        self.settings_custom['misc_settings']['text_mem_max'] = self.spin_box_text_mem_max.value()
+        self.settings_custom['misc_settings']['text_mem_max_no_limit'] = self.checkbox_text_mem_max_no_limit.isChecked()
+
+        wl_texts.text_store.update_settings(self.main)
 
         return True
 
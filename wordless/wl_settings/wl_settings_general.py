@@ -105,6 +105,22 @@ class Wl_Settings_General(wl_settings.Wl_Settings_Node):
         self.group_box_update_settings.setLayout(wl_layouts.Wl_Layout())
         self.group_box_update_settings.layout().addWidget(self.checkbox_check_updates_on_startup, 0, 0)
 
+        # Profiling Settings
+        self.group_box_profiling_settings = QtWidgets.QGroupBox(self.tr('Profiling Settings'), self)
+
+        self.checkbox_enable_profiling = QtWidgets.QCheckBox(self.tr('Enable profiling of data processing'), self)
+        self.checkbox_track_mem_usage = QtWidgets.QCheckBox(self.tr('Track peak memory usage (slower)'), self)
+        self.checkbox_show_breakdown = QtWidgets.QCheckBox(self.tr('Show breakdown of stages after processing'), self)
+        self.checkbox_save_traces = QtWidgets.QCheckBox(self.tr('Save traces in JSON format to the default export path of tables'), self)
+
+        self.checkbox_enable_profiling.stateChanged.connect(self.profiling_settings_changed)
+
+        self.group_box_profiling_settings.setLayout(wl_layouts.Wl_Layout())
+        self.group_box_profiling_settings.layout().addWidget(self.checkbox_enable_profiling, 0, 0)
+        self.group_box_profiling_settings.layout().addWidget(self.checkbox_track_mem_usage, 1, 0)
+        self.group_box_profiling_settings.layout().addWidget(self.checkbox_show_breakdown, 2, 0)
+        self.group_box_profiling_settings.layout().addWidget(self.checkbox_save_traces, 3, 0)
+
         # Miscellaneous Settings
         self.group_box_misc_settings = QtWidgets.QGroupBox(self.tr('Miscellaneous Settings'), self)
 
@@ -116,9 +132,10 @@ class Wl_Settings_General(wl_settings.Wl_Settings_Node):
         self.layout().addWidget(self.group_box_ui_settings, 0, 0)
         self.layout().addWidget(self.group_box_proxy_settings, 1, 0)
         self.layout().addWidget(self.group_box_update_settings, 2, 0)
-        self.layout().addWidget(self.group_box_misc_settings, 3, 0)
+        self.layout().addWidget(self.group_box_profiling_settings, 3, 0)
+        self.layout().addWidget(self.group_box_misc_settings, 4, 0)
 
-        self.layout().setRowStretch(4, 1)
+        self.layout().setRowStretch(5, 1)
 
     def proxy_settings_changed(self):
         if self.checkbox_use_proxy.isChecked():
@@ -132,6 +149,16 @@ class Wl_Settings_General(wl_settings.Wl_Settings_Node):
             self.line_edit_username.setEnabled(False)
             self.line_edit_password.setEnabled(False)
 
+    def profiling_settings_changed(self):
+        if self.checkbox_enable_profiling.isChecked():
+            self.checkbox_track_mem_usage.setEnabled(True)
+            self.checkbox_show_breakdown.setEnabled(True)
+            self.checkbox_save_traces.setEnabled(True)
+        else:
+            self.checkbox_track_mem_usage.setEnabled(False)
+            self.checkbox_show_breakdown.setEnabled(False)
+            self.checkbox_save_traces.setEnabled(False)
+
     def load_settings(self, defaults = False):
         if defaults:
             settings = copy.deepcopy(self.settings_default)
@@ -153,10 +180,17 @@ class Wl_Settings_General(wl_settings.Wl_Settings_Node):
         # Update Settings
         self.checkbox_check_updates_on_startup.setChecked(settings['update_settings']['check_updates_on_startup'])
 
+        # Profiling Settings
+        self.checkbox_enable_profiling.setChecked(settings['profiling_settings']['enable_profiling'])
+        self.checkbox_track_mem_usage.setChecked(settings['profiling_settings']['track_mem_usage'])
+        self.checkbox_show_breakdown.setChecked(settings['profiling_settings']['show_breakdown'])
+        self.checkbox_save_traces.setChecked(settings['profiling_settings']['save_traces'])
+
         # Miscellaneous Settings
         self.checkbox_always_confirm_on_exit.setChecked(settings['misc_settings']['always_confirm_on_exit'])
 
         self.proxy_settings_changed()
+        self.profiling_settings_changed()
 
     def apply_settings(self):
         # Check UI settings
@@ -196,6 +230,12 @@ class Wl_Settings_General(wl_settings.Wl_Settings_Node):
             # Update Settings
             self.settings_custom['update_settings']['check_updates_on_startup'] = self.checkbox_check_updates_on_startup.isChecked()
 
+            # Profiling Settings
+            self.settings_custom['profiling_settings']['enable_profiling'] = self.checkbox_enable_profiling.isChecked()
+            self.settings_custom['profiling_settings']['track_mem_usage'] = self.checkbox_track_mem_usage.isChecked()
+            self.settings_custom['profiling_settings']['show_breakdown'] = self.checkbox_show_breakdown.isChecked()
+            self.settings_custom['profiling_settings']['save_traces'] = self.checkbox_save_traces.isChecked()
+
             # Miscellaneous Settings
             self.settings_custom['misc_settings']['always_confirm_on_exit'] = self.checkbox_always_confirm_on_exit.isChecked()
 
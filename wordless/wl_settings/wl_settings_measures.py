@@ -478,6 +478,20 @@ class Wl_Settings_Measures_Lexical_Density_Diversity(wl_settings.Wl_Settings_Nod
 
         self.group_box_shannon_entropy.layout().setColumnStretch(2, 1)
 
+        # vocd-D
+        self.group_box_vocdd = QtWidgets.QGroupBox('vocd-D', self)
+
+        self.label_random_seed = QtWidgets.QLabel(self.tr('Random seed:'), self)
+        self.spin_box_random_seed = wl_boxes.Wl_Spin_Box(self)
+
+        self.spin_box_random_seed.setRange(0, 2147483647)
+
+        self.group_box_vocdd.setLayout(wl_layouts.Wl_Layout())
+        self.group_box_vocdd.layout().addWidget(self.label_random_seed, 0, 0)
+        self.group_box_vocdd.layout().addWidget(self.spin_box_random_seed, 0, 1)
+
+        self.group_box_vocdd.layout().setColumnStretch(2, 1)
+
         self.layout().addWidget(self.group_box_hdd, 0, 0)
         self.layout().addWidget(self.group_box_logttr, 1, 0)
         self.layout().addWidget(self.group_box_msttr, 2, 0)
@@ -485,8 +499,9 @@ class Wl_Settings_Measures_Lexical_Density_Diversity(wl_settings.Wl_Settings_Nod
         self.layout().addWidget(self.group_box_mattr, 4, 0)
         self.layout().addWidget(self.group_box_repeat_rate, 5, 0)
         self.layout().addWidget(self.group_box_shannon_entropy, 6, 0)
+        self.layout().addWidget(self.group_box_vocdd, 7, 0)
 
-        self.layout().setRowStretch(7, 1)
+        self.layout().setRowStretch(8, 1)
 
     def load_settings(self, defaults = False):
         if defaults:
@@ -515,6 +530,9 @@ class Wl_Settings_Measures_Lexical_Density_Diversity(wl_settings.Wl_Settings_Nod
         # Shannon Entropy
         self.combo_box_use_data_shannon_entropy.setCurrentText(settings['shannon_entropy']['use_data'])
 
+        # vocd-D
+        self.spin_box_random_seed.setValue(settings['vocdd']['random_seed'])
+
     def apply_settings(self):
         # HD-D
         self.settings_custom['hdd']['sample_size'] = self.spin_box_sample_size.value()
@@ -537,6 +555,9 @@ class Wl_Settings_Measures_Lexical_Density_Diversity(wl_settings.Wl_Settings_Nod
         # Shannon Entropy
         self.settings_custom['shannon_entropy']['use_data'] = self.combo_box_use_data_shannon_entropy.currentText()
 
+        # vocd-D
+        self.settings_custom['vocdd']['random_seed'] = self.spin_box_random_seed.value()
+
         return True
 
 # Measures - Dispersion
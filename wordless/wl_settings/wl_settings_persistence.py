@@ -0,0 +1,165 @@
+# ----------------------------------------------------------------------
+# Wordless: Settings - Persistence
+# Copyright (C) 2018-2025  Ye Lei (叶磊)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import tempfile
+import threading
+
+from wordless.wl_checks import wl_checks_misc
+
+# Version of the format of settings files
+FORMAT_VER = 1
+
+def _is_equal(val_1, val_2):
+    if type(val_1) is not type(val_2):
+        return False
+
+    try:
+        return bool(val_1 == val_2)
+    # Values whose comparisons are ambiguous (e.g. NumPy arrays) are always saved
+    except (TypeError, ValueError):
+        return False
+
+def get_settings_delta(settings_custom, settings_default):
+    """Return differences of custom settings against default settings, with unchanged settings omitted."""
+    settings_delta = {}
+
+    for key, val in settings_custom.items():
+        val_default = settings_default.get(key)
+
+        if isinstance(val, dict) and isinstance(val_default, dict):
+            if (val_delta := get_settings_delta(val, val_default)):
+                settings_delta[key] = val_delta
+        elif not _is_equal(val, val_default):
+            settings_delta[key] = val
+
+    return settings_delta
+
+def apply_settings_delta(settings, settings_delta):
+    for key, val in settings_delta.items():
+        if isinstance(val, dict) and isinstance(settings.get(key), dict):
+            apply_settings_delta(settings[key], val)
+        else:
+            settings[key] = val
+
+    return settings
+
+def copy_settings(settings):
+    # Faster than deep copies
+    return pickle.loads(pickle.dumps(settings, protocol = pickle.HIGHEST_PROTOCOL))
+
+def read_settings(file_path):
+    """Return differences of custom settings against default settings and pickled sections of settings read from the settings file.
+
+    Errors are raised as is if the settings file is corrupt, while sections that could not be unpickled are skipped.
+    """
+    with open(file_path, 'rb') as f:
+        settings = pickle.load(f)
+
+    # Settings files saved by earlier versions of Wordless contain all settings
+    if 'format_ver' not in settings:
+        return settings, {}
+
+    settings_delta = {}
+    sections = {}
+
+    for section, section_pickled in settings['sections'].items():
+        try:
+            settings_delta[section] = pickle.loads(section_pickled)
+            sections[section] = section_pickled
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass
+
+    return settings_delta, sections
+
+class Wl_Settings_File:
+    """Settings file in which differences of custom settings against default settings are pickled separately by sections and written in the background."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+        # Section -> pickled differences last read from or written to the settings file
+        self.sections = {}
+        self.thread_save = None
+
+    def load(self, settings_default):
+        settings_custom = copy_settings(settings_default)
+
+        if os.path.exists(self.file_path):
+            settings_delta, self.sections = read_settings(self.file_path)
+
+            for section, section_delta in settings_delta.items():
+                # Sections incompatible with the current version are reset
+                if wl_checks_misc.check_settings_delta({section: section_delta}, settings_default):
+                    apply_settings_delta(settings_custom, {section: section_delta})
+                else:
+                    self.sections.pop(section, None)
+
+        return settings_custom
+
+    def save(self, settings_custom, settings_default, block = False):
+        # Pending saves are finished first so that newer settings would not be overwritten
+        self.wait()
+
+        # Settings are pickled in the calling thread as a snapshot, since they might still be modified afterwards
+        sections = {
+            section: pickle.dumps(section_delta, protocol = pickle.HIGHEST_PROTOCOL)
+            for section, section_delta in get_settings_delta(settings_custom, settings_default).items()
+        }
+
+        # The settings file is not rewritten if no sections have been changed
+        if sections == self.sections and os.path.exists(self.file_path):
+            return
+
+        # Only writing is done in the background
+        self.thread_save = threading.Thread(target = self._save, args = (sections,))
+        self.thread_save.start()
+
+        if block:
+            self.wait()
+
+    def _save(self, sections):
+        fd, file_path_temp = tempfile.mkstemp(
+            prefix = f'{os.path.basename(self.file_path)}.',
+            suffix = '.tmp',
+            dir = os.path.dirname(os.path.abspath(self.file_path))
+        )
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'format_ver': FORMAT_VER, 'sections': sections}, f, protocol = pickle.HIGHEST_PROTOCOL)
+
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Replace the settings file only after the new one has been completely written so that it would not be corrupted if Wordless crashes
+            os.replace(file_path_temp, self.file_path)
+        except BaseException:
+            if os.path.exists(file_path_temp):
+                os.remove(file_path_temp)
+
+            raise
+
+        self.sections = sections
+
+    def wait(self):
+        if self.thread_save is not None:
+            self.thread_save.join()
+
+            self.thread_save = None
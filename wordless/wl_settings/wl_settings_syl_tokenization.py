@@ -84,6 +84,30 @@ class Wl_Settings_Syl_Tokenization(wl_settings.Wl_Settings_Node):
         self.group_box_syl_tokenizer_settings.setLayout(wl_layouts.Wl_Layout())
         self.group_box_syl_tokenizer_settings.layout().addWidget(self.table_syl_tokenizers, 0, 0)
 
+        # Cache Settings
+        self.group_box_cache_settings = QtWidgets.QGroupBox(self.tr('Cache Settings'), self)
+
+        self.label_max_cache_size = QtWidgets.QLabel(self.tr('Maximum number of words to cache:'), self)
+        self.spin_box_max_cache_size = wl_boxes.Wl_Spin_Box(self)
+        self.checkbox_save_cache = QtWidgets.QCheckBox(self.tr('Save cache to disk on exit'), self)
+        self.label_cache_size = QtWidgets.QLabel(self)
+        self.button_clear_cache = QtWidgets.QPushButton(self.tr('Clear cache'), self)
+
+        self.spin_box_max_cache_size.setRange(0, 100000000)
+        self.spin_box_max_cache_size.setSingleStep(10000)
+        self.button_clear_cache.setMinimumWidth(140)
+
+        self.button_clear_cache.clicked.connect(self.clear_cache)
+
+        self.group_box_cache_settings.setLayout(wl_layouts.Wl_Layout())
+        self.group_box_cache_settings.layout().addWidget(self.label_max_cache_size, 0, 0)
+        self.group_box_cache_settings.layout().addWidget(self.spin_box_max_cache_size, 0, 1)
+        self.group_box_cache_settings.layout().addWidget(self.checkbox_save_cache, 1, 0, 1, 3)
+        self.group_box_cache_settings.layout().addWidget(self.label_cache_size, 2, 0, 1, 2)
+        self.group_box_cache_settings.layout().addWidget(self.button_clear_cache, 2, 3)
+
+        self.group_box_cache_settings.layout().setColumnStretch(2, 1)
+
         # Preview
         self.group_box_preview = QtWidgets.QGroupBox(self.tr('Preview'), self)
 
@@ -117,9 +141,18 @@ class Wl_Settings_Syl_Tokenization(wl_settings.Wl_Settings_Node):
         self.group_box_preview.layout().addWidget(self.text_edit_preview_results, 1, 1)
 
         self.layout().addWidget(self.group_box_syl_tokenizer_settings, 0, 0)
-        self.layout().addWidget(self.group_box_preview, 1, 0)
+        self.layout().addWidget(self.group_box_cache_settings, 1, 0)
+        self.layout().addWidget(self.group_box_preview, 2, 0)
+
+        self.layout().setRowStretch(2, 1)
 
-        self.layout().setRowStretch(1, 1)
+    def update_cache_size(self):
+        self.label_cache_size.setText(self.tr('Number of words cached: {}').format(len(wl_syl_tokenization.syl_cache)))
+
+    def clear_cache(self):
+        wl_syl_tokenization.syl_cache.clear()
+
+        self.update_cache_size()
 
     def preview_changed(self):
         self.settings_custom['preview']['preview_lang'] = wl_conversion.to_lang_code(self.main, self.combo_box_preview_lang.currentText())
@@ -201,6 +234,12 @@ class Wl_Settings_Syl_Tokenization(wl_settings.Wl_Settings_Node):
 
         self.table_syl_tokenizers.enable_updates()
 
+        # Cache Settings
+        self.spin_box_max_cache_size.setValue(settings['cache_settings']['max_cache_size'])
+        self.checkbox_save_cache.setChecked(settings['cache_settings']['save_cache'])
+
+        self.update_cache_size()
+
         if not defaults:
             self.combo_box_preview_lang.blockSignals(True)
             self.text_edit_preview_samples.blockSignals(True)
@@ -222,6 +261,14 @@ class Wl_Settings_Syl_Tokenization(wl_settings.Wl_Settings_Node):
                 util_text = self.table_syl_tokenizers.model().item(i, 1).text()
             )
 
+        # Cache Settings
+        self.settings_custom['cache_settings']['max_cache_size'] = self.spin_box_max_cache_size.value()
+        self.settings_custom['cache_settings']['save_cache'] = self.checkbox_save_cache.isChecked()
+
+        wl_syl_tokenization.syl_cache.set_max_size(self.settings_custom['cache_settings']['max_cache_size'])
+
+        self.update_cache_size()
+
         return True
 
 class Wl_Worker_Preview_Syl_Tokenizer(wl_threading.Wl_Worker_No_Progress):
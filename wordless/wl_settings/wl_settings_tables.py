@@ -112,6 +112,10 @@ class Wl_Settings_Tables(wl_settings.Wl_Settings_Node):
         # Miscellaneous Settings
         self.settings_custom['misc_settings']['show_thousand_separators'] = self.checkbox_show_thousand_separators.isChecked()
 
+        # Numeric data are formatted when rendered, so only visible cells need to be repainted
+        for table in self.main.findChildren(QtWidgets.QTableView):
+            table.viewport().update()
+
         return True
 
 # Tables - Profiler
@@ -0,0 +1,207 @@
+# ----------------------------------------------------------------------
+# Wordless: Utilities - Instrumentation
+# Copyright (C) 2018-2025  Ye Lei (叶磊)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+class Wl_Trace:
+    def __init__(self, track_mem = False):
+        self.track_mem = track_mem
+        self.time_start = time.perf_counter()
+        self.time_elapsed = 0
+
+        # Stage name -> [number of calls, number of items, elapsed time, peak memory usage]
+        self.stages = {}
+        # Complete events in Chrome's trace event format
+        self.events = []
+
+        self.lock = threading.Lock()
+
+    def add_stage(self, name, num_items, time_start, time_elapsed, mem_peak):
+        with self.lock:
+            if name in self.stages:
+                stats = self.stages[name]
+
+                stats[0] += 1
+                stats[1] += num_items
+                stats[2] += time_elapsed
+
+                if mem_peak is not None:
+                    stats[3] = max(stats[3] or 0, mem_peak)
+            else:
+                self.stages[name] = [1, num_items, time_elapsed, mem_peak]
+
+            self.events.append({
+                'name': name,
+                'ph': 'X',
+                'ts': (time_start - self.time_start) * 1_000_000,
+                'dur': time_elapsed * 1_000_000,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': {'num_items': num_items}
+            })
+
+    def get_stages(self):
+        """Return statistics of all stages sorted by their elapsed time in descending order.
+
+        Nested stages are timed inclusively, so the elapsed time of a stage also includes those of the stages called within it.
+        """
+        with self.lock:
+            return sorted(
+                ((name, *stats) for name, stats in self.stages.items()),
+                key = lambda stage: (-stage[3], stage[0])
+            )
+
+    def dump(self, file_path):
+        with self.lock:
+            trace = {
+                'traceEvents': list(self.events),
+                'displayTimeUnit': 'ms',
+                'otherData': {
+                    'time_elapsed': self.time_elapsed,
+                    'stages': {
+                        name: {
+                            'num_calls': num_calls,
+                            'num_items': num_items,
+                            'time_elapsed': time_elapsed,
+                            'mem_peak': mem_peak
+                        }
+                        for name, (num_calls, num_items, time_elapsed, mem_peak) in self.stages.items()
+                    }
+                }
+            }
+
+        with open(file_path, 'w', encoding = 'utf_8') as f:
+            json.dump(trace, f, ensure_ascii = False, indent = 4)
+
+_trace = None
+_trace_depth = 0
+_tracemalloc_started = False
+_lock = threading.Lock()
+_local = threading.local()
+
+def start(track_mem = False):
+    """Start collecting statistics of stages.
+
+    Calls may be nested, in which case statistics are collected until the outermost call of stop().
+    """
+    global _trace, _trace_depth, _tracemalloc_started # pylint: disable=global-statement
+
+    with _lock:
+        _trace_depth += 1
+
+        if _trace_depth == 1:
+            _trace = Wl_Trace(track_mem = track_mem)
+
+            if track_mem and not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+                _tracemalloc_started = True
+
+def stop():
+    """Stop collecting statistics of stages and return the trace, or None if the trace is still being collected by outer calls."""
+    global _trace, _trace_depth, _tracemalloc_started # pylint: disable=global-statement
+
+    with _lock:
+        if not _trace_depth:
+            return None
+
+        _trace_depth -= 1
+
+        if _trace_depth:
+            return None
+
+        trace = _trace
+        trace.time_elapsed = time.perf_counter() - trace.time_start
+
+        _trace = None
+
+        if _tracemalloc_started:
+            tracemalloc.stop()
+
+            _tracemalloc_started = False
+
+    return trace
+
+def is_tracing():
+    return _trace is not None
+
+@contextlib.contextmanager
+def stage(name, num_items = 0):
+    trace = _trace
+
+    # No overhead other than the check when not tracing
+    if trace is None:
+        yield
+
+        return
+
+    track_mem = trace.track_mem and tracemalloc.is_tracing()
+
+    if not hasattr(_local, 'mems'):
+        _local.mems = []
+
+    # Peak memory usage of outer stages are updated before resetting the peak
+    if track_mem:
+        mem_cur, mem_peak = tracemalloc.get_traced_memory()
+
+        for mem in _local.mems:
+            mem[1] = max(mem[1], mem_peak - mem[0])
+
+        tracemalloc.reset_peak()
+
+        _local.mems.append([mem_cur, 0])
+
+    time_start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        time_elapsed = time.perf_counter() - time_start
+
+        # Memory usage is approximate when stages are run concurrently in different threads
+        if track_mem:
+            mem_start, mem_peak_stage = _local.mems.pop()
+            mem_peak = tracemalloc.get_traced_memory()[1]
+            mem_peak_stage = max(mem_peak_stage, mem_peak - mem_start)
+
+            for mem in _local.mems:
+                mem[1] = max(mem[1], mem_peak - mem[0])
+        else:
+            mem_peak_stage = None
+
+        trace.add_stage(name, num_items, time_start, time_elapsed, mem_peak_stage)
+
+def log_stage(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _trace is None:
+                return func(*args, **kwargs)
+
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -20,6 +20,7 @@ import collections
 import copy
 import os
 import platform
+import random
 import re
 import time
 import traceback
@@ -31,7 +32,10 @@ from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 import requests
 
-from wordless.wl_utils import wl_paths
+from wordless.wl_utils import (
+    wl_instrumentation,
+    wl_paths
+)
 
 _tr = QtCore.QCoreApplication.translate
 
@@ -151,9 +155,19 @@ def log_time(func):
         else:
             main = widget.main
 
+        settings = main.settings_custom['general']['profiling_settings']
         time_start = time.time()
 
-        return_val = func(widget, *args, **kwargs)
+        if settings['enable_profiling']:
+            wl_instrumentation.start(track_mem = settings['track_mem_usage'])
+
+            try:
+                return_val = func(widget, *args, **kwargs)
+            finally:
+                trace = wl_instrumentation.stop()
+        else:
+            return_val = func(widget, *args, **kwargs)
+            trace = None
 
         if return_val != 'skip_logging_time':
             time_elapsed = time.time() - time_start
@@ -163,6 +177,14 @@ def log_time(func):
             msg_min = check_noun_number(time_elapsed_mins, _tr('wl_misc', 'minute'))
             msg_time = _tr('wl_misc', '(In {} {:.2f} seconds)').format(msg_min, time_elapsed_secs)
 
+            # Show the 3 most time-consuming stages
+            if trace is not None and (stages := trace.get_stages()):
+                msg_stages = ', '.join((
+                    f'{name}: {time_stage:.2f}s'
+                    for name, _, _, time_stage, _ in stages[:3]
+                ))
+                msg_time = f'{msg_time[:-1]}; {msg_stages})'
+
             if (msg_cur := main.statusBar().currentMessage()):
                 if _tr('wl_misc', '(In') in msg_cur:
                     main.statusBar().showMessage(f"{msg_cur.split(_tr('wl_misc', '(In'))[0].rstrip()} {msg_time}")
@@ -171,10 +193,28 @@ def log_time(func):
             else:
                 main.statusBar().showMessage(msg_time)
 
+            if trace is not None:
+                log_trace(main, trace)
+
         return return_val
 
     return wrapper
 
+def log_trace(main, trace):
+    settings = main.settings_custom['general']['profiling_settings']
+
+    if settings['save_traces']:
+        dir_exp = main.settings_custom['general']['exp']['tables']['default_path']
+        os.makedirs(dir_exp, exist_ok = True)
+
+        trace.dump(os.path.join(dir_exp, f"wl_trace_{time.strftime('%Y%m%d_%H%M%S')}.json"))
+
+    if settings['show_breakdown'] and trace.stages:
+        # Avoid circular imports
+        from wordless.wl_dialogs import wl_dialogs_misc # pylint: disable=import-outside-toplevel
+
+        wl_dialogs_misc.Wl_Dialog_Profiling(main, trace).open()
+
 def flatten_list(list_to_flatten):
     for item in list_to_flatten:
         if isinstance(item, collections.abc.Iterable) and not isinstance(item, (str, bytes)):
@@ -232,5 +272,63 @@ def normalize_nums(nums, normalized_min, normalized_max, reverse = False):
 
     return nums_normalized
 
+# Sample hits of search terms on the fly so that only sampled hits need to be kept and generated
+class Wl_Sampler_Hits:
+    def __init__(self, sampling_method = 'none', sample_size = 1000, sampling_interval = 10, seed = 0):
+        self.sampling_method = sampling_method
+        self.sample_size = sample_size
+        self.sampling_interval = sampling_interval
+        self.random = random.Random(seed)
+
+        # Total number of hits, including those that are not sampled
+        self.num_hits = 0
+        # Pairs of hit numbers and hits, the former of which are used to restore the original order of hits
+        self.hits = []
+
+        self.i_slot = None
+
+        if self.sampling_method == 'systematic':
+            self.start = self.random.randrange(self.sampling_interval)
+
+    def keep_hit(self):
+        """Count a new hit and return whether it is sampled, in which case it should be then passed to add_hit()."""
+        self.num_hits += 1
+
+        match self.sampling_method:
+            case 'first':
+                self.i_slot = len(self.hits) if len(self.hits) < self.sample_size else None
+            case 'reservoir':
+                if len(self.hits) < self.sample_size:
+                    self.i_slot = len(self.hits)
+                else:
+                    i_slot = self.random.randrange(self.num_hits)
+
+                    self.i_slot = i_slot if i_slot < self.sample_size else None
+            case 'systematic':
+                self.i_slot = len(self.hits) if (self.num_hits - 1) % self.sampling_interval == self.start else None
+            case _:
+                self.i_slot = len(self.hits)
+
+        return self.i_slot is not None
+
+    def add_hit(self, hit):
+        if self.i_slot == len(self.hits):
+            self.hits.append((self.num_hits, hit))
+        else:
+            self.hits[self.i_slot] = (self.num_hits, hit)
+
+    def get_hits(self):
+        if self.sampling_method == 'reservoir':
+            self.hits.sort(key = lambda item: item[0])
+
+        return [hit for _, hit in self.hits]
+
+    def sample(self, hits):
+        for hit in hits:
+            if self.keep_hit():
+                self.add_hit(hit)
+
+        return self.get_hits()
+
 def check_noun_number(number, noun):
     return f'{number} {noun}' if number == 1 else _tr('wl_misc', '{} {}s').format(number, noun)
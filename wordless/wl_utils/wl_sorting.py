@@ -16,58 +16,82 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------
 
-# Frequency
-def sorted_freq_files_items(freq_files_items, sort_by_col = 0, reverse = False):
-    def key(item):
-        if reverse:
-            # Frequency
-            keys = list(item[1])
+import numpy
+
+def _lexsort_items(items, keys, top_k = None):
+    """Sort items by the numeric keys (in order of priority) and then by the items themselves.
+
+    If top_k is specified, only the first top_k items are returned and the items which could not rank among them are discarded before sorting.
+    """
+    keys = numpy.array(keys, dtype = numpy.float64)
+    idxs = numpy.arange(len(items))
+
+    if not keys.shape[1]:
+        return sorted(items, key = lambda item: item[0])[:top_k]
+
+    if top_k is not None and top_k < len(items):
+        # All items tied with the top_k-th item on the primary key are kept since ties are broken by the remaining keys
+        key_kth = numpy.partition(keys[:, 0], max(0, top_k - 1))[max(0, top_k - 1)]
+        idxs = numpy.flatnonzero(keys[:, 0] <= key_kth)
 
-            keys.remove(item[1][sort_by_col])
-            keys.insert(0, item[1][sort_by_col])
+    keys = keys[idxs]
+    # The last key passed to numpy.lexsort is the primary key
+    order = numpy.lexsort(keys.T[::-1])
+    idxs = idxs[order]
+    keys = keys[order]
+
+    # Break ties by the items
+    idxs_sorted = []
+    boundaries = numpy.flatnonzero(numpy.any(keys[1:] != keys[:-1], axis = 1)) + 1
+
+    for idxs_tied in numpy.split(idxs, boundaries):
+        if len(idxs_tied) > 1:
+            idxs_sorted.extend(sorted(idxs_tied.tolist(), key = lambda i: items[i][0]))
         else:
-            keys = [-freq for freq in item[1]]
+            idxs_sorted.extend(idxs_tied.tolist())
 
-            keys.remove(-item[1][sort_by_col])
-            keys.insert(0, -item[1][sort_by_col])
+        if top_k is not None and len(idxs_sorted) >= top_k:
+            break
 
-        # Tokens/N-grams
-        keys.append(item[0])
+    return [items[i] for i in idxs_sorted[:top_k]]
 
-        return keys
+# Frequency
+def sorted_freq_files_items(freq_files_items, sort_by_col = 0, reverse = False, top_k = None):
+    items = list(freq_files_items.items())
 
-    return sorted(freq_files_items.items(), key = key)
+    if not items:
+        return items
 
-def sorted_freq_files_items_keyword_extractor(freq_files_items, sort_by_col = 0, reverse = False):
-    def key(item):
-        if reverse:
-            # Frequency in observed files
-            keys = list(item[1][1:])
+    freqs = numpy.array([freq_files for _, freq_files in items], dtype = numpy.float64)
+    cols = [sort_by_col, *(i for i in range(freqs.shape[1]) if i != sort_by_col)]
 
-            keys.remove(item[1][sort_by_col])
-            keys.insert(0, item[1][sort_by_col])
+    # Frequency
+    keys = freqs[:, cols]
 
-            # Frequency in reference file
-            keys.append(item[1][0])
-        else:
-            # Frequency in observed files
-            keys = [-freq for freq in item[1][1:]]
+    if not reverse:
+        keys = -keys
 
-            keys.remove(-item[1][sort_by_col])
-            keys.insert(0, -item[1][sort_by_col])
+    return _lexsort_items(items, keys, top_k = top_k)
 
-            # Frequency in reference file
-            keys.append(-item[1][0])
+def sorted_freq_files_items_keyword_extractor(freq_files_items, sort_by_col = 0, reverse = False, top_k = None):
+    items = list(freq_files_items.items())
 
-        # Keywords
-        keys.append(item[0])
+    if not items:
+        return items
 
-        return keys
+    freqs = numpy.array([freq_files for _, freq_files in items], dtype = numpy.float64)
+    # Frequency in observed files and then frequency in reference file
+    cols = [sort_by_col, *(i for i in range(1, freqs.shape[1]) if i != sort_by_col), 0]
+
+    keys = freqs[:, cols]
+
+    if not reverse:
+        keys = -keys
 
-    return sorted(freq_files_items.items(), key = key)
+    return _lexsort_items(items, keys, top_k = top_k)
 
 # Statistics
-def sorted_stats_files_items(stats_files_items):
+def sorted_stats_files_items(stats_files_items, top_k = None):
     def key(item):
         keys = []
 
@@ -83,9 +107,38 @@ def sorted_stats_files_items(stats_files_items):
         # Effect Size
         keys.extend((-stats[3] for stats in item[1] if stats[3] is not None))
 
-        # Collocates/Keywords
-        keys.append(item[0])
-
         return keys
 
-    return sorted(stats_files_items.items(), key = key)
+    items = list(stats_files_items.items())
+    keys = [key(item) for item in items]
+
+    # Fall back to Python's sorting if the statistics are not computed for all items
+    if len({len(keys_item) for keys_item in keys}) > 1:
+        return sorted(items, key = lambda item: [*key(item), item[0]])[:top_k]
+
+    if not items:
+        return items
+
+    return _lexsort_items(items, keys, top_k = top_k)
+
+# Ranking
+def get_ranks(vals_sorted, continue_numbering_after_ties = False):
+    """Rank sorted values, with tied values sharing the same rank.
+
+    If continue_numbering_after_ties is True, the value after ties is ranked one more than the tied values (1, 1, 2), otherwise the ranks of the tied values are skipped (1, 1, 3).
+    """
+    if not len(vals_sorted): # pylint: disable=use-implicit-booleaness-not-len
+        return numpy.array([], dtype = numpy.int64)
+
+    # Avoid creating multi-dimensional arrays from sequences of tuples
+    vals = numpy.empty(len(vals_sorted), dtype = object)
+    vals[:] = list(vals_sorted)
+
+    vals_new = numpy.empty(len(vals), dtype = bool)
+    vals_new[0] = True
+    vals_new[1:] = vals[1:] != vals[:-1]
+
+    if continue_numbering_after_ties:
+        return numpy.cumsum(vals_new)
+    else:
+        return numpy.maximum.accumulate(numpy.where(vals_new, numpy.arange(1, len(vals) + 1), 0))
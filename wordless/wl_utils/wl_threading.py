@@ -21,6 +21,18 @@ import time
 from PyQt5 import QtCore
 
 # Workers
+def pin_texts_selected(main):
+    # Avoid circular imports
+    from wordless.wl_nlp import wl_texts # pylint: disable=import-outside-toplevel
+
+    texts = []
+
+    for file_area in ('wl_file_area', 'wl_file_area_ref'):
+        if (wrapper_file_area := getattr(main, file_area, None)) is not None:
+            texts.extend((file['text'] for file in wrapper_file_area.get_selected_files() if 'text' in file))
+
+    return wl_texts.text_store.pin(texts)
+
 class Wl_Worker(QtCore.QObject):
     progress_updated = QtCore.pyqtSignal(str)
     finished = QtCore.pyqtSignal()
@@ -41,9 +53,20 @@ class Wl_Worker(QtCore.QObject):
         if hasattr(self.dialog_progress, 'button_abort'):
             self.dialog_progress.button_abort.clicked.connect(self.stop)
 
+        # Texts of selected files are not unloaded until workers are finished
+        self.texts_pinned = pin_texts_selected(self.main)
+        self.finished.connect(self.unpin_texts, QtCore.Qt.DirectConnection)
+
     def stop(self):
         self._running = False
 
+    def unpin_texts(self):
+        from wordless.wl_nlp import wl_texts # pylint: disable=import-outside-toplevel
+
+        wl_texts.text_store.unpin(self.texts_pinned)
+
+        self.texts_pinned = []
+
 class Wl_Worker_No_Progress(QtCore.QObject):
     finished = QtCore.pyqtSignal()
 
@@ -51,6 +51,19 @@ class Wl_Item_Delegate(QtWidgets.QStyledItemDelegate):
     def set_enabled(self, enabled):
         self.enabled = enabled
 
+# Numeric data (including cumulative data) are formatted according to table settings only when cells are rendered
+class Wl_Item_Delegate_Num_Data(QtWidgets.QStyledItemDelegate):
+    def __init__(self, parent, table):
+        super().__init__(parent)
+
+        self.table = table
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+
+        if (text := self.table.get_num_text(index.row(), index.column())) is not None:
+            option.text = text
+
 # Combo boxes
 class Wl_Item_Delegate_Combo_Box(Wl_Item_Delegate):
     def __init__(self, parent, items = None, row = None, col = None, editable = False):
@@ -24,6 +24,7 @@ import traceback
 
 import bs4
 import docx
+import numpy
 import openpyxl
 from PyQt5 import QtCore
 from PyQt5 import QtGui
@@ -42,9 +43,13 @@ from wordless.wl_utils import (
     wl_excs,
     wl_misc,
     wl_paths,
+    wl_sorting,
     wl_threading
 )
-from wordless.wl_widgets import wl_buttons
+from wordless.wl_widgets import (
+    wl_buttons,
+    wl_item_delegates
+)
 
 _tr = QtCore.QCoreApplication.translate
 
@@ -328,6 +333,9 @@ class Wl_Table(QtWidgets.QTableView):
             if text in header
         ]
 
+    def get_item_text(self, row, col):
+        return self.model().item(row, col).text()
+
     def get_visible_rows(self):
         if self.is_empty():
             return []
@@ -523,7 +531,7 @@ class Wl_Worker_Exp_Table(wl_threading.Wl_Worker):
                                         raise wl_excs.Wl_Exc_Aborted(self.main)
 
                                     if self.table.model().item(row, col):
-                                        cell_text = self.table.model().item(row, col).text()
+                                        cell_text = self.table.get_item_text(row, col)
                                     else:
                                         cell_text = self.table.indexWidget(self.table.model().index(row, col)).text()
                                         cell_text = wl_nlp_utils.html_to_text(cell_text)
@@ -550,7 +558,7 @@ class Wl_Worker_Exp_Table(wl_threading.Wl_Worker):
                                     if not self._running:
                                         raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                                    row_to_exp.append(self.table.model().item(row, col).text())
+                                    row_to_exp.append(self.table.get_item_text(row, col))
 
                                 csv_writer.writerow(self.clean_text_csv(row_to_exp))
             # Excel workbooks
@@ -1180,6 +1188,10 @@ class Wl_Table_Data(Wl_Table):
         self.rows_filter = set()
         self.rows_sample = set()
 
+        # Cumulative values of each header in the current order of rows/columns
+        self.vals_cum = {}
+        self.setItemDelegate(wl_item_delegates.Wl_Item_Delegate_Num_Data(self, table = self))
+
         if enable_sorting:
             self.setSortingEnabled(True)
 
@@ -1442,6 +1454,51 @@ class Wl_Table_Data(Wl_Table):
     def format_pct(val, precision):
         return f'{val:.{precision}%}'
 
+    def get_item_text(self, row, col):
+        if (text := self.get_num_text(row, col)) is not None:
+            return text
+        else:
+            return super().get_item_text(row, col)
+
+    def get_num_text(self, row, col):
+        match self.header_orientation:
+            case 'hor':
+                header, i = col, row
+            case 'vert':
+                header, i = row, col
+
+        item = self.model().item(row, col)
+
+        # Error messages and non-numeric data
+        if not isinstance(item, Wl_Table_Item) or not hasattr(item, 'val'):
+            return None
+
+        precision_settings = self.settings['tables']['precision_settings']
+
+        if (
+            header in self.vals_cum
+            and i < len(self.vals_cum[header])
+            and not numpy.isnan(val_cum := self.vals_cum[header][i])
+        ):
+            val = int(val_cum) if header in self.headers_int else val_cum
+        else:
+            val = item.val
+
+        # Integers
+        if header in self.headers_int:
+            return self.format_int(val)
+        # Floats
+        elif header in self.headers_float:
+            return self.format_float(val, precision_settings['precision_decimals'])
+        # Percentages
+        elif header in self.headers_pct:
+            return self.format_pct(val, precision_settings['precision_pcts'])
+        # p-values
+        elif header in self.headers_p_val:
+            return self.format_float(val, precision_settings['precision_p_vals'])
+        else:
+            return None
+
     def set_item_num(self, row, col, val, total = -1):
         match self.header_orientation:
             case 'hor':
@@ -1525,10 +1582,6 @@ class Wl_Table_Data(Wl_Table):
         self.model().setItem(row, col, item)
 
     def update_ranks(self):
-        data_prev = ''
-        rank_prev = 1
-        rank_next = 1
-
         sort_section = self.horizontalHeader().sortIndicatorSection()
         sort_order = self.horizontalHeader().sortIndicatorOrder()
 
@@ -1539,34 +1592,19 @@ class Wl_Table_Data(Wl_Table):
         if sort_section != col_rank:
             self.disable_updates()
 
-            for row in range(self.model().rowCount()):
-                if not self.isRowHidden(row):
-                    data_cur = self.model().item(row, sort_section).read_data()
-
-                    if self.main.settings_custom['tables']['rank_settings']['continue_numbering_after_ties']:
-                        if data_cur == data_prev:
-                            self.model().item(row, col_rank).val = rank_prev
-                            self.model().item(row, col_rank).setText(str(rank_prev))
-                        else:
-                            self.model().item(row, col_rank).val = rank_next
-                            self.model().item(row, col_rank).setText(str(rank_next))
-
-                            rank_prev = rank_next
-                            rank_next += 1
-
-                        data_prev = data_cur
-                    else:
-                        if data_cur == data_prev:
-                            self.model().item(row, col_rank).val = rank_prev
-                            self.model().item(row, col_rank).setText(str(rank_prev))
-                        else:
-                            self.model().item(row, col_rank).val = rank_next
-                            self.model().item(row, col_rank).setText(str(rank_next))
-
-                            rank_prev = rank_next
+            rows_visible = [
+                row
+                for row in range(self.model().rowCount())
+                if not self.isRowHidden(row)
+            ]
+            ranks = wl_sorting.get_ranks(
+                [self.model().item(row, sort_section).read_data() for row in rows_visible],
+                continue_numbering_after_ties = self.main.settings_custom['tables']['rank_settings']['continue_numbering_after_ties']
+            )
 
-                        rank_next += 1
-                        data_prev = data_cur
+            for row, rank in zip(rows_visible, ranks.tolist()):
+                self.model().item(row, col_rank).val = rank
+                self.model().item(row, col_rank).setText(str(rank))
 
             self.enable_updates()
 
@@ -1588,12 +1626,6 @@ class Wl_Table_Data(Wl_Table):
 
                 if not self.table_settings['show_total']:
                     cols_hide |= self.cols_total
-
-                for col in cols_hide:
-                    self.hideColumn(col)
-
-                for col in set(range(self.model().columnCount())) - cols_hide:
-                    self.showColumn(col)
             case 'vert':
                 rows_hide = set()
 
@@ -1606,24 +1638,21 @@ class Wl_Table_Data(Wl_Table):
                 if not self.table_settings['show_total']:
                     cols_hide |= self.cols_total
 
-                for row in rows_hide:
-                    self.hideRow(row)
+                # Only update rows whose visibility is changed
+                for row in range(self.model().rowCount()):
+                    if self.isRowHidden(row) != (row in rows_hide):
+                        self.setRowHidden(row, row in rows_hide)
 
-                for row in set(range(self.model().rowCount())) - rows_hide:
-                    self.showRow(row)
-
-                for col in cols_hide:
-                    self.hideColumn(col)
-
-                for col in set(range(self.model().columnCount())) - cols_hide:
-                    self.showColumn(col)
+        for col in range(self.model().columnCount()):
+            if self.isColumnHidden(col) != (col in cols_hide):
+                self.setColumnHidden(col, col in cols_hide)
 
         self.enable_updates()
 
-    def toggle_cum_data(self):
-        precision_decimals = self.main.settings_custom['tables']['precision_settings']['precision_decimals']
-        precision_pcts = self.main.settings_custom['tables']['precision_settings']['precision_pcts']
+    def clr_cum_data(self):
+        self.vals_cum.clear()
 
+    def toggle_cum_data(self):
         # Boost performance
         if self.enable_sorting:
             self.sortByColumn(
@@ -1632,99 +1661,38 @@ class Wl_Table_Data(Wl_Table):
             )
 
         self.disable_updates()
-        self.setSortingEnabled(False)
-
-        match (self.header_orientation, self.table_settings['show_cum_data']):
-            case ('hor', True):
-                for col in self.headers_cum:
-                    val_cum = 0
-
-                    # Integers
-                    if col in self.headers_int:
-                        for row in range(self.model().rowCount()):
-                            if not self.isRowHidden(row):
-                                item = self.model().item(row, col)
-
-                                val_cum += item.val
-                                item.setText(self.format_int(val_cum))
-                    # Floats
-                    elif col in self.headers_float:
-                        for row in range(self.model().rowCount()):
-                            if not self.isRowHidden(row):
-                                item = self.model().item(row, col)
-
-                                val_cum += item.val
-                                item.setText(self.format_float(val_cum, precision_decimals))
-                    # Percentages
-                    elif col in self.headers_pct:
-                        for row in range(self.model().rowCount()):
-                            if not self.isRowHidden(row):
-                                item = self.model().item(row, col)
-
-                                val_cum += item.val
-                                item.setText(self.format_pct(val_cum, precision_pcts))
-            case ('hor', False):
-                for col in self.headers_cum:
-                    # Integers
-                    if col in self.headers_int:
-                        for row in range(self.model().rowCount()):
-                            if not self.isRowHidden(row):
-                                item = self.model().item(row, col)
-
-                                item.setText(self.format_int(item.val))
-                    # Floats
-                    elif col in self.headers_float:
-                        for row in range(self.model().rowCount()):
-                            if not self.isRowHidden(row):
-                                item = self.model().item(row, col)
-
-                                item.setText(self.format_float(item.val, precision_decimals))
-                    # Percentages
-                    elif col in self.headers_pct:
-                        for row in range(self.model().rowCount()):
-                            if not self.isRowHidden(row):
-                                item = self.model().item(row, col)
-
-                                item.setText(self.format_pct(item.val, precision_pcts))
-            case ('vert', True):
-                for row in self.headers_cum:
-                    val_cum = 0
-
-                    for col in range(self.model().columnCount() - 1):
-                        item = self.model().item(row, col)
-
-                        if not self.isColumnHidden(col) and not isinstance(item, Wl_Table_Item_Err):
-                            val_cum += item.val
-
-                            # Integers
-                            if row in self.headers_int:
-                                item.setText(self.format_int(val_cum))
-                            # Floats
-                            elif row in self.headers_float:
-                                item.setText(self.format_float(val_cum, precision_decimals))
-                            # Percentages
-                            elif row in self.headers_pct:
-                                item.setText(self.format_pct(val_cum, precision_pcts))
-            case ('vert', False):
-                for row in self.headers_cum:
-                    for col in range(self.model().columnCount() - 1):
-                        item = self.model().item(row, col)
-
-                        if not self.isColumnHidden(col) and not isinstance(item, Wl_Table_Item_Err):
-                            # Integers
-                            if row in self.headers_int:
-                                item.setText(self.format_int(item.val))
-                            # Floats
-                            elif row in self.headers_float:
-                                item.setText(self.format_float(item.val, precision_decimals))
-                            # Percentages
-                            elif row in self.headers_pct:
-                                item.setText(self.format_pct(item.val, precision_pcts))
 
-        self.enable_updates()
+        self.clr_cum_data()
 
-        if self.enable_sorting:
-            self.setSortingEnabled(True)
+        # Cumulative values are computed once in the current order and are formatted by the item delegate when rendered
+        if self.table_settings['show_cum_data']:
+            match self.header_orientation:
+                case 'hor':
+                    rows_visible = [row for row in range(self.model().rowCount()) if not self.isRowHidden(row)]
+
+                    for col in self.headers_cum & (self.headers_int | self.headers_float | self.headers_pct):
+                        vals_cum = numpy.full(self.model().rowCount(), numpy.nan)
+                        vals_cum[rows_visible] = numpy.cumsum([self.model().item(row, col).val for row in rows_visible])
+
+                        self.vals_cum[col] = vals_cum
+                case 'vert':
+                    for row in self.headers_cum & (self.headers_int | self.headers_float | self.headers_pct):
+                        # Exclude the total column
+                        cols_visible = [
+                            col
+                            for col in range(self.model().columnCount() - 1)
+                            if (
+                                not self.isColumnHidden(col)
+                                and not isinstance(self.model().item(row, col), Wl_Table_Item_Err)
+                            )
+                        ]
+
+                        vals_cum = numpy.full(self.model().columnCount(), numpy.nan)
+                        vals_cum[cols_visible] = numpy.cumsum([self.model().item(row, col).val for col in cols_visible])
+
+                        self.vals_cum[row] = vals_cum
+
+        self.enable_updates()
 
     def filter_table(self):
         self.disable_updates()
@@ -1769,6 +1737,7 @@ class Wl_Table_Data(Wl_Table):
                 ).exec()
 
         if confirmed:
+            self.clr_cum_data()
             self.model().clear()
 
             match self.header_orientation:
@@ -657,6 +657,51 @@ def wl_widgets_measures_collocation_keyword_extraction(parent, extraction_type):
         label_measure_effect_size, combo_box_measure_effect_size
     )
 
+def wl_widgets_sampling_settings(parent):
+    label_sampling_method = QtWidgets.QLabel(_tr('wl_widgets', 'Sampling method:'), parent)
+    combo_box_sampling_method = wl_boxes.Wl_Combo_Box(parent)
+    label_sample_size = QtWidgets.QLabel(_tr('wl_widgets', 'Sample size:'), parent)
+    spin_box_sample_size = wl_boxes.Wl_Spin_Box(parent)
+    label_sampling_interval = QtWidgets.QLabel(_tr('wl_widgets', 'Sampling interval:'), parent)
+    spin_box_sampling_interval = wl_boxes.Wl_Spin_Box(parent)
+    label_sampling_seed = QtWidgets.QLabel(_tr('wl_widgets', 'Random seed:'), parent)
+    spin_box_sampling_seed = wl_boxes.Wl_Spin_Box(parent)
+
+    combo_box_sampling_method.addItems([
+        _tr('wl_widgets', 'None'),
+        _tr('wl_widgets', 'First N hits'),
+        _tr('wl_widgets', 'Reservoir sampling'),
+        _tr('wl_widgets', 'Systematic sampling')
+    ])
+
+    spin_box_sample_size.setRange(1, 100000000)
+    spin_box_sampling_interval.setRange(2, 100000000)
+    spin_box_sampling_seed.setRange(0, 2147483647)
+
+    def sampling_method_changed():
+        sampling_method = combo_box_sampling_method.currentText()
+
+        spin_box_sample_size.setEnabled(sampling_method in [
+            _tr('wl_widgets', 'First N hits'),
+            _tr('wl_widgets', 'Reservoir sampling')
+        ])
+        spin_box_sampling_interval.setEnabled(sampling_method == _tr('wl_widgets', 'Systematic sampling'))
+        spin_box_sampling_seed.setEnabled(sampling_method in [
+            _tr('wl_widgets', 'Reservoir sampling'),
+            _tr('wl_widgets', 'Systematic sampling')
+        ])
+
+    combo_box_sampling_method.currentTextChanged.connect(sampling_method_changed)
+
+    sampling_method_changed()
+
+    return (
+        label_sampling_method, combo_box_sampling_method,
+        label_sample_size, spin_box_sample_size,
+        label_sampling_interval, spin_box_sampling_interval,
+        label_sampling_seed, spin_box_sampling_seed
+    )
+
 # Table Settings
 def wl_widgets_table_settings(parent, tables):
     def show_pct_data_changed():
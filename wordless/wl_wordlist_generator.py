@@ -41,6 +41,7 @@ from wordless.wl_nlp import (
 from wordless.wl_utils import (
     wl_conversion,
     wl_excs,
+    wl_instrumentation,
     wl_misc,
     wl_sorting,
     wl_threading
@@ -401,6 +402,7 @@ class Wl_Table_Wordlist_Generator(wl_tables.Wl_Table_Data):
                 self.update_gui_table
             )
 
+    @wl_instrumentation.log_stage('tables/wordlist_generator')
     def update_gui_table(self, err_msg, tokens_freq_files, tokens_stats_files, syls_tokens):
         if wl_checks_work_area.check_results(self.main, err_msg, tokens_freq_files):
             try:
@@ -582,6 +584,7 @@ class Wl_Table_Wordlist_Generator(wl_tables.Wl_Table_Data):
                 self.update_gui_fig
             )
 
+    @wl_instrumentation.log_stage('figs/wordlist_generator')
     def update_gui_fig(self, err_msg, tokens_freq_files, tokens_stats_files, syls_tokens): # pylint: disable=unused-argument
         if wl_checks_work_area.check_results(self.main, err_msg, tokens_freq_files):
             hide_dialog_err_fatal = False
@@ -691,7 +694,12 @@ class Wl_Worker_Wordlist_Generator(wl_threading.Wl_Worker):
                 texts.append(wl_texts.Wl_Text_Total(texts))
 
                 # Frequency
-                self.tokens_freq_files.append(sum(self.tokens_freq_files, collections.Counter()))
+                tokens_freq_total = collections.Counter()
+
+                for tokens_freq_file in self.tokens_freq_files:
+                    tokens_freq_total.update(tokens_freq_file)
+
+                self.tokens_freq_files.append(tokens_freq_total)
 
             # Dispersion & Adjusted Frequency
             measure_dispersion = settings['generation_settings']['measure_dispersion']
@@ -715,54 +723,56 @@ class Wl_Worker_Wordlist_Generator(wl_threading.Wl_Worker):
                 tokens = wl_nlp_utils.add_missing_ending_tshegs(self.main, tokens, tab = 'wordlist_generator')
 
                 # Dispersion
-                if measure_dispersion == 'none':
-                    tokens_stats_file = {
-                        token: [None]
-                        for token in tokens_total
-                    }
-                elif type_dispersion == 'parts_based':
-                    freqs_sections_tokens = wl_measure_utils.to_freqs_sections_dispersion(
-                        self.main,
-                        items_to_search = tokens_total,
-                        items = tokens
-                    )
+                with wl_instrumentation.stage('measures/dispersion', num_items = len(tokens_total)):
+                    if measure_dispersion == 'none':
+                        tokens_stats_file = {
+                            token: [None]
+                            for token in tokens_total
+                        }
+                    elif type_dispersion == 'parts_based':
+                        freqs_sections_tokens = wl_measure_utils.to_freqs_sections_dispersion(
+                            self.main,
+                            items_to_search = tokens_total,
+                            items = tokens
+                        )
 
-                    for token, freqs in freqs_sections_tokens.items():
-                        if not self._running:
-                            raise wl_excs.Wl_Exc_Aborted(self.main)
+                        for token, freqs in freqs_sections_tokens.items():
+                            if not self._running:
+                                raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                        tokens_stats_file[token] = [func_dispersion(self.main, freqs)]
-                elif type_dispersion == 'dist_based':
-                    for token in tokens_total:
-                        if not self._running:
-                            raise wl_excs.Wl_Exc_Aborted(self.main)
+                            tokens_stats_file[token] = [func_dispersion(self.main, freqs)]
+                    elif type_dispersion == 'dist_based':
+                        for token in tokens_total:
+                            if not self._running:
+                                raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                        tokens_stats_file[token] = [func_dispersion(self.main, tokens, token)]
+                            tokens_stats_file[token] = [func_dispersion(self.main, tokens, token)]
 
                 # Adjusted Frequency
-                if measure_adjusted_freq == 'none':
-                    tokens_stats_file = {
-                        token: stats + [None]
-                        for token, stats in tokens_stats_file.items()
-                    }
-                elif type_adjusted_freq == 'parts_based':
-                    freqs_sections_tokens = wl_measure_utils.to_freqs_sections_adjusted_freq(
-                        self.main,
-                        items_to_search = tokens_total,
-                        items = tokens
-                    )
+                with wl_instrumentation.stage('measures/adjusted_freq', num_items = len(tokens_total)):
+                    if measure_adjusted_freq == 'none':
+                        tokens_stats_file = {
+                            token: stats + [None]
+                            for token, stats in tokens_stats_file.items()
+                        }
+                    elif type_adjusted_freq == 'parts_based':
+                        freqs_sections_tokens = wl_measure_utils.to_freqs_sections_adjusted_freq(
+                            self.main,
+                            items_to_search = tokens_total,
+                            items = tokens
+                        )
 
-                    for token, freqs in freqs_sections_tokens.items():
-                        if not self._running:
-                            raise wl_excs.Wl_Exc_Aborted(self.main)
+                        for token, freqs in freqs_sections_tokens.items():
+                            if not self._running:
+                                raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                        tokens_stats_file[token].append(func_adjusted_freq(self.main, freqs))
-                elif type_adjusted_freq == 'dist_based':
-                    for token in tokens_total:
-                        if not self._running:
-                            raise wl_excs.Wl_Exc_Aborted(self.main)
+                            tokens_stats_file[token].append(func_adjusted_freq(self.main, freqs))
+                    elif type_adjusted_freq == 'dist_based':
+                        for token in tokens_total:
+                            if not self._running:
+                                raise wl_excs.Wl_Exc_Aborted(self.main)
 
-                        tokens_stats_file[token].append(func_adjusted_freq(self.main, tokens, token))
+                            tokens_stats_file[token].append(func_adjusted_freq(self.main, tokens, token))
 
                 self.tokens_stats_files.append(tokens_stats_file)
 